@@ -11,6 +11,7 @@ import styled from "styled-components/macro";
 export type IRunStatus =
   | "SUCCESS"
   | "NOT_STARTED"
+  | "QUEUED"
   | "FAILURE"
   | "STARTED"
   | "MANAGED";
@@ -84,6 +85,7 @@ const RunStatusDot = styled.div<{ status: IRunStatus }>`
   background: ${({ status }) =>
     ({
       NOT_STARTED: Colors.GRAY1,
+      QUEUED: Colors.GRAY1,
       MANAGED: Colors.GRAY3,
       STARTED: Colors.GRAY3,
       SUCCESS: Colors.GREEN2,
@@ -93,6 +95,7 @@ const RunStatusDot = styled.div<{ status: IRunStatus }>`
     background: ${({ status }) =>
       ({
         NOT_STARTED: Colors.GRAY1,
+        QUEUED: Colors.GRAY1,
         STARTED: Colors.GRAY3,
         SUCCESS: Colors.GREEN2,
         FAILURE: Colors.RED5
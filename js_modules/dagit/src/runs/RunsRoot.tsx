@@ -45,7 +45,7 @@ function searchSuggestionsForRuns(
     },
     {
       token: "status",
-      values: () => ["NOT_STARTED", "STARTED", "SUCCESS", "FAILURE", "MANAGED"]
+      values: () => ["NOT_STARTED", "QUEUED", "STARTED", "SUCCESS", "FAILURE", "MANAGED"]
     },
     {
       token: "pipeline",
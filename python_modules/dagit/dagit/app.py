@@ -159,7 +159,12 @@ def create_app(handle, instance, reloader=None):
     execution_manager_settings = instance.dagit_settings.get('execution_manager')
     if execution_manager_settings and execution_manager_settings.get('max_concurrent_runs'):
         execution_manager = QueueingSubprocessExecutionManager(
-            instance, execution_manager_settings.get('max_concurrent_runs')
+            instance,
+            execution_manager_settings.get('max_concurrent_runs'),
+            max_concurrent_runs_per_pipeline=execution_manager_settings.get(
+                'max_concurrent_runs_per_pipeline'
+            ),
+            handle=handle,
         )
     else:
         execution_manager = SubprocessExecutionManager(instance)
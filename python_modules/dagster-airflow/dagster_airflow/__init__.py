@@ -1,3 +1,4 @@
+from .compile import TaskFusionPolicy
 from .factory import make_airflow_dag, make_airflow_dag_containerized
 
-__all__ = ['make_airflow_dag', 'make_airflow_dag_containerized']
+__all__ = ['make_airflow_dag', 'make_airflow_dag_containerized', 'TaskFusionPolicy']
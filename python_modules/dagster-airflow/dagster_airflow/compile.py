@@ -1,7 +1,11 @@
 import itertools
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, namedtuple
 
 from dagster import check
+from dagster.core.storage.pipeline_run import StepMetricsAggregate
+
+# Solids tagged with {FUSE_TAG: 'false'} always run in an Airflow task of their own
+FUSE_TAG = 'dagster-airflow/fuse'
 
 
 def _coalesce_solid_order(execution_plan):
@@ -33,3 +37,133 @@ def coalesce_execution_steps(execution_plan):
             ),
         )
     return OrderedDict([(solid_handle, steps[solid_handle]) for solid_handle in solid_order])
+
+
+class TaskFusionPolicy(namedtuple('_TaskFusionPolicy', 'max_steps_per_task max_task_duration_ms')):
+    '''Bounds on the Airflow tasks that linear chains of solids are fused into.
+
+    A solid is fused into the task of its upstream solids when they all run in the same task and
+    it is their only downstream solid, so that fusing it doesn't serialize steps that could have
+    run in parallel. The fused task executes its steps in a single process.
+
+    Args:
+        max_steps_per_task (Optional[int]): The most execution steps to run in a single task.
+        max_task_duration_ms (Optional[float]): The longest that a task should take, by the median
+            durations of the successful executions of its steps recorded by the instance. Steps
+            that have never succeeded count as taking no time.
+    '''
+
+    def __new__(cls, max_steps_per_task=None, max_task_duration_ms=None):
+        check.opt_int_param(max_steps_per_task, 'max_steps_per_task')
+        check.param_invariant(
+            max_steps_per_task is None or max_steps_per_task > 0, 'max_steps_per_task'
+        )
+        return super(TaskFusionPolicy, cls).__new__(
+            cls,
+            max_steps_per_task=max_steps_per_task,
+            max_task_duration_ms=check.opt_numeric_param(
+                max_task_duration_ms, 'max_task_duration_ms'
+            ),
+        )
+
+
+def _fused_task_id(solid_handles):
+    if len(solid_handles) == 1:
+        return solid_handles[0]
+    return '{first}__{last}'.format(first=solid_handles[0], last=solid_handles[-1])
+
+
+def fuse_execution_steps(execution_plan, fusion_policy, step_metrics_aggregates=None):
+    '''Groups execution steps into Airflow tasks, fusing linear chains of solids within the
+    bounds of the fusion policy.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to group the steps of.
+        fusion_policy (TaskFusionPolicy): Bounds on the fused tasks.
+        step_metrics_aggregates (Optional[Dict[str, StepMetricsAggregate]]): Historical metrics
+            keyed by solid handle, as returned by ``DagsterInstance.get_step_metrics_aggregates``.
+
+    Returns:
+        OrderedDict[str, List[ExecutionStep]]: The steps of each task keyed by task id, in
+        topological order of the first step of each task.
+    '''
+    check.inst_param(fusion_policy, 'fusion_policy', TaskFusionPolicy)
+    step_metrics_aggregates = check.opt_dict_param(
+        step_metrics_aggregates,
+        'step_metrics_aggregates',
+        key_type=str,
+        value_type=StepMetricsAggregate,
+    )
+
+    coalesced_plan = coalesce_execution_steps(execution_plan)
+
+    upstream_solids = {}
+    downstream_solids = defaultdict(set)
+    for solid_handle, solid_steps in coalesced_plan.items():
+        upstream_solids[solid_handle] = {
+            execution_plan.get_step_by_key(key).solid_handle.to_string()
+            for step in solid_steps
+            for step_input in step.step_inputs
+            for key in step_input.dependency_keys
+        } - {solid_handle}
+        for upstream_solid in upstream_solids[solid_handle]:
+            downstream_solids[upstream_solid].add(solid_handle)
+
+    def _duration_ms(solid_handle):
+        aggregate = step_metrics_aggregates.get(solid_handle)
+        return (aggregate.duration_ms_p50 or 0) if aggregate else 0
+
+    def _is_fusible(solid_handle):
+        return all(
+            step.tags.get(FUSE_TAG, 'true').lower() != 'false'
+            for step in coalesced_plan[solid_handle]
+        )
+
+    # the solid handles of each task, keyed by the first of them
+    tasks = OrderedDict()
+    task_for_solid = {}
+    for solid_handle, solid_steps in coalesced_plan.items():
+        upstream_tasks = {task_for_solid[upstream] for upstream in upstream_solids[solid_handle]}
+        task = upstream_tasks.pop() if len(upstream_tasks) == 1 else None
+
+        if task is not None:
+            task_solids = tasks[task]
+            can_fuse = (
+                _is_fusible(solid_handle)
+                and all(_is_fusible(task_solid) for task_solid in task_solids)
+                and all(
+                    downstream_solids[upstream] == {solid_handle}
+                    for upstream in upstream_solids[solid_handle]
+                )
+                and (
+                    fusion_policy.max_steps_per_task is None
+                    or sum(len(coalesced_plan[task_solid]) for task_solid in task_solids)
+                    + len(solid_steps)
+                    <= fusion_policy.max_steps_per_task
+                )
+                and (
+                    fusion_policy.max_task_duration_ms is None
+                    or sum(_duration_ms(task_solid) for task_solid in task_solids)
+                    + _duration_ms(solid_handle)
+                    <= fusion_policy.max_task_duration_ms
+                )
+            )
+            if not can_fuse:
+                task = None
+
+        if task is None:
+            task = solid_handle
+            tasks[task] = []
+
+        tasks[task].append(solid_handle)
+        task_for_solid[solid_handle] = task
+
+    return OrderedDict(
+        [
+            (
+                _fused_task_id(task_solids),
+                [step for task_solid in task_solids for step in coalesced_plan[task_solid]],
+            )
+            for task_solids in tasks.values()
+        ]
+    )
@@ -6,9 +6,10 @@ from airflow.operators import BaseOperator
 
 from dagster import ExecutionTargetHandle, RunConfig, check, seven
 from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.priority import DEFAULT_HISTORY_LIMIT
 from dagster.core.instance import DagsterInstance
 
-from .compile import coalesce_execution_steps
+from .compile import TaskFusionPolicy, coalesce_execution_steps, fuse_execution_steps
 from .operators.docker_operator import DagsterDockerOperator
 from .operators.python_operator import DagsterPythonOperator
 
@@ -55,6 +56,7 @@ def _make_airflow_dag(
     dag_kwargs=None,
     op_kwargs=None,
     operator=DagsterPythonOperator,
+    fusion_policy=None,
 ):
     check.inst_param(handle, 'handle', ExecutionTargetHandle)
     check.str_param(pipeline_name, 'pipeline_name')
@@ -82,6 +84,7 @@ def _make_airflow_dag(
     )
 
     op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
+    check.opt_inst_param(fusion_policy, 'fusion_policy', TaskFusionPolicy)
 
     dag = DAG(dag_id=dag_id, description=dag_description, **dag_kwargs)
 
@@ -96,11 +99,26 @@ def _make_airflow_dag(
 
     tasks = {}
 
-    coalesced_plan = coalesce_execution_steps(execution_plan)
+    if fusion_policy:
+        coalesced_plan = fuse_execution_steps(
+            execution_plan,
+            fusion_policy,
+            step_metrics_aggregates=instance.get_step_metrics_aggregates(
+                pipeline_name, mode=mode, limit=DEFAULT_HISTORY_LIMIT
+            )
+            if fusion_policy.max_task_duration_ms is not None
+            else None,
+        )
+    else:
+        coalesced_plan = coalesce_execution_steps(execution_plan)
+
+    task_id_for_step_key = {
+        step.key: task_id for task_id, steps in coalesced_plan.items() for step in steps
+    }
 
-    for solid_handle, solid_steps in coalesced_plan.items():
+    for task_id, task_steps in coalesced_plan.items():
 
-        step_keys = [step.key for step in solid_steps]
+        step_keys = [step.key for step in task_steps]
 
         if operator == DagsterPythonOperator:
             task = operator(
@@ -108,7 +126,7 @@ def _make_airflow_dag(
                 pipeline_name=pipeline_name,
                 environment_dict=environment_dict,
                 mode=mode,
-                task_id=solid_handle,
+                task_id=task_id,
                 step_keys=step_keys,
                 dag=dag,
                 instance_ref=instance.get_ref(),
@@ -119,23 +137,26 @@ def _make_airflow_dag(
                 pipeline_name=pipeline_name,
                 environment_dict=environment_dict,
                 mode=mode,
-                task_id=solid_handle,
+                task_id=task_id,
                 step_keys=step_keys,
                 dag=dag,
                 instance_ref=instance.get_ref(),
                 **op_kwargs
             )
 
-        tasks[solid_handle] = task
+        tasks[task_id] = task
 
-        for solid_step in solid_steps:
-            for step_input in solid_step.step_inputs:
-                for key in step_input.dependency_keys:
-                    prev_solid_handle = execution_plan.get_step_by_key(key).solid_handle.to_string()
-                    if solid_handle != prev_solid_handle:
-                        tasks[prev_solid_handle].set_downstream(task)
+        # the tasks this one depends on precede it in the plan, so have already been made
+        upstream_task_ids = {
+            task_id_for_step_key[key]
+            for step in task_steps
+            for step_input in step.step_inputs
+            for key in step_input.dependency_keys
+        } - {task_id}
+        for upstream_task_id in sorted(upstream_task_ids):
+            tasks[upstream_task_id].set_downstream(task)
 
-    return (dag, [tasks[solid_handle] for solid_handle in coalesced_plan.keys()])
+    return (dag, [tasks[task_id] for task_id in coalesced_plan.keys()])
 
 
 def make_airflow_dag(
@@ -148,6 +169,7 @@ def make_airflow_dag(
     dag_description=None,
     dag_kwargs=None,
     op_kwargs=None,
+    fusion_policy=None,
 ):
     '''Construct an Airflow DAG corresponding to a given Dagster pipeline.
 
@@ -179,6 +201,9 @@ def make_airflow_dag(
         op_kwargs (Optional[dict]): Any additional kwargs to pass to the underlying Airflow
             operator (a subclass of
             :py:class:`PythonOperator <airflow:airflow.operators.python_operator.PythonOperator>`).
+        fusion_policy (Optional[TaskFusionPolicy]): If provided, linear chains of solids are fused
+            into single tasks within the bounds of the policy, rather than each solid running in a
+            task of its own.
 
     Returns:
         (airflow.models.DAG, List[airflow.models.BaseOperator]): The generated Airflow DAG, and a
@@ -199,6 +224,7 @@ def make_airflow_dag(
         dag_description=dag_description,
         dag_kwargs=dag_kwargs,
         op_kwargs=op_kwargs,
+        fusion_policy=fusion_policy,
     )
 
 
@@ -211,6 +237,7 @@ def make_airflow_dag_for_handle(
     dag_description=None,
     dag_kwargs=None,
     op_kwargs=None,
+    fusion_policy=None,
 ):
     return _make_airflow_dag(
         handle=handle,
@@ -221,6 +248,7 @@ def make_airflow_dag_for_handle(
         dag_description=dag_description,
         dag_kwargs=dag_kwargs,
         op_kwargs=op_kwargs,
+        fusion_policy=fusion_policy,
     )
 
 
@@ -234,6 +262,7 @@ def make_airflow_dag_containerized(
     dag_description=None,
     dag_kwargs=None,
     op_kwargs=None,
+    fusion_policy=None,
 ):
     '''Construct a containerized Airflow DAG corresponding to a given Dagster pipeline.
 
@@ -266,6 +295,9 @@ def make_airflow_dag_containerized(
         op_kwargs (Optional[dict]): Any additional kwargs to pass to the underlying Airflow
             operator (a subclass of
             :py:class:`DockerOperator <airflow:airflow.operators.docker_operator.DockerOperator>`).
+        fusion_policy (Optional[TaskFusionPolicy]): If provided, linear chains of solids are fused
+            into single tasks within the bounds of the policy, rather than each solid running in a
+            task of its own.
 
     Returns:
         (airflow.models.DAG, List[airflow.models.BaseOperator]): The generated Airflow DAG, and a
@@ -286,6 +318,7 @@ def make_airflow_dag_containerized(
         dag_description=dag_description,
         dag_kwargs=dag_kwargs,
         op_kwargs=op_kwargs,
+        fusion_policy=fusion_policy,
         operator=DagsterDockerOperator,
     )
 
@@ -300,6 +333,7 @@ def make_airflow_dag_containerized_for_handle(
     dag_description=None,
     dag_kwargs=None,
     op_kwargs=None,
+    fusion_policy=None,
 ):
     op_kwargs = check.opt_dict_param(op_kwargs, 'op_kwargs', key_type=str)
     op_kwargs['image'] = image
@@ -313,6 +347,7 @@ def make_airflow_dag_containerized_for_handle(
         dag_description=dag_description,
         dag_kwargs=dag_kwargs,
         op_kwargs=op_kwargs,
+        fusion_policy=fusion_policy,
         operator=DagsterDockerOperator,
     )
 
@@ -328,6 +363,7 @@ def make_airflow_dag_kubernetized_for_handle(
     dag_description=None,
     dag_kwargs=None,
     op_kwargs=None,
+    fusion_policy=None,
 ):
     from .operators.kubernetes_operator import DagsterKubernetesPodOperator
 
@@ -345,5 +381,6 @@ def make_airflow_dag_kubernetized_for_handle(
         dag_description=dag_description,
         dag_kwargs=dag_kwargs,
         op_kwargs=op_kwargs,
+        fusion_policy=fusion_policy,
         operator=DagsterKubernetesPodOperator,
     )
@@ -1,18 +1,35 @@
-from dagster_airflow.compile import coalesce_execution_steps
+from dagster_airflow.compile import (
+    FUSE_TAG,
+    TaskFusionPolicy,
+    coalesce_execution_steps,
+    fuse_execution_steps,
+)
 from dagster_examples.toys.composition import composition
 
-from dagster import RunConfig
+from dagster import InputDefinition, RunConfig, lambda_solid, pipeline
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.pipeline_run import StepMetricsAggregate
 from dagster.core.system_config.objects import EnvironmentConfig
 
 
-def test_compile():
+def _composition_plan():
     run_config = RunConfig()
     environment_config = EnvironmentConfig.build(
         composition, {'solids': {'add_four': {'inputs': {'num': {'value': 1}}}}}, run_config=None
     )
 
-    plan = ExecutionPlan.build(composition, environment_config, run_config)
+    return ExecutionPlan.build(composition, environment_config, run_config)
+
+
+def _task_solids(fused_plan):
+    return [
+        [step.solid_handle.to_string() for step in task_steps] for task_steps in fused_plan.values()
+    ]
+
+
+def test_compile():
+    plan = _composition_plan()
 
     res = coalesce_execution_steps(plan)
 
@@ -25,3 +42,84 @@ def test_compile():
         'div_four.div_two_2',
         'int_to_float',
     }
+
+
+def test_fuse_linear_chain():
+    plan = _composition_plan()
+
+    assert _task_solids(fuse_execution_steps(plan, TaskFusionPolicy())) == [
+        [
+            'add_four.add_two.add_one',
+            'add_four.add_two.add_one_2',
+            'add_four.add_two_2.add_one',
+            'add_four.add_two_2.add_one_2',
+            'int_to_float',
+            'div_four.div_two',
+            'div_four.div_two_2',
+        ]
+    ]
+
+    fused_plan = fuse_execution_steps(plan, TaskFusionPolicy(max_steps_per_task=3))
+    assert list(fused_plan.keys()) == [
+        'add_four.add_two.add_one__add_four.add_two_2.add_one',
+        'add_four.add_two_2.add_one_2__div_four.div_two',
+        'div_four.div_two_2',
+    ]
+
+
+def test_fuse_within_historical_durations():
+    fused_plan = fuse_execution_steps(
+        _composition_plan(),
+        TaskFusionPolicy(max_task_duration_ms=50.0),
+        step_metrics_aggregates={
+            'int_to_float': StepMetricsAggregate('int_to_float', 3, duration_ms_p50=100.0)
+        },
+    )
+
+    assert _task_solids(fused_plan) == [
+        [
+            'add_four.add_two.add_one',
+            'add_four.add_two.add_one_2',
+            'add_four.add_two_2.add_one',
+            'add_four.add_two_2.add_one_2',
+        ],
+        ['int_to_float'],
+        ['div_four.div_two', 'div_four.div_two_2'],
+    ]
+
+
+def test_fuse_preserves_parallelism_and_opt_out():
+    @lambda_solid
+    def emit():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def left(num):
+        return num
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def right(num):
+        return num
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def after_left(num):
+        return num
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def unfused(num):
+        return num
+
+    @pipeline
+    def fan_out():
+        num = emit()
+        right(num)
+        unfused.tag({FUSE_TAG: 'false'})(after_left(left(num)))
+
+    fused_plan = fuse_execution_steps(create_execution_plan(fan_out), TaskFusionPolicy())
+
+    assert sorted(_task_solids(fused_plan)) == [
+        ['emit'],
+        ['left', 'after_left'],
+        ['right'],
+        ['unfused'],
+    ]
@@ -1,7 +1,7 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.config import ExecutorConfig, StepPriorityPolicy
 
 from .defaults import (
     broker_transport_options,
@@ -28,7 +28,8 @@ class dict_wrapper(object):
 
 
 class CeleryConfig(
-    namedtuple('CeleryConfig', 'broker backend include config_source'), ExecutorConfig,
+    namedtuple('CeleryConfig', 'broker backend include config_source step_priority'),
+    ExecutorConfig,
 ):
     '''Configuration class for the Celery execution engine.
 
@@ -37,11 +38,13 @@ class CeleryConfig(
         backend (Optional[str]): The URL of the Celery backend.
         include (Optional[List[str]]): List of modules every worker should import.
         config_source (Optional[Dict]): Config settings for the Celery app.
+        step_priority (Optional[str]): The order in which to submit steps that are ready at the
+            same time, either ``tags`` (the default) or ``critical_path``.
 
     '''
 
     def __new__(
-        cls, broker=None, backend=None, include=None, config_source=None,
+        cls, broker=None, backend=None, include=None, config_source=None, step_priority=None,
     ):
 
         return super(CeleryConfig, cls).__new__(
@@ -52,6 +55,9 @@ class CeleryConfig(
             config_source=dict_wrapper(
                 dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, 'config_source'))
             ),
+            step_priority=StepPriorityPolicy(
+                check.opt_str_param(step_priority, 'step_priority', StepPriorityPolicy.TAGS.value)
+            ),
         )
 
     @staticmethod
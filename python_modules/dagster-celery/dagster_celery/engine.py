@@ -8,6 +8,7 @@ from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import build_step_sort_key_fn
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.net import is_local_uri
@@ -102,7 +103,16 @@ class CeleryEngine(Engine):
         step_success = {}
         step_errors = {}
         completed_steps = set({})  # Set[step_key]
-        active_execution = execution_plan.start(sort_key_fn=priority_for_step)
+        sort_key_fn, priority_events = build_step_sort_key_fn(
+            pipeline_context,
+            execution_plan,
+            celery_config.step_priority,
+            base_sort_key_fn=priority_for_step,
+        )
+        for event in priority_events:
+            yield event
+
+        active_execution = execution_plan.start(sort_key_fn=sort_key_fn)
         stopping = False
 
         while (not active_execution.is_complete and not stopping) or step_results:
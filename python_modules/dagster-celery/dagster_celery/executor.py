@@ -1,5 +1,6 @@
 from dagster import Field, Permissive, String
 from dagster.core.definitions.executor import check_cross_process_constraints, executor
+from dagster.core.execution.config import step_priority_config_field
 
 from .config import CeleryConfig
 
@@ -28,6 +29,7 @@ from .config import CeleryConfig
         'config_source': Field(
             Permissive(), is_required=False, description='Additional settings for the Celery app.'
         ),
+        'step_priority': step_priority_config_field(),
     },
 )
 def celery_executor(init_context):
@@ -42,6 +44,10 @@ def celery_executor(init_context):
     The executor also exposes the ``broker``, `backend`, and ``include`` arguments to the
     :py:class:`celery.Celery` constructor.
 
+    Setting ``step_priority`` to ``critical_path`` submits the steps that head the longest
+    remaining chain of downstream work first, among those with the same ``dagster-celery/priority``
+    tag, estimating step durations from recent runs of the pipeline.
+
     In the most common case, you may want to modify the ``broker`` and ``backend`` (e.g., to use
     Redis instead of RabbitMQ). We expect that ``config_source`` will be less frequently
     modified, but that when solid executions are especially fast or slow, or when there are
@@ -71,6 +77,7 @@ def celery_executor(init_context):
               broker?: 'pyamqp://guest@localhost//',  # The URL of the Celery broker
               backend?: 'rpc://', # The URL of the Celery results backend
               include?: ['my_module'], # List of modules every worker should import
+              step_priority?: 'critical_path', # How to order steps that are ready together
               config_source:
                   ...
 
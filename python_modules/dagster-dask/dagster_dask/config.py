@@ -1,11 +1,14 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.config import ExecutorConfig, StepPriorityPolicy
 
 
 class DaskConfig(
-    namedtuple('DaskConfig', 'address timeout scheduler_file direct_to_workers heartbeat_interval'),
+    namedtuple(
+        'DaskConfig',
+        'address timeout scheduler_file direct_to_workers heartbeat_interval step_priority',
+    ),
     ExecutorConfig,
 ):
     '''DaskConfig - configuration for the Dask execution engine
@@ -17,6 +20,8 @@ class DaskConfig(
         direct_to_workers (Optional[bool]): Whether or not to connect directly to the workers, or
             to ask the scheduler to serve as intermediary.
         heartbeat_interval (Optional[int]): Time in milliseconds between heartbeats to scheduler.
+        step_priority (Optional[str]): How the Dask scheduler should prioritize steps that are
+            ready at the same time, either ``tags`` (the default) or ``critical_path``.
     '''
 
     def __new__(
@@ -26,6 +31,7 @@ class DaskConfig(
         scheduler_file=None,
         direct_to_workers=False,
         heartbeat_interval=None,
+        step_priority=None,
     ):
         return super(DaskConfig, cls).__new__(
             cls,
@@ -34,6 +40,9 @@ class DaskConfig(
             scheduler_file=check.opt_str_param(scheduler_file, 'scheduler_file'),
             direct_to_workers=check.opt_bool_param(direct_to_workers, 'direct_to_workers'),
             heartbeat_interval=check.opt_int_param(heartbeat_interval, 'heartbeat_interval'),
+            step_priority=StepPriorityPolicy(
+                check.opt_str_param(step_priority, 'step_priority', StepPriorityPolicy.TAGS.value)
+            ),
         )
 
     @staticmethod
@@ -6,7 +6,9 @@ from dagster import check, seven
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.config import StepPriorityPolicy
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import CriticalPathPriority
 from dagster.utils import frozentags
 from dagster.utils.net import is_local_uri
 
@@ -81,6 +83,17 @@ class DaskEngine(Engine):  # pylint: disable=no-init
 
         instance = pipeline_context.instance
 
+        # Dask runs higher priority tasks first when more are ready than it has workers for
+        priority_for_step = lambda _step: 0
+        if dask_config.step_priority == StepPriorityPolicy.CRITICAL_PATH:
+            critical_path_priority = CriticalPathPriority.from_history(
+                pipeline_context, execution_plan
+            )
+            yield critical_path_priority.engine_event(pipeline_context)
+            priority_for_step = lambda step: int(
+                critical_path_priority.remaining_duration(step.key) * 1000
+            )
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
             execution_futures = []
             execution_futures_dict = {}
@@ -117,6 +130,7 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                         instance.get_ref(),
                         key=dask_task_name,
                         resources=get_dask_resource_requirements(step.tags),
+                        priority=priority_for_step(step),
                     )
 
                     execution_futures.append(future)
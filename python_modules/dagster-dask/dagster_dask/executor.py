@@ -1,5 +1,6 @@
 from dagster import Bool, Field, Int, String
 from dagster.core.definitions.executor import check_cross_process_constraints, executor
+from dagster.core.execution.config import step_priority_config_field
 
 from .config import DaskConfig
 
@@ -33,6 +34,7 @@ from .config import DaskConfig
             is_required=False,
             description='Time in milliseconds between heartbeats to scheduler.',
         ),
+        'step_priority': step_priority_config_field(),
     },
 )
 def dask_executor(init_context):
@@ -54,6 +56,9 @@ def dask_executor(init_context):
             # intermediary
             direct_to_workers?: False,
             heartbeat_interval?: 1000,  # Time in milliseconds between heartbeats to scheduler
+            # Set to 'critical_path' to have Dask run the steps heading the longest remaining chain
+            # of downstream work first, estimating step durations from recent runs
+            step_priority?: 'tags',
         }
 
     If you'd like to configure a dask executor in addition to the
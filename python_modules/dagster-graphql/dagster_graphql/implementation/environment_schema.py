@@ -1,7 +1,6 @@
 from graphql.execution.base import ResolveInfo
 
 from dagster import check
-from dagster.config.validate import validate_config
 from dagster.core.definitions.environment_schema import EnvironmentSchema, create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector, PipelineDefinition
 
@@ -40,7 +39,7 @@ def resolve_is_environment_config_valid(
     check.inst_param(dagster_pipeline, 'dagster_pipeline', PipelineDefinition)
     check.dict_param(environment_dict, 'environment_dict', key_type=str)
 
-    validated_config = validate_config(environment_schema.environment_type, environment_dict)
+    validated_config = environment_schema.compiled_environment_type.validate(environment_dict)
 
     dauphin_pipeline = graphene_info.schema.type_named('Pipeline')(dagster_pipeline)
 
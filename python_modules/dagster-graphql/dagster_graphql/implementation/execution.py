@@ -43,7 +43,7 @@ def cancel_pipeline_execution(graphene_info, run_id):
 
     dauphin_run = graphene_info.schema.type_named('PipelineRun')(run)
 
-    if run.status != PipelineRunStatus.STARTED:
+    if run.status not in (PipelineRunStatus.STARTED, PipelineRunStatus.QUEUED):
         return graphene_info.schema.type_named('CancelPipelineExecutionFailure')(
             run=dauphin_run,
             message='Run {run_id} is not in a started state. Current status is {status}'.format(
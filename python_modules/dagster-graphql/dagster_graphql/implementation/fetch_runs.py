@@ -1,7 +1,6 @@
 from graphql.execution.base import ResolveInfo
 
 from dagster import RunConfig, check
-from dagster.config.validate import validate_config
 from dagster.core.definitions import create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
 from dagster.core.execution.api import create_execution_plan
@@ -20,7 +19,7 @@ def get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode
 
     environment_schema = create_environment_schema(pipeline, mode)
 
-    validated_config = validate_config(environment_schema.environment_type, environment_dict)
+    validated_config = environment_schema.compiled_environment_type.validate(environment_dict)
 
     if not validated_config.success:
         raise UserFacingGraphQLError(
@@ -1,16 +1,17 @@
 from __future__ import absolute_import
 
 import abc
+import heapq
 import logging
 import os
 import sys
+import threading
 import time
-from queue import Empty
 
-import gevent
 import six
 
 from dagster import ExecutionTargetHandle, PipelineDefinition, PipelineExecutionResult, check
+from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import (
     DagsterEvent,
@@ -22,9 +23,17 @@ from dagster.core.events import (
 from dagster.core.events.log import DagsterEventRecord
 from dagster.core.execution.api import execute_run_iterator
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+try:
+    from multiprocessing.connection import wait as wait_for_connections
+except ImportError:
+    # Python 2 has no way to wait on process sentinels
+    wait_for_connections = None
+
 
 class PipelineExecutionManager(six.with_metaclass(abc.ABCMeta)):
     @abc.abstractmethod
@@ -153,6 +162,50 @@ def build_process_exited_event(run_id, pipeline_name, process_id):
     )
 
 
+def build_pipeline_enqueued_event(run_id, pipeline_name):
+    check.str_param(run_id, 'run_id')
+    check.str_param(pipeline_name, 'pipeline_name')
+    message = 'Queued pipeline "{pipeline_name}" (run_id: {run_id}).'.format(
+        pipeline_name=pipeline_name, run_id=run_id
+    )
+
+    return DagsterEventRecord(
+        message=message,
+        user_message=message,
+        level=logging.INFO,
+        run_id=run_id,
+        timestamp=time.time(),
+        error_info=None,
+        pipeline_name=pipeline_name,
+        dagster_event=DagsterEvent(
+            message=message,
+            event_type_value=DagsterEventType.PIPELINE_ENQUEUED.value,
+            pipeline_name=pipeline_name,
+        ),
+    )
+
+
+def build_queued_run_terminated_event(run_id, pipeline_name):
+    check.str_param(run_id, 'run_id')
+    check.str_param(pipeline_name, 'pipeline_name')
+    message = 'Run {run_id} was terminated before it left the queue.'.format(run_id=run_id)
+
+    return DagsterEventRecord(
+        message=message,
+        user_message=message,
+        level=logging.INFO,
+        run_id=run_id,
+        timestamp=time.time(),
+        error_info=None,
+        pipeline_name=pipeline_name,
+        dagster_event=DagsterEvent(
+            message=message,
+            event_type_value=DagsterEventType.PIPELINE_FAILURE.value,
+            pipeline_name=pipeline_name,
+        ),
+    )
+
+
 class SynchronousExecutionManager(PipelineExecutionManager):
     def __init__(self):
         self._active = set()
@@ -196,16 +249,32 @@ class SubprocessExecutionManager(PipelineExecutionManager):
     falls back to system default. On unix variants that means it forks
     the process. This could lead to subtle behavior changes between
     python 2 and python 3.
+
+    A monitor thread waits on the sentinels of the living processes, so that each process is
+    cleaned up as soon as it exits, and ``on_process_exit`` (if provided) is called with its run
+    id. On python 2, which cannot wait on sentinels, the monitor checks the processes every tick.
     '''
 
-    def __init__(self, instance):
+    def __init__(self, instance, on_process_exit=None):
         self._multiprocessing_context = get_multiprocessing_context()
         self._instance = instance
         self._living_process_by_run_id = {}
         self._term_events = {}
         self._processes_lock = self._multiprocessing_context.Lock()
+        self._reap_lock = threading.Lock()
+        self._on_process_exit = check.opt_callable_param(on_process_exit, 'on_process_exit')
 
-        gevent.spawn(self._clock)
+        # written to whenever a process is started, to interrupt the monitor thread's wait
+        self._wakeup_receiver, self._wakeup_sender = self._multiprocessing_context.Pipe(
+            duplex=False
+        )
+
+        monitor_thread = threading.Thread(
+            target=self._monitor_processes,
+            name='dagster-execution-manager-monitor-{}'.format(id(self)),
+        )
+        monitor_thread.daemon = True
+        monitor_thread.start()
 
     def _generate_synthetic_error_from_crash(self, run):
         try:
@@ -227,51 +296,86 @@ class SubprocessExecutionManager(PipelineExecutionManager):
         with self._processes_lock:
             return {run_id: process for run_id, process in self._living_process_by_run_id.items()}
 
-    def _clock(self):
-        '''
-        This function polls the instance to synchronize it with the state of processes managed
-        by this manager instance. On every tick (every 0.5 seconds currently) it checks for zombie
-        processes
-        '''
+    def _monitor_processes(self):
         while True:
-            self._check_for_zombies()
-            gevent.sleep(SUBPROCESS_TICK)
+            try:
+                for run_id in self._wait_for_exited_processes():
+                    self._reap(run_id)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('Error while monitoring pipeline execution processes')
+
+    def _wait_for_exited_processes(self):
+        '''Block until at least one of the living processes has exited, or a new process has been
+        started, and return the run ids of the exited processes.
+        '''
+        living_process_snapshot = self._living_process_snapshot()
 
-    def _check_for_zombies(self):
+        if wait_for_connections is None:
+            time.sleep(SUBPROCESS_TICK)
+            return [
+                run_id
+                for run_id, process in living_process_snapshot.items()
+                if not process.is_alive()
+            ]
+
+        run_id_by_sentinel = {
+            process.sentinel: run_id for run_id, process in living_process_snapshot.items()
+        }
+        ready = wait_for_connections([self._wakeup_receiver] + list(run_id_by_sentinel.keys()))
+
+        if self._wakeup_receiver in ready:
+            while self._wakeup_receiver.poll():
+                self._wakeup_receiver.recv()
+
+        return [
+            run_id_by_sentinel[sentinel] for sentinel in ready if sentinel in run_id_by_sentinel
+        ]
+
+    def _reap(self, run_id):
         '''
-        Checks the current index of run_id => process and sees if any of them are dead. If they are,
-        it queries the instance to see if the runs are in a proper terminal state (success or
-        failure). If not, then we can assume that the underlying process died unexpected and clean
-        everything. In either case, the dead process is removed from the run_id => process index.
+        Cleans up after the dead process for a run. It queries the instance to see if the run is in
+        a proper terminal state (success or failure). If not, then we can assume that the underlying
+        process died unexpected and clean everything. In either case, the dead process is removed
+        from the run_id => process index.
+
+        The process is only removed once it has been fully handled, so that join() does not return
+        while the monitor thread is still reporting a crash.
         '''
-        runs_to_clear = []
+        with self._reap_lock:
+            process = self._get_process(run_id)
+            if not process:
+                # already handled
+                return
 
-        living_process_snapshot = self._living_process_snapshot()
+            try:
+                process.join()
 
-        for run_id, process in living_process_snapshot.items():
-            if not process.is_alive():
                 run = self._instance.get_run_by_id(run_id)
-                if not run:  # defensive
-                    continue
-
-                runs_to_clear.append(run_id)
-
-                # expected terminal state. it's fine for process to be dead
-                if run.is_finished:
-                    continue
+                # a finished run is the expected terminal state. it's fine for process to be dead
+                if run and not run.is_finished:
+                    # the process died in an unexpected manner. inform the system
+                    self._generate_synthetic_error_from_crash(run)
+            finally:
+                with self._processes_lock:
+                    del self._living_process_by_run_id[run_id]
+                    del self._term_events[run_id]
 
-                # the process died in an unexpected manner. inform the system
-                self._generate_synthetic_error_from_crash(run)
+        if self._on_process_exit:
+            self._on_process_exit(run_id)
 
-        with self._processes_lock:
-            for run_to_clear_id in runs_to_clear:
-                del self._living_process_by_run_id[run_to_clear_id]
-                del self._term_events[run_to_clear_id]
+    def _check_for_zombies(self):
+        '''
+        Checks the current index of run_id => process and cleans up after any dead processes. The
+        monitor thread does this as processes exit; this is a fallback for callers that want to make
+        sure that every dead process has been handled.
+        '''
+        for run_id, process in self._living_process_snapshot().items():
+            if not process.is_alive():
+                self._reap(run_id)
 
     def check(self):
         '''
-        Utility method for pytest to manually kick off zombie cleanup calls (in absence of
-        gevent)
+        Utility method for pytest to manually kick off zombie cleanup calls
         '''
         self._check_for_zombies()
 
@@ -296,16 +400,12 @@ class SubprocessExecutionManager(PipelineExecutionManager):
             self._living_process_by_run_id[pipeline_run.run_id] = mp_process
             self._term_events[pipeline_run.run_id] = term_event
 
-    def join(self):
-        with self._processes_lock:
-            for run_id, process in self._living_process_by_run_id.items():
-                if process.is_alive():
-                    process.join()
-
-                run = self._instance.get_run_by_id(run_id)
+        self._wakeup_sender.send(None)
 
-                if run and not run.is_finished:
-                    self._generate_synthetic_error_from_crash(run)
+    def join(self):
+        for run_id, process in self._living_process_snapshot().items():
+            process.join()
+            self._reap(run_id)
 
     def _get_process(self, run_id):
         with self._processes_lock:
@@ -332,7 +432,9 @@ class SubprocessExecutionManager(PipelineExecutionManager):
     def terminate(self, run_id):
         check.str_param(run_id, 'run_id')
 
-        process = self._get_process(run_id)
+        with self._processes_lock:
+            process = self._living_process_by_run_id.get(run_id)
+            term_event = self._term_events.get(run_id)
 
         if not process:
             return False
@@ -340,7 +442,7 @@ class SubprocessExecutionManager(PipelineExecutionManager):
         if not process.is_alive():
             return False
 
-        self._term_events[run_id].set()
+        term_event.set()
         process.join()
         return True
 
@@ -406,61 +508,179 @@ def _in_mp_process(handle, pipeline_run, instance_ref, term_event):
         instance.handle_new_event(build_process_exited_event(run_id, pipeline_name, os.getpid()))
 
 
+def _run_priority(pipeline_run):
+    try:
+        return int(pipeline_run.tags.get(PRIORITY_TAG, 0))
+    except ValueError:
+        return 0
+
+
 class QueueingSubprocessExecutionManager(PipelineExecutionManager):
-    def __init__(self, instance, max_concurrent_runs):
-        check.inst_param(instance, 'instance', DagsterInstance)
-        self._delegate = SubprocessExecutionManager(instance)
+    '''
+    Runs at most ``max_concurrent_runs`` pipeline processes at once, queueing the rest.
+
+    Queued runs are started in order of priority (the ``dagster/priority`` run tag, highest first),
+    then in the order they were submitted. If ``max_concurrent_runs_per_pipeline`` is set, runs of
+    a pipeline that already has that many runs in progress are passed over until one finishes. The
+    queue is checked whenever a run is submitted and as soon as a run's process exits.
+
+    Queued runs are marked as such in run storage. When given a handle, the manager picks up runs
+    of the handle's pipelines that were left queued by a previous process, e.g. before dagit was
+    restarted.
+    '''
+
+    def __init__(
+        self, instance, max_concurrent_runs, max_concurrent_runs_per_pipeline=None, handle=None
+    ):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
         self._max_concurrent_runs = check.int_param(max_concurrent_runs, 'max_concurrent_runs')
-        self._multiprocessing_context = get_multiprocessing_context()
-        self._queue = self._multiprocessing_context.JoinableQueue(maxsize=0)
-        gevent.spawn(self._clock)
+        self._max_concurrent_runs_per_pipeline = check.opt_int_param(
+            max_concurrent_runs_per_pipeline, 'max_concurrent_runs_per_pipeline'
+        )
+        check.opt_inst_param(handle, 'handle', ExecutionTargetHandle)
 
-    def _clock(self):
-        while True:
-            self._check_queue()
-            gevent.sleep(1)
+        # heap of (-priority, submission number, job args), guarded by _queue_lock
+        self._queue = []
+        self._submission_count = 0
+        self._pipeline_name_by_active_run_id = {}
+        self._queue_lock = threading.RLock()
+
+        self._delegate = SubprocessExecutionManager(instance, on_process_exit=self._on_process_exit)
+
+        if handle:
+            self._recover_queued_runs(handle)
+
+    def _recover_queued_runs(self, handle):
+        # the instance may be shared with other repositories, whose queued runs are left queued
+        repository = handle.build_repository_definition()
+
+        # runs are returned most recent first
+        for pipeline_run in reversed(
+            self._instance.get_runs(PipelineRunsFilter(status=PipelineRunStatus.QUEUED))
+        ):
+            if repository.has_pipeline(pipeline_run.pipeline_name):
+                self._enqueue(handle, pipeline_run, self._instance.get_ref())
+
+        self._check_queue()
+
+    def _enqueue(self, handle, pipeline_run, instance_ref):
+        job_args = {
+            'handle': handle,
+            'pipeline_run': pipeline_run,
+            'instance_ref': instance_ref,
+        }
+        with self._queue_lock:
+            heapq.heappush(
+                self._queue, (-_run_priority(pipeline_run), self._submission_count, job_args)
+            )
+            self._submission_count += 1
+
+    def _pipeline_has_capacity(self, pipeline_name):
+        if self._max_concurrent_runs_per_pipeline is None:
+            return True
+
+        active_count = len(
+            [
+                active_pipeline_name
+                for active_pipeline_name in self._pipeline_name_by_active_run_id.values()
+                if active_pipeline_name == pipeline_name
+            ]
+        )
+        return active_count < self._max_concurrent_runs_per_pipeline
 
     def _check_queue(self):
-        run_count = self._delegate.get_active_run_count()
-        if run_count < self._max_concurrent_runs:
-            try:
-                job_args = self._queue.get(block=False)
-            except Empty:
-                return
-            else:
+        with self._queue_lock:
+            passed_over = []
+            while (
+                self._queue
+                and len(self._pipeline_name_by_active_run_id) < self._max_concurrent_runs
+            ):
+                entry = heapq.heappop(self._queue)
+                job_args = entry[-1]
+                if not self._pipeline_has_capacity(job_args['pipeline_run'].pipeline_name):
+                    passed_over.append(entry)
+                    continue
+
                 self._start_pipeline_execution(job_args)
 
+            for entry in passed_over:
+                heapq.heappush(self._queue, entry)
+
     def _start_pipeline_execution(self, job_args):
         handle = job_args['handle']
         pipeline_run = job_args['pipeline_run']
-        pipeline = handle.build_repository_definition().get_pipeline(pipeline_run.pipeline_name)
         instance = DagsterInstance.from_ref(job_args['instance_ref'])
+
+        try:
+            pipeline = handle.build_repository_definition().get_pipeline(pipeline_run.pipeline_name)
+        except Exception:  # pylint: disable=broad-except
+            instance.handle_new_event(
+                build_synthetic_pipeline_error_record(
+                    pipeline_run.run_id,
+                    serializable_error_info_from_exc_info(sys.exc_info()),
+                    pipeline_run.pipeline_name,
+                )
+            )
+            return
+
+        self._pipeline_name_by_active_run_id[pipeline_run.run_id] = pipeline_run.pipeline_name
         self._delegate.execute_pipeline(handle, pipeline, pipeline_run, instance)
 
+    def _on_process_exit(self, run_id):
+        with self._queue_lock:
+            self._pipeline_name_by_active_run_id.pop(run_id, None)
+            self._check_queue()
+
     def execute_pipeline(self, handle, pipeline, pipeline_run, instance):
         check.inst_param(handle, 'handle', ExecutionTargetHandle)
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
-        job_args = {
-            'handle': handle,
-            'pipeline_run': pipeline_run,
-            'instance_ref': instance.get_ref(),
-        }
-        self._queue.put(job_args, block=False)
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        check.inst_param(instance, 'instance', DagsterInstance)
+
+        instance.handle_new_event(
+            build_pipeline_enqueued_event(pipeline_run.run_id, pipeline_run.pipeline_name)
+        )
+        self._enqueue(handle, pipeline_run, instance.get_ref())
         self._check_queue()
 
+    def join(self):
+        '''Wait for the runs in progress to finish. Runs still in the queue are not waited on.'''
+        self._delegate.join()
+
     def check(self):
         '''
         Utility method for pytest to manually kick off queue check calls
         '''
-        self._check_queue()
         self._delegate.check()
+        self._check_queue()
+
+    def _remove_from_queue(self, run_id):
+        with self._queue_lock:
+            for entry in self._queue:
+                if entry[-1]['pipeline_run'].run_id == run_id:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    return entry[-1]['pipeline_run']
+        return None
+
+    def is_queued(self, run_id):
+        check.str_param(run_id, 'run_id')
+        with self._queue_lock:
+            return any(entry[-1]['pipeline_run'].run_id == run_id for entry in self._queue)
 
     def can_terminate(self, run_id):
-        # deal with enqueued shit
-        return self._delegate.can_terminate(run_id)
+        return self.is_queued(run_id) or self._delegate.can_terminate(run_id)
 
     def terminate(self, run_id):
-        # deal with enqueued shit
+        check.str_param(run_id, 'run_id')
+
+        pipeline_run = self._remove_from_queue(run_id)
+        if pipeline_run:
+            self._instance.handle_new_event(
+                build_queued_run_terminated_event(run_id, pipeline_run.pipeline_name)
+            )
+            return True
+
         return self._delegate.terminate(run_id)
 
     def get_active_run_count(self):
@@ -8,6 +8,7 @@ from dagster_graphql.schema.errors import (
 
 from dagster import check
 from dagster.core.definitions.partition import Partition, PartitionSetDefinition
+from dagster.core.storage.pipeline_run import RunPartitionData
 
 
 class DauphinPartition(dauphin.ObjectType):
@@ -20,19 +21,25 @@ class DauphinPartition(dauphin.ObjectType):
     mode = dauphin.NonNull(dauphin.String)
     environmentConfigYaml = dauphin.NonNull(dauphin.String)
     tags = dauphin.non_null_list('PipelineTag')
+    runId = dauphin.String()
+    runStatus = dauphin.Field('PipelineRunStatus')
 
-    def __init__(self, partition, partition_set):
+    def __init__(self, partition, partition_set, run_data=None):
         self._partition = check.inst_param(partition, 'partition', Partition)
 
         self._partition_set = check.inst_param(
             partition_set, 'partition_set', PartitionSetDefinition
         )
 
+        run_data = check.opt_inst_param(run_data, 'run_data', RunPartitionData)
+
         super(DauphinPartition, self).__init__(
             name=partition.name,
             partition_set_name=partition_set.name,
             solid_subset=partition_set.solid_subset,
             mode=partition_set.mode,
+            runId=run_data.run_id if run_data else None,
+            runStatus=run_data.status if run_data else None,
         )
 
     def resolve_environmentConfigYaml(self, _):
@@ -71,9 +78,16 @@ class DauphinPartitionSet(dauphin.ObjectType):
     def resolve_partitions(self, graphene_info):
         partitions = self._partition_set.get_partitions()
 
+        # fetch the latest run for every partition up front, rather than querying per partition
+        run_data_by_partition = graphene_info.context.instance.get_run_partition_data(
+            self._partition_set.name
+        )
+
         return [
             graphene_info.schema.type_named('Partition')(
-                partition=partition, partition_set=self._partition_set
+                partition=partition,
+                partition_set=self._partition_set,
+                run_data=run_data_by_partition.get(partition.name),
             )
             for partition in partitions
         ]
@@ -22,6 +22,7 @@ from dagster.core.events.log import EventRecord
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import estimate_remaining_run_duration
 from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
 from dagster.core.storage.pipeline_run import (
     PipelineRun,
@@ -94,6 +95,13 @@ class DauphinPipelineRun(dauphin.ObjectType):
     tags = dauphin.non_null_list('PipelineTag')
     canCancel = dauphin.NonNull(dauphin.Boolean)
     executionSelection = dauphin.NonNull('ExecutionSelection')
+    estimatedRemainingSeconds = dauphin.Field(
+        dauphin.Float,
+        description='''
+        For queued and in-progress runs, an estimate of the time left in seconds: the longest chain
+        of unfinished steps, weighted by the median durations of their recent executions
+        ''',
+    )
 
     def __init__(self, pipeline_run):
         super(DauphinPipelineRun, self).__init__(
@@ -147,6 +155,21 @@ class DauphinPipelineRun(dauphin.ObjectType):
     def resolve_executionSelection(self, graphene_info):
         return graphene_info.schema.type_named('ExecutionSelection')(self._pipeline_run.selector)
 
+    def resolve_estimatedRemainingSeconds(self, graphene_info):
+        if self._pipeline_run.status not in (PipelineRunStatus.QUEUED, PipelineRunStatus.STARTED):
+            return None
+
+        pipeline = self.resolve_pipeline(graphene_info)
+        if not isinstance(pipeline, DauphinPipeline):
+            return None
+
+        execution_plan = create_execution_plan(
+            pipeline.get_dagster_pipeline(), self._pipeline_run.environment_dict, self._pipeline_run
+        )
+        return estimate_remaining_run_duration(
+            graphene_info.context.instance, self._pipeline_run, execution_plan
+        )
+
 
 # output version of input type DauphinExecutionSelector
 class DauphinExectionSelection(dauphin.ObjectType):
@@ -338,6 +361,12 @@ class DauphinPipelineEvent(dauphin.Interface):
     pipeline = dauphin.NonNull('Pipeline')
 
 
+class DauphinPipelineEnqueuedEvent(dauphin.ObjectType):
+    class Meta(object):
+        name = 'PipelineEnqueuedEvent'
+        interfaces = (DauphinMessageEvent, DauphinPipelineEvent)
+
+
 class DauphinPipelineStartEvent(dauphin.ObjectType):
     class Meta(object):
         name = 'PipelineStartEvent'
@@ -630,6 +659,7 @@ class DauphinPipelineRunEvent(dauphin.Union):
             DauphinExecutionStepStartEvent,
             DauphinExecutionStepSuccessEvent,
             DauphinLogMessageEvent,
+            DauphinPipelineEnqueuedEvent,
             DauphinPipelineFailureEvent,
             DauphinPipelineInitFailureEvent,
             DauphinPipelineProcessExitedEvent,
@@ -703,6 +733,10 @@ def from_dagster_event_record(graphene_info, event_record, dauphin_pipeline, exe
             ),
             **basic_params
         )
+    elif dagster_event.event_type == DagsterEventType.PIPELINE_ENQUEUED:
+        return graphene_info.schema.type_named('PipelineEnqueuedEvent')(
+            pipeline=dauphin_pipeline, **basic_params
+        )
     elif dagster_event.event_type == DagsterEventType.PIPELINE_START:
         return graphene_info.schema.type_named('PipelineStartEvent')(
             pipeline=dauphin_pipeline, **basic_params
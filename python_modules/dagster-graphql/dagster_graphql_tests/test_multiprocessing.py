@@ -24,9 +24,10 @@ from dagster import (
     lambda_solid,
     output_materialization_config,
     pipeline,
+    seven,
     solid,
 )
-from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
 from dagster.core.events import DagsterEventType
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
@@ -529,3 +530,167 @@ def test_max_concurrency_one():
         assert not execution_manager.is_active(run_id_one)
         assert execution_manager.is_active(run_id_two)
         assert execution_manager.terminate(run_id_two)
+
+
+def _wait_for(condition, timeout=60):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, 'Timed out waiting for condition'
+        time.sleep(0.1)
+
+
+def _create_loop_run(instance, filepath, tags=None):
+    return instance.create_run(
+        PipelineRun.create_empty_run(
+            pipeline_name=infinite_loop_pipeline.name,
+            run_id=make_new_run_id(),
+            environment_dict={'solids': {'loop': {'config': {'file': filepath}}}},
+            tags=tags,
+        )
+    )
+
+
+def test_dequeue_on_process_exit():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+
+    with safe_tempfile_path() as file_one, safe_tempfile_path() as file_two:
+        instance = DagsterInstance.local_temp()
+        execution_manager = QueueingSubprocessExecutionManager(instance, max_concurrent_runs=1)
+
+        run_one = _create_loop_run(instance, file_one)
+        run_two = _create_loop_run(instance, file_two)
+        execution_manager.execute_pipeline(handle, infinite_loop_pipeline, run_one, instance)
+        execution_manager.execute_pipeline(handle, infinite_loop_pipeline, run_two, instance)
+
+        assert instance.get_run_by_id(run_two.run_id).status == PipelineRunStatus.QUEUED
+
+        _wait_for(lambda: os.path.exists(file_one))
+        assert execution_manager.terminate(run_one.run_id)
+
+        # no check() calls: the exit of the first process starts the next run
+        _wait_for(lambda: os.path.exists(file_two))
+        assert execution_manager.is_active(run_two.run_id)
+        assert execution_manager.terminate(run_two.run_id)
+
+
+def test_queue_priority():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+
+    with safe_tempfile_path() as file_one, safe_tempfile_path() as low_file, safe_tempfile_path() as high_file:
+        instance = DagsterInstance.local_temp()
+        execution_manager = QueueingSubprocessExecutionManager(instance, max_concurrent_runs=1)
+
+        run_one = _create_loop_run(instance, file_one)
+        low_run = _create_loop_run(instance, low_file)
+        high_run = _create_loop_run(instance, high_file, tags={'dagster/priority': '10'})
+
+        for run in [run_one, low_run, high_run]:
+            execution_manager.execute_pipeline(handle, infinite_loop_pipeline, run, instance)
+
+        _wait_for(lambda: os.path.exists(file_one))
+        assert execution_manager.terminate(run_one.run_id)
+
+        _wait_for(lambda: os.path.exists(high_file))
+        assert not os.path.exists(low_file)
+        assert execution_manager.is_queued(low_run.run_id)
+        assert execution_manager.terminate(high_run.run_id)
+
+        _wait_for(lambda: os.path.exists(low_file))
+        assert execution_manager.terminate(low_run.run_id)
+
+
+def test_max_concurrency_per_pipeline():
+    loop_handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+    passing_handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'passing_pipeline')
+
+    with safe_tempfile_path() as file_one, safe_tempfile_path() as file_two:
+        instance = DagsterInstance.local_temp()
+        execution_manager = QueueingSubprocessExecutionManager(
+            instance, max_concurrent_runs=2, max_concurrent_runs_per_pipeline=1
+        )
+
+        loop_one = _create_loop_run(instance, file_one)
+        loop_two = _create_loop_run(instance, file_two)
+        passing_run = instance.create_run(
+            PipelineRun.create_empty_run(
+                pipeline_name=passing_pipeline.name,
+                run_id=make_new_run_id(),
+                environment_dict={
+                    'solids': {
+                        'sum_solid': {
+                            'inputs': {'num': file_relative_path(__file__, 'data/num.csv')}
+                        }
+                    }
+                },
+            )
+        )
+
+        execution_manager.execute_pipeline(loop_handle, infinite_loop_pipeline, loop_one, instance)
+        execution_manager.execute_pipeline(loop_handle, infinite_loop_pipeline, loop_two, instance)
+        execution_manager.execute_pipeline(passing_handle, passing_pipeline, passing_run, instance)
+
+        # the second loop run is passed over in favor of a run of a different pipeline
+        _wait_for(
+            lambda: instance.get_run_by_id(passing_run.run_id).status == PipelineRunStatus.SUCCESS
+        )
+        assert execution_manager.is_queued(loop_two.run_id)
+        assert not os.path.exists(file_two)
+
+        assert execution_manager.terminate(loop_one.run_id)
+        _wait_for(lambda: os.path.exists(file_two))
+        assert execution_manager.terminate(loop_two.run_id)
+
+
+def test_terminate_queued_run():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+
+    with safe_tempfile_path() as filepath:
+        instance = DagsterInstance.local_temp()
+        execution_manager = QueueingSubprocessExecutionManager(instance, max_concurrent_runs=0)
+
+        pipeline_run = _create_loop_run(instance, filepath)
+        execution_manager.execute_pipeline(handle, infinite_loop_pipeline, pipeline_run, instance)
+
+        assert execution_manager.can_terminate(pipeline_run.run_id)
+        assert execution_manager.terminate(pipeline_run.run_id)
+        assert not execution_manager.is_queued(pipeline_run.run_id)
+        assert instance.get_run_by_id(pipeline_run.run_id).status == PipelineRunStatus.FAILURE
+
+
+def test_queued_runs_recovered():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+
+    passing_handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'passing_pipeline')
+
+    with safe_tempfile_path() as filepath, seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        queueing_manager = QueueingSubprocessExecutionManager(instance, max_concurrent_runs=0)
+        queueing_manager.execute_pipeline(
+            handle, infinite_loop_pipeline, _create_loop_run(instance, filepath), instance
+        )
+        # a run of a pipeline that isn't in the handle's repository
+        other_run = instance.create_run(
+            PipelineRun.create_empty_run(
+                pipeline_name=passing_pipeline.name, run_id=make_new_run_id(), environment_dict={}
+            )
+        )
+        queueing_manager.execute_pipeline(passing_handle, passing_pipeline, other_run, instance)
+
+        queued_run = instance.get_runs(
+            PipelineRunsFilter(pipeline_name=infinite_loop_pipeline.name)
+        )[0]
+        assert queued_run.status == PipelineRunStatus.QUEUED
+
+        # e.g. dagit restarting with the same instance
+        execution_manager = QueueingSubprocessExecutionManager(
+            instance, max_concurrent_runs=1, handle=handle
+        )
+
+        _wait_for(lambda: os.path.exists(filepath))
+        assert execution_manager.is_active(queued_run.run_id)
+        assert not execution_manager.is_queued(other_run.run_id)
+        assert instance.get_run_by_id(other_run.run_id).status == PipelineRunStatus.QUEUED
+        assert execution_manager.terminate(queued_run.run_id)
+
+        # wait for the process to be cleaned up before the instance directory goes away
+        execution_manager.join()
@@ -37,6 +37,7 @@ from dagster.core.definitions import (
     TextMetadataEntryData,
     TypeCheck,
     UrlMetadataEntryData,
+    asyncio_executor,
     composite_solid,
     daily_schedule,
     default_executors,
@@ -53,6 +54,7 @@ from dagster.core.definitions import (
     schedules,
     solid,
     system_storage,
+    threaded_executor,
 )
 from dagster.core.engine import Engine
 from dagster.core.engine.engine_inprocess import DagsterTypeCheckDidNotPass
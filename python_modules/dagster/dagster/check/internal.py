@@ -0,0 +1,24 @@
+'''Checks for dagster's calls to itself in its hot paths -- e.g. the construction of events, event
+records and execution plan objects -- which mirror dagster.check:
+
+    from dagster.check import internal as check
+
+By default, these are exactly the checks of dagster.check. Set the DAGSTER_SKIP_INTERNAL_CHECKS
+environment variable before dagster is imported to replace the parameter and type checks with the
+stand-ins of dagster.check.unchecked, which skip checking, including the checks of the elements of
+collections. Invariants are still checked. Subprocesses inherit the environment, so the checks are
+skipped in every process of a run.
+
+Values that users pass in are checked by dagster.check at the boundaries of the public API in
+either mode, so that it is only errors in dagster itself that may go undetected. Only skip the checks
+once a deployment's pipelines have been run with them.
+'''
+
+import os
+
+from dagster.check import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+INTERNAL_CHECKS_ENABLED = not os.getenv('DAGSTER_SKIP_INTERNAL_CHECKS')
+
+if not INTERNAL_CHECKS_ENABLED:
+    from dagster.check.unchecked import *  # pylint: disable=wildcard-import,unused-wildcard-import
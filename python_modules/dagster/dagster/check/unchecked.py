@@ -0,0 +1,169 @@
+'''Stand-ins for the checks of dagster.check that skip checking, and only do what the checks do
+besides raising -- apply defaults, and replace None with empty collections.
+
+These are used by dagster.check.internal when DAGSTER_SKIP_INTERNAL_CHECKS is set.
+'''
+
+__all__ = [
+    'bool_param',
+    'callable_param',
+    'dict_param',
+    'float_param',
+    'generator',
+    'generator_param',
+    'inst',
+    'inst_param',
+    'int_param',
+    'is_list',
+    'list_param',
+    'numeric_param',
+    'opt_bool_param',
+    'opt_callable_param',
+    'opt_dict_param',
+    'opt_float_param',
+    'opt_generator',
+    'opt_generator_param',
+    'opt_inst_param',
+    'opt_int_param',
+    'opt_list_param',
+    'opt_nonempty_str_param',
+    'opt_nullable_dict_param',
+    'opt_nullable_list_param',
+    'opt_numeric_param',
+    'opt_set_param',
+    'opt_str_param',
+    'opt_tuple_param',
+    'set_param',
+    'str_param',
+    'tuple_param',
+]
+
+# pylint: disable=unused-argument
+
+
+def inst(obj, ttype, desc=None):
+    return obj
+
+
+def inst_param(obj, param_name, ttype, additional_message=None):
+    return obj
+
+
+def opt_inst_param(obj, param_name, ttype, default=None):
+    return default if obj is None else obj
+
+
+def callable_param(obj, param_name):
+    return obj
+
+
+def opt_callable_param(obj, param_name, default=None):
+    return default if obj is None else obj
+
+
+def int_param(obj, param_name):
+    return obj
+
+
+def opt_int_param(obj, param_name):
+    return obj
+
+
+def float_param(obj, param_name):
+    return obj
+
+
+def opt_float_param(obj, param_name):
+    return obj
+
+
+def numeric_param(obj, param_name):
+    return obj
+
+
+def opt_numeric_param(obj, param_name):
+    return obj
+
+
+def str_param(obj, param_name):
+    return obj
+
+
+def opt_str_param(obj, param_name, default=None):
+    return default if obj is None else obj
+
+
+def opt_nonempty_str_param(obj, param_name, default=None):
+    return default if obj is None or obj == '' else obj
+
+
+def bool_param(obj, param_name):
+    return obj
+
+
+def opt_bool_param(obj, param_name, default=None):
+    return default if obj is None else obj
+
+
+def is_list(obj_list, of_type=None, desc=None):
+    return obj_list
+
+
+def list_param(obj_list, param_name, of_type=None):
+    return obj_list
+
+
+def opt_list_param(obj_list, param_name, of_type=None):
+    return obj_list if obj_list else []
+
+
+def opt_nullable_list_param(obj_list, param_name, of_type=None):
+    if not obj_list:
+        return None if obj_list is None else []
+    return obj_list
+
+
+def set_param(obj_set, param_name, of_type=None):
+    return obj_set
+
+
+def opt_set_param(obj_set, param_name, of_type=None):
+    return obj_set if obj_set else set()
+
+
+def tuple_param(obj, param_name):
+    return obj
+
+
+def opt_tuple_param(obj, param_name, default=None):
+    return default if obj is None else obj
+
+
+def dict_param(obj, param_name, key_type=None, value_type=None):
+    return obj
+
+
+def opt_dict_param(obj, param_name, key_type=None, value_type=None, value_class=None):
+    return obj if obj else {}
+
+
+def opt_nullable_dict_param(obj, param_name, key_type=None, value_type=None, value_class=None):
+    if not obj:
+        return None if obj is None else {}
+    return obj
+
+
+def generator(obj):
+    return obj
+
+
+def opt_generator(obj):
+    return obj
+
+
+def generator_param(obj, param_name):
+    return obj
+
+
+def opt_generator_param(obj, param_name):
+    return obj
@@ -1,27 +1,44 @@
+import importlib
 import os
 import sys
 
 import click
 
-from ..core.instance import DagsterInstance
 from ..version import __version__
-from .instance import instance_cli
-from .pipeline import pipeline_cli
-from .run import run_cli
-from .schedule import schedule_cli
-from .utils import utils_cli
+
+# Subcommand name => (module, attribute) of its click group. Subcommands are imported only once
+# they are invoked, or listed by --help, so that e.g. `dagster --version` and `dagster utils tail`
+# don't pay for importing the instance, scheduler and execution machinery the others need.
+SUBCOMMANDS = {
+    'pipeline': ('dagster.cli.pipeline', 'pipeline_cli'),
+    'run': ('dagster.cli.run', 'run_cli'),
+    'instance': ('dagster.cli.instance', 'instance_cli'),
+    'schedule': ('dagster.cli.schedule', 'schedule_cli'),
+    'utils': ('dagster.cli.utils', 'utils_cli'),
+}
+
+
+class LazySubcommandGroup(click.Group):
+    '''A click group whose subcommands are imported when they are first needed.'''
+
+    def __init__(self, lazy_subcommands=None, **kwargs):
+        super(LazySubcommandGroup, self).__init__(**kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(
+            set(super(LazySubcommandGroup, self).list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name]
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super(LazySubcommandGroup, self).get_command(ctx, cmd_name)
 
 
 def create_dagster_cli():
-    commands = {
-        'pipeline': pipeline_cli,
-        'run': run_cli,
-        'instance': instance_cli,
-        'schedule': schedule_cli,
-        'utils': utils_cli,
-    }
-
-    @click.group(commands=commands)
+    @click.group(cls=LazySubcommandGroup, lazy_subcommands=SUBCOMMANDS)
     @click.version_option(version=__version__)
     def group():
         'CLI tools for working with dagster.'
@@ -0,0 +1,341 @@
+import weakref
+
+import six
+
+from dagster import check
+from dagster.utils import frozendict, frozenlist
+
+from .config_type import Bool, ConfigType, ConfigTypeKind, Float, Int, Path, String
+from .evaluate_value_result import EvaluateValueResult
+from .post_process import post_process_config
+from .validate import validate_config
+
+
+class _Invalid(Exception):
+    '''Raised by compiled validators and processors to abandon the fast path.'''
+
+
+class CompiledConfigType(object):
+    '''A config type compiled into a tree of closures that validate and post-process config values.
+
+    :py:func:`validate_config` and :py:func:`process_config` walk the config type afresh for every
+    value, building a :py:class:`ValidationContext` and :py:class:`EvaluationStack` for each node they
+    visit, so that they can report where an error occured. Compiled, every node dispatches on its
+    kind once, and values that turn out to be valid -- by far the common case -- are checked
+    without any of that bookkeeping. As soon as anything is amiss, the value is handed to
+    ``validate_config`` and ``process_config`` instead, which produce the errors.
+
+    The closures mirror ``validate.py`` and ``post_process.py`` exactly, and must be kept in step
+    with them.
+
+    Use :py:func:`compile_config_type` to get the compiled form of a config type.
+    '''
+
+    def __init__(self, config_type):
+        self.config_type = check.inst_param(config_type, 'config_type', ConfigType)
+        self._validate = _compile_validator(config_type)
+        self._post_process = _compile_processor(config_type)
+
+    def validate(self, config_value):
+        '''Equivalent to ``validate_config(self.config_type, config_value)``.'''
+        try:
+            return EvaluateValueResult.for_value(self._validate(config_value))
+        except _Invalid:
+            return validate_config(self.config_type, config_value)
+
+    def process(self, config_value):
+        '''Equivalent to ``process_config(self.config_type, config_value)``.'''
+        try:
+            validated_value = self._validate(config_value)
+        except _Invalid:
+            return validate_config(self.config_type, config_value)
+
+        try:
+            return EvaluateValueResult.for_value(self._post_process(validated_value))
+        except _Invalid:
+            return post_process_config(self.config_type, validated_value)
+
+
+# config type => CompiledConfigType. Config types are memoized by key, so this is shared by every
+# schema that uses a given type.
+_COMPILED_CONFIG_TYPES = weakref.WeakKeyDictionary()
+
+
+def compile_config_type(config_type):
+    '''Get the compiled form of a config type, compiling it on first use.
+
+    Args:
+        config_type (ConfigType)
+
+    Returns:
+        CompiledConfigType
+    '''
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    compiled = _COMPILED_CONFIG_TYPES.get(config_type)
+    if compiled is None:
+        compiled = CompiledConfigType(config_type)
+        _COMPILED_CONFIG_TYPES[config_type] = compiled
+    return compiled
+
+
+# Validators take a config value and return the value validate_config would, or raise _Invalid
+
+
+def _compile_validator(config_type):
+    kind = config_type.kind
+
+    if kind == ConfigTypeKind.NONEABLE:
+        validate_inner = _compile_validator(config_type.inner_type)
+        return lambda value: None if value is None else validate_inner(value)
+
+    if kind == ConfigTypeKind.ANY:
+        return lambda value: value
+
+    if kind == ConfigTypeKind.SCALAR:
+        is_valid = _compile_scalar_check(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        is_valid = lambda value: (
+            isinstance(value, six.string_types) and config_type.is_valid_config_enum_value(value)
+        )
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_validator(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_validator(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_validator(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(
+            config_type,
+            _compile_validator(config_type.scalar_type),
+            _compile_validator(config_type.non_scalar_type),
+        )
+    else:
+        check.failed('Unsupported ConfigTypeKind {}'.format(kind))
+
+    def _validate_scalar(value):
+        if value is None or not is_valid(value):
+            raise _Invalid()
+        return value
+
+    return _validate_scalar
+
+
+def _compile_scalar_check(config_type):
+    if isinstance(config_type, Int):
+        return lambda value: not isinstance(value, bool) and isinstance(value, six.integer_types)
+    elif isinstance(config_type, (String, Path)):
+        return lambda value: isinstance(value, six.string_types)
+    elif isinstance(config_type, Bool):
+        return lambda value: isinstance(value, bool)
+    elif isinstance(config_type, Float):
+        return lambda value: isinstance(value, float)
+    else:
+        return config_type.is_config_scalar_valid
+
+
+def _compile_scalar_union(config_type, compiled_scalar, compiled_non_scalar):
+    check.invariant(config_type.kind == ConfigTypeKind.SCALAR_UNION)
+
+    def _scalar_union(value):
+        if value is None:
+            raise _Invalid()
+        if isinstance(value, (dict, list)):
+            return compiled_non_scalar(value)
+        return compiled_scalar(value)
+
+    return _scalar_union
+
+
+def _compile_selector_validator(config_type):
+    fields = config_type.fields
+    field_validators = {
+        name: _compile_validator(field.config_type) for name, field in fields.items()
+    }
+    fields_with_fields = {
+        name for name, field in fields.items() if ConfigTypeKind.has_fields(field.config_type.kind)
+    }
+    # an empty selector is only valid when it has a single, optional field
+    empty_is_valid = len(fields) == 1 and all(field.is_optional for field in fields.values())
+
+    def _validate_selector(value):
+        if value == {}:
+            if not empty_is_valid:
+                raise _Invalid()
+            return {}
+
+        if not isinstance(value, dict) or len(value) > 1:
+            raise _Invalid()
+
+        ((field_name, field_value),) = value.items()
+        validate_field = field_validators.get(field_name)
+        if validate_field is None:
+            raise _Invalid()
+
+        if field_value is None and field_name in fields_with_fields:
+            field_value = {}
+        return frozendict({field_name: validate_field(field_value)})
+
+    return _validate_selector
+
+
+def _compile_shape_validator(config_type):
+    fields = config_type.fields
+    field_validators = [
+        (name, _compile_validator(field.config_type)) for name, field in fields.items()
+    ]
+    required_field_names = [name for name, field in fields.items() if not field.is_optional]
+    check_for_extra_fields = config_type.kind == ConfigTypeKind.STRICT_SHAPE
+
+    def _validate_shape(value):
+        if not isinstance(value, dict):
+            raise _Invalid()
+
+        if check_for_extra_fields:
+            for name in value:
+                if name not in fields:
+                    raise _Invalid()
+
+        for name in required_field_names:
+            if name not in value:
+                raise _Invalid()
+
+        for name, validate_field in field_validators:
+            if name in value:
+                validate_field(value[name])
+
+        return frozendict(value)
+
+    return _validate_shape
+
+
+def _compile_array_validator(config_type):
+    validate_item = _compile_validator(config_type.inner_type)
+
+    def _validate_array(value):
+        if not isinstance(value, list):
+            raise _Invalid()
+        return [validate_item(item) for item in value]
+
+    return _validate_array
+
+
+# Processors take a validated config value, resolve defaults and apply the post_process method of
+# every config type, and return the value post_process_config would, or raise _Invalid
+
+
+def _compile_processor(config_type):
+    resolve_defaults = _compile_default_resolver(config_type)
+
+    # most config types do not post-process their values, so avoid the call for those
+    if type(config_type).post_process == ConfigType.post_process:
+        return resolve_defaults
+
+    def _process(value):
+        value = resolve_defaults(value)
+        try:
+            return config_type.post_process(value)
+        except Exception:  # pylint: disable=broad-except
+            raise _Invalid()
+
+    return _process
+
+
+def _compile_default_resolver(config_type):
+    kind = config_type.kind
+
+    if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+        return lambda value: value
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_processor(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_processor(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_processor(config_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        process_inner = _compile_processor(config_type.inner_type)
+        return lambda value: None if value is None else process_inner(value)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(
+            config_type,
+            _compile_processor(config_type.scalar_type),
+            _compile_processor(config_type.non_scalar_type),
+        )
+    else:
+        check.failed('Unsupported type {name}'.format(name=config_type.name))
+
+
+def _compile_selector_processor(config_type):
+    fields = config_type.fields
+    field_processors = {
+        name: _compile_processor(field.config_type) for name, field in fields.items()
+    }
+    fields_with_fields = {
+        name for name, field in fields.items() if ConfigTypeKind.has_fields(field.config_type.kind)
+    }
+
+    def _process_selector(value):
+        if value:
+            if len(value) != 1:
+                raise _Invalid()
+            ((field_name, field_value),) = value.items()
+        else:
+            if len(fields) != 1:
+                raise _Invalid()
+            ((field_name, field_def),) = fields.items()
+            field_value = field_def.default_value if field_def.default_provided else None
+
+        if field_value is None and field_name in fields_with_fields:
+            field_value = {}
+        return frozendict({field_name: field_processors[field_name](field_value)})
+
+    return _process_selector
+
+
+def _compile_shape_processor(config_type):
+    fields = config_type.fields
+    field_processors = [
+        (name, field, _compile_processor(field.config_type)) for name, field in fields.items()
+    ]
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+    def _process_shape(value):
+        if value is None:
+            value = {}
+        elif not isinstance(value, dict) or not all(isinstance(name, str) for name in value):
+            raise _Invalid()
+
+        processed = {}
+        for name, field_def, process_field in field_processors:
+            if name in value:
+                processed[name] = process_field(value[name])
+            elif field_def.default_provided:
+                processed[name] = process_field(field_def.default_value)
+            elif not field_def.is_optional:
+                raise _Invalid()
+
+        # for permissive shapes, fields unknown to us are passed through as they are
+        if is_permissive:
+            for name in value:
+                if name not in fields:
+                    processed[name] = value[name]
+
+        return frozendict(processed)
+
+    return _process_shape
+
+
+def _compile_array_processor(config_type):
+    process_item = _compile_processor(config_type.inner_type)
+    items_may_be_none = config_type.inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _process_array(value):
+        if not value:
+            return []
+
+        if not items_may_be_none and any(item is None for item in value):
+            raise _Invalid()
+
+        return frozenlist([process_item(item) for item in value])
+
+    return _process_array
@@ -39,10 +39,12 @@ from .events import (
 )
 from .executor import (
     ExecutorDefinition,
+    asyncio_executor,
     default_executors,
     executor,
     in_process_executor,
     multiprocess_executor,
+    threaded_executor,
 )
 from .handle import ExecutionTargetHandle, LoaderEntrypoint
 from .input import InputDefinition, InputMapping
@@ -8,6 +8,12 @@ from dateutil.relativedelta import relativedelta
 from dagster import check
 from dagster.core.definitions.partition import PartitionSetDefinition
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+from dagster.core.execution.async_compute import (
+    AwaitRequest,
+    is_async_generator,
+    is_coroutine,
+    iterate_async_generator,
+)
 from dagster.core.partition.utils import date_partition_range
 from dagster.utils.backcompat import canonicalize_backcompat_args
 
@@ -195,7 +201,8 @@ def lambda_solid(name=None, description=None, input_defs=None, output_def=None):
     of the decorated function.
 
     The body of the decorated function should return a single value, which will be yielded as the
-    solid's output.
+    solid's output. On Python 3, the decorated function may also be a coroutine function
+    (``async def``), whose result will be awaited.
 
     Args:
         name (str): Name of solid.
@@ -266,6 +273,11 @@ def solid(
     to decorate a function that yields events, it must also wrap its eventual output in an
     :py:class:`Output` and yield it.
 
+    On Python 3, the decorated function may also be a coroutine function (``async def``) that
+    returns as in 1) or 2), or, from Python 3.6, an async generator that yields as in 3). Any
+    executor can run such solids, but only the :py:data:`asyncio_executor` runs several of them
+    concurrently.
+
     Args:
         name (str): Name of solid. Must be unique within any :py:class:`PipelineDefinition`
             using the solid.
@@ -381,6 +393,11 @@ def _create_lambda_solid_compute_wrapper(fn, input_defs, output_def):
             kwargs[input_name] = input_defs[input_name]
 
         result = fn(**kwargs)
+        if is_coroutine(result):
+            request = AwaitRequest(result)
+            yield request
+            result = request.get()
+
         yield Output(value=result, output_name=output_def.name)
 
     return compute
@@ -403,10 +420,18 @@ def _create_solid_compute_wrapper(fn, input_defs, output_defs):
 
         result = fn(context, **kwargs)
 
-        if inspect.isgenerator(result):
+        if is_async_generator(result):
+            for item in iterate_async_generator(result):
+                yield item
+        elif inspect.isgenerator(result):
             for item in result:
                 yield item
         else:
+            if is_coroutine(result):
+                request = AwaitRequest(result)
+                yield request
+                result = request.get()
+
             if isinstance(result, (Materialization, ExpectationResult)):
                 raise DagsterInvariantViolationError(
                     (
@@ -6,6 +6,7 @@ import six
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.serdes import whitelist_for_serdes
+from dagster.seven import intern_string
 from dagster.utils import camelcase, frozentags
 
 from .input import InputDefinition
@@ -151,11 +152,13 @@ class Solid(object):
 
 @whitelist_for_serdes
 class SolidHandle(namedtuple('_SolidHandle', 'name definition_name parent')):
+    __slots__ = ()
+
     def __new__(cls, name, definition_name, parent):
         return super(SolidHandle, cls).__new__(
             cls,
-            check.str_param(name, 'name'),
-            check.opt_str_param(definition_name, 'definition_name'),
+            intern_string(check.str_param(name, 'name')),
+            intern_string(check.opt_str_param(definition_name, 'definition_name')),
             check.opt_inst_param(parent, 'parent', SolidHandle),
         )
 
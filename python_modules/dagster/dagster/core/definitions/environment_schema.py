@@ -1,6 +1,7 @@
 from collections import namedtuple
 
 from dagster import check
+from dagster.config.compiled import compile_config_type
 from dagster.config.config_type import ConfigType
 
 from .pipeline import PipelineDefinition
@@ -29,6 +30,12 @@ class EnvironmentSchema(
             ),
         )
 
+    @property
+    def compiled_environment_type(self):
+        '''CompiledConfigType: The environment type, compiled for fast validation and processing of
+        environment dicts. Compiled on first access.'''
+        return compile_config_type(self.environment_type)
+
     def has_config_type(self, name):
         check.str_param(name, 'name')
         return name in self.config_type_dict_by_name
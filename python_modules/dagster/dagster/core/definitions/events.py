@@ -336,7 +336,8 @@ class ObjectStoreOperationType(Enum):
 class ObjectStoreOperation(
     namedtuple(
         '_ObjectStoreOperation',
-        'op key dest_key obj serialization_strategy_name object_store_name value_name',
+        'op key dest_key obj serialization_strategy_name object_store_name value_name '
+        'size_bytes',
     )
 ):
     '''This event is used internally by Dagster machinery when values are written to and read from
@@ -353,6 +354,9 @@ class ObjectStoreOperation(
             employed by the operation
         object_store_name (Optional[str]): The name of the object store that performed the
             operation.
+        value_name (Optional[str]): The name of the input or output the object belongs to.
+        size_bytes (Optional[int]): The size of the object as written, if the object store
+            knows it.
     '''
 
     def __new__(
@@ -364,6 +368,7 @@ class ObjectStoreOperation(
         serialization_strategy_name=None,
         object_store_name=None,
         value_name=None,
+        size_bytes=None,
     ):
         return super(ObjectStoreOperation, cls).__new__(
             cls,
@@ -376,6 +381,7 @@ class ObjectStoreOperation(
             ),
             object_store_name=check.opt_str_param(object_store_name, 'object_store_name'),
             value_name=check.opt_str_param(value_name, 'value_name'),
+            size_bytes=check.opt_int_param(size_bytes, 'size_bytes'),
         )
 
     @classmethod
@@ -390,6 +396,7 @@ class ObjectStoreOperation(
                     'serialization_strategy_name': inst.serialization_strategy_name,
                     'object_store_name': inst.object_store_name,
                     'value_name': inst.value_name,
+                    'size_bytes': inst.size_bytes,
                 },
                 **kwargs
             )
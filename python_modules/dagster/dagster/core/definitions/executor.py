@@ -5,7 +5,13 @@ from dagster.builtins import Int
 from dagster.config.field import Field
 from dagster.config.field_utils import check_user_facing_opt_config_param
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
-from dagster.core.execution.config import InProcessExecutorConfig, MultiprocessExecutorConfig
+from dagster.core.execution.config import (
+    AsyncioExecutorConfig,
+    InProcessExecutorConfig,
+    MultiprocessExecutorConfig,
+    ThreadedExecutorConfig,
+    step_priority_config_field,
+)
 
 
 class ExecutorDefinition(object):
@@ -138,7 +144,11 @@ def in_process_executor(init_context):
 
 
 @executor(
-    name='multiprocess', config={'max_concurrent': Field(Int, is_required=False, default_value=0)}
+    name='multiprocess',
+    config={
+        'max_concurrent': Field(Int, is_required=False, default_value=0),
+        'step_priority': step_priority_config_field(),
+    },
 )
 def multiprocess_executor(init_context):
     '''The default multiprocess executor.
@@ -152,11 +162,17 @@ def multiprocess_executor(init_context):
         execution:
           multiprocess:
             max_concurrent: 4
+            step_priority: critical_path
 
     The ``max_concurrent`` arg is optional and tells the execution engine how many processes may run
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    The ``step_priority`` arg is optional. When more steps are ready than there are processes
+    available, ``critical_path`` starts the steps with the longest remaining chain of downstream
+    work first, estimating step durations from recent runs of the pipeline. The default, ``tags``,
+    only considers the ``dagster/priority`` tag.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -170,11 +186,119 @@ def multiprocess_executor(init_context):
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
     return MultiprocessExecutorConfig(
-        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+        handle=handle,
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        step_priority=init_context.executor_config['step_priority'],
+    )
+
+
+@executor(
+    name='threaded',
+    config={
+        'max_concurrent': Field(Int, is_required=False, default_value=0),
+        'step_priority': step_priority_config_field(),
+    },
+)
+def threaded_executor(init_context):
+    '''The default threaded executor.
+
+    This executor runs steps concurrently on a pool of threads within the pipeline process. It is
+    meant for pipelines whose steps spend most of their time waiting on I/O -- object store
+    transfers, database queries, HTTP calls -- which can overlap in threads without paying the
+    process start-up cost of the multiprocess executor. Since steps share a process, it works with
+    in-memory system storage and with the resources of the run. CPU-bound steps will not run any
+    faster than in process, and resources and solids must be safe to use from several threads at
+    once. To select the threaded executor, include a fragment such as the following in your
+    config:
+
+    .. code-block:: yaml
+
+        execution:
+          threaded:
+            max_concurrent: 8
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is four more than the
+    return value of :py:func:`python:multiprocessing.cpu_count`, up to 32.
+
+    The ``step_priority`` arg is optional and behaves as for the multiprocess executor.
+
+    Compute logs are captured per step by routing writes to :py:data:`python:sys.stdout` and
+    :py:data:`python:sys.stderr` by thread, so, unlike with the other executors, output written
+    directly to the process's file descriptors (e.g. by subprocesses or C extensions) is not
+    captured.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    '''
+    from dagster.core.engine.init import InitExecutorContext
+
+    check.inst_param(init_context, 'init_context', InitExecutorContext)
+
+    return ThreadedExecutorConfig(
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        step_priority=init_context.executor_config['step_priority'],
+    )
+
+
+@executor(
+    name='asyncio',
+    config={
+        'max_concurrent': Field(Int, is_required=False, default_value=0),
+        'step_priority': step_priority_config_field(),
+    },
+)
+def asyncio_executor(init_context):
+    '''An executor that runs the steps of solids with async compute functions concurrently on a
+    single asyncio event loop in the pipeline process.
+
+    It is meant for pipelines that fan out to many remote calls, which can overlap on one event
+    loop without a thread or a process per step. Steps are started in dependency and priority order
+    as for the other executors, and each step executes synchronously until its compute function
+    awaits, at which point the engine moves on to other steps. Steps with synchronous compute
+    functions therefore block the event loop while they execute. The events of each step are
+    yielded in order.
+
+    This executor requires Python 3, and is not among the :py:data:`default_executors`. To use it,
+    add it to the executors of your mode:
+
+    .. code-block:: python
+
+        ModeDefinition(executor_defs=default_executors + [asyncio_executor])
+
+    and include a fragment such as the following in your config:
+
+    .. code-block:: yaml
+
+        execution:
+          asyncio:
+            max_concurrent: 500
+
+    The ``max_concurrent`` arg is optional and bounds how many steps may be in progress at once.
+    By default, or if you set ``max_concurrent`` to be 0, this is 100.
+
+    The ``step_priority`` arg is optional and behaves as for the multiprocess executor.
+
+    The compute logs of steps are not captured under this executor.
+    '''
+    from dagster.core.engine.init import InitExecutorContext
+    from dagster.core.execution.async_compute import is_asyncio_available
+
+    check.inst_param(init_context, 'init_context', InitExecutorContext)
+
+    if not is_asyncio_available():
+        raise DagsterUnmetExecutorRequirementsError(
+            'You have attempted to use the asyncio executor, which requires Python 3.'
+        )
+
+    return AsyncioExecutorConfig(
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        step_priority=init_context.executor_config['step_priority'],
     )
 
 
-default_executors = [in_process_executor, multiprocess_executor]
+default_executors = [in_process_executor, multiprocess_executor, threaded_executor]
 
 
 def check_cross_process_constraints(init_context):
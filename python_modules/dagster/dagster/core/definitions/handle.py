@@ -23,6 +23,11 @@ else:
 
 EPHEMERAL_NAME = '<<unnamed>>'
 
+# _ExecutionTargetHandleData (less the pipeline name) => the repository or pipeline its entrypoint
+# loads. Workers and child processes rebuild definitions from handles over and over, so each target
+# is only loaded -- its module imported and its function called -- once per process.
+_LOADED_TARGETS = {}
+
 
 class PartitionLoaderEntrypoint(
     namedtuple('_PartitionLoaderEntrypoint', 'module module_name fn_name from_handle')
@@ -492,7 +497,7 @@ class ExecutionTargetHandle(object):
         If this ExecutionTargetHandle points to a pipeline, we create an ephemeral repository to
         wrap the pipeline and return it.
         '''
-        obj = self.entrypoint.perform_load()
+        obj = self._load_target()
 
         if self.mode == _ExecutionTargetMode.REPOSITORY:
             # User passed in a function that returns a pipeline definition, not a repository. See:
@@ -528,7 +533,7 @@ class ExecutionTargetHandle(object):
                 ' ExecutionTargetHandle.'
             )
         elif self.mode == _ExecutionTargetMode.PIPELINE:
-            obj = self.entrypoint.perform_load()
+            obj = self._load_target()
             if isinstance(obj, PipelineDefinition):
                 return ExecutionTargetHandle.cache_handle(obj, self)
             else:
@@ -538,6 +543,20 @@ class ExecutionTargetHandle(object):
         else:
             check.failed('Unhandled mode {mode}'.format(mode=self.mode))
 
+    def _load_target(self):
+        '''Load the repository or pipeline this handle's entrypoint refers to, or get it from the
+        process-wide cache if it has already been loaded.
+
+        Handles that only differ by pipeline name share the loaded repository, so that qualifying a
+        repository handle with with_pipeline_name() does not load the repository again, and only
+        the pipeline named is constructed, if the repository constructs its pipelines lazily.
+        '''
+        key = self.data.target_key()
+        if key not in _LOADED_TARGETS:
+            _LOADED_TARGETS[key] = self.entrypoint.perform_load()
+
+        return ExecutionTargetHandle.cache_handle(_LOADED_TARGETS[key], self)
+
     @property
     def partition_handle_entrypoint(self):
         return self.data.get_partition_entrypoint(from_handle=self)
@@ -618,6 +637,14 @@ class _ExecutionTargetHandleData(
             pipeline_name=check.opt_str_param(pipeline_name, 'pipeline_name'),
         )
 
+    def target_key(self):
+        '''Identifies the target loaded by the entrypoints of this data, regardless of the pipeline
+        named.'''
+        return self._replace(
+            python_file=os.path.abspath(self.python_file) if self.python_file else None,
+            pipeline_name=None,
+        )
+
     def get_partition_entrypoint(self, from_handle=None):
         if self.repository_yaml:
             return PartitionLoaderEntrypoint.from_yaml(
@@ -19,9 +19,12 @@ class InputDefinition(object):
             :py:func:`as_dagster_type`, :py:func:`@usable_as_dagster_type <dagster_type`, or
             :py:func:`PythonObjectDagsterType`, or a Python type. Defaults to :py:class:`Any`.
         description (Optional[str]): Human-readable description of the input.
+        metadata (Optional[Dict[str, Any]]): A dict of metadata for the input, which is made
+            available to the machinery that provides the input's value -- e.g. hints for the type
+            storage plugin that loads it, such as the columns of a DataFrame the solid reads.
     '''
 
-    def __init__(self, name, dagster_type=None, description=None):
+    def __init__(self, name, dagster_type=None, description=None, metadata=None):
         ''
         self._name = check_valid_name(name)
 
@@ -29,6 +32,8 @@ class InputDefinition(object):
 
         self._description = check.opt_str_param(description, 'description')
 
+        self._metadata = check.opt_dict_param(metadata, 'metadata', key_type=str)
+
     @property
     def name(self):
         return self._name
@@ -41,6 +46,10 @@ class InputDefinition(object):
     def description(self):
         return self._description
 
+    @property
+    def metadata(self):
+        return self._metadata
+
     def mapping_to(self, solid_name, input_name):
         '''Create an input mapping to an input of a child solid.
 
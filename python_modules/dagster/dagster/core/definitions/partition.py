@@ -1,10 +1,10 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.definitions.schedule import ScheduleDefinition, ScheduleExecutionContext
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster.utils import merge_dicts
 
 from .mode import DEFAULT_MODE_NAME
@@ -49,16 +49,12 @@ def last_empty_partition(context, partition_set_def):
     partitions = partition_set_def.get_partitions()
     if not partitions:
         return None
+    successful_partitions = context.instance.get_run_partition_data(
+        partition_set_def.name, status=PipelineRunStatus.SUCCESS
+    )
     selected = None
     for partition in reversed(partitions):
-        filters = PipelineRunsFilter(
-            tags={
-                "dagster/partition": partition.name,
-                'dagster/partition_set': partition_set_def.name,
-            }
-        )
-        matching = context.instance.get_runs(filters)
-        if not any(run.status == PipelineRunStatus.SUCCESS for run in matching):
+        if partition.name not in successful_partitions:
             selected = partition
             break
     return selected
@@ -146,10 +142,10 @@ class PartitionSetDefinition(
     def tags_for_partition(self, partition):
         user_tags = self.user_defined_tags_fn_for_partition(partition)
         # TODO: Validate tags from user - Check they returned a Dict[str, str]
-        check.invariant('dagster/partition' not in user_tags)
-        check.invariant('dagster/partition_set' not in user_tags)
+        check.invariant(PARTITION_NAME_TAG not in user_tags)
+        check.invariant(PARTITION_SET_TAG not in user_tags)
         return merge_dicts(
-            {'dagster/partition': partition.name, 'dagster/partition_set': self.name}, user_tags
+            {PARTITION_NAME_TAG: partition.name, PARTITION_SET_TAG: self.name}, user_tags
         )
 
     def get_partitions(self):
@@ -199,6 +199,7 @@ class PipelineDefinition(IContainSolids, object):
             _parent_pipeline_def, '_parent_pipeline_def', PipelineDefinition
         )
         self._cached_enviroment_schemas = {}
+        self._sub_pipeline_cache = {}
 
     def get_environment_schema(self, mode=None):
         check.str_param(mode, 'mode')
@@ -388,7 +389,15 @@ class PipelineDefinition(IContainSolids, object):
 
     def build_sub_pipeline(self, solid_subset):
         check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
-        return self if solid_subset is None else _build_sub_pipeline(self, solid_subset)
+        if solid_subset is None:
+            return self
+
+        # sub-pipelines are memoized, as a pipeline's subsets are built over and over, e.g. for
+        # each step of a run executed in its own process
+        key = frozenset(solid_subset)
+        if key not in self._sub_pipeline_cache:
+            self._sub_pipeline_cache[key] = _build_sub_pipeline(self, solid_subset)
+        return self._sub_pipeline_cache[key]
 
     def get_presets(self):
         return list(self._preset_dict.values())
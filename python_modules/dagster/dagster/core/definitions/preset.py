@@ -3,7 +3,6 @@ from collections import namedtuple
 from glob import glob
 
 import six
-import yaml
 
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
@@ -60,6 +59,8 @@ class PresetDefinition(namedtuple('_PresetDefinition', 'name environment_dict so
         solid_subset = check.opt_nullable_list_param(solid_subset, 'solid_subset', of_type=str)
         mode = check.opt_str_param(mode, 'mode', DEFAULT_MODE_NAME)
 
+        import yaml
+
         filenames = []
         for file_glob in environment_files or []:
             globbed_files = glob(file_glob)
@@ -101,4 +102,6 @@ class PresetDefinition(namedtuple('_PresetDefinition', 'name environment_dict so
         Returns:
             str: The environment dict as YAML.
         '''
+        import yaml
+
         return yaml.dump(self.environment_dict, default_flow_style=False)
@@ -1,3 +1,5 @@
 from .engine_base import Engine
 from .engine_inprocess import InProcessEngine
-from .engine_multiprocess import MultiprocessEngine
+
+# The other engines are imported by their executor configs, once they are selected, so that their
+# dependencies -- e.g. multiprocessing -- are not imported by every process that imports dagster.
@@ -0,0 +1,201 @@
+import asyncio
+import os
+import sys
+from collections import deque
+
+import six
+
+from dagster.check import internal as check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.async_compute import AwaitRequest, close_event_loop
+from dagster.core.execution.config import AsyncioExecutorConfig
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import build_step_sort_key_fn
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .engine_base import Engine
+from .engine_inprocess import _assert_missing_inputs_optional, dagster_event_sequence_for_step
+
+# Stands in for the next item of a step's event sequence once the sequence is exhausted
+_STEP_DONE = object()
+
+
+class AsyncioEngine(Engine):  # pylint: disable=no-init
+    '''Executes steps concurrently on a single asyncio event loop.
+
+    Every step in progress has its event sequence, which the engine advances until the step's
+    compute function awaits something -- yielding an AwaitRequest -- or the sequence ends. The
+    awaitables of all waiting steps are scheduled on the engine's event loop, and the loop runs until
+    at least one of them is done, at which point the steps they belong to are advanced again. The
+    engine's thread does everything, so the steps, the execution plan and the event loop are only
+    ever touched by one thread.
+    '''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.param_invariant(
+            isinstance(pipeline_context.executor_config, AsyncioExecutorConfig),
+            'pipeline_context',
+            'Expected executor_config to be AsyncioExecutorConfig got {}'.format(
+                pipeline_context.executor_config
+            ),
+        )
+
+        limit = pipeline_context.executor_config.max_concurrent
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Executing up to {limit} steps at a time on an asyncio event loop (pid: {pid})'.format(
+                limit=limit, pid=os.getpid()
+            ),
+            event_specific_data=EngineEventData.in_process(
+                os.getpid(), execution_plan.step_keys_to_execute
+            ),
+        )
+
+        with time_execution_scope() as timer_result:
+            for event in copy_required_intermediates_for_execution(
+                pipeline_context, execution_plan
+            ):
+                yield event
+
+            sort_key_fn, priority_events = build_step_sort_key_fn(
+                pipeline_context, execution_plan, pipeline_context.executor_config.step_priority
+            )
+            for event in priority_events:
+                yield event
+
+            loop = asyncio.new_event_loop()
+            try:
+                for event in _execute_steps_on_loop(
+                    pipeline_context, execution_plan, sort_key_fn, limit, loop
+                ):
+                    yield event
+            finally:
+                close_event_loop(loop)
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Finished steps on asyncio event loop (pid: {pid}) in {duration_ms}'.format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(
+                os.getpid(), execution_plan.step_keys_to_execute
+            ),
+        )
+
+
+def _execute_steps_on_loop(pipeline_context, execution_plan, sort_key_fn, limit, loop):
+    active_execution = execution_plan.start(sort_key_fn=sort_key_fn)
+
+    # step key => event sequence, for every step in progress
+    step_sequences = {}
+    # keys of the steps in progress that are not waiting on an awaitable
+    runnable = deque()
+    # future => (step key, AwaitRequest), for every step waiting on an awaitable
+    waiting = {}
+    step_results = {}
+    errors = []
+
+    while (not errors and not active_execution.is_complete) or step_sequences:
+        # whether any step finished in this pass, which may allow more steps to start
+        finished_any = False
+
+        # start steps, unless a step has raised, in which case we only finish the steps in progress
+        # before re-raising
+        if not errors and len(step_sequences) < limit:
+            for step in active_execution.get_steps_to_execute(limit=(limit - len(step_sequences))):
+                step_context = pipeline_context.for_step(step)
+                uncovered_inputs = pipeline_context.intermediates_manager.uncovered_inputs(
+                    step_context, step
+                )
+                if uncovered_inputs:
+                    # In partial pipeline execution, we may end up here without having validated
+                    # the missing dependent outputs were optional
+                    _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step.key)
+
+                    step_context.log.info(
+                        (
+                            'Not all inputs covered for {step}. Not executing. Output missing for '
+                            'inputs: {uncovered_inputs}'
+                        ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                    )
+                    yield DagsterEvent.step_skipped_event(step_context)
+                    active_execution.mark_skipped(step.key)
+                    finished_any = True
+                    continue
+
+                step_sequences[step.key] = dagster_event_sequence_for_step(
+                    step_context, resolve_awaits=False
+                )
+                runnable.append(step.key)
+
+        # advance each runnable step until it awaits or finishes
+        while runnable:
+            step_key = runnable.popleft()
+            while True:
+                try:
+                    item = next(step_sequences[step_key])
+                except StopIteration:
+                    item = _STEP_DONE
+                except Exception:  # pylint: disable=broad-except
+                    errors.append(sys.exc_info())
+                    item = _STEP_DONE
+
+                if isinstance(item, AwaitRequest):
+                    waiting[asyncio.ensure_future(item.awaitable, loop=loop)] = (step_key, item)
+                    break
+
+                if item is _STEP_DONE:
+                    del step_sequences[step_key]
+                    finished_any = True
+
+                    # make sure everything logged by the step has been delivered
+                    pipeline_context.log.flush()
+
+                    was_success = step_results.get(step_key)
+                    if was_success == True:
+                        active_execution.mark_success(step_key)
+                    elif was_success == False:
+                        active_execution.mark_failed(step_key)
+                    else:
+                        pipeline_context.log.error(
+                            'Step {key} finished without success or failure event, '
+                            'assuming failure.'.format(key=step_key)
+                        )
+                        active_execution.mark_failed(step_key)
+                    break
+
+                yield item
+                if item.is_step_success:
+                    step_results[step_key] = True
+                elif item.is_step_failure:
+                    step_results[step_key] = False
+
+        # process skips from failures or uncovered inputs
+        for event in active_execution.skipped_step_events_iterator(pipeline_context):
+            yield event
+
+        # run the event loop until at least one waiting step can make progress, unless steps
+        # finished, in which case their dependents get a chance to start first
+        if waiting and not finished_any:
+            done, _ = loop.run_until_complete(
+                asyncio.wait(list(waiting), return_when=asyncio.FIRST_COMPLETED)
+            )
+            # resume steps in the order they started waiting
+            for future in [future for future in waiting if future in done]:
+                step_key, request = waiting.pop(future)
+                try:
+                    request.set_result(future.result())
+                except Exception:  # pylint: disable=broad-except
+                    # re-raised by the compute function wrapper, within the user code error
+                    # boundary
+                    request.set_exc_info(sys.exc_info())
+                runnable.append(step_key)
+
+    if errors:
+        six.reraise(*errors[0])
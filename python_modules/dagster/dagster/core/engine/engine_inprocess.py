@@ -1,7 +1,8 @@
 import os
 import sys
 
-from dagster import EventMetadataEntry, check
+from dagster import EventMetadataEntry, seven
+from dagster.check import internal as check
 from dagster.core.definitions import ExpectationResult, Materialization, Output, TypeCheck
 from dagster.core.errors import (
     DagsterError,
@@ -15,6 +16,7 @@ from dagster.core.errors import (
     user_code_error_boundary,
 )
 from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.async_compute import AwaitRequest, resolve_await_requests
 from dagster.core.execution.compute_logs import mirror_step_io
 from dagster.core.execution.config import ExecutorConfig
 from dagster.core.execution.context.system import (
@@ -34,6 +36,7 @@ from dagster.core.execution.plan.objects import (
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.object_store import ObjectStoreOperation
 from dagster.core.types.dagster_type import DagsterType
+from dagster.utils import get_peak_rss_bytes
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
 
@@ -120,6 +123,9 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
                         elif step_event.is_step_success:
                             step_success = True
 
+                    # make sure everything logged by the step has been delivered before moving on
+                    step_context.log.flush()
+
                     if step_success == True:
                         active_execution.mark_success(step.key)
                     elif step_success == False:
@@ -174,6 +180,7 @@ def _input_values_from_intermediates_manager(step_context):
         if step_input.runtime_type.is_nothing:
             continue
 
+        input_context = step_context.for_input(step_input.name)
         if step_input.is_from_multiple_outputs:
             if hasattr(step_input.runtime_type, 'inner_type'):
                 runtime_type = step_input.runtime_type.inner_type
@@ -181,7 +188,7 @@ def _input_values_from_intermediates_manager(step_context):
                 runtime_type = step_input.runtime_type
             _input_value = [
                 step_context.intermediates_manager.get_intermediate(
-                    step_context, runtime_type, source_handle
+                    input_context, runtime_type, source_handle
                 )
                 for source_handle in step_input.source_handles
             ]
@@ -195,7 +202,7 @@ def _input_values_from_intermediates_manager(step_context):
 
         elif step_input.is_from_single_output:
             input_value = step_context.intermediates_manager.get_intermediate(
-                step_context, step_input.runtime_type, step_input.source_handles[0]
+                input_context, step_input.runtime_type, step_input.source_handles[0]
             )
 
         else:  # is from config
@@ -225,20 +232,26 @@ def _input_values_from_intermediates_manager(step_context):
     return input_values
 
 
-def _step_failure_event_from_exc_info(step_context, exc_info, user_failure_data=None):
+def _step_failure_event_from_exc_info(step_context, start_time, exc_info, user_failure_data=None):
     return DagsterEvent.step_failure_event(
         step_context=step_context,
         step_failure_data=StepFailureData(
             error=serializable_error_info_from_exc_info(exc_info),
             user_failure_data=user_failure_data,
+            duration_ms=(seven.time_fn() - start_time) * 1000,
+            peak_rss_bytes=get_peak_rss_bytes(),
         ),
     )
 
 
-def dagster_event_sequence_for_step(step_context):
+def dagster_event_sequence_for_step(step_context, resolve_awaits=True):
     '''
     Yield a sequence of dagster events for the given step with the step context.
 
+    If the step's compute function is asynchronous, it awaits through AwaitRequests, which are
+    resolved on a private event loop unless resolve_awaits is False, in which case they are
+    yielded along with the events for the caller to resolve (see async_compute.py).
+
     Thie function also processes errors. It handles a few error cases:
 
         (1) The user-space code has raised an Exception. It has been
@@ -270,14 +283,21 @@ def dagster_event_sequence_for_step(step_context):
 
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
 
+    start_time = seven.time_fn()
+
     try:
-        for step_event in check.generator(_core_dagster_event_sequence_for_step(step_context)):
+        step_events = check.generator(_core_dagster_event_sequence_for_step(step_context))
+        if resolve_awaits:
+            step_events = resolve_await_requests(step_events)
+
+        for step_event in step_events:
             yield step_event
 
     # case (1) in top comment
     except DagsterUserCodeExecutionError as dagster_user_error:  # case (1) above
         yield _step_failure_event_from_exc_info(
             step_context,
+            start_time,
             dagster_user_error.original_exc_info,
             UserFailureData(
                 label='intentional-failure',
@@ -293,14 +313,14 @@ def dagster_event_sequence_for_step(step_context):
 
     # case (2) in top comment
     except DagsterError as dagster_error:
-        yield _step_failure_event_from_exc_info(step_context, sys.exc_info())
+        yield _step_failure_event_from_exc_info(step_context, start_time, sys.exc_info())
 
         if step_context.raise_on_error:
             raise dagster_error
 
     # case (3) in top comment
     except (Exception, KeyboardInterrupt) as unexpected_exception:  # pylint: disable=broad-except
-        yield _step_failure_event_from_exc_info(step_context, sys.exc_info())
+        yield _step_failure_event_from_exc_info(step_context, start_time, sys.exc_info())
 
         raise unexpected_exception
 
@@ -541,6 +561,9 @@ def _core_dagster_event_sequence_for_step(step_context):
         ):
             yield evt
 
+    # sizes of the intermediates written by this step, where the object store reports them
+    output_sizes = []
+
     with time_execution_scope() as timer_result:
         user_event_sequence = check.generator(
             _user_event_sequence_for_step_compute_fn(step_context, inputs)
@@ -553,12 +576,14 @@ def _core_dagster_event_sequence_for_step(step_context):
         ):
 
             if isinstance(user_event, Output):
-                for evt in _create_step_events_for_output(step_context, user_event):
+                for evt in _create_step_events_for_output(step_context, user_event, output_sizes):
                     yield evt
             elif isinstance(user_event, Materialization):
                 yield DagsterEvent.step_materialization(step_context, user_event)
             elif isinstance(user_event, ExpectationResult):
                 yield DagsterEvent.step_expectation_result(step_context, user_event)
+            elif isinstance(user_event, AwaitRequest):
+                yield user_event
             else:
                 check.failed(
                     'Unexpected event {event}, should have been caught earlier'.format(
@@ -567,11 +592,16 @@ def _core_dagster_event_sequence_for_step(step_context):
                 )
 
     yield DagsterEvent.step_success_event(
-        step_context, StepSuccessData(duration_ms=timer_result.millis)
+        step_context,
+        StepSuccessData(
+            duration_ms=timer_result.millis,
+            output_bytes=sum(output_sizes) if output_sizes else None,
+            peak_rss_bytes=get_peak_rss_bytes(),
+        ),
     )
 
 
-def _create_step_events_for_output(step_context, output):
+def _create_step_events_for_output(step_context, output, output_sizes):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.inst_param(output, 'output', Output)
 
@@ -583,14 +613,16 @@ def _create_step_events_for_output(step_context, output):
 
     step_output_handle = StepOutputHandle.from_step(step=step, output_name=output.output_name)
 
-    for evt in _set_intermediates(step_context, step_output, step_output_handle, output):
+    for evt in _set_intermediates(
+        step_context, step_output, step_output_handle, output, output_sizes
+    ):
         yield evt
 
     for evt in _create_output_materializations(step_context, output.output_name, output.value):
         yield evt
 
 
-def _set_intermediates(step_context, step_output, step_output_handle, output):
+def _set_intermediates(step_context, step_output, step_output_handle, output, output_sizes):
     res = step_context.intermediates_manager.set_intermediate(
         context=step_context,
         runtime_type=step_output.runtime_type,
@@ -598,6 +630,8 @@ def _set_intermediates(step_context, step_output, step_output_handle, output):
         value=output.value,
     )
     if isinstance(res, ObjectStoreOperation):
+        if res.size_bytes is not None:
+            output_sizes.append(res.size_bytes)
         yield DagsterEvent.object_store_operation(
             step_context, ObjectStoreOperation.serializable(res, value_name=output.output_name)
         )
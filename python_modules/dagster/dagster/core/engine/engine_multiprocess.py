@@ -1,6 +1,6 @@
 import os
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
@@ -8,6 +8,7 @@ from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import build_step_sort_key_fn
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -110,7 +111,13 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ):
                 yield event
 
-            active_execution = execution_plan.start()
+            sort_key_fn, priority_events = build_step_sort_key_fn(
+                pipeline_context, execution_plan, pipeline_context.executor_config.step_priority
+            )
+            for event in priority_events:
+                yield event
+
+            active_execution = execution_plan.start(sort_key_fn=sort_key_fn)
             active_iters = {}
             errors = {}
             term_events = {}
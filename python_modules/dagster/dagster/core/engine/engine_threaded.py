@@ -0,0 +1,181 @@
+import os
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+from dagster.check import internal as check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.compute_logs import mirror_step_io_for_thread, thread_routed_io
+from dagster.core.execution.config import ThreadedExecutorConfig
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.priority import build_step_sort_key_fn
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .engine_base import Engine
+from .engine_inprocess import _assert_missing_inputs_optional, dagster_event_sequence_for_step
+
+# Placed on the event queue by a step's thread once it is done with the step
+_STEP_DONE = object()
+
+
+def _execute_step_in_thread(step_context, event_queue):
+    '''Run a step on the current thread, reporting back to the engine through the event queue.
+
+    Every item put on the queue is a (step key, item) pair, where the item is a DagsterEvent, the
+    exc_info of an error that escaped the step, or _STEP_DONE, which is always put last.
+    '''
+    step_key = step_context.step.key
+    try:
+        with mirror_step_io_for_thread(step_context):
+            for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+                check.inst(step_event, DagsterEvent)
+                event_queue.put((step_key, step_event))
+
+        # make sure everything logged by the step has been delivered before reporting it done
+        step_context.log.flush()
+    except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+        event_queue.put((step_key, sys.exc_info()))
+    finally:
+        event_queue.put((step_key, _STEP_DONE))
+
+
+class ThreadedEngine(Engine):  # pylint: disable=no-init
+    '''Executes steps concurrently on threads of the pipeline process.
+
+    Each step runs on a thread of its own, up to ``max_concurrent`` at a time, sharing the
+    pipeline's resources and intermediates manager. The threads only execute steps: they hand the
+    events of their step to the engine through a queue, and the engine yields them and does all of
+    the bookkeeping of the execution plan, so that only the engine's thread touches it.
+    '''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.param_invariant(
+            isinstance(pipeline_context.executor_config, ThreadedExecutorConfig),
+            'pipeline_context',
+            'Expected executor_config to be ThreadedExecutorConfig got {}'.format(
+                pipeline_context.executor_config
+            ),
+        )
+
+        limit = pipeline_context.executor_config.max_concurrent
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Executing steps on up to {limit} threads (pid: {pid})'.format(
+                limit=limit, pid=os.getpid()
+            ),
+            event_specific_data=EngineEventData.in_process(
+                os.getpid(), execution_plan.step_keys_to_execute
+            ),
+        )
+
+        with time_execution_scope() as timer_result:
+            for event in copy_required_intermediates_for_execution(
+                pipeline_context, execution_plan
+            ):
+                yield event
+
+            sort_key_fn, priority_events = build_step_sort_key_fn(
+                pipeline_context, execution_plan, pipeline_context.executor_config.step_priority
+            )
+            for event in priority_events:
+                yield event
+
+            active_execution = execution_plan.start(sort_key_fn=sort_key_fn)
+            event_queue = queue.Queue()
+            active_threads = {}
+            step_results = {}
+            errors = []
+
+            with thread_routed_io():
+                while (not errors and not active_execution.is_complete) or active_threads:
+                    # start threads, unless a step has raised, in which case we only wait for the
+                    # steps already executing before re-raising
+                    while len(active_threads) < limit and not errors:
+                        steps = active_execution.get_steps_to_execute(
+                            limit=(limit - len(active_threads))
+                        )
+
+                        if not steps:
+                            break
+
+                        for step in steps:
+                            step_context = pipeline_context.for_step(step)
+                            uncovered_inputs = pipeline_context.intermediates_manager.uncovered_inputs(
+                                step_context, step
+                            )
+                            if uncovered_inputs:
+                                # In partial pipeline execution, we may end up here without having
+                                # validated the missing dependent outputs were optional
+                                _assert_missing_inputs_optional(
+                                    uncovered_inputs, execution_plan, step.key
+                                )
+
+                                step_context.log.info(
+                                    (
+                                        'Not all inputs covered for {step}. Not executing. Output '
+                                        'missing for inputs: {uncovered_inputs}'
+                                    ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                                )
+                                yield DagsterEvent.step_skipped_event(step_context)
+                                active_execution.mark_skipped(step.key)
+                                continue
+
+                            thread = threading.Thread(
+                                target=_execute_step_in_thread,
+                                args=(step_context, event_queue),
+                                name='dagster-step-{}'.format(step.key),
+                            )
+                            thread.daemon = True
+                            active_threads[step.key] = thread
+                            thread.start()
+
+                    # wait for the next event from any of the executing steps
+                    if active_threads:
+                        step_key, item = event_queue.get()
+
+                        if item is _STEP_DONE:
+                            active_threads.pop(step_key).join()
+                            was_success = step_results.get(step_key)
+                            if was_success == True:
+                                active_execution.mark_success(step_key)
+                            elif was_success == False:
+                                active_execution.mark_failed(step_key)
+                            else:
+                                pipeline_context.log.error(
+                                    'Step {key} finished without success or failure event, '
+                                    'assuming failure.'.format(key=step_key)
+                                )
+                                active_execution.mark_failed(step_key)
+                        elif isinstance(item, DagsterEvent):
+                            yield item
+                            if item.is_step_success:
+                                step_results[step_key] = True
+                            elif item.is_step_failure:
+                                step_results[step_key] = False
+                        else:
+                            errors.append(item)
+
+                    # process skips from failures or uncovered inputs
+                    for event in active_execution.skipped_step_events_iterator(pipeline_context):
+                        yield event
+
+            if errors:
+                six.reraise(*errors[0])
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Finished steps on threads (pid: {pid}) in {duration_ms}'.format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(
+                os.getpid(), execution_plan.step_keys_to_execute
+            ),
+        )
@@ -2,7 +2,7 @@
 from collections import namedtuple
 from enum import Enum
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.definitions import (
     EventMetadataEntry,
     ExpectationResult,
@@ -18,6 +18,8 @@ from dagster.core.execution.context.system import (
 from dagster.core.execution.plan.objects import StepOutputData
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.serdes import whitelist_for_serdes
+from dagster.seven import intern_string
+from dagster.utils import intern_tags
 from dagster.utils.error import SerializableErrorInfo
 from dagster.utils.timing import format_duration
 
@@ -36,6 +38,7 @@ class DagsterEventType(Enum):
 
     PIPELINE_INIT_FAILURE = 'PIPELINE_INIT_FAILURE'
 
+    PIPELINE_ENQUEUED = 'PIPELINE_ENQUEUED'
     PIPELINE_START = 'PIPELINE_START'
     PIPELINE_SUCCESS = 'PIPELINE_SUCCESS'
     PIPELINE_FAILURE = 'PIPELINE_FAILURE'
@@ -68,6 +71,7 @@ FAILURE_EVENTS = {
 }
 
 PIPELINE_EVENTS = {
+    DagsterEventType.PIPELINE_ENQUEUED,
     DagsterEventType.PIPELINE_START,
     DagsterEventType.PIPELINE_SUCCESS,
     DagsterEventType.PIPELINE_FAILURE,
@@ -154,6 +158,8 @@ class DagsterEvent(
 
     Users should not instantiate this class.'''
 
+    __slots__ = ()
+
     @staticmethod
     def from_step(event_type, step_context, event_specific_data=None, message=None):
 
@@ -204,12 +210,12 @@ class DagsterEvent(
     ):
         return super(DagsterEvent, cls).__new__(
             cls,
-            check.str_param(event_type_value, 'event_type_value'),
-            check.str_param(pipeline_name, 'pipeline_name'),
-            check.opt_str_param(step_key, 'step_key'),
+            intern_string(check.str_param(event_type_value, 'event_type_value')),
+            intern_string(check.str_param(pipeline_name, 'pipeline_name')),
+            intern_string(check.opt_str_param(step_key, 'step_key')),
             check.opt_inst_param(solid_handle, 'solid_handle', SolidHandle),
-            check.opt_str_param(step_kind_value, 'step_kind_value'),
-            check.opt_dict_param(logging_tags, 'logging_tags'),
+            intern_string(check.opt_str_param(step_kind_value, 'step_kind_value')),
+            intern_tags(check.opt_dict_param(logging_tags, 'logging_tags')),
             _validate_event_specific_data(DagsterEventType(event_type_value), event_specific_data),
             check.opt_str_param(message, 'message'),
         )
@@ -599,23 +605,25 @@ def get_step_output_event(events, step_key, output_name='result'):
 
 @whitelist_for_serdes
 class StepMaterializationData(namedtuple('_StepMaterializationData', 'materialization')):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class StepExpectationResultData(namedtuple('_StepExpectationResultData', 'expectation_result')):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class ObjectStoreOperationResultData(
     namedtuple('_ObjectStoreOperationResultData', 'op value_name metadata_entries')
 ):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class EngineEventData(namedtuple('_EngineEventData', 'metadata_entries error')):
+    __slots__ = ()
+
     # serdes log
     # * added optional error
     #
@@ -673,23 +681,25 @@ class EngineEventData(namedtuple('_EngineEventData', 'metadata_entries error')):
 class PipelineProcessStartedData(
     namedtuple('_PipelineProcessStartedData', 'process_id pipeline_name run_id')
 ):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class PipelineProcessExitedData(
     namedtuple('_PipelineProcessExitedData', 'process_id pipeline_name run_id')
 ):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class PipelineProcessStartData(namedtuple('_PipelineProcessStartData', 'pipeline_name run_id')):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class PipelineInitFailureData(namedtuple('_PipelineInitFailureData', 'error')):
+    __slots__ = ()
+
     def __new__(cls, error):
         return super(PipelineInitFailureData, cls).__new__(
             cls, error=check.inst_param(error, 'error', SerializableErrorInfo)
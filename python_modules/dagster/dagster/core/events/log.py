@@ -1,6 +1,6 @@
 from collections import namedtuple
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.events import DagsterEvent
 from dagster.core.log_manager import coerce_valid_log_level
 from dagster.core.serdes import (
@@ -8,6 +8,7 @@ from dagster.core.serdes import (
     serialize_dagster_namedtuple,
     whitelist_for_serdes,
 )
+from dagster.seven import intern_string
 from dagster.utils.error import SerializableErrorInfo
 from dagster.utils.log import (
     JsonEventLoggerHandler,
@@ -24,6 +25,8 @@ class EventRecord(
         'dagster_event',
     )
 ):
+    __slots__ = ()
+
     def __new__(
         cls,
         error_info,
@@ -42,10 +45,10 @@ class EventRecord(
             check.str_param(message, 'message'),
             coerce_valid_log_level(level),
             check.str_param(user_message, 'user_message'),
-            check.str_param(run_id, 'run_id'),
+            intern_string(check.str_param(run_id, 'run_id')),
             check.float_param(timestamp, 'timestamp'),
-            check.opt_str_param(step_key, 'step_key'),
-            check.opt_str_param(pipeline_name, 'pipeline_name'),
+            intern_string(check.opt_str_param(step_key, 'step_key')),
+            intern_string(check.opt_str_param(pipeline_name, 'pipeline_name')),
             check.opt_inst_param(dagster_event, 'dagster_event', DagsterEvent),
         )
 
@@ -63,12 +66,12 @@ class EventRecord(
 
 @whitelist_for_serdes
 class DagsterEventRecord(EventRecord):
-    pass
+    __slots__ = ()
 
 
 @whitelist_for_serdes
 class LogMessageRecord(EventRecord):
-    pass
+    __slots__ = ()
 
 
 def construct_event_record(logger_message):
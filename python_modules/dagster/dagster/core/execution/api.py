@@ -89,16 +89,21 @@ def _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run)
         raise  # finally block will run before this is re-raised
     finally:
         if pipeline_success:
-            yield DagsterEvent.pipeline_success(pipeline_context)
-
+            pipeline_event = DagsterEvent.pipeline_success(pipeline_context)
         else:
-            yield DagsterEvent.pipeline_failure(pipeline_context)
+            pipeline_event = DagsterEvent.pipeline_failure(pipeline_context)
+
+        # the run is only finished once its terminal event has reached storage
+        pipeline_context.log.flush()
+        yield pipeline_event
 
 
 def execute_run_iterator(pipeline, pipeline_run, instance):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     instance = check.inst_param(instance, 'instance', DagsterInstance)
-    check.invariant(pipeline_run.status == PipelineRunStatus.NOT_STARTED)
+    check.invariant(
+        pipeline_run.status in (PipelineRunStatus.NOT_STARTED, PipelineRunStatus.QUEUED)
+    )
 
     execution_plan = create_execution_plan(
         pipeline, environment_dict=pipeline_run.environment_dict, run_config=pipeline_run
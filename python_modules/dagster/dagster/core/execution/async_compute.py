@@ -0,0 +1,99 @@
+'''Support for solids whose compute functions are coroutine functions or async generators.
+
+Steps execute as synchronous generators of events, so an async compute function can not await
+directly. Instead, the compute function wrapper yields an :py:class:`AwaitRequest` up through the
+step's event sequence whenever it needs to await something. Whoever drives the sequence awaits the
+request, reports the outcome on it, and resumes the sequence, at which point the wrapper picks the
+outcome up with :py:meth:`AwaitRequest.get`. The synchronous engines resolve requests one at a
+time on a private event loop (see :py:func:`resolve_await_requests`), while the asyncio engine
+awaits the requests of many steps at once on a single loop.
+'''
+
+import inspect
+import sys
+
+import six
+
+from dagster import check, seven
+
+
+def is_asyncio_available():
+    # asyncio is only imported once an event loop is needed, as it is slow to import
+    return seven.is_module_available('asyncio')
+
+
+def is_coroutine(value):
+    iscoroutine = getattr(inspect, 'iscoroutine', None)
+    return bool(iscoroutine and iscoroutine(value))
+
+
+def is_async_generator(value):
+    # async generators are only available from python 3.6
+    isasyncgen = getattr(inspect, 'isasyncgen', None)
+    return bool(isasyncgen and isasyncgen(value))
+
+
+class AwaitRequest(object):
+    '''Asks whoever drives a step's event sequence to await an awaitable on the step's behalf.'''
+
+    __slots__ = ['awaitable', '_result', '_exc_info']
+
+    def __init__(self, awaitable):
+        self.awaitable = check.not_none_param(awaitable, 'awaitable')
+        self._result = None
+        self._exc_info = None
+
+    def set_result(self, result):
+        self._result = result
+
+    def set_exc_info(self, exc_info):
+        self._exc_info = check.tuple_param(exc_info, 'exc_info')
+
+    def get(self):
+        '''The result of the awaitable, re-raising any error it raised.'''
+        if self._exc_info:
+            six.reraise(*self._exc_info)
+        return self._result
+
+
+def iterate_async_generator(async_generator):
+    '''Iterate over an async generator, yielding an :py:class:`AwaitRequest` before each item.'''
+    while True:
+        request = AwaitRequest(async_generator.__anext__())
+        yield request
+        try:
+            item = request.get()
+        except StopAsyncIteration:  # pylint: disable=undefined-variable
+            return
+        yield item
+
+
+def resolve_await_requests(sequence):
+    '''Drive a step's event sequence synchronously, awaiting each request on a private event loop.
+    '''
+    loop = None
+    try:
+        for item in sequence:
+            if not isinstance(item, AwaitRequest):
+                yield item
+                continue
+
+            if loop is None:
+                import asyncio  # pylint: disable=import-error
+
+                loop = asyncio.new_event_loop()
+            try:
+                item.set_result(loop.run_until_complete(item.awaitable))
+            except Exception:  # pylint: disable=broad-except
+                # re-raised by the compute function wrapper, within the user code error boundary
+                item.set_exc_info(sys.exc_info())
+    finally:
+        if loop is not None:
+            close_event_loop(loop)
+
+
+def close_event_loop(loop):
+    # async generators abandoned midway, e.g. by a failing step, need to be finalized on the loop
+    if hasattr(loop, 'shutdown_asyncgens'):
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
@@ -4,6 +4,7 @@ import io
 import os
 import subprocess
 import sys
+import threading
 import time
 from contextlib import contextmanager
 
@@ -39,6 +40,94 @@ def mirror_step_io(step_context):
     manager.on_compute_finish(step_context)
 
 
+class ThreadRoutedStream(object):
+    '''Stands in for sys.stdout or sys.stderr while steps execute on several threads at once.
+
+    File descriptors are shared by every thread in the process, so the descriptor swapping that
+    :py:func:`mirror_step_io` relies on can not separate the output of concurrent steps. Instead,
+    each thread may route its writes to a file of its own, while everything written still reaches
+    the original stream, as it would have through the tail process.
+    '''
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    @property
+    def stream(self):
+        return self._stream
+
+    @contextmanager
+    def route(self, to_stream):
+        self._local.to_stream = to_stream
+        try:
+            yield
+        finally:
+            self._local.to_stream = None
+
+    def write(self, data):
+        to_stream = getattr(self._local, 'to_stream', None)
+        if to_stream is not None:
+            to_stream.write(data)
+        return self._stream.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        to_stream = getattr(self._local, 'to_stream', None)
+        if to_stream is not None:
+            to_stream.flush()
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def thread_routed_io():
+    '''Replace sys.stdout and sys.stderr with :py:class:`ThreadRoutedStream` for the duration, so
+    that :py:func:`mirror_step_io_for_thread` can capture the output of concurrent steps.'''
+    if isinstance(sys.stdout, ThreadRoutedStream):
+        yield
+        return
+
+    sys.stdout, sys.stderr = ThreadRoutedStream(sys.stdout), ThreadRoutedStream(sys.stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = sys.stdout.stream, sys.stderr.stream
+
+
+@contextmanager
+def mirror_step_io_for_thread(step_context, buffering=1):
+    '''Capture the output of a step executing on the current thread, for engines that run several
+    steps concurrently in one process. Must be used within :py:func:`thread_routed_io`.'''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    manager = step_context.instance.compute_log_manager
+    if not manager.enabled(step_context) or not isinstance(sys.stdout, ThreadRoutedStream):
+        yield
+        return
+
+    outpath = manager.get_local_path(
+        step_context.run_id, step_context.step.key, ComputeIOType.STDOUT
+    )
+    errpath = manager.get_local_path(
+        step_context.run_id, step_context.step.key, ComputeIOType.STDERR
+    )
+    ensure_file(outpath)
+    ensure_file(errpath)
+
+    manager.on_compute_start(step_context)
+    with open(outpath, 'a+', buffering=buffering) as out_stream:
+        with open(errpath, 'a+', buffering=buffering) as err_stream:
+            with sys.stdout.route(out_stream), sys.stderr.route(err_stream):
+                # compute function executed here
+                yield
+    manager.on_compute_finish(step_context)
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     return (
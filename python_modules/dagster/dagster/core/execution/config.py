@@ -1,10 +1,13 @@
-import multiprocessing
 from abc import ABCMeta, abstractmethod, abstractproperty
 from collections import namedtuple
+from enum import Enum
 
 import six
 
 from dagster import check
+from dagster.config.config_type import Enum as ConfigEnum
+from dagster.config.config_type import EnumValue
+from dagster.config.field import Field
 from dagster.core.utils import make_new_run_id
 from dagster.utils import merge_dicts
 
@@ -105,6 +108,43 @@ class RunConfig(
         )
 
 
+class StepPriorityPolicy(Enum):
+    '''How an engine orders steps that are ready to execute at the same time.
+
+    ``TAGS`` orders steps by their priority tag only. ``CRITICAL_PATH`` additionally ranks steps of
+    equal tagged priority by the longest chain of work that remains downstream of them, weighting
+    each step by how long it took in recent runs of the pipeline, so that long-pole chains start as
+    early as possible.
+    '''
+
+    TAGS = 'tags'
+    CRITICAL_PATH = 'critical_path'
+
+
+def step_priority_config_field():
+    return Field(
+        ConfigEnum(
+            'StepPriorityPolicy',
+            [
+                EnumValue(
+                    StepPriorityPolicy.TAGS.value,
+                    description='Order ready steps by their priority tag.',
+                ),
+                EnumValue(
+                    StepPriorityPolicy.CRITICAL_PATH.value,
+                    description=(
+                        'Order ready steps by their priority tag, then by the longest remaining '
+                        'downstream path, weighted by step durations from recent runs.'
+                    ),
+                ),
+            ],
+        ),
+        is_required=False,
+        default_value=StepPriorityPolicy.TAGS.value,
+        description='How to order steps that are ready to execute at the same time.',
+    )
+
+
 class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     @abstractmethod
     def get_engine(self):
@@ -121,13 +161,56 @@ class InProcessExecutorConfig(ExecutorConfig):
         return InProcessEngine
 
 
+class ThreadedExecutorConfig(ExecutorConfig):
+    def __init__(self, max_concurrent=None, step_priority=None):
+        import multiprocessing
+
+        # as for concurrent.futures.ThreadPoolExecutor: the steps this is meant for spend most of
+        # their time waiting on I/O, so allow a few more threads than there are CPUs
+        max_concurrent = (
+            max_concurrent if max_concurrent else min(32, multiprocessing.cpu_count() + 4)
+        )
+        self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.step_priority = StepPriorityPolicy(
+            check.opt_str_param(step_priority, 'step_priority', StepPriorityPolicy.TAGS.value)
+        )
+
+    def get_engine(self):
+        from dagster.core.engine.engine_threaded import ThreadedEngine
+
+        return ThreadedEngine
+
+
+# Number of steps the asyncio executor awaits at once by default
+DEFAULT_ASYNCIO_MAX_CONCURRENT = 100
+
+
+class AsyncioExecutorConfig(ExecutorConfig):
+    def __init__(self, max_concurrent=None, step_priority=None):
+        max_concurrent = max_concurrent if max_concurrent else DEFAULT_ASYNCIO_MAX_CONCURRENT
+        self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.step_priority = StepPriorityPolicy(
+            check.opt_str_param(step_priority, 'step_priority', StepPriorityPolicy.TAGS.value)
+        )
+
+    def get_engine(self):
+        from dagster.core.engine.engine_asyncio import AsyncioEngine
+
+        return AsyncioEngine
+
+
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    def __init__(self, handle, max_concurrent=None, step_priority=None):
+        import multiprocessing
+
         from dagster import ExecutionTargetHandle
 
         self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle,)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.step_priority = StepPriorityPolicy(
+            check.opt_str_param(step_priority, 'step_priority', StepPriorityPolicy.TAGS.value)
+        )
 
     def load_pipeline(self, pipeline_run):
         from dagster.core.storage.pipeline_run import PipelineRun
@@ -105,7 +105,10 @@ class SystemPipelineExecutionContext(object):
         return SystemStepExecutionContext(
             self._pipeline_context_data,
             DagsterLogManager(
-                self.run_id, merge_dicts(self.logging_tags, step.logging_tags), self.log.loggers
+                self.run_id,
+                merge_dicts(self.logging_tags, step.logging_tags),
+                self.log.loggers,
+                self.log.dispatcher,
             ),
             step,
         )
@@ -208,6 +211,9 @@ class SystemStepExecutionContext(SystemPipelineExecutionContext):
     def for_compute(self):
         return SystemComputeExecutionContext(self._pipeline_context_data, self.log, self.step)
 
+    def for_input(self, input_name):
+        return SystemStepInputContext(self._pipeline_context_data, self.log, self.step, input_name)
+
     @property
     def step(self):
         return self._step
@@ -237,6 +243,21 @@ class SystemStepExecutionContext(SystemPipelineExecutionContext):
         return self._log_manager
 
 
+class SystemStepInputContext(SystemStepExecutionContext):
+    '''The context in which the value of one of a step's inputs is loaded, e.g. by a type storage
+    plugin.'''
+
+    __slots__ = ['_input_name']
+
+    def __init__(self, pipeline_context_data, log_manager, step, input_name):
+        super(SystemStepInputContext, self).__init__(pipeline_context_data, log_manager, step)
+        self._input_name = check.str_param(input_name, 'input_name')
+
+    @property
+    def input_name(self):
+        return self._input_name
+
+
 class SystemComputeExecutionContext(SystemStepExecutionContext):
     '''The ``context`` object available to solid compute logic.
 
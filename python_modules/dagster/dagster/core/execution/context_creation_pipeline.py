@@ -21,6 +21,7 @@ from dagster.core.execution.config import ExecutorConfig
 from dagster.core.execution.plan.objects import StepInputSourceType
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
+from dagster.core.log_dispatch import BackgroundLogDispatcher
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.init import InitSystemStorageContext
 from dagster.core.storage.pipeline_run import PipelineRun
@@ -205,6 +206,7 @@ def scoped_pipeline_context(
 
     # After this try block, a Dagster exception thrown will result in a pipeline init failure event.
     pipeline_context = None
+    log_manager = None
     try:
         executor_config = create_executor_config(context_creation_data)
 
@@ -257,6 +259,10 @@ def scoped_pipeline_context(
         else:
             raise dagster_error
 
+    finally:
+        if log_manager:
+            log_manager.close()
+
 
 def create_system_storage_data(
     context_creation_data, system_storage_data, scoped_resources_builder
@@ -450,10 +456,15 @@ def create_log_manager(context_creation_data):
     # should this be first in loggers list?
     loggers.append(context_creation_data.instance.get_logger())
 
+    log_dispatch_settings = context_creation_data.instance.log_dispatch_settings
+
     return DagsterLogManager(
         run_id=pipeline_run.run_id,
         logging_tags=get_logging_tags(pipeline_run, context_creation_data.pipeline_def),
         loggers=loggers,
+        dispatcher=BackgroundLogDispatcher(log_dispatch_settings).start()
+        if log_dispatch_settings
+        else None,
     )
 
 
@@ -1,6 +1,7 @@
 from dagster import check
 from dagster.core.definitions import ExpectationResult, Materialization, Output, Solid, SolidHandle
 from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.async_compute import AwaitRequest
 from dagster.core.execution.context.compute import ComputeExecutionContext
 from dagster.core.execution.context.system import SystemComputeExecutionContext
 
@@ -62,7 +63,7 @@ def _yield_compute_results(compute_context, inputs, compute_fn):
         return
 
     for event in user_event_sequence:
-        if isinstance(event, (Output, Materialization, ExpectationResult)):
+        if isinstance(event, (Output, Materialization, ExpectationResult, AwaitRequest)):
             yield event
         else:
             raise DagsterInvariantViolationError(
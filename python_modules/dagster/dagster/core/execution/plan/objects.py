@@ -1,17 +1,20 @@
 from collections import namedtuple
 from enum import Enum
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.definitions import Materialization, SolidHandle
 from dagster.core.definitions.events import EventMetadataEntry
 from dagster.core.serdes import whitelist_for_serdes
 from dagster.core.types.dagster_type import DagsterType
-from dagster.utils import frozentags, merge_dicts
+from dagster.seven import intern_string
+from dagster.utils import frozendict, frozentags, merge_dicts
 from dagster.utils.error import SerializableErrorInfo
 
 
 @whitelist_for_serdes
 class StepOutputHandle(namedtuple('_StepOutputHandle', 'step_key output_name')):
+    __slots__ = ()
+
     @staticmethod
     def from_step(step, output_name='result'):
         check.inst_param(step, 'step', ExecutionStep)
@@ -21,13 +24,15 @@ class StepOutputHandle(namedtuple('_StepOutputHandle', 'step_key output_name')):
     def __new__(cls, step_key, output_name='result'):
         return super(StepOutputHandle, cls).__new__(
             cls,
-            step_key=check.str_param(step_key, 'step_key'),
-            output_name=check.str_param(output_name, 'output_name'),
+            step_key=intern_string(check.str_param(step_key, 'step_key')),
+            output_name=intern_string(check.str_param(output_name, 'output_name')),
         )
 
 
 @whitelist_for_serdes
 class StepInputData(namedtuple('_StepInputData', 'input_name type_check_data')):
+    __slots__ = ()
+
     def __new__(cls, input_name, type_check_data):
         return super(StepInputData, cls).__new__(
             cls,
@@ -38,6 +43,8 @@ class StepInputData(namedtuple('_StepInputData', 'input_name type_check_data')):
 
 @whitelist_for_serdes
 class TypeCheckData(namedtuple('_TypeCheckData', 'success label description metadata_entries')):
+    __slots__ = ()
+
     def __new__(cls, success, label, description=None, metadata_entries=None):
         return super(TypeCheckData, cls).__new__(
             cls,
@@ -52,6 +59,8 @@ class TypeCheckData(namedtuple('_TypeCheckData', 'success label description meta
 
 @whitelist_for_serdes
 class UserFailureData(namedtuple('_UserFailureData', 'label description metadata_entries')):
+    __slots__ = ()
+
     def __new__(cls, label, description=None, metadata_entries=None):
         return super(UserFailureData, cls).__new__(
             cls,
@@ -67,6 +76,8 @@ class UserFailureData(namedtuple('_UserFailureData', 'label description metadata
 class StepOutputData(
     namedtuple('_StepOutputData', 'step_output_handle intermediate_materialization type_check_data')
 ):
+    __slots__ = ()
+
     def __new__(cls, step_output_handle, intermediate_materialization=None, type_check_data=None):
         return super(StepOutputData, cls).__new__(
             cls,
@@ -85,22 +96,39 @@ class StepOutputData(
 
 
 @whitelist_for_serdes
-class StepFailureData(namedtuple('_StepFailureData', 'error user_failure_data')):
-    def __new__(cls, error, user_failure_data):
+class StepFailureData(
+    namedtuple('_StepFailureData', 'error user_failure_data duration_ms peak_rss_bytes')
+):
+    __slots__ = ()
+
+    # serdes log
+    # * added optional duration_ms and peak_rss_bytes
+    #
+    def __new__(cls, error, user_failure_data, duration_ms=None, peak_rss_bytes=None):
         return super(StepFailureData, cls).__new__(
             cls,
             error=check.opt_inst_param(error, 'error', SerializableErrorInfo),
             user_failure_data=check.opt_inst_param(
                 user_failure_data, 'user_failure_data', UserFailureData
             ),
+            duration_ms=check.opt_float_param(duration_ms, 'duration_ms'),
+            peak_rss_bytes=check.opt_int_param(peak_rss_bytes, 'peak_rss_bytes'),
         )
 
 
 @whitelist_for_serdes
-class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms')):
-    def __new__(cls, duration_ms):
+class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms output_bytes peak_rss_bytes')):
+    __slots__ = ()
+
+    # serdes log
+    # * added optional output_bytes and peak_rss_bytes
+    #
+    def __new__(cls, duration_ms, output_bytes=None, peak_rss_bytes=None):
         return super(StepSuccessData, cls).__new__(
-            cls, duration_ms=check.float_param(duration_ms, 'duration_ms')
+            cls,
+            duration_ms=check.float_param(duration_ms, 'duration_ms'),
+            output_bytes=check.opt_int_param(output_bytes, 'output_bytes'),
+            peak_rss_bytes=check.opt_int_param(peak_rss_bytes, 'peak_rss_bytes'),
         )
 
 
@@ -117,6 +145,8 @@ class StepInputSourceType(Enum):
 class StepInput(
     namedtuple('_StepInput', 'name runtime_type source_type source_handles config_data')
 ):
+    __slots__ = ()
+
     def __new__(cls, name, runtime_type, source_type, source_handles=None, config_data=None):
         return super(StepInput, cls).__new__(
             cls,
@@ -150,6 +180,8 @@ class StepInput(
 
 
 class StepOutput(namedtuple('_StepOutput', 'name runtime_type optional should_materialize')):
+    __slots__ = ()
+
     def __new__(cls, name, runtime_type, optional, should_materialize):
         return super(StepOutput, cls).__new__(
             cls,
@@ -164,11 +196,13 @@ class ExecutionStep(
     namedtuple(
         '_ExecutionStep',
         (
-            'pipeline_name key_suffix step_inputs step_input_dict step_outputs step_output_dict '
-            'compute_fn kind solid_handle logging_tags tags'
+            'pipeline_name key_suffix key step_inputs step_input_dict step_outputs '
+            'step_output_dict compute_fn kind solid_handle logging_tags tags'
         ),
     )
 ):
+    __slots__ = ()
+
     def __new__(
         cls,
         pipeline_name,
@@ -181,33 +215,39 @@ class ExecutionStep(
         logging_tags=None,
         tags=None,
     ):
+        check.inst_param(solid_handle, 'solid_handle', SolidHandle)
+        check.str_param(key_suffix, 'key_suffix')
+
+        # the key is computed once, rather than on every access, and interned, so that the step,
+        # its logging tags, and the handles and events that refer to it all share the one string
+        key = intern_string(solid_handle.to_string() + '.' + key_suffix)
+
         return super(ExecutionStep, cls).__new__(
             cls,
-            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
-            key_suffix=check.str_param(key_suffix, 'key_suffix'),
+            pipeline_name=intern_string(check.str_param(pipeline_name, 'pipeline_name')),
+            key_suffix=key_suffix,
+            key=key,
             step_inputs=check.list_param(step_inputs, 'step_inputs', of_type=StepInput),
             step_input_dict={si.name: si for si in step_inputs},
             step_outputs=check.list_param(step_outputs, 'step_outputs', of_type=StepOutput),
             step_output_dict={so.name: so for so in step_outputs},
             compute_fn=check.callable_param(compute_fn, 'compute_fn'),
             kind=check.inst_param(kind, 'kind', StepKind),
-            solid_handle=check.inst_param(solid_handle, 'solid_handle', SolidHandle),
-            logging_tags=merge_dicts(
-                {
-                    'step_key': str(solid_handle) + '.' + key_suffix,
-                    'pipeline': pipeline_name,
-                    'solid': solid_handle.name,
-                    'solid_definition': solid_handle.definition_name,
-                },
-                check.opt_dict_param(logging_tags, 'logging_tags'),
+            solid_handle=solid_handle,
+            logging_tags=frozendict(
+                merge_dicts(
+                    {
+                        'step_key': key,
+                        'pipeline': pipeline_name,
+                        'solid': solid_handle.name,
+                        'solid_definition': solid_handle.definition_name,
+                    },
+                    check.opt_dict_param(logging_tags, 'logging_tags'),
+                )
             ),
             tags=check.opt_inst_param(tags, 'tags', frozentags),
         )
 
-    @property
-    def key(self):
-        return str(self.solid_handle) + '.' + self.key_suffix
-
     @property
     def solid_name(self):
         return self.solid_handle.name
@@ -1,6 +1,7 @@
-from collections import OrderedDict, namedtuple
+import heapq
+from collections import OrderedDict, defaultdict, namedtuple
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.definitions import (
     CompositeSolidDefinition,
     InputDefinition,
@@ -329,6 +330,7 @@ class ExecutionPlan(
 
     def execution_deps(self):
         deps = OrderedDict()
+        step_keys_to_execute = set(self.step_keys_to_execute)
 
         for key in self.step_keys_to_execute:
             deps[key] = set()
@@ -336,9 +338,7 @@ class ExecutionPlan(
         for key in self.step_keys_to_execute:
             step = self.step_dict[key]
             for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
+                deps[key].update(step_input.dependency_keys.intersection(step_keys_to_execute))
         return deps
 
     def build_subset_plan(self, step_keys_to_execute):
@@ -380,11 +380,32 @@ def _default_sort_key(step):
 
 
 class ActiveExecution(object):
+    '''The state of an in-progress execution of an ExecutionPlan.
+
+    Each pending step keeps a count of its dependencies that have not completed yet, and each step
+    the list of steps that depend on it, so that completing a step only touches its direct
+    dependents. Steps whose dependencies all succeeded are kept in a heap ordered by
+    ``sort_key_fn``, ties broken by the order in which they became executable. Steps with a failed
+    or skipped dependency are skipped.
+    '''
+
     def __init__(self, execution_plan, sort_key_fn=None):
         self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
         self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
 
-        self._pending = self._plan.execution_deps()
+        execution_deps = self._plan.execution_deps()
+
+        # step key => number of dependencies that have not yet completed
+        self._pending = {}
+        # step key => keys of the steps that depend on it, in plan order
+        self._dependents = defaultdict(list)
+        # pending steps with at least one failed or skipped dependency
+        self._blocked = set()
+
+        for step_key, requirements in execution_deps.items():
+            self._pending[step_key] = len(requirements)
+            for requirement in requirements:
+                self._dependents[requirement].append(step_key)
 
         self._completed = set()
         self._success = set()
@@ -393,53 +414,48 @@ class ActiveExecution(object):
 
         self._in_flight = set()
 
+        # heap of (sort key, sequence number, step key)
         self._executable = []
+        self._executable_count = 0
         self._to_skip = []
 
-        self._update()
-
-    def _update(self):
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        for step_key, requirements in self._pending.items():
+        for step_key, requirements in execution_deps.items():
+            if not requirements:
+                self._ready(step_key)
 
-            if requirements.issubset(self._completed):
-                if requirements.issubset(self._success):
-                    new_steps_to_execute.append(step_key)
-                else:
-                    new_steps_to_skip.append(step_key)
+    def _ready(self, step_key):
+        del self._pending[step_key]
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        if step_key in self._blocked:
+            self._blocked.remove(step_key)
+            self._to_skip.append(step_key)
+            return
 
-        for key in new_steps_to_skip:
-            self._to_skip.append(key)
-            del self._pending[key]
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self._plan.get_step_by_key(step_key)),
+                self._executable_count,
+                step_key,
+            ),
+        )
+        self._executable_count += 1
 
     def get_steps_to_execute(self, limit=None):
         check.opt_int_param(limit, 'limit')
 
-        steps = sorted(
-            [self._plan.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            self._in_flight.add(step_key)
+            steps.append(self._plan.get_step_by_key(step_key))
 
         return steps
 
     def get_steps_to_skip(self):
-        steps = []
-        steps_to_skip = list(self._to_skip)
-        for key in steps_to_skip:
-            steps.append(self._plan.get_step_by_key(key))
-            self._in_flight.add(key)
-            self._to_skip.remove(key)
+        steps = [self._plan.get_step_by_key(key) for key in self._to_skip]
+        self._in_flight.update(self._to_skip)
+        self._to_skip = []
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -469,17 +485,17 @@ class ActiveExecution(object):
 
     def mark_failed(self, step_key):
         self._failed.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, success=False)
 
     def mark_success(self, step_key):
         self._success.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, success=True)
 
     def mark_skipped(self, step_key):
         self._skipped.add(step_key)
-        self._mark_complete(step_key)
+        self._mark_complete(step_key, success=False)
 
-    def _mark_complete(self, step_key):
+    def _mark_complete(self, step_key, success):
         check.invariant(
             step_key not in self._completed,
             'Attempted to mark step {} as complete that was already completed'.format(step_key),
@@ -492,7 +508,14 @@ class ActiveExecution(object):
         )
         self._in_flight.remove(step_key)
         self._completed.add(step_key)
-        self._update()
+
+        for dependent_key in self._dependents.get(step_key, []):
+            if not success:
+                self._blocked.add(dependent_key)
+
+            self._pending[dependent_key] -= 1
+            if self._pending[dependent_key] == 0:
+                self._ready(dependent_key)
 
     @property
     def is_complete(self):
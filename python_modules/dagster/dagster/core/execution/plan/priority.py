@@ -0,0 +1,223 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.config import StepPriorityPolicy
+from dagster.utils.timing import format_duration
+
+from .plan import ExecutionPlan, _default_sort_key
+
+# Number of recent successful executions of each solid consulted for step durations
+DEFAULT_HISTORY_LIMIT = 20
+
+# Duration assumed for every step when there is no history at all, so that the critical path
+# degenerates to the longest chain of steps
+DEFAULT_STEP_DURATION = 1.0
+
+
+def historical_step_durations(instance, execution_plan, mode=None, limit=DEFAULT_HISTORY_LIMIT):
+    '''Get the median duration of each step in a plan over its solid's recent executions.
+
+    Durations are read from the step metrics recorded in run storage, so only successful
+    executions are counted.
+
+    Args:
+        instance (DagsterInstance): The instance whose run storage to read.
+        execution_plan (ExecutionPlan): The plan whose steps to look up.
+        mode (Optional[str]): If provided, only consider runs in this mode.
+        limit (Optional[int]): The number of most recent executions of each solid to consult.
+
+    Returns:
+        Dict[str, float]: The median duration in seconds, keyed by step key. Steps without history
+            are absent.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.opt_str_param(mode, 'mode')
+    check.int_param(limit, 'limit')
+
+    steps = [execution_plan.get_step_by_key(key) for key in execution_plan.step_keys_to_execute]
+    aggregates = instance.get_step_metrics_aggregates(
+        execution_plan.pipeline_def.name,
+        mode=mode,
+        solid_handles=list({step.solid_handle.to_string() for step in steps}),
+        limit=limit,
+    )
+
+    durations = {}
+    for step in steps:
+        aggregate = aggregates.get(step.solid_handle.to_string())
+        if aggregate and aggregate.duration_ms_p50 is not None:
+            durations[step.key] = aggregate.duration_ms_p50 / 1000
+    return durations
+
+
+class CriticalPathPriority(object):
+    '''Ranks the steps of an execution plan by the longest path of work remaining below them.
+
+    The remaining path of a step is its own estimated duration plus the largest remaining path of
+    the steps that depend on it. Steps without a historical duration are assumed to take the mean
+    duration of the steps that have one.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to rank.
+        step_durations (Optional[Dict[str, float]]): Estimated step durations in seconds, keyed by
+            step key.
+        base_sort_key_fn (Optional[Callable[[ExecutionStep], Any]]): The engine's own sort key,
+            which takes precedence over the critical path. Defaults to the ``dagster/priority`` tag.
+    '''
+
+    def __init__(self, execution_plan, step_durations=None, base_sort_key_fn=None):
+        self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        step_durations = check.opt_dict_param(
+            step_durations, 'step_durations', key_type=str, value_type=float
+        )
+        self._base_sort_key_fn = check.opt_callable_param(
+            base_sort_key_fn, 'base_sort_key_fn', _default_sort_key
+        )
+
+        execution_deps = self._plan.execution_deps()
+
+        known = [step_durations[key] for key in execution_deps if key in step_durations]
+        self._default_duration = sum(known) / len(known) if known else DEFAULT_STEP_DURATION
+        self._missing_history = [key for key in execution_deps if key not in step_durations]
+
+        dependents = defaultdict(list)
+        for step_key, requirements in execution_deps.items():
+            for requirement in requirements:
+                dependents[requirement].append(step_key)
+
+        # step key => estimated duration of the longest path starting at that step
+        self._remaining = {}
+        # step key => the dependent that continues that path
+        self._next_on_path = {}
+        # execution_deps is not in dependency order when steps_to_execute is a subset
+        for step_level in reversed(self._plan.execution_step_levels()):
+            for step in step_level:
+                longest_after = 0.0
+                for dependent_key in dependents[step.key]:
+                    if self._remaining[dependent_key] > longest_after:
+                        longest_after = self._remaining[dependent_key]
+                        self._next_on_path[step.key] = dependent_key
+                self._remaining[step.key] = (
+                    step_durations.get(step.key, self._default_duration) + longest_after
+                )
+
+    @staticmethod
+    def from_history(pipeline_context, execution_plan, base_sort_key_fn=None):
+        '''Build the ranking from the step durations of recent runs of the executing pipeline.'''
+        return CriticalPathPriority(
+            execution_plan,
+            historical_step_durations(
+                pipeline_context.instance, execution_plan, mode=pipeline_context.mode_def.name
+            ),
+            base_sort_key_fn=base_sort_key_fn,
+        )
+
+    def remaining_duration(self, step_key):
+        '''The estimated duration in seconds of the longest path starting at a step.'''
+        check.str_param(step_key, 'step_key')
+        return self._remaining[step_key]
+
+    def sort_key(self, step):
+        return (self._base_sort_key_fn(step), -self._remaining[step.key])
+
+    def critical_path(self):
+        '''The step keys along the longest path through the plan, in execution order.'''
+        if not self._remaining:
+            return []
+
+        step_key = max(self._plan.execution_deps(), key=self._remaining.get)
+        path = [step_key]
+        while step_key in self._next_on_path:
+            step_key = self._next_on_path[step_key]
+            path.append(step_key)
+        return path
+
+    def estimated_duration(self):
+        '''The estimated duration in seconds of the critical path, i.e. of the whole plan given
+        unlimited parallelism.'''
+        critical_path = self.critical_path()
+        return self._remaining[critical_path[0]] if critical_path else 0.0
+
+    def engine_event(self, pipeline_context):
+        critical_path = self.critical_path()
+        estimate = self.estimated_duration()
+
+        return DagsterEvent.engine_event(
+            pipeline_context,
+            'Ordering ready steps by critical path. Estimated duration {estimate} along '
+            '{path}, using median step durations from recent runs; '
+            '{missing_count} step(s) without history were assumed to take {default}.'.format(
+                estimate=format_duration(estimate * 1000),
+                path=' -> '.join(critical_path),
+                missing_count=len(self._missing_history),
+                default=format_duration(self._default_duration * 1000),
+            ),
+            event_specific_data=EngineEventData(
+                metadata_entries=[
+                    EventMetadataEntry.text(' -> '.join(critical_path), 'critical_path'),
+                    EventMetadataEntry.text(
+                        format_duration(estimate * 1000), 'estimated_critical_path_duration'
+                    ),
+                    EventMetadataEntry.json(
+                        {
+                            step_key: round(remaining, 3)
+                            for step_key, remaining in self._remaining.items()
+                        },
+                        'remaining_path_seconds',
+                    ),
+                    EventMetadataEntry.text(str(self._missing_history), 'steps_without_history'),
+                ]
+            ),
+        )
+
+
+def build_step_sort_key_fn(pipeline_context, execution_plan, policy, base_sort_key_fn=None):
+    '''Get the sort key an engine should start its execution plan with under a priority policy.
+
+    Returns:
+        Tuple[Optional[Callable[[ExecutionStep], Any]], List[DagsterEvent]]: The sort key function,
+            or the ``base_sort_key_fn`` under the ``TAGS`` policy, and the engine events explaining
+            the resulting order.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.inst_param(policy, 'policy', StepPriorityPolicy)
+    check.opt_callable_param(base_sort_key_fn, 'base_sort_key_fn')
+
+    if policy != StepPriorityPolicy.CRITICAL_PATH:
+        return base_sort_key_fn, []
+
+    priority = CriticalPathPriority.from_history(
+        pipeline_context, execution_plan, base_sort_key_fn=base_sort_key_fn
+    )
+    return priority.sort_key, [priority.engine_event(pipeline_context)]
+
+
+def estimate_remaining_run_duration(instance, pipeline_run, execution_plan):
+    '''Estimate how much longer an in-progress run will take, in seconds.
+
+    The estimate is the critical path through the steps of the run that have not finished yet,
+    weighted by median historical step durations. Steps that are executing are counted in full.
+
+    Args:
+        instance (DagsterInstance): The instance the run belongs to.
+        pipeline_run (PipelineRun): The run.
+        execution_plan (ExecutionPlan): The run's execution plan.
+
+    Returns:
+        float
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    finished = {
+        step_metrics.step_key for step_metrics in instance.get_step_metrics(pipeline_run.run_id)
+    }
+    remaining = [key for key in execution_plan.step_keys_to_execute if key not in finished]
+    if not remaining:
+        return 0.0
+
+    remaining_plan = execution_plan.build_subset_plan(remaining)
+    return CriticalPathPriority(
+        remaining_plan, historical_step_durations(instance, remaining_plan, mode=pipeline_run.mode)
+    ).estimated_duration()
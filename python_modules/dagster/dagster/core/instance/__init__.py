@@ -5,8 +5,6 @@ from collections import defaultdict, namedtuple
 from enum import Enum
 
 import six
-import yaml
-from rx import Observable
 
 from dagster import check, seven
 from dagster.config import Field, Permissive
@@ -18,7 +16,7 @@ from dagster.core.errors import (
     DagsterRunConflict,
 )
 from dagster.core.serdes import ConfigurableClass, whitelist_for_serdes
-from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.pipeline_run import PipelineRun, StepMetrics
 from dagster.utils.yaml_utils import load_yaml_from_globs
 
 from .config import DAGSTER_CONFIG_YAML_FILENAME
@@ -111,6 +109,11 @@ class DagsterInstance:
             addition to runnning them locally.
         dagit_settings (Optional[Dict]): Specifies certain Dagit-specific, per-instance settings,
             such as feature flags. These are set in the ``dagster.yaml`` under the key ``dagit``.
+        log_dispatch_settings (Optional[Dict]): If set, log messages and events are delivered to
+            loggers and event storage from a background thread with a bounded queue, rather than
+            inline in the thread doing compute. Accepts ``max_queue_size``, ``batch_size`` and
+            ``overflow_policy`` (``block`` or ``drop_debug``). These are set in the
+            ``dagster.yaml`` under the key ``log_dispatch``.
         ref (Optional[InstanceRef]): Used by internal machinery to pass instances across process
             boundaries.
     '''
@@ -128,6 +131,7 @@ class DagsterInstance:
         scheduler=None,
         run_launcher=None,
         dagit_settings=None,
+        log_dispatch_settings=None,
         ref=None,
     ):
         from dagster.core.storage.compute_log_manager import ComputeLogManager
@@ -153,6 +157,9 @@ class DagsterInstance:
         self._scheduler = check.opt_inst_param(scheduler, 'scheduler', Scheduler)
         self._run_launcher = check.opt_inst_param(run_launcher, 'run_launcher', RunLauncher)
         self._dagit_settings = check.opt_dict_param(dagit_settings, 'dagit_settings')
+        self._log_dispatch_settings = check.opt_nullable_dict_param(
+            log_dispatch_settings, 'log_dispatch_settings'
+        )
         self._ref = check.opt_inst_param(ref, 'ref', InstanceRef)
 
         self._subscribers = defaultdict(list)
@@ -218,6 +225,7 @@ class DagsterInstance:
             scheduler=instance_ref.scheduler,
             run_launcher=instance_ref.run_launcher,
             dagit_settings=instance_ref.dagit_settings,
+            log_dispatch_settings=instance_ref.log_dispatch_settings,
             ref=instance_ref,
         )
 
@@ -248,6 +256,8 @@ class DagsterInstance:
         return DagsterInstance._PROCESS_TEMPDIR.name
 
     def info_str(self):
+        import yaml
+
         def _info(component):
             prefix = '     '
             if isinstance(component, ConfigurableClass):
@@ -312,6 +322,14 @@ class DagsterInstance:
             return self._dagit_settings
         return {}
 
+    @property
+    def log_dispatch_settings(self):
+        from dagster.core.log_dispatch import LogDispatchSettings
+
+        if self._log_dispatch_settings is None:
+            return None
+        return LogDispatchSettings.from_config_value(self._log_dispatch_settings)
+
     def upgrade(self, print_fn=lambda _: None):
         print_fn('Updating run storage...')
         self._run_storage.upgrade()
@@ -334,6 +352,17 @@ class DagsterInstance:
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
+    def get_run_partition_data(self, partition_set_name, status=None):
+        return self._run_storage.get_run_partition_data(partition_set_name, status)
+
+    def get_step_metrics(self, run_id):
+        return self._run_storage.get_step_metrics(run_id)
+
+    def get_step_metrics_aggregates(self, pipeline_name, mode=None, solid_handles=None, limit=None):
+        return self._run_storage.get_step_metrics_aggregates(
+            pipeline_name, mode=mode, solid_handles=solid_handles, limit=limit
+        )
+
     def create_empty_run(self, run_id, pipeline_name):
         return self.create_run(PipelineRun.create_empty_run(pipeline_name, run_id))
 
@@ -425,6 +454,15 @@ class DagsterInstance:
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
 
+        if event.is_dagster_event and (
+            event.dagster_event.is_step_success or event.dagster_event.is_step_failure
+        ):
+            pipeline_run = self._run_storage.get_run_by_id(run_id)
+            if pipeline_run:
+                self._run_storage.add_step_metrics(
+                    StepMetrics.from_step_event(pipeline_run, event.dagster_event)
+                )
+
         for sub in self._subscribers[run_id]:
             sub(event)
 
@@ -41,7 +41,23 @@ def define_dagster_config_cls():
         'scheduler': config_field_for_configurable_class(),
         'run_launcher': config_field_for_configurable_class(),
         'dagit': Field(
-            {'execution_manager': Field({'max_concurrent_runs': int}, is_required=False)},
+            {
+                'execution_manager': Field(
+                    {
+                        'max_concurrent_runs': int,
+                        'max_concurrent_runs_per_pipeline': Field(int, is_required=False),
+                    },
+                    is_required=False,
+                )
+            },
+            is_required=False,
+        ),
+        'log_dispatch': Field(
+            {
+                'max_queue_size': Field(int, is_required=False),
+                'batch_size': Field(int, is_required=False),
+                'overflow_policy': Field(str, is_required=False),
+            },
             is_required=False,
         ),
     }
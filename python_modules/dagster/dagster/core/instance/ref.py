@@ -1,8 +1,6 @@
 import os
 from collections import namedtuple
 
-import yaml
-
 from dagster import check
 from dagster.core.serdes import ConfigurableClassData, whitelist_for_serdes
 
@@ -26,6 +24,8 @@ def _schedule_directory(base):
 
 
 def configurable_class_data_or_default(config_value, field_name, default):
+    import yaml
+
     if config_value.get(field_name):
         return ConfigurableClassData(
             config_value[field_name]['module'],
@@ -40,7 +40,8 @@ class InstanceRef(
     namedtuple(
         '_InstanceRef',
         'local_artifact_storage_data run_storage_data event_storage_data compute_logs_data '
-        'schedule_storage_data scheduler_data run_launcher_data dagit_settings',
+        'schedule_storage_data scheduler_data run_launcher_data dagit_settings '
+        'log_dispatch_settings',
     )
 ):
     '''Serializable representation of a :py:class:`DagsterInstance`.
@@ -58,6 +59,7 @@ class InstanceRef(
         scheduler_data,
         run_launcher_data,
         dagit_settings,
+        log_dispatch_settings=None,
     ):
         return super(self, InstanceRef).__new__(
             self,
@@ -83,10 +85,15 @@ class InstanceRef(
                 run_launcher_data, 'run_launcher_data', ConfigurableClassData
             ),
             dagit_settings=check.opt_dict_param(dagit_settings, 'dagit_settings'),
+            log_dispatch_settings=check.opt_nullable_dict_param(
+                log_dispatch_settings, 'log_dispatch_settings'
+            ),
         )
 
     @staticmethod
     def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=None):
+        import yaml
+
         overrides = check.opt_dict_param(overrides, 'overrides')
         config_value = dagster_instance_config(
             base_dir, config_filename=config_filename, overrides=overrides
@@ -154,6 +161,7 @@ class InstanceRef(
             scheduler_data=scheduler_data,
             run_launcher_data=run_launcher_data,
             dagit_settings=config_value.get('dagit'),
+            log_dispatch_settings=config_value.get('log_dispatch'),
         )
 
     @staticmethod
@@ -161,7 +169,7 @@ class InstanceRef(
         def value_for_ref_item(k, v):
             if v is None:
                 return None
-            if k == 'dagit_settings':
+            if k in ('dagit_settings', 'log_dispatch_settings'):
                 return v
             return ConfigurableClassData(*v)
 
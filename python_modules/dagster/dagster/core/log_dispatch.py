@@ -0,0 +1,201 @@
+import logging
+import threading
+from collections import namedtuple
+
+from six.moves import queue
+
+from dagster import check
+
+from .log_manager import DAGSTER_META_KEY
+
+
+class LogDispatchOverflowPolicy(object):
+    '''What the :py:class:`BackgroundLogDispatcher` does when its queue is full.
+
+    ``BLOCK`` makes the logging thread wait for room in the queue. ``DROP_DEBUG`` discards plain
+    ``DEBUG`` messages instead of waiting; records carrying a Dagster event are never dropped, since
+    the event log (and everything built on top of it) depends on them.
+    '''
+
+    BLOCK = 'block'
+    DROP_DEBUG = 'drop_debug'
+
+    ALL = (BLOCK, DROP_DEBUG)
+
+
+DEFAULT_LOG_DISPATCH_QUEUE_SIZE = 10000
+DEFAULT_LOG_DISPATCH_BATCH_SIZE = 100
+
+
+class LogDispatchSettings(
+    namedtuple('_LogDispatchSettings', 'max_queue_size batch_size overflow_policy')
+):
+    '''Settings for background log delivery, as set under ``log_dispatch`` in ``dagster.yaml``.'''
+
+    def __new__(cls, max_queue_size=None, batch_size=None, overflow_policy=None):
+        overflow_policy = check.opt_str_param(
+            overflow_policy, 'overflow_policy', LogDispatchOverflowPolicy.BLOCK
+        )
+        check.param_invariant(
+            overflow_policy in LogDispatchOverflowPolicy.ALL,
+            'overflow_policy',
+            'Expected one of {policies}, got {policy}'.format(
+                policies=', '.join(LogDispatchOverflowPolicy.ALL), policy=overflow_policy
+            ),
+        )
+        return super(LogDispatchSettings, cls).__new__(
+            cls,
+            max_queue_size=DEFAULT_LOG_DISPATCH_QUEUE_SIZE
+            if max_queue_size is None
+            else check.int_param(max_queue_size, 'max_queue_size'),
+            batch_size=DEFAULT_LOG_DISPATCH_BATCH_SIZE
+            if batch_size is None
+            else check.int_param(batch_size, 'batch_size'),
+            overflow_policy=overflow_policy,
+        )
+
+    @staticmethod
+    def from_config_value(config_value):
+        return LogDispatchSettings(**check.dict_param(config_value, 'config_value', key_type=str))
+
+
+_STOP = object()
+
+
+def _is_droppable(record):
+    if record.levelno > logging.DEBUG:
+        return False
+    meta = getattr(record, DAGSTER_META_KEY, None)
+    return not (meta and meta.get('dagster_event'))
+
+
+class BackgroundLogDispatcher(object):
+    '''Delivers log records to loggers from a single background thread.
+
+    The :py:class:`DagsterLogManager` builds each ``LogRecord`` on the calling thread (so that
+    timestamps and thread information are those of the original call) and hands it off here, so
+    that slow handlers -- event log storage, remote sinks -- do not stall user compute. Records are
+    delivered in the order they were dispatched.
+
+    Callers must :py:meth:`flush` at the points where they need everything logged so far to have
+    reached the handlers, e.g. at step and pipeline boundaries. Once stopped, or before it has been
+    started, the dispatcher delivers records synchronously.
+    '''
+
+    def __init__(self, settings=None):
+        self._settings = check.opt_inst_param(
+            settings, 'settings', LogDispatchSettings, LogDispatchSettings()
+        )
+        self._queue = queue.Queue(maxsize=self._settings.max_queue_size)
+        self._thread = None
+        self._dropped_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self):
+        return self._settings
+
+    @property
+    def is_running(self):
+        return self._thread is not None
+
+    @property
+    def dropped_count(self):
+        return self._dropped_count
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return self
+
+            self._thread = threading.Thread(
+                target=self._run, name='dagster-log-dispatcher-{}'.format(id(self))
+            )
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def dispatch(self, logger, record, format_message=None):
+        '''Hand a record off for delivery to a logger.
+
+        Args:
+            logger (logging.Logger): The logger whose handlers should receive the record.
+            record (logging.LogRecord): The record to deliver.
+            format_message (Optional[Callable[[], str]]): If set, called on the background thread
+                to render the record's message just before delivery.
+        '''
+        check.inst_param(logger, 'logger', logging.Logger)
+        check.inst_param(record, 'record', logging.LogRecord)
+        check.opt_callable_param(format_message, 'format_message')
+
+        item = (logger, record, format_message)
+
+        if not self.is_running:
+            self._deliver(*item)
+            return
+
+        if (
+            self._settings.overflow_policy == LogDispatchOverflowPolicy.DROP_DEBUG
+            and _is_droppable(record)
+        ):
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._dropped_count += 1
+            return
+
+        self._queue.put(item)
+
+    def flush(self):
+        '''Block until every record dispatched so far has been delivered.'''
+        if self.is_running:
+            self._queue.join()
+
+    def stop(self):
+        '''Deliver any outstanding records and shut down the background thread.'''
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+            thread.join()
+            self._thread = None
+
+        if self._dropped_count:
+            logging.getLogger('dagster').warning(
+                'Dropped {count} debug log messages because the log dispatch queue was full.'.format(
+                    count=self._dropped_count
+                )
+            )
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._settings.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                else:
+                    try:
+                        self._deliver(*item)
+                    except Exception:  # pylint: disable=broad-except
+                        # there is no caller to raise to from here, so report the failure and
+                        # keep going
+                        logging.exception(
+                            'Error delivering log record from the background log dispatcher'
+                        )
+                self._queue.task_done()
+
+            if stop:
+                return
+
+    def _deliver(self, logger, record, format_message):
+        if format_message:
+            record.msg = format_message()
+        logger.handle(record)
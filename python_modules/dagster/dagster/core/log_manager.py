@@ -1,9 +1,11 @@
 import datetime
 import itertools
 import logging
+import os
 from collections import OrderedDict, namedtuple
 
-from dagster import check, seven
+from dagster import seven
+from dagster.check import internal as check
 from dagster.core.utils import make_new_run_id
 from dagster.utils import frozendict
 
@@ -90,6 +92,51 @@ def construct_log_string(synth_props, logging_tags, message_props):
     return prefix + log_props_str + stack
 
 
+class _DeferredLogString(object):
+    '''Renders the full key-value log string on first use, and only once for all loggers.'''
+
+    __slots__ = ['_args', '_message']
+
+    def __init__(self, synth_props, logging_tags, message_props):
+        self._args = (synth_props, logging_tags, message_props)
+        self._message = None
+
+    def __call__(self):
+        if self._message is None:
+            self._message = construct_log_string(*self._args)
+            self._args = None
+        return self._message
+
+
+class _LogMessageIdGenerator(object):
+    '''Cheap, monotonic log message ids: a per-process uuid prefix and a counter.
+
+    Generating a uuid4 per message is comparatively expensive; the prefix is regenerated in
+    forked child processes so that ids stay unique across the processes of a run.
+    '''
+
+    def __init__(self):
+        self._pid = None
+        self._prefix = None
+        self._counter = None
+
+    def __call__(self):
+        pid = os.getpid()
+        if pid != self._pid:
+            self._prefix = make_new_run_id()
+            self._counter = itertools.count()
+            self._pid = pid
+
+        return '{prefix}-{count}'.format(prefix=self._prefix, count=next(self._counter))
+
+
+_make_log_message_id = _LogMessageIdGenerator()
+
+_RESERVED_MESSAGE_PROPS = frozenset(
+    ['extra', 'exc_info', 'orig_message', 'message', 'log_message_id', 'log_timestamp']
+)
+
+
 def coerce_valid_log_level(log_level):
     '''Convert a log level into an integer for consumption by the low-level Python logging API.'''
     if isinstance(log_level, int):
@@ -108,7 +155,7 @@ def coerce_valid_log_level(log_level):
     return PYTHON_LOGGING_LEVELS_MAPPING[log_level]
 
 
-class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags loggers')):
+class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags loggers dispatcher')):
     '''Centralized dispatch for logging from user code.
 
     Handles the construction of uniform structured log messages and passes them through to the
@@ -128,50 +175,51 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
 
     User-defined custom log levels are not supported, and calls to, e.g.,
     ``context.log.trace`` or ``context.log.notice`` will result in hard exceptions **at runtime**.
+
+    If the instance is configured with ``log_dispatch`` settings, records are handed off to a
+    :py:class:`~dagster.core.log_dispatch.BackgroundLogDispatcher` rather than delivered to the
+    loggers inline; the execution machinery calls :py:meth:`flush` at step and pipeline boundaries.
     '''
 
-    def __new__(cls, run_id, logging_tags, loggers):
+    def __new__(cls, run_id, logging_tags, loggers, dispatcher=None):
+        from dagster.core.log_dispatch import BackgroundLogDispatcher
+
         return super(DagsterLogManager, cls).__new__(
             cls,
             run_id=check.str_param(run_id, 'run_id'),
             logging_tags=check.dict_param(logging_tags, 'logging_tags'),
             loggers=check.list_param(loggers, 'loggers', of_type=logging.Logger),
+            dispatcher=check.opt_inst_param(dispatcher, 'dispatcher', BackgroundLogDispatcher),
         )
 
     def _prepare_message(self, orig_message, message_props):
-        check.str_param(orig_message, 'orig_message')
-        check.dict_param(message_props, 'message_props')
-
-        # These are todos to further align with the Python logging API
-        check.invariant(
-            'extra' not in message_props, 'do not allow until explicit support is handled'
-        )
-        check.invariant(
-            'exc_info' not in message_props, 'do not allow until explicit support is handled'
-        )
-
-        # Reserved keys in the message_props -- these are system generated.
-        check.invariant('orig_message' not in message_props, 'orig_message reserved value')
-        check.invariant('message' not in message_props, 'message reserved value')
-        check.invariant('log_message_id' not in message_props, 'log_message_id reserved value')
-        check.invariant('log_timestamp' not in message_props, 'log_timestamp reserved value')
-
-        log_message_id = make_new_run_id()
-
-        log_timestamp = datetime.datetime.utcnow().isoformat()
+        if not _RESERVED_MESSAGE_PROPS.isdisjoint(message_props):
+            # These are todos to further align with the Python logging API
+            check.invariant(
+                'extra' not in message_props, 'do not allow until explicit support is handled'
+            )
+            check.invariant(
+                'exc_info' not in message_props, 'do not allow until explicit support is handled'
+            )
+
+            # Reserved keys in the message_props -- these are system generated.
+            check.invariant('orig_message' not in message_props, 'orig_message reserved value')
+            check.invariant('message' not in message_props, 'message reserved value')
+            check.invariant('log_message_id' not in message_props, 'log_message_id reserved value')
+            check.invariant('log_timestamp' not in message_props, 'log_timestamp reserved value')
 
         synth_props = {
             'orig_message': orig_message,
-            'log_message_id': log_message_id,
-            'log_timestamp': log_timestamp,
+            'log_message_id': _make_log_message_id(),
+            'log_timestamp': datetime.datetime.utcnow().isoformat(),
             'run_id': self.run_id,
         }
 
         # We first generate all props for the purpose of producing the semi-structured
         # log message via _kv_messsage
-        all_props = dict(
-            itertools.chain(synth_props.items(), self.logging_tags.items(), message_props.items())
-        )
+        all_props = dict(synth_props)
+        all_props.update(self.logging_tags)
+        all_props.update(message_props)
 
         # So here we use the arbitrary key DAGSTER_META_KEY to store a dictionary of
         # all the meta information that dagster injects into log message.
@@ -182,7 +230,7 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
         # See __init__.py:363 (makeLogRecord) in the python 3.6 logging module source
         # for the gory details.
         return (
-            construct_log_string(synth_props, self.logging_tags, message_props),
+            _DeferredLogString(synth_props, self.logging_tags, message_props),
             {DAGSTER_META_KEY: all_props},
         )
 
@@ -200,11 +248,55 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
 
         level = coerce_valid_log_level(level)
 
-        message, extra = self._prepare_message(orig_message, message_props)
+        # filter on level before doing any of the work of preparing the message
+        loggers = [logger_ for logger_ in self.loggers if logger_.isEnabledFor(level)]
+        if not loggers:
+            return
 
-        for logger_ in self.loggers:
+        deferred_message, extra = self._prepare_message(orig_message, message_props)
+
+        if self.dispatcher:
+            for logger_ in loggers:
+                # build the record here so it carries the time and thread of the original call,
+                # but leave rendering the message to the dispatcher
+                self.dispatcher.dispatch(
+                    logger_,
+                    logger_.makeRecord(
+                        logger_.name, level, '(unknown file)', 0, None, (), None, extra=extra
+                    ),
+                    format_message=deferred_message,
+                )
+            return
+
+        message = deferred_message()
+        for logger_ in loggers:
             logger_.log(level, message, extra=extra)
 
+    def flush(self):
+        '''Block until every message logged so far has been delivered to the underlying loggers,
+        and flush their handlers, so that handlers that buffer records (e.g., to ship them to a
+        remote service in batches) can do so at step and pipeline boundaries.
+        '''
+        if self.dispatcher:
+            self.dispatcher.flush()
+
+        for logger_ in self.loggers:
+            for handler in logger_.handlers:
+                handler.flush()
+
+    def close(self):
+        '''Deliver every message logged so far, and close the handlers of the underlying loggers,
+        e.g. to stop the background threads of handlers that ship records remotely, once the run the
+        loggers were created for is over.
+        '''
+        if self.dispatcher:
+            self.dispatcher.stop()
+
+        for logger_ in self.loggers:
+            for handler in logger_.handlers:
+                handler.flush()
+                handler.close()
+
     def log(self, level, msg, **kwargs):
         '''Invoke the underlying loggers for a given integer log level.
 
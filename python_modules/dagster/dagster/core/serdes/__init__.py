@@ -19,7 +19,6 @@ from collections import namedtuple
 from enum import Enum
 
 import six
-import yaml
 
 from dagster import check, seven
 
@@ -196,6 +195,8 @@ class ConfigurableClassData(
                 ConfigurableClass,
             )
 
+        import yaml
+
         config_dict = yaml.safe_load(self.config_yaml)
         result = process_config(resolve_to_config_type(klass.config_type()), config_dict)
         if not result.success:
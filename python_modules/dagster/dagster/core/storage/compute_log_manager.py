@@ -4,7 +4,6 @@ from collections import namedtuple
 from enum import Enum
 
 import six
-from rx import Observable
 
 from dagster import check
 
@@ -155,6 +154,10 @@ class ComputeLogManager(six.with_metaclass(ABCMeta)):
 
         subscription = ComputeLogSubscription(self, run_id, step_key, io_type, cursor)
         self.on_subscribe(subscription)
+        # rx is only needed by dagit, so it is imported here rather than by every process that
+        # creates an instance
+        from rx import Observable
+
         return Observable.create(subscription)  # pylint: disable=E1101
 
 
@@ -2,7 +2,7 @@ from collections import defaultdict
 
 import gevent.lock
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.events.log import EventRecord
 
 from .base import EventLogSequence, EventLogStorage
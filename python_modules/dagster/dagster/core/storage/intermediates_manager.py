@@ -23,6 +23,10 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def has_intermediate(self, context, step_output_handle):
         pass
 
+    @abstractmethod
+    def rm_intermediate(self, context, step_output_handle):
+        pass
+
     @abstractmethod
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         pass
@@ -75,6 +79,11 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return step_output_handle in self.values
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        self.values.pop(step_output_handle, None)
+
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
@@ -126,6 +135,12 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
 
         return self._intermediate_store.has_object(context, self._get_paths(step_output_handle))
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.rm_object(context, self._get_paths(step_output_handle))
+
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         return self._intermediate_store.copy_object_from_prev_run(
             context, previous_run_id, self._get_paths(step_output_handle)
@@ -96,6 +96,7 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             obj=obj,
             serialization_strategy_name=serialization_strategy.name,
             object_store_name=self.name,
+            size_bytes=os.path.getsize(key),
         )
 
     def get_object(self, key, serialization_strategy=DEFAULT_SERIALIZATION_STRATEGY):
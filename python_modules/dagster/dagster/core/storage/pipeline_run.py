@@ -1,3 +1,4 @@
+import math
 from collections import namedtuple
 from enum import Enum
 
@@ -9,6 +10,7 @@ from dagster.core.serdes import whitelist_for_serdes
 @whitelist_for_serdes
 class PipelineRunStatus(Enum):
     NOT_STARTED = 'NOT_STARTED'
+    QUEUED = 'QUEUED'
     MANAGED = 'MANAGED'
     STARTED = 'STARTED'
     SUCCESS = 'SUCCESS'
@@ -133,3 +135,161 @@ class PipelineRun(
     @property
     def is_finished(self):
         return self.status == PipelineRunStatus.SUCCESS or self.status == PipelineRunStatus.FAILURE
+
+
+class RunPartitionData(namedtuple('_RunPartitionData', 'partition run_id status')):
+    '''The most recent run launched for a single partition of a partition set, as returned in bulk
+    by :py:meth:`RunStorage.get_run_partition_data`.'''
+
+    def __new__(cls, partition, run_id, status):
+        return super(RunPartitionData, cls).__new__(
+            cls,
+            partition=check.str_param(partition, 'partition'),
+            run_id=check.str_param(run_id, 'run_id'),
+            status=check.inst_param(status, 'status', PipelineRunStatus),
+        )
+
+
+class StepMetrics(
+    namedtuple(
+        '_StepMetrics',
+        'run_id pipeline_name mode solid_handle step_key success duration_ms output_bytes '
+        'peak_rss_bytes',
+    )
+):
+    '''Resource usage of a single step execution, as recorded in a :py:class:`RunStorage` when the
+    step succeeds or fails.
+
+    Args:
+        run_id (str): The id of the run the step executed in.
+        pipeline_name (str): The name of the pipeline.
+        mode (str): The mode the run executed in.
+        solid_handle (str): The handle of the solid the step belongs to.
+        step_key (str): The key of the step.
+        success (bool): Whether the step succeeded.
+        duration_ms (Optional[float]): How long the step took; for successful steps, the time spent
+            in the solid's compute function.
+        output_bytes (Optional[int]): The total size of the intermediates the step wrote, if the
+            object store reported it.
+        peak_rss_bytes (Optional[int]): The peak resident set size of the process that executed
+            the step, where available.
+    '''
+
+    def __new__(
+        cls,
+        run_id,
+        pipeline_name,
+        mode,
+        solid_handle,
+        step_key,
+        success,
+        duration_ms=None,
+        output_bytes=None,
+        peak_rss_bytes=None,
+    ):
+        return super(StepMetrics, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, 'run_id'),
+            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
+            mode=check.str_param(mode, 'mode'),
+            solid_handle=check.str_param(solid_handle, 'solid_handle'),
+            step_key=check.str_param(step_key, 'step_key'),
+            success=check.bool_param(success, 'success'),
+            duration_ms=check.opt_float_param(duration_ms, 'duration_ms'),
+            output_bytes=check.opt_int_param(output_bytes, 'output_bytes'),
+            peak_rss_bytes=check.opt_int_param(peak_rss_bytes, 'peak_rss_bytes'),
+        )
+
+    @staticmethod
+    def from_step_event(pipeline_run, dagster_event):
+        '''Build the metrics for a STEP_SUCCESS or STEP_FAILURE event.'''
+        from dagster.core.events import DagsterEvent
+
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        check.inst_param(dagster_event, 'dagster_event', DagsterEvent)
+        check.param_invariant(
+            dagster_event.is_step_success or dagster_event.is_step_failure, 'dagster_event'
+        )
+
+        if dagster_event.is_step_success:
+            data = dagster_event.step_success_data
+            output_bytes = data.output_bytes
+        else:
+            data = dagster_event.step_failure_data
+            output_bytes = None
+
+        return StepMetrics(
+            run_id=pipeline_run.run_id,
+            pipeline_name=pipeline_run.pipeline_name,
+            mode=pipeline_run.mode,
+            solid_handle=dagster_event.solid_handle.to_string(),
+            step_key=dagster_event.step_key,
+            success=dagster_event.is_step_success,
+            duration_ms=data.duration_ms,
+            output_bytes=output_bytes,
+            peak_rss_bytes=data.peak_rss_bytes,
+        )
+
+
+def _percentile(values, percentile):
+    # nearest-rank percentile of the values that were recorded
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None
+    rank = int(math.ceil(percentile / 100.0 * len(values)))
+    return values[max(rank, 1) - 1]
+
+
+class StepMetricsAggregate(
+    namedtuple(
+        '_StepMetricsAggregate',
+        'solid_handle count duration_ms_p50 duration_ms_p95 output_bytes_p50 output_bytes_p95 '
+        'peak_rss_bytes_p50 peak_rss_bytes_p95',
+    )
+):
+    '''Percentiles of the metrics recorded for the successful executions of a solid, as returned
+    by :py:meth:`RunStorage.get_step_metrics_aggregates`. Percentiles are ``None`` when no
+    execution recorded the metric.'''
+
+    def __new__(
+        cls,
+        solid_handle,
+        count,
+        duration_ms_p50=None,
+        duration_ms_p95=None,
+        output_bytes_p50=None,
+        output_bytes_p95=None,
+        peak_rss_bytes_p50=None,
+        peak_rss_bytes_p95=None,
+    ):
+        return super(StepMetricsAggregate, cls).__new__(
+            cls,
+            solid_handle=check.str_param(solid_handle, 'solid_handle'),
+            count=check.int_param(count, 'count'),
+            duration_ms_p50=check.opt_float_param(duration_ms_p50, 'duration_ms_p50'),
+            duration_ms_p95=check.opt_float_param(duration_ms_p95, 'duration_ms_p95'),
+            output_bytes_p50=check.opt_int_param(output_bytes_p50, 'output_bytes_p50'),
+            output_bytes_p95=check.opt_int_param(output_bytes_p95, 'output_bytes_p95'),
+            peak_rss_bytes_p50=check.opt_int_param(peak_rss_bytes_p50, 'peak_rss_bytes_p50'),
+            peak_rss_bytes_p95=check.opt_int_param(peak_rss_bytes_p95, 'peak_rss_bytes_p95'),
+        )
+
+    @staticmethod
+    def from_step_metrics(solid_handle, step_metrics):
+        check.str_param(solid_handle, 'solid_handle')
+        check.list_param(step_metrics, 'step_metrics', of_type=StepMetrics)
+
+        durations = [metrics.duration_ms for metrics in step_metrics]
+        output_bytes = [metrics.output_bytes for metrics in step_metrics]
+        peak_rss_bytes = [metrics.peak_rss_bytes for metrics in step_metrics]
+
+        return StepMetricsAggregate(
+            solid_handle=solid_handle,
+            count=len(step_metrics),
+            duration_ms_p50=_percentile(durations, 50),
+            duration_ms_p95=_percentile(durations, 95),
+            output_bytes_p50=_percentile(output_bytes, 50),
+            output_bytes_p95=_percentile(output_bytes, 95),
+            peak_rss_bytes_p50=_percentile(peak_rss_bytes, 50),
+            peak_rss_bytes_p95=_percentile(peak_rss_bytes, 95),
+        )
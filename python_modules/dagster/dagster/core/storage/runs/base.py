@@ -66,6 +66,56 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             List[Tuple[string, Set[string]]]
         '''
 
+    @abstractmethod
+    def get_run_partition_data(self, partition_set_name, status=None):
+        '''Get the most recent run for every partition of a partition set in a single query.
+
+        Args:
+            partition_set_name (str): The name of the partition set, as recorded in the
+                ``dagster/partition_set`` run tag
+            status (Optional[PipelineRunStatus]): If provided, only consider runs with this status
+
+        Returns:
+            Dict[str, RunPartitionData]: The latest run data, keyed by partition name. Partitions
+                without any matching runs are absent.
+        '''
+
+    @abstractmethod
+    def add_step_metrics(self, step_metrics):
+        '''Record the metrics of a finished step execution.
+
+        Args:
+            step_metrics (StepMetrics)
+        '''
+
+    @abstractmethod
+    def get_step_metrics(self, run_id):
+        '''Get the metrics recorded for the steps of a run, in the order the steps finished.
+
+        Args:
+            run_id (str): The id of the run
+
+        Returns:
+            List[StepMetrics]
+        '''
+
+    @abstractmethod
+    def get_step_metrics_aggregates(self, pipeline_name, mode=None, solid_handles=None, limit=None):
+        '''Get percentiles of the metrics recorded for the successful executions of each solid in a
+        pipeline.
+
+        Args:
+            pipeline_name (str): The name of the pipeline
+            mode (Optional[str]): If provided, only consider runs in this mode
+            solid_handles (Optional[List[str]]): If provided, only aggregate these solids
+            limit (Optional[int]): If provided, only consider the most recent executions of each
+                solid, up to this number
+
+        Returns:
+            Dict[str, StepMetricsAggregate]: The aggregates, keyed by solid handle. Solids without
+                any successful executions are absent.
+        '''
+
     @abstractmethod
     def has_run(self, run_id):
         '''Check if the storage contains a run.
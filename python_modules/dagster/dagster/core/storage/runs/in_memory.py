@@ -1,11 +1,18 @@
 from collections import OrderedDict, defaultdict
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.utils import frozendict
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus
+from ..pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    RunPartitionData,
+    StepMetrics,
+    StepMetricsAggregate,
+)
+from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from .base import RunStorage
 
 
@@ -13,6 +20,7 @@ class InMemoryRunStorage(RunStorage):
     def __init__(self):
         self._runs = OrderedDict()
         self._run_tags = defaultdict(dict)
+        self._step_metrics = []
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
@@ -32,7 +40,9 @@ class InMemoryRunStorage(RunStorage):
         check.inst_param(event, 'event', DagsterEvent)
         run = self._runs[run_id]
 
-        if event.event_type == DagsterEventType.PIPELINE_START:
+        if event.event_type == DagsterEventType.PIPELINE_ENQUEUED:
+            self._runs[run_id] = run.run_with_status(PipelineRunStatus.QUEUED)
+        elif event.event_type == DagsterEventType.PIPELINE_START:
             self._runs[run_id] = run.run_with_status(PipelineRunStatus.STARTED)
         elif event.event_type == DagsterEventType.PIPELINE_SUCCESS:
             self._runs[run_id] = run.run_with_status(PipelineRunStatus.SUCCESS)
@@ -101,6 +111,59 @@ class InMemoryRunStorage(RunStorage):
 
         return sorted([(k, v) for k, v in all_tags.items()], key=lambda x: x[0])
 
+    def get_run_partition_data(self, partition_set_name, status=None):
+        check.str_param(partition_set_name, 'partition_set_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
+
+        partition_data = {}
+        # runs are stored in insertion order, so later runs overwrite earlier ones
+        for run in self._runs.values():
+            if run.tags.get(PARTITION_SET_TAG) != partition_set_name:
+                continue
+            if PARTITION_NAME_TAG not in run.tags:
+                continue
+            if status and run.status != status:
+                continue
+
+            partition = run.tags[PARTITION_NAME_TAG]
+            partition_data[partition] = RunPartitionData(
+                partition=partition, run_id=run.run_id, status=run.status
+            )
+
+        return partition_data
+
+    def add_step_metrics(self, step_metrics):
+        check.inst_param(step_metrics, 'step_metrics', StepMetrics)
+        self._step_metrics.append(step_metrics)
+
+    def get_step_metrics(self, run_id):
+        check.str_param(run_id, 'run_id')
+        return [metrics for metrics in self._step_metrics if metrics.run_id == run_id]
+
+    def get_step_metrics_aggregates(self, pipeline_name, mode=None, solid_handles=None, limit=None):
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.opt_str_param(mode, 'mode')
+        check.opt_list_param(solid_handles, 'solid_handles', of_type=str)
+        check.opt_int_param(limit, 'limit')
+
+        metrics_by_solid = defaultdict(list)
+        # most recent first, so that limit keeps the latest executions
+        for metrics in reversed(self._step_metrics):
+            if metrics.pipeline_name != pipeline_name or not metrics.success:
+                continue
+            if mode is not None and metrics.mode != mode:
+                continue
+            if solid_handles is not None and metrics.solid_handle not in solid_handles:
+                continue
+            if limit and len(metrics_by_solid[metrics.solid_handle]) >= limit:
+                continue
+            metrics_by_solid[metrics.solid_handle].append(metrics)
+
+        return {
+            solid_handle: StepMetricsAggregate.from_step_metrics(solid_handle, metrics)
+            for solid_handle, metrics in metrics_by_solid.items()
+        }
+
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return run_id in self._runs
@@ -110,6 +173,8 @@ class InMemoryRunStorage(RunStorage):
         del self._runs[run_id]
         if run_id in self._run_tags:
             del self._run_tags[run_id]
+        self._step_metrics = [metrics for metrics in self._step_metrics if metrics.run_id != run_id]
 
     def wipe(self):
         self._runs = OrderedDict()
+        self._step_metrics = []
@@ -22,3 +22,30 @@ RunTagsTable = db.Table(
     db.Column('key', db.String),
     db.Column('value', db.String),
 )
+
+# Speeds up lookups of runs by tag, e.g. fetching the runs for every partition of a partition set
+db.Index('idx_run_tags', RunTagsTable.c.key, RunTagsTable.c.value)
+
+StepMetricsTable = db.Table(
+    'step_metrics',
+    RunStorageSqlMetadata,
+    db.Column('id', db.Integer, primary_key=True, autoincrement=True),
+    db.Column('run_id', None, db.ForeignKey('runs.run_id', ondelete="CASCADE")),
+    db.Column('pipeline_name', db.String),
+    db.Column('mode', db.String),
+    db.Column('solid_handle', db.String),
+    db.Column('step_key', db.String),
+    db.Column('success', db.Boolean),
+    db.Column('duration_ms', db.Float),
+    db.Column('output_bytes', db.BigInteger),
+    db.Column('peak_rss_bytes', db.BigInteger),
+    db.Column('create_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
+)
+
+# Serves the per-solid aggregate queries over a pipeline's history
+db.Index(
+    'idx_step_metrics',
+    StepMetricsTable.c.pipeline_name,
+    StepMetricsTable.c.solid_handle,
+    StepMetricsTable.c.mode,
+)
@@ -5,15 +5,22 @@ from datetime import datetime
 import six
 import sqlalchemy as db
 
-from dagster import check
+from dagster.check import internal as check
 from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.errors import DagsterRunAlreadyExists
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus
+from ..pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    RunPartitionData,
+    StepMetrics,
+    StepMetricsAggregate,
+)
+from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from .base import RunStorage
-from .schema import RunTagsTable, RunsTable
+from .schema import RunTagsTable, RunsTable, StepMetricsTable
 
 
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
@@ -60,6 +67,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.inst_param(event, 'event', DagsterEvent)
 
         lookup = {
+            DagsterEventType.PIPELINE_ENQUEUED: PipelineRunStatus.QUEUED,
             DagsterEventType.PIPELINE_START: PipelineRunStatus.STARTED,
             DagsterEventType.PIPELINE_SUCCESS: PipelineRunStatus.SUCCESS,
             DagsterEventType.PIPELINE_FAILURE: PipelineRunStatus.FAILURE,
@@ -196,6 +204,149 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_partition_data(self, partition_set_name, status=None):
+        check.str_param(partition_set_name, 'partition_set_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
+
+        partition_set_tags = RunTagsTable.alias('partition_set_tags')
+        partition_tags = RunTagsTable.alias('partition_tags')
+
+        # select the id of the most recent matching run for each partition, relying on the
+        # (key, value) index on the run tags table to resolve the partition set
+        latest_query = (
+            db.select(
+                [partition_tags.c.value.label('partition'), db.func.max(RunsTable.c.id).label('id')]
+            )
+            .select_from(
+                RunsTable.join(
+                    partition_set_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_set_tags.c.run_id,
+                        partition_set_tags.c.key == PARTITION_SET_TAG,
+                    ),
+                ).join(
+                    partition_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_tags.c.run_id,
+                        partition_tags.c.key == PARTITION_NAME_TAG,
+                    ),
+                )
+            )
+            .where(partition_set_tags.c.value == partition_set_name)
+            .group_by(partition_tags.c.value)
+        )
+
+        if status:
+            latest_query = latest_query.where(RunsTable.c.status == status.value)
+
+        latest = latest_query.alias('latest')
+        query = db.select([latest.c.partition, RunsTable.c.run_id, RunsTable.c.status]).select_from(
+            latest.join(RunsTable, RunsTable.c.id == latest.c.id)
+        )
+
+        return {
+            partition: RunPartitionData(
+                partition=partition, run_id=run_id, status=PipelineRunStatus(run_status)
+            )
+            for partition, run_id, run_status in self.execute(query)
+        }
+
+    def add_step_metrics(self, step_metrics):
+        check.inst_param(step_metrics, 'step_metrics', StepMetrics)
+
+        with self.connect() as conn:
+            conn.execute(
+                StepMetricsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=step_metrics.run_id,
+                    pipeline_name=step_metrics.pipeline_name,
+                    mode=step_metrics.mode,
+                    solid_handle=step_metrics.solid_handle,
+                    step_key=step_metrics.step_key,
+                    success=step_metrics.success,
+                    duration_ms=step_metrics.duration_ms,
+                    output_bytes=step_metrics.output_bytes,
+                    peak_rss_bytes=step_metrics.peak_rss_bytes,
+                )
+            )
+
+    def get_step_metrics(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        query = (
+            db.select(
+                [
+                    StepMetricsTable.c.run_id,
+                    StepMetricsTable.c.pipeline_name,
+                    StepMetricsTable.c.mode,
+                    StepMetricsTable.c.solid_handle,
+                    StepMetricsTable.c.step_key,
+                    StepMetricsTable.c.success,
+                    StepMetricsTable.c.duration_ms,
+                    StepMetricsTable.c.output_bytes,
+                    StepMetricsTable.c.peak_rss_bytes,
+                ]
+            )
+            .where(StepMetricsTable.c.run_id == run_id)
+            .order_by(StepMetricsTable.c.id.asc())
+        )
+        return [_step_metrics_from_row(row) for row in self.execute(query)]
+
+    def get_step_metrics_aggregates(self, pipeline_name, mode=None, solid_handles=None, limit=None):
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.opt_str_param(mode, 'mode')
+        check.opt_list_param(solid_handles, 'solid_handles', of_type=str)
+        check.opt_int_param(limit, 'limit')
+
+        conditions = [
+            StepMetricsTable.c.pipeline_name == pipeline_name,
+            StepMetricsTable.c.success == True,  # pylint: disable=singleton-comparison
+        ]
+        if mode is not None:
+            conditions.append(StepMetricsTable.c.mode == mode)
+
+        if solid_handles is None:
+            solid_handles = [
+                row[0]
+                for row in self.execute(
+                    db.select([StepMetricsTable.c.solid_handle])
+                    .where(db.and_(*conditions))
+                    .distinct()
+                )
+            ]
+
+        # Each solid is fetched separately so that the ordering and limit apply per solid in the
+        # database, through the (pipeline_name, solid_handle, mode) index. Percentiles are not
+        # portable across sqlite and postgres, so they are computed here over the fetched rows.
+        aggregates = {}
+        for solid_handle in sorted(set(solid_handles)):
+            query = (
+                db.select(
+                    [
+                        StepMetricsTable.c.run_id,
+                        StepMetricsTable.c.pipeline_name,
+                        StepMetricsTable.c.mode,
+                        StepMetricsTable.c.solid_handle,
+                        StepMetricsTable.c.step_key,
+                        StepMetricsTable.c.success,
+                        StepMetricsTable.c.duration_ms,
+                        StepMetricsTable.c.output_bytes,
+                        StepMetricsTable.c.peak_rss_bytes,
+                    ]
+                )
+                .where(db.and_(StepMetricsTable.c.solid_handle == solid_handle, *conditions))
+                .order_by(StepMetricsTable.c.id.desc())
+            )
+            if limit:
+                query = query.limit(limit)
+
+            metrics = [_step_metrics_from_row(row) for row in self.execute(query)]
+            if metrics:
+                aggregates[solid_handle] = StepMetricsAggregate.from_step_metrics(
+                    solid_handle, metrics
+                )
+
+        return aggregates
+
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return bool(self.get_run_by_id(run_id))
@@ -204,6 +355,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.str_param(run_id, 'run_id')
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
+            conn.execute(db.delete(StepMetricsTable).where(StepMetricsTable.c.run_id == run_id))
             conn.execute(query)
 
     def wipe(self):
@@ -212,3 +364,29 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(RunTagsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepMetricsTable.delete())  # pylint: disable=no-value-for-parameter
+
+
+def _step_metrics_from_row(row):
+    (
+        run_id,
+        pipeline_name,
+        mode,
+        solid_handle,
+        step_key,
+        success,
+        duration_ms,
+        output_bytes,
+        peak_rss_bytes,
+    ) = row
+    return StepMetrics(
+        run_id=run_id,
+        pipeline_name=pipeline_name,
+        mode=mode,
+        solid_handle=solid_handle,
+        step_key=step_key,
+        success=bool(success),
+        duration_ms=duration_ms,
+        output_bytes=output_bytes,
+        peak_rss_bytes=peak_rss_bytes,
+    )
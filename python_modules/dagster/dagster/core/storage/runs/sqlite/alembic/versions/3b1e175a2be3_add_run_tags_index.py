@@ -0,0 +1,39 @@
+"""add run tags index
+
+Revision ID: 3b1e175a2be3
+Revises: 9fe9e746268c
+Create Date: 2020-02-20 10:14:32.618275
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = '3b1e175a2be3'
+down_revision = '9fe9e746268c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_tags' in has_tables:
+        indices = [x.get('name') for x in inspector.get_indexes('run_tags')]
+        if 'idx_run_tags' not in indices:
+            op.create_index('idx_run_tags', 'run_tags', ['key', 'value'], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_tags' in has_tables:
+        indices = [x.get('name') for x in inspector.get_indexes('run_tags')]
+        if 'idx_run_tags' in indices:
+            op.drop_index('idx_run_tags', 'run_tags')
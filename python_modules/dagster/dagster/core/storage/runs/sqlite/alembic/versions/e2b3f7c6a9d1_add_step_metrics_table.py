@@ -0,0 +1,53 @@
+"""add step metrics table
+
+Revision ID: e2b3f7c6a9d1
+Revises: 3b1e175a2be3
+Create Date: 2020-02-24 11:42:07.136544
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = 'e2b3f7c6a9d1'
+down_revision = '3b1e175a2be3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'step_metrics' not in has_tables:
+        op.create_table(
+            'step_metrics',
+            sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column('run_id', sa.String(255), sa.ForeignKey('runs.run_id', ondelete='CASCADE')),
+            sa.Column('pipeline_name', sa.String),
+            sa.Column('mode', sa.String),
+            sa.Column('solid_handle', sa.String),
+            sa.Column('step_key', sa.String),
+            sa.Column('success', sa.Boolean),
+            sa.Column('duration_ms', sa.Float),
+            sa.Column('output_bytes', sa.BigInteger),
+            sa.Column('peak_rss_bytes', sa.BigInteger),
+            sa.Column('create_timestamp', sa.DateTime, server_default=sa.text('CURRENT_TIMESTAMP')),
+        )
+        op.create_index(
+            'idx_step_metrics', 'step_metrics', ['pipeline_name', 'solid_handle', 'mode']
+        )
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'step_metrics' in has_tables:
+        op.drop_index('idx_step_metrics', 'step_metrics')
+        op.drop_table('step_metrics')
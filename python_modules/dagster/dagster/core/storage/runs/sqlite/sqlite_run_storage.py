@@ -10,7 +10,7 @@ from dagster.seven import urljoin, urlparse
 from dagster.utils import mkdir_p
 
 from ...sql import check_alembic_revision, create_engine, get_alembic_config, stamp_alembic_rev
-from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable
+from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable, StepMetricsTable
 from ..sql_run_storage import SqlRunStorage
 
 
@@ -77,7 +77,9 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
         support on cascading deletes '''
         check.str_param(run_id, 'run_id')
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
+        remove_step_metrics = db.delete(StepMetricsTable).where(StepMetricsTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(remove_tags)
+            conn.execute(remove_step_metrics)
             conn.execute(remove_run)
@@ -0,0 +1,8 @@
+# Reserved tag keys that dagster attaches to pipeline runs
+
+PARTITION_NAME_TAG = 'dagster/partition'
+
+PARTITION_SET_TAG = 'dagster/partition_set'
+
+# Runs with a higher priority are dequeued first by dagit's queueing execution manager
+PRIORITY_TAG = 'dagster/priority'
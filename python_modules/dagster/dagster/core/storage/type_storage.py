@@ -30,6 +30,13 @@ class TypeStoragePlugin(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     def required_resource_keys(cls):
         return frozenset()
 
+    @classmethod
+    def falls_back_in_composites(cls):
+        '''Whether values of the type may be stored with its serialization strategy, rather than by
+        this plugin, when they are nested in a List or Optional, which plugins don't store. Plugins
+        that only speed up storage of values that could be pickled can return True.'''
+        return False
+
 
 class TypeStoragePluginRegistry(object):
     def __init__(self, types_to_register):
@@ -63,7 +70,11 @@ class TypeStoragePluginRegistry(object):
         return self._registry.get(name)
 
     def check_for_unsupported_composite_overrides(self, runtime_type):
-        composite_overrides = {t.name for t in runtime_type.inner_types if t.name in self._registry}
+        composite_overrides = {
+            t.name
+            for t in runtime_type.inner_types
+            if t.name in self._registry and not self._registry[t.name].falls_back_in_composites()
+        }
         if composite_overrides:
             outer_type = 'composite type'
             if runtime_type.is_list:
@@ -2,7 +2,7 @@ from collections import namedtuple
 
 from dagster import check
 from dagster.config.evaluate_value_result import EvaluateValueResult
-from dagster.config.validate import process_config
+from dagster.config.compiled import compile_config_type
 from dagster.core.definitions.dependency import SolidHandle
 from dagster.core.definitions.environment_configs import define_solid_dictionary_cls
 from dagster.core.definitions.pipeline import PipelineDefinition
@@ -160,7 +160,7 @@ def _get_mapped_solids_dict(composite_def, current_stack, current_solid_config):
 
     # process against that new type
 
-    evr = process_config(type_to_evaluate_against, mapped_solids_config)
+    evr = compile_config_type(type_to_evaluate_against).process(mapped_solids_config)
 
     if not evr.success:
         raise_composite_descent_config_error(current_stack, mapped_solids_config, evr)
@@ -2,7 +2,7 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.definitions.environment_schema import create_environment_type
+from dagster.core.definitions.environment_schema import create_environment_schema
 from dagster.core.definitions.pipeline import PipelineDefinition
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.config import IRunConfig, RunConfig
@@ -63,7 +63,6 @@ class EnvironmentConfig(
 
     @staticmethod
     def build(pipeline, environment_dict=None, run_config=None):
-        from dagster.config.validate import process_config
         from .composite_descent import composite_descent
 
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
@@ -71,9 +70,9 @@ class EnvironmentConfig(
         run_config = check.opt_inst_param(run_config, 'run_config', IRunConfig, default=RunConfig())
 
         mode = run_config.mode or pipeline.get_default_mode_name()
-        environment_type = create_environment_type(pipeline, mode)
+        environment_schema = create_environment_schema(pipeline, mode)
 
-        config_evr = process_config(environment_type, environment_dict)
+        config_evr = environment_schema.compiled_environment_type.process(environment_dict)
         if not config_evr.success:
             raise DagsterInvalidConfigError(
                 'Error in config for pipeline {}'.format(pipeline.name),
@@ -1,7 +1,5 @@
 import logging
 
-import coloredlogs
-
 from dagster import seven
 from dagster.config import Field
 from dagster.core.definitions.logger import logger
@@ -20,6 +18,9 @@ def colored_console_logger(init_context):
     level = coerce_valid_log_level(init_context.logger_config['log_level'])
     name = init_context.logger_config['name']
 
+    # coloredlogs is slow to import, so it is left until a logger is created
+    import coloredlogs
+
     klass = logging.getLoggerClass()
     logger_ = klass(name, level=level)
     coloredlogs.install(
@@ -46,6 +47,8 @@ def json_console_logger(init_context):
     klass = logging.getLoggerClass()
     logger_ = klass(name, level=level)
 
+    import coloredlogs
+
     handler = coloredlogs.StandardErrorHandler()
 
     class JsonFormatter(logging.Formatter):
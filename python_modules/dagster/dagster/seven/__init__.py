@@ -99,19 +99,9 @@ elif IS_WINDOWS:
 else:
     time_fn = time.time
 
-try:
-    from unittest import mock
-except ImportError:
-    # Because this dependency is not encoded setup.py deliberately
-    # (we do not want to override or conflict with our users mocks)
-    # we never fail when importing this.
-
-    # This will only be used within *our* test enviroment of which
-    # we have total control
-    try:
-        import mock
-    except ImportError:
-        pass
+# mock lives in its own submodule, dagster.seven.mock, so that importing it -- and asyncio, which
+# unittest.mock imports -- is left to the tests that use it, rather than paid by every import of
+# dagster
 
 
 def get_args(callble):
@@ -146,3 +136,17 @@ def is_module_available(module_name):
         loader = importlib.util.find_spec(module_name)
 
     return loader is not None
+
+
+try:
+    from sys import intern as _intern
+except ImportError:
+    # pylint: disable=redefined-builtin
+    from __builtin__ import intern as _intern
+
+
+def intern_string(str_):
+    '''Intern a string, so that the strings that recur across steps and events -- step keys,
+    pipeline names, run ids -- are held in memory once rather than once per object that carries
+    them. Values that can't be interned, such as None and unicode on py2, are returned unchanged.'''
+    return _intern(str_) if type(str_) is str else str_  # pylint: disable=unidiomatic-typecheck
@@ -0,0 +1,16 @@
+'''``from dagster.seven import mock`` gets unittest.mock, or the mock backport on python 2.
+
+Because this dependency is not encoded in setup.py deliberately (we do not want to override or
+conflict with our users' mocks), this is only ever imported within *our* test environment, of which
+we have total control.
+'''
+from __future__ import absolute_import
+
+import sys
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+sys.modules[__name__] = mock
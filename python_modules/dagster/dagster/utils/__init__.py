@@ -2,7 +2,6 @@ import contextlib
 import datetime
 import errno
 import inspect
-import multiprocessing
 import os
 import re
 import signal
@@ -10,11 +9,11 @@ import subprocess
 import sys
 import tempfile
 import threading
+import weakref
 from collections import namedtuple
 from enum import Enum
 from warnings import warn
 
-import yaml
 from six.moves import configparser
 
 from dagster import check
@@ -29,6 +28,11 @@ if sys.version_info > (3,):
 else:
     from pathlib2 import Path  # pylint: disable=import-error
 
+try:
+    import resource
+except ImportError:
+    resource = None
+
 EPOCH = datetime.datetime.utcfromtimestamp(0)
 
 PICKLE_PROTOCOL = 2
@@ -166,6 +170,26 @@ class frozendict(dict):
     del __readonly__
 
 
+_INTERNED_TAGS = weakref.WeakValueDictionary()
+
+
+def intern_tags(tags):
+    '''Returns a frozendict equal to tags, which is shared with every other equal dict of tags
+    interned while it is in use -- e.g. the logging tags of each of the events of a step, which are
+    otherwise copied per event when events are deserialized. Tags that can't be hashed are returned
+    as they are.'''
+    try:
+        key = tuple(sorted(tags.items()))
+        interned = _INTERNED_TAGS.get(key)
+    except TypeError:
+        return tags
+
+    if interned is None:
+        interned = tags if isinstance(tags, frozendict) else frozendict(tags)
+        _INTERNED_TAGS[key] = interned
+    return interned
+
+
 class frozenlist(list):
     def __readonly__(self, *args, **kwargs):
         raise RuntimeError("Cannot modify ReadOnlyList")
@@ -202,7 +226,22 @@ def list_pull(alist, key):
     return list(map(lambda elem: get_prop_or_key(elem, key), alist))
 
 
+def get_peak_rss_bytes():
+    '''The peak resident set size of the current process, in bytes.
+
+    Returns None on platforms without the :py:mod:`python:resource` module, i.e. Windows.
+    '''
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return int(max_rss if sys.platform == 'darwin' else max_rss * 1024)
+
+
 def get_multiprocessing_context():
+    import multiprocessing
+
     # Set execution method to spawn, to avoid fork and to have same behavior between platforms.
     # Older versions are stuck with whatever is the default on their platform (fork on
     # Unix-like and spawn on windows)
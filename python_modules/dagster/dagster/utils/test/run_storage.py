@@ -1,7 +1,8 @@
 import pytest
 
 from dagster.core.definitions.pipeline import PipelineRunsFilter
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, StepMetrics
 from dagster.core.utils import make_new_run_id
 
 
@@ -431,3 +432,130 @@ class TestRunStorage:
         storage.delete_run(run_id)
         assert list(storage.get_runs()) == []
         assert run_id not in [key for key, value in storage.get_run_tags()]
+
+    def test_fetch_run_partition_data(self, storage):
+        assert storage
+
+        def _add_partition_run(partition, status, partition_set='partition_set'):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name='some_pipeline',
+                    tags={'dagster/partition': partition, 'dagster/partition_set': partition_set},
+                    status=status,
+                )
+            )
+            return run_id
+
+        _add_partition_run('a', PipelineRunStatus.SUCCESS)
+        latest_a = _add_partition_run('a', PipelineRunStatus.FAILURE)
+        success_b = _add_partition_run('b', PipelineRunStatus.SUCCESS)
+        latest_b = _add_partition_run('b', PipelineRunStatus.STARTED)
+        _add_partition_run('c', PipelineRunStatus.FAILURE)
+        _add_partition_run('a', PipelineRunStatus.SUCCESS, partition_set='other_partition_set')
+
+        partition_data = storage.get_run_partition_data('partition_set')
+        assert set(partition_data.keys()) == {'a', 'b', 'c'}
+        assert partition_data['a'].run_id == latest_a
+        assert partition_data['a'].status == PipelineRunStatus.FAILURE
+        assert partition_data['b'].run_id == latest_b
+        assert partition_data['b'].status == PipelineRunStatus.STARTED
+
+        successful = storage.get_run_partition_data(
+            'partition_set', status=PipelineRunStatus.SUCCESS
+        )
+        assert set(successful.keys()) == {'a', 'b'}
+        assert successful['b'].run_id == success_b
+
+        assert storage.get_run_partition_data('unknown_partition_set') == {}
+
+    def test_queued_status(self, storage):
+        assert storage
+        run_id = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=run_id, pipeline_name='some_pipeline'))
+
+        storage.handle_run_event(
+            run_id, DagsterEvent(DagsterEventType.PIPELINE_ENQUEUED.value, 'some_pipeline')
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.QUEUED
+        assert [
+            run.run_id
+            for run in storage.get_runs(PipelineRunsFilter(status=PipelineRunStatus.QUEUED))
+        ] == [run_id]
+
+        storage.handle_run_event(
+            run_id, DagsterEvent(DagsterEventType.PIPELINE_START.value, 'some_pipeline')
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+        assert storage.get_runs(PipelineRunsFilter(status=PipelineRunStatus.QUEUED)) == []
+
+    def test_step_metrics(self, storage):
+        assert storage
+
+        def _add_run_with_metrics(durations, mode='default', success=True):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(run_id=run_id, pipeline_name='some_pipeline', mode=mode)
+            )
+            for solid_name, duration_ms in durations.items():
+                storage.add_step_metrics(
+                    StepMetrics(
+                        run_id=run_id,
+                        pipeline_name='some_pipeline',
+                        mode=mode,
+                        solid_handle=solid_name,
+                        step_key='{}.compute'.format(solid_name),
+                        success=success,
+                        duration_ms=duration_ms,
+                        output_bytes=int(duration_ms) * 10,
+                        peak_rss_bytes=None,
+                    )
+                )
+            return run_id
+
+        first = _add_run_with_metrics({'a': 10.0, 'b': 100.0})
+        for duration_ms in [20.0, 30.0, 40.0]:
+            _add_run_with_metrics({'a': duration_ms})
+        _add_run_with_metrics({'a': 1000.0}, success=False)
+        _add_run_with_metrics({'a': 5000.0}, mode='other')
+
+        first_metrics = storage.get_step_metrics(first)
+        assert [metrics.step_key for metrics in first_metrics] == ['a.compute', 'b.compute']
+        assert first_metrics[0].success
+        assert first_metrics[1].duration_ms == 100.0
+        assert first_metrics[1].output_bytes == 1000
+        assert first_metrics[1].peak_rss_bytes is None
+
+        aggregates = storage.get_step_metrics_aggregates('some_pipeline', mode='default')
+        assert set(aggregates.keys()) == {'a', 'b'}
+        assert aggregates['a'].count == 4
+        assert aggregates['a'].duration_ms_p50 == 20.0
+        assert aggregates['a'].duration_ms_p95 == 40.0
+        assert aggregates['a'].output_bytes_p50 == 200
+        assert aggregates['a'].peak_rss_bytes_p50 is None
+        assert aggregates['b'].count == 1
+        assert aggregates['b'].duration_ms_p50 == 100.0
+
+        assert storage.get_step_metrics_aggregates('some_pipeline')['a'].count == 5
+
+        # only the most recent executions
+        limited = storage.get_step_metrics_aggregates(
+            'some_pipeline', mode='default', solid_handles=['a'], limit=2
+        )
+        assert set(limited.keys()) == {'a'}
+        assert limited['a'].count == 2
+        assert limited['a'].duration_ms_p50 == 30.0
+
+        # the limit applies to each solid, whether or not the solids are named
+        limited = storage.get_step_metrics_aggregates('some_pipeline', limit=2)
+        assert set(limited.keys()) == {'a', 'b'}
+        assert limited['a'].count == 2
+        assert limited['a'].duration_ms_p50 == 40.0
+        assert limited['b'].count == 1
+
+        assert storage.get_step_metrics_aggregates('other_pipeline') == {}
+
+        storage.delete_run(first)
+        assert storage.get_step_metrics(first) == []
+        assert 'b' not in storage.get_step_metrics_aggregates('some_pipeline')
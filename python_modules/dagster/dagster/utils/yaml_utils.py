@@ -1,7 +1,5 @@
 import glob
 
-import yaml
-
 from dagster import check
 
 from .merger import dict_merge
@@ -31,6 +29,9 @@ def merge_yamls(file_list):
 
 
 def load_yaml_from_path(path):
+    # yaml is slow to import, so it is left until a file is loaded
+    import yaml
+
     check.str_param(path, 'path')
     with open(path, 'r') as ff:
         return yaml.safe_load(ff)
@@ -0,0 +1,168 @@
+import pytest
+
+from dagster import PipelineDefinition, check, lambda_solid
+from dagster.core.definitions import SolidHandle
+from dagster.core.execution.plan.objects import (
+    ExecutionStep,
+    StepInput,
+    StepInputSourceType,
+    StepKind,
+    StepOutput,
+    StepOutputHandle,
+)
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.types.dagster_type import Any
+from dagster.utils import frozentags
+
+
+@lambda_solid
+def noop():
+    pass
+
+
+BENCHMARK_PIPELINE = PipelineDefinition(name='benchmark_pipeline', solid_defs=[noop])
+
+
+def _step(index, dependency_keys):
+    step_inputs = (
+        [
+            StepInput(
+                'deps',
+                Any,
+                StepInputSourceType.MULTIPLE_OUTPUTS,
+                [StepOutputHandle(key) for key in dependency_keys],
+            )
+        ]
+        if dependency_keys
+        else []
+    )
+    return ExecutionStep(
+        pipeline_name=BENCHMARK_PIPELINE.name,
+        key_suffix='compute',
+        step_inputs=step_inputs,
+        step_outputs=[StepOutput('result', Any, optional=False, should_materialize=False)],
+        compute_fn=lambda *_args: None,
+        kind=StepKind.COMPUTE,
+        solid_handle=SolidHandle('step_{index}'.format(index=index), 'noop', None),
+        tags=frozentags(),
+    )
+
+
+def _plan(steps):
+    step_dict = {step.key: step for step in steps}
+    deps = {
+        step.key: {key for step_input in step.step_inputs for key in step_input.dependency_keys}
+        for step in steps
+    }
+    return ExecutionPlan(
+        BENCHMARK_PIPELINE, step_dict, deps, False, None, [step.key for step in steps]
+    )
+
+
+def deep_plan(num_steps):
+    '''A single chain of steps.'''
+    steps = [_step(0, [])]
+    for index in range(1, num_steps):
+        steps.append(_step(index, [steps[-1].key]))
+    return _plan(steps)
+
+
+def wide_plan(num_steps):
+    '''One step fanning out to all the others, which then fan back in to a final step.'''
+    root = _step(0, [])
+    middle = [_step(index, [root.key]) for index in range(1, num_steps - 1)]
+    sink = _step(num_steps - 1, [step.key for step in middle])
+    return _plan([root] + middle + [sink])
+
+
+class _ScanCountingDict(dict):
+    '''A dict that counts how many times it is iterated over.'''
+
+    def __init__(self, *args, **kwargs):
+        super(_ScanCountingDict, self).__init__(*args, **kwargs)
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super(_ScanCountingDict, self).__iter__()
+
+    def keys(self):
+        self.scans += 1
+        return super(_ScanCountingDict, self).keys()
+
+    def values(self):
+        self.scans += 1
+        return super(_ScanCountingDict, self).values()
+
+    def items(self):
+        self.scans += 1
+        return super(_ScanCountingDict, self).items()
+
+
+def _count_work(execution_plan, limit, monkeypatch):
+    '''Runs the plan to completion and counts the scheduler's work: scans of the pending steps,
+    lookups of steps by key, and sort key computations.'''
+    step_lookups = []
+    get_step_by_key = ExecutionPlan.get_step_by_key
+
+    def _counting_get_step_by_key(self, key):
+        step_lookups.append(key)
+        return get_step_by_key(self, key)
+
+    monkeypatch.setattr(ExecutionPlan, 'get_step_by_key', _counting_get_step_by_key)
+
+    sort_keys = []
+
+    def _counting_sort_key(step):
+        sort_keys.append(step.key)
+        return 0
+
+    active_execution = execution_plan.start(sort_key_fn=_counting_sort_key)
+    # pending steps are only ever looked up by key, never scanned, as each step completes
+    pending = _ScanCountingDict(active_execution._pending)  # pylint: disable=protected-access
+    active_execution._pending = pending  # pylint: disable=protected-access
+
+    executed = 0
+    while not active_execution.is_complete:
+        steps = active_execution.get_steps_to_execute(limit=limit)
+        check.invariant(steps, 'Execution stalled')
+        for step in steps:
+            active_execution.mark_success(step.key)
+        executed += len(steps)
+
+    monkeypatch.undo()
+    assert executed == len(execution_plan.steps)
+    return {'scans': pending.scans, 'step_lookups': len(step_lookups), 'sort_keys': len(sort_keys)}
+
+
+@pytest.mark.parametrize('build_plan', [deep_plan, wide_plan])
+@pytest.mark.parametrize('limit', [1, 8])
+def test_active_execution_work_is_linear(build_plan, limit, monkeypatch):
+    work = {
+        num_steps: _count_work(build_plan(num_steps), limit, monkeypatch)
+        for num_steps in [1000, 10000, 50000]
+    }
+
+    for num_steps, counts in work.items():
+        # each step is looked up once as it becomes executable, and once as it is executed, and
+        # its sort key is computed once, however large the plan
+        assert counts == {'scans': 0, 'step_lookups': 2 * num_steps, 'sort_keys': num_steps}
+
+
+def test_failure_skips_downstream_of_wide_plan():
+    execution_plan = wide_plan(1000)
+    active_execution = execution_plan.start()
+
+    [root] = active_execution.get_steps_to_execute()
+    active_execution.mark_success(root.key)
+
+    middle = active_execution.get_steps_to_execute()
+    assert len(middle) == 998
+    active_execution.mark_failed(middle[0].key)
+    for step in middle[1:]:
+        active_execution.mark_success(step.key)
+
+    assert active_execution.get_steps_to_execute() == []
+    assert [step.key for step in active_execution.get_steps_to_skip()] == ['step_999.compute']
+    active_execution.mark_skipped('step_999.compute')
+    assert active_execution.is_complete
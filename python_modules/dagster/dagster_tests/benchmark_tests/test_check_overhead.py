@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from dagster import check
+from dagster.check import unchecked
+
+# Constructs what the engine and log manager construct for a step output event, with checks or
+# without, depending on DAGSTER_SKIP_INTERNAL_CHECKS, and prints the seconds it takes per event
+PER_EVENT_SCRIPT = '''
+import timeit
+
+from dagster import EventMetadataEntry
+from dagster.check import internal
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import StepOutputData, StepOutputHandle, TypeCheckData
+
+ITERATIONS = 2000
+
+LOGGING_TAGS = {'pipeline': 'benchmark', 'solid': 'a_solid', 'step_key': 'a_solid.compute'}
+METADATA_ENTRIES = [EventMetadataEntry.text(str(i), 'entry_{}'.format(i)) for i in range(10)]
+
+
+def construct_event():
+    dagster_event = DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        'benchmark',
+        step_key='a_solid.compute',
+        logging_tags=LOGGING_TAGS,
+        event_specific_data=StepOutputData(
+            StepOutputHandle('a_solid.compute', 'result'),
+            type_check_data=TypeCheckData(True, 'result', metadata_entries=METADATA_ENTRIES),
+        ),
+    )
+    return DagsterEventRecord(
+        None,
+        'message',
+        'DEBUG',
+        'user message',
+        'run_id',
+        1.0,
+        step_key='a_solid.compute',
+        pipeline_name='benchmark',
+        dagster_event=dagster_event,
+    )
+
+
+seconds = min(timeit.repeat(construct_event, number=ITERATIONS, repeat=5)) / ITERATIONS
+print(internal.INTERNAL_CHECKS_ENABLED, seconds)
+'''
+
+
+def _per_event_seconds(skip_internal_checks):
+    env = dict(os.environ)
+    env.pop('DAGSTER_SKIP_INTERNAL_CHECKS', None)
+    if skip_internal_checks:
+        env['DAGSTER_SKIP_INTERNAL_CHECKS'] = '1'
+
+    output = subprocess.check_output([sys.executable, '-c', PER_EVENT_SCRIPT], env=env)
+    checks_enabled, seconds = output.decode('utf-8').split()
+    assert checks_enabled == str(not skip_internal_checks)
+    return float(seconds)
+
+
+def test_skipping_internal_checks_reduces_per_event_overhead():
+    # best of a few runs of each, interleaved, to keep noise from other processes out of the
+    # comparison
+    checked_runs = []
+    unchecked_runs = []
+    for _ in range(3):
+        checked_runs.append(_per_event_seconds(skip_internal_checks=False))
+        unchecked_runs.append(_per_event_seconds(skip_internal_checks=True))
+    checked, unchecked_ = min(checked_runs), min(unchecked_runs)
+
+    print(
+        'Per event: {checked:.2f}us with internal checks, {unchecked:.2f}us without'.format(
+            checked=checked * 1e6, unchecked=unchecked_ * 1e6
+        )
+    )
+    assert unchecked_ < checked
+
+
+@pytest.mark.parametrize(
+    'name,args',
+    [
+        ('opt_inst_param', (None, 'param', int, 3)),
+        ('opt_str_param', (None, 'param', 'default')),
+        ('opt_nonempty_str_param', ('', 'param', 'default')),
+        ('opt_bool_param', (None, 'param', False)),
+        ('opt_callable_param', (None, 'param', len)),
+        ('opt_tuple_param', (None, 'param', (1,))),
+        ('opt_list_param', (None, 'param')),
+        ('opt_list_param', ([1], 'param', int)),
+        ('opt_nullable_list_param', (None, 'param')),
+        ('opt_nullable_list_param', ([], 'param')),
+        ('opt_set_param', (None, 'param')),
+        ('opt_dict_param', (None, 'param')),
+        ('opt_dict_param', ({'a': 1}, 'param', str, int)),
+        ('opt_nullable_dict_param', (None, 'param')),
+        ('opt_nullable_dict_param', ({}, 'param')),
+        ('list_param', ([1, 2], 'param', int)),
+        ('dict_param', ({'a': 1}, 'param', str, int)),
+    ],
+)
+def test_unchecked_returns_what_check_returns(name, args):
+    assert getattr(unchecked, name)(*args) == getattr(check, name)(*args)
+
+
+def test_unchecked_mirrors_check():
+    for name in unchecked.__all__:
+        assert callable(getattr(check, name))
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous, to keep loaded CI machines from failing the build -- `import dagster` takes around a
+# tenth of this on a developer machine. The module checks below are what catch regressions.
+IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+# Dependencies that are slow to import and only needed by some code paths, which import them
+# when they are used
+DEFERRED_MODULES = [
+    'alembic',
+    'asyncio',
+    'coloredlogs',
+    'multiprocessing',
+    'rx',
+    'sqlalchemy',
+    'unittest.mock',
+    'watchdog',
+    'yaml',
+]
+
+CLI_SUBCOMMAND_MODULES = [
+    'dagster.cli.instance',
+    'dagster.cli.pipeline',
+    'dagster.cli.run',
+    'dagster.cli.schedule',
+]
+
+requires_importtime = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason='-X importtime requires python 3.7'
+)
+
+
+def _import_times(*args):
+    '''Run python with -X importtime, returning module name => cumulative import time in seconds.
+    '''
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime'] + list(args), stderr=subprocess.STDOUT
+    ).decode('utf-8')
+
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, module = line[len('import time:') :].split('|')
+        if cumulative.strip().isdigit():
+            import_times[module.strip()] = int(cumulative) / 1e6
+    return import_times
+
+
+@requires_importtime
+def test_import_dagster_defers_slow_dependencies():
+    import_times = _import_times('-c', 'import dagster')
+    assert 'dagster' in import_times
+
+    imported = [module for module in DEFERRED_MODULES if module in import_times]
+    assert not imported
+
+
+@requires_importtime
+def test_import_dagster_time():
+    # best of a few runs to keep noise from other processes out of the measurement
+    seconds = min(_import_times('-c', 'import dagster')['dagster'] for _ in range(3))
+    assert seconds < IMPORT_TIME_BUDGET_SECONDS
+
+
+@requires_importtime
+def test_cli_version_skips_subcommands():
+    import_times = _import_times('-m', 'dagster', '--version')
+    assert 'dagster.cli' in import_times
+
+    imported = [module for module in CLI_SUBCOMMAND_MODULES if module in import_times]
+    assert not imported
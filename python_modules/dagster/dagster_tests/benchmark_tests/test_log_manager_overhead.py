@@ -0,0 +1,119 @@
+import logging
+import timeit
+
+from dagster.core import log_manager as log_manager_module
+from dagster.core.log_manager import DagsterLogManager
+
+ITERATIONS = 100
+
+BENCHMARK_ITERATIONS = 2000
+
+
+class NullHandler(logging.Handler):
+    def __init__(self):
+        self.count = 0
+        super(NullHandler, self).__init__()
+
+    def emit(self, record):
+        self.count += 1
+
+
+def _log_manager(level):
+    handler = NullHandler()
+    logger = logging.Logger('benchmark_log_manager', level=level)
+    logger.addHandler(handler)
+    return (
+        DagsterLogManager(
+            run_id='123', logging_tags={'pipeline': 'bench', 'solid': 'a_solid'}, loggers=[logger]
+        ),
+        handler,
+    )
+
+
+def _per_call_seconds(fn):
+    # best of a few repeats to keep noise from other processes out of the measurement
+    return min(timeit.repeat(fn, number=BENCHMARK_ITERATIONS, repeat=5)) / BENCHMARK_ITERATIONS
+
+
+def test_filtered_messages_skip_preparation(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise Exception('should not render a message that no logger will emit')
+
+    monkeypatch.setattr(log_manager_module, 'construct_log_string', _fail)
+    monkeypatch.setattr(log_manager_module, '_make_log_message_id', _fail)
+
+    log_manager, handler = _log_manager(logging.INFO)
+    log_manager.debug('filtered', some_prop='value')
+    assert handler.count == 0
+
+
+def test_message_ids_unique_and_ordered():
+    log_manager, _ = _log_manager(logging.DEBUG)
+    records = []
+
+    class CapturingHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    log_manager.loggers[0].addHandler(CapturingHandler())
+    for i in range(10):
+        log_manager.info('message {}'.format(i))
+
+    ids = [record.dagster_meta['log_message_id'] for record in records]
+    assert len(set(ids)) == 10
+    assert [int(id_.rsplit('-', 1)[1]) for id_ in ids] == sorted(
+        int(id_.rsplit('-', 1)[1]) for id_ in ids
+    )
+
+
+def _count_calls(monkeypatch, obj, name):
+    calls = []
+    fn = getattr(obj, name)
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, _counting)
+    return calls
+
+
+def test_filtered_debug_overhead(monkeypatch):
+    emitting, emitting_handler = _log_manager(logging.DEBUG)
+    filtering, filtering_handler = _log_manager(logging.INFO)
+
+    prepare_calls = _count_calls(monkeypatch, DagsterLogManager, '_prepare_message')
+    format_calls = _count_calls(monkeypatch, log_manager_module, 'construct_log_string')
+
+    for _ in range(ITERATIONS):
+        emitting.debug('a debug message', key='value')
+    assert emitting_handler.count == ITERATIONS
+    assert len(prepare_calls) == ITERATIONS
+    assert len(format_calls) == ITERATIONS
+
+    # filtered calls stop at the level check, before the message is prepared or formatted
+    for _ in range(ITERATIONS):
+        filtering.debug('a debug message', key='value')
+    assert filtering_handler.count == 0
+    assert len(prepare_calls) == ITERATIONS
+    assert len(format_calls) == ITERATIONS
+
+
+def test_filtered_debug_per_call_overhead():
+    emitting, emitting_handler = _log_manager(logging.DEBUG)
+    filtering, filtering_handler = _log_manager(logging.INFO)
+
+    emitted = _per_call_seconds(lambda: emitting.debug('a debug message', key='value'))
+    filtered = _per_call_seconds(lambda: filtering.debug('a debug message', key='value'))
+
+    print(
+        'Per debug call: {emitted:.2f}us emitted, {filtered:.2f}us filtered'.format(
+            emitted=emitted * 1e6, filtered=filtered * 1e6
+        )
+    )
+    assert emitting_handler.count == BENCHMARK_ITERATIONS * 5
+    assert filtering_handler.count == 0
+
+    # the call counts above pin down the skipped work; this only guards against the level check
+    # itself becoming as expensive as emitting, so the bound is loose
+    assert filtered < emitted
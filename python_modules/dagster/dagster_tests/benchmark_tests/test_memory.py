@@ -0,0 +1,124 @@
+import gc
+import sys
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+NUM_SOLIDS = 500
+
+# Generous -- around twice what is measured on a developer machine -- to keep differences between
+# python versions from failing the build. Before steps and events shared their strings and tags,
+# a deserialized event took around 1.5kb.
+PLAN_BYTES_PER_STEP_BUDGET = 4096
+EVENT_BYTES_BUDGET = 1024
+
+requires_tracemalloc = pytest.mark.skipif(
+    sys.version_info < (3, 4), reason='tracemalloc requires python 3.4'
+)
+
+
+@lambda_solid
+def emit():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def add_one(num):
+    return num + 1
+
+
+def define_chain_pipeline(num_solids):
+    return PipelineDefinition(
+        name='chain_pipeline',
+        solid_defs=[emit, add_one],
+        dependencies={
+            SolidInvocation('add_one', 'add_one_{}'.format(index)): {
+                'num': DependencyDefinition(
+                    'emit' if index == 0 else 'add_one_{}'.format(index - 1)
+                )
+            }
+            for index in range(num_solids)
+        },
+    )
+
+
+def _traced_bytes(fn):
+    '''Call fn, returning its result and the bytes it allocated that are still held once it
+    returns.'''
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        gc.collect()
+        held, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, held
+
+
+@requires_tracemalloc
+def test_execution_plan_memory():
+    pipeline = define_chain_pipeline(NUM_SOLIDS)
+    # warm up, so that what is built once per pipeline isn't counted
+    create_execution_plan(pipeline)
+
+    plan, held = _traced_bytes(lambda: create_execution_plan(pipeline))
+
+    bytes_per_step = held / len(plan.steps)
+    print('{:.0f} bytes per step'.format(bytes_per_step))
+    assert bytes_per_step < PLAN_BYTES_PER_STEP_BUDGET
+
+
+@requires_tracemalloc
+def test_run_events_memory():
+    result = execute_pipeline(define_chain_pipeline(NUM_SOLIDS))
+    assert result.success
+    serialized = [serialize_dagster_namedtuple(event) for event in result.event_list]
+
+    # what holding the events of a run that were read from storage costs
+    events, held = _traced_bytes(
+        lambda: [deserialize_json_to_dagster_namedtuple(event) for event in serialized]
+    )
+
+    bytes_per_event = held / len(events)
+    print('{:.0f} bytes per event'.format(bytes_per_event))
+    assert bytes_per_event < EVENT_BYTES_BUDGET
+
+
+def test_steps_share_keys_and_tags():
+    plan = create_execution_plan(define_chain_pipeline(2))
+    step = plan.get_step_by_key('add_one_1.compute')
+
+    assert step.logging_tags['step_key'] is step.key
+    assert (
+        step.step_inputs[0].source_handles[0].step_key
+        is plan.get_step_by_key('add_one_0.compute').key
+    )
+
+    with pytest.raises(RuntimeError):
+        step.logging_tags['step_key'] = 'other'
+
+
+def test_deserialized_events_share_tags():
+    result = execute_pipeline(define_chain_pipeline(2))
+    events = [
+        deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(event))
+        for event in result.event_list
+        if event.step_key == 'add_one_1.compute'
+    ]
+    assert len(events) > 1
+
+    assert all(event.logging_tags is events[0].logging_tags for event in events)
+    assert all(event.step_key is events[0].step_key for event in events)
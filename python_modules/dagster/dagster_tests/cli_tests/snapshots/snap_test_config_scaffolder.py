@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 
 from snapshottest import Snapshot
 
+
 snapshots = Snapshot()
 
 snapshots['test_basic_solids_config 1'] = {
@@ -12,7 +13,14 @@ snapshots['test_basic_solids_config 1'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
+            }
+        },
+        'threaded': {
+            'config': {
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
             }
         }
     },
@@ -60,7 +68,14 @@ snapshots['test_two_modes 2'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
+            }
+        },
+        'threaded': {
+            'config': {
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
             }
         }
     },
@@ -108,7 +123,14 @@ snapshots['test_two_modes 4'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
+            }
+        },
+        'threaded': {
+            'config': {
+                'max_concurrent': 0,
+                'step_priority': 'critical_path|tags'
             }
         }
     },
@@ -0,0 +1,157 @@
+import pytest
+
+from dagster import (
+    Any,
+    Array,
+    Bool,
+    Enum,
+    EnumValue,
+    Field,
+    Float,
+    Int,
+    Noneable,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    Shape,
+    String,
+    pipeline,
+    solid,
+)
+from dagster.config.compiled import compile_config_type
+from dagster.config.field import resolve_to_config_type
+from dagster.config.validate import process_config, validate_config
+from dagster.core.definitions.environment_schema import create_environment_schema
+
+SCALARS = [
+    (Int, 1),
+    (Int, True),
+    (Int, 1.5),
+    (Float, 1.5),
+    (Float, 1),
+    (Bool, False),
+    (Bool, 0),
+    (String, 'foo'),
+    (String, None),
+    (Any, {'anything': ['goes']}),
+    (Noneable(Int), None),
+    (Noneable(Int), 'foo'),
+    (Enum('CompiledEnum', [EnumValue('FOO', python_value=1), EnumValue('BAR')]), 'FOO'),
+    (Enum('CompiledEnum', [EnumValue('FOO', python_value=1), EnumValue('BAR')]), 'BAZ'),
+]
+
+SHAPE = Shape(
+    {
+        'required': Field(Int),
+        'optional': Field(String, is_required=False),
+        'defaulted': Field(Int, default_value=3),
+        'nested': Field(Shape({'inner': Field(Bool, default_value=True)}), is_required=False),
+    }
+)
+
+SHAPES = [
+    (SHAPE, {'required': 1}),
+    (SHAPE, {'required': 1, 'optional': 'foo', 'defaulted': 4, 'nested': {}}),
+    (SHAPE, {'required': 1, 'nested': None}),
+    (SHAPE, {}),
+    (SHAPE, {'required': 'one'}),
+    (SHAPE, {'required': 1, 'extra': 2}),
+    (SHAPE, {'required': 1, 'nested': {'inner': 'yes'}}),
+    (SHAPE, [1]),
+    (Permissive({'known': Field(Int, default_value=1)}), {'unknown': [1, 2]}),
+    (Permissive({'known': Field(Int, default_value=1)}), {'known': 'one'}),
+]
+
+SELECTOR = Selector({'a': Field(Int), 'b': Field(Shape({'c': Field(String, default_value='d')}))})
+
+SELECTORS = [
+    (SELECTOR, {'a': 1}),
+    (SELECTOR, {'b': {}}),
+    (SELECTOR, {'b': None}),
+    (SELECTOR, {}),
+    (SELECTOR, {'a': 1, 'b': {}}),
+    (SELECTOR, {'c': 1}),
+    (Selector({'only': Field(Int, default_value=2)}), {}),
+]
+
+ARRAYS = [
+    (Array(Int), []),
+    (Array(Int), [1, 2, 3]),
+    (Array(Int), [1, 'two']),
+    (Array(Int), [1, None]),
+    (Array(Noneable(Int)), [1, None]),
+    (Array(Shape({'x': Field(Int, default_value=1)})), [{}, {'x': 2}]),
+    (Array(Int), 1),
+]
+
+STRING_OR_SHAPE = ScalarUnion(
+    scalar_type=resolve_to_config_type(String), non_scalar_type=Shape({'path': Field(String)})
+)
+
+SCALAR_UNIONS = [
+    (STRING_OR_SHAPE, 'foo'),
+    (STRING_OR_SHAPE, {'path': 'foo'}),
+    (STRING_OR_SHAPE, {'path': 1}),
+    (STRING_OR_SHAPE, 1),
+]
+
+
+def _ids(cases):
+    return ['{}-{}'.format(i, value) for i, (_, value) in enumerate(cases)]
+
+
+def assert_same_result(result, expected):
+    assert result.success == expected.success
+    assert result.value == expected.value
+    assert result.errors == expected.errors
+
+
+@pytest.mark.parametrize(
+    'dagster_type,value',
+    SCALARS + SHAPES + SELECTORS + ARRAYS + SCALAR_UNIONS,
+    ids=_ids(SCALARS + SHAPES + SELECTORS + ARRAYS + SCALAR_UNIONS),
+)
+def test_compiled_matches_reference(dagster_type, value):
+    config_type = resolve_to_config_type(dagster_type)
+    compiled = compile_config_type(config_type)
+
+    assert_same_result(compiled.validate(value), validate_config(config_type, value))
+    assert_same_result(compiled.process(value), process_config(config_type, value))
+
+
+def test_compiled_once():
+    config_type = resolve_to_config_type(SHAPE)
+    assert compile_config_type(config_type) is compile_config_type(config_type)
+
+
+def test_compiled_environment_type():
+    @solid(config={'num': Field(Int, is_required=False, default_value=2)})
+    def configured(context):
+        return context.solid_config['num']
+
+    @pipeline
+    def configured_pipeline():
+        configured()
+
+    environment_schema = create_environment_schema(configured_pipeline)
+    assert environment_schema.compiled_environment_type is compile_config_type(
+        environment_schema.environment_type
+    )
+
+    result = environment_schema.compiled_environment_type.process(
+        {'solids': {'configured': {'config': {}}}}
+    )
+    assert result.success
+    assert result.value['solids']['configured']['config'] == {'num': 2}
+
+    result = environment_schema.compiled_environment_type.validate(
+        {'solids': {'configured': {'config': {'num': 'two'}}}}
+    )
+    assert not result.success
+    assert (
+        result.errors
+        == validate_config(
+            environment_schema.environment_type,
+            {'solids': {'configured': {'config': {'num': 'two'}}}},
+        ).errors
+    )
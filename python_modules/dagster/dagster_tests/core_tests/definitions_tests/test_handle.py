@@ -43,6 +43,19 @@ def define_bar_repo():
     return RepositoryDefinition('bar', pipeline_defs=[foo_pipeline])
 
 
+def define_lazy_repo():
+    def _define_unused_pipeline():
+        raise Exception('Only the pipeline asked for should be constructed')
+
+    return RepositoryDefinition(
+        'lazy',
+        pipeline_dict={
+            'foo_pipeline': define_foo_pipeline,
+            'unused_pipeline': _define_unused_pipeline,
+        },
+    )
+
+
 def define_not_a_pipeline_or_repo():
     return 'nope'
 
@@ -184,6 +197,23 @@ def test_for_repo_fn_with_pipeline_name():
     assert pipe.name == 'foo_pipeline'
 
 
+def test_loaded_once_per_process():
+    handle = ExecutionTargetHandle.for_repo_fn(define_lazy_repo)
+    handle = ExecutionTargetHandle.from_dict(handle.to_dict())
+
+    repo = handle.build_repository_definition()
+    assert repo.name == 'lazy'
+    assert handle.build_repository_definition() is repo
+
+    handle_for_pipeline = handle.with_pipeline_name('foo_pipeline')
+    assert handle_for_pipeline.build_repository_definition() is repo
+
+    pipe = handle_for_pipeline.build_pipeline_definition()
+    assert pipe.name == 'foo_pipeline'
+    assert handle_for_pipeline.build_pipeline_definition() is pipe
+    assert ExecutionTargetHandle.get_handle(pipe) == (handle_for_pipeline, None)
+
+
 def test_bad_modes():
     handle = ExecutionTargetHandle.for_repo_fn(define_bar_repo).with_pipeline_name('foo_pipeline')
     handle.mode = 'not a mode'
@@ -1,4 +1,18 @@
-from dagster import DagsterInstance, ExecutionTargetHandle, execute_pipeline, pipeline, solid
+from dagster import (
+    DagsterInstance,
+    ExecutionTargetHandle,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.utils import make_new_run_id
+from dagster.core.execution.plan.priority import (
+    CriticalPathPriority,
+    estimate_remaining_run_duration,
+    historical_step_durations,
+)
 
 
 @solid(metadata={'dagster/priority': '-1'})
@@ -51,3 +65,161 @@ def test_priorities_mp():
     assert [
         str(event.solid_handle) for event in result.step_event_list if event.is_step_success
     ] == ['high', 'high_2', 'none', 'none_2', 'low', 'low_2']
+
+
+@solid
+def chain_start(_):
+    return 1
+
+
+@solid
+def chain_link(_, num):
+    return num + 1
+
+
+@solid
+def standalone(_):
+    pass
+
+
+@pipeline
+def critical_path_test():
+    standalone()
+    standalone()
+    chain_link.alias('chain_end')(chain_link(chain_start()))
+
+
+def test_critical_path_ranking():
+    plan = create_execution_plan(critical_path_test)
+
+    # without history every step counts the same, so the longest chain goes first
+    priority = CriticalPathPriority(plan)
+    assert priority.critical_path() == [
+        'chain_start.compute',
+        'chain_link.compute',
+        'chain_end.compute',
+    ]
+    assert priority.remaining_duration('chain_start.compute') == 3.0
+
+    steps = plan.start(sort_key_fn=priority.sort_key).get_steps_to_execute()
+    assert [step.key for step in steps] == [
+        'chain_start.compute',
+        'standalone.compute',
+        'standalone_2.compute',
+    ]
+
+    # a slow standalone step outweighs a chain of faster ones
+    priority = CriticalPathPriority(
+        plan,
+        {
+            'standalone_2.compute': 10.0,
+            'chain_start.compute': 2.0,
+            'chain_link.compute': 2.0,
+            'chain_end.compute': 2.0,
+        },
+    )
+    assert priority.critical_path() == ['standalone_2.compute']
+    # steps without history are assumed to take the mean duration of the others
+    assert priority.remaining_duration('standalone.compute') == 4.0
+
+    steps = plan.start(sort_key_fn=priority.sort_key).get_steps_to_execute()
+    assert [step.key for step in steps] == [
+        'standalone_2.compute',
+        'chain_start.compute',
+        'standalone.compute',
+    ]
+
+
+def test_critical_path_respects_priority_tags():
+    plan = create_execution_plan(priority_test)
+    priority = CriticalPathPriority(plan, {'low.compute': 100.0})
+
+    steps = plan.start(sort_key_fn=priority.sort_key).get_steps_to_execute()
+    assert [step.key for step in steps] == [
+        'high.compute',
+        'high_2.compute',
+        'none.compute',
+        'none_2.compute',
+        'low.compute',
+        'low_2.compute',
+    ]
+
+
+def test_historical_step_durations():
+    plan = create_execution_plan(critical_path_test)
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        assert historical_step_durations(instance, plan) == {}
+
+        for _ in range(2):
+            assert execute_pipeline(critical_path_test, instance=instance).success
+
+        durations = historical_step_durations(instance, plan, mode='default')
+        assert set(durations.keys()) == set(plan.step_keys_to_execute)
+        assert all(duration >= 0 for duration in durations.values())
+
+        assert historical_step_durations(instance, plan, mode='other') == {}
+
+
+def test_step_metrics_recorded():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            critical_path_test, {'storage': {'filesystem': {}}}, instance=instance
+        )
+        assert result.success
+
+        step_metrics = instance.get_step_metrics(result.run_id)
+        assert [metrics.step_key for metrics in step_metrics] == [
+            event.step_key for event in result.step_event_list if event.is_step_success
+        ]
+        for metrics in step_metrics:
+            assert metrics.success
+            assert metrics.mode == 'default'
+            assert metrics.duration_ms >= 0
+            # every solid returns None, which still pickles to a few bytes
+            assert metrics.output_bytes > 0
+
+        pipeline_run = instance.get_run_by_id(result.run_id)
+        plan = create_execution_plan(critical_path_test)
+        assert estimate_remaining_run_duration(instance, pipeline_run, plan) == 0.0
+
+        # a fresh run of the same pipeline has the whole critical path ahead of it
+        new_run = instance.create_empty_run(make_new_run_id(), 'critical_path_test')
+        estimate = estimate_remaining_run_duration(instance, new_run, plan)
+        durations = historical_step_durations(instance, plan)
+        assert estimate == CriticalPathPriority(plan, durations).estimated_duration()
+
+
+def test_critical_path_mp():
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'critical_path_test'
+    ).build_pipeline_definition()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            pipe,
+            {
+                'execution': {
+                    'multiprocess': {
+                        'config': {'max_concurrent': 1, 'step_priority': 'critical_path'}
+                    }
+                },
+                'storage': {'filesystem': {}},
+            },
+            instance=DagsterInstance.local_temp(temp_dir),
+        )
+
+    assert result.success
+    step_order = [
+        str(event.solid_handle) for event in result.step_event_list if event.is_step_success
+    ]
+    # once chain_link is done every remaining step has the same remaining path
+    assert step_order[:2] == ['chain_start', 'chain_link']
+    assert set(step_order[2:]) == {'chain_end', 'standalone', 'standalone_2'}
+
+    engine_messages = [event.message for event in result.event_list if event.is_engine_event]
+    assert any(
+        message.startswith('Ordering ready steps by critical path') for message in engine_messages
+    )
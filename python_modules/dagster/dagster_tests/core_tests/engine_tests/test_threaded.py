@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+
+from dagster import (
+    DagsterInstance,
+    Failure,
+    InputDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.storage.compute_log_manager import ComputeIOType
+
+THREADED = {'execution': {'threaded': {}}}
+
+# set by each of the rendezvous solids, which only succeed when run at the same time
+left_arrived = threading.Event()
+right_arrived = threading.Event()
+
+
+@lambda_solid
+def return_two():
+    return 2
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def add_three(num):
+    return num + 3
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def mult_three(num):
+    return num * 3
+
+
+@lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+def adder(left, right):
+    return left + right
+
+
+@pipeline
+def diamond():
+    two = return_two()
+    adder(left=add_three(two), right=mult_three(two))
+
+
+def test_diamond_threaded_execution():
+    result = execute_pipeline(diamond, THREADED)
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    step_order = [event.step_key for event in result.step_event_list if event.is_step_success]
+    assert step_order[0] == 'return_two.compute'
+    assert step_order[-1] == 'adder.compute'
+
+
+@solid
+def rendezvous_left(context):
+    print('left says hello')
+    left_arrived.set()
+    assert right_arrived.wait(5), 'rendezvous_right did not run concurrently'
+    context.log.info('left done')
+
+
+@solid
+def rendezvous_right(context):
+    print('right says hello')
+    right_arrived.set()
+    assert left_arrived.wait(5), 'rendezvous_left did not run concurrently'
+    context.log.info('right done')
+
+
+@pipeline
+def rendezvous():
+    rendezvous_left()
+    rendezvous_right()
+
+
+def test_steps_execute_concurrently():
+    left_arrived.clear()
+    right_arrived.clear()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(rendezvous, THREADED, instance=instance)
+        assert result.success
+
+        # each step's compute log only holds its own output
+        manager = instance.compute_log_manager
+        left_log = manager.read_logs_file(
+            result.run_id, 'rendezvous_left.compute', ComputeIOType.STDOUT
+        )
+        right_log = manager.read_logs_file(
+            result.run_id, 'rendezvous_right.compute', ComputeIOType.STDOUT
+        )
+        assert 'left says hello' in left_log.data
+        assert 'right says hello' not in left_log.data
+        assert 'right says hello' in right_log.data
+        assert 'left says hello' not in right_log.data
+
+
+def test_max_concurrent():
+    left_arrived.clear()
+    right_arrived.clear()
+
+    result = execute_pipeline(
+        rendezvous,
+        {'execution': {'threaded': {'config': {'max_concurrent': 1}}}},
+        raise_on_error=False,
+    )
+    # one step at a time, so the first one waits for the second in vain
+    assert not result.success
+
+
+@solid
+def throw(_):
+    raise Failure('it failed')
+
+
+@solid
+def downstream_of_throw(_, _input):
+    pass
+
+
+@pipeline
+def failing():
+    downstream_of_throw(throw())
+    return_two()
+
+
+def test_failure():
+    result = execute_pipeline(failing, THREADED, raise_on_error=False)
+    assert not result.success
+    assert result.result_for_solid('throw').failure_data.error.message.startswith(
+        'dagster.core.definitions.events.Failure: it failed'
+    )
+    assert result.result_for_solid('downstream_of_throw').skipped
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def test_failure_raises():
+    with pytest.raises(Failure, match='it failed'):
+        execute_pipeline(failing, THREADED)
@@ -172,3 +172,36 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_dagster_type(Optional[List[String]]), ['obj_name']
             )
+
+
+class FallbackFancyStringFilesystemTypeStoragePlugin(
+    FancyStringFilesystemTypeStoragePlugin
+):  # pylint:disable=no-init
+    @classmethod
+    def falls_back_in_composites(cls):
+        return True
+
+
+def test_file_system_intermediate_store_with_composite_type_storage_plugin_fallback():
+    run_id = make_new_run_id()
+    instance = DagsterInstance.ephemeral()
+
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory,
+        run_id=run_id,
+        type_storage_plugin_registry=TypeStoragePluginRegistry(
+            [(RuntimeString, FallbackFancyStringFilesystemTypeStoragePlugin)]
+        ),
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        for runtime_type in [List[String], Optional[List[String]]]:
+            try:
+                intermediate_store.set_value(
+                    ['hello'], context, resolve_dagster_type(runtime_type), ['obj_name']
+                )
+                assert intermediate_store.get_value(
+                    context, resolve_dagster_type(runtime_type), ['obj_name']
+                ).obj == ['hello']
+            finally:
+                intermediate_store.rm_object(context, ['obj_name'])
@@ -0,0 +1,147 @@
+import logging
+import threading
+
+from dagster import DagsterEventType, execute_pipeline, pipeline, seven, solid
+from dagster.core.events import DagsterEvent
+from dagster.core.instance import DagsterInstance
+from dagster.core.log_dispatch import (
+    BackgroundLogDispatcher,
+    LogDispatchOverflowPolicy,
+    LogDispatchSettings,
+)
+from dagster.core.log_manager import DagsterLogManager
+
+
+class CapturingHandler(logging.Handler):
+    def __init__(self, gate=None):
+        self.records = []
+        self.threads = set()
+        self._gate = gate
+        super(CapturingHandler, self).__init__()
+
+    def emit(self, record):
+        if self._gate:
+            self._gate.wait()
+        self.threads.add(threading.current_thread().name)
+        self.records.append(record)
+
+
+def _capturing_logger(handler):
+    logger = logging.Logger('test_log_dispatch')
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_background_dispatch_in_order():
+    handler = CapturingHandler()
+    dispatcher = BackgroundLogDispatcher(LogDispatchSettings(batch_size=7)).start()
+    log_manager = DagsterLogManager('123', {}, [_capturing_logger(handler)], dispatcher)
+
+    try:
+        for i in range(100):
+            log_manager.info('message {}'.format(i))
+        log_manager.flush()
+
+        assert [record.dagster_meta['orig_message'] for record in handler.records] == [
+            'message {}'.format(i) for i in range(100)
+        ]
+        assert threading.current_thread().name not in handler.threads
+    finally:
+        dispatcher.stop()
+
+
+def test_level_filtered_before_dispatch():
+    handler = CapturingHandler()
+    logger = _capturing_logger(handler)
+    logger.setLevel(logging.INFO)
+    dispatcher = BackgroundLogDispatcher().start()
+    log_manager = DagsterLogManager('123', {}, [logger], dispatcher)
+
+    try:
+        log_manager.debug('filtered')
+        log_manager.info('delivered')
+        log_manager.flush()
+    finally:
+        dispatcher.stop()
+
+    assert [record.dagster_meta['orig_message'] for record in handler.records] == ['delivered']
+
+
+def test_synchronous_when_stopped():
+    handler = CapturingHandler()
+    dispatcher = BackgroundLogDispatcher()
+    log_manager = DagsterLogManager('123', {}, [_capturing_logger(handler)], dispatcher)
+
+    log_manager.info('before start')
+    assert len(handler.records) == 1
+
+    dispatcher.start()
+    dispatcher.stop()
+
+    log_manager.info('after stop')
+    assert len(handler.records) == 2
+    assert handler.threads == {threading.current_thread().name}
+
+
+def test_drop_debug_overflow_policy():
+    gate = threading.Event()
+    handler = CapturingHandler(gate=gate)
+    dispatcher = BackgroundLogDispatcher(
+        LogDispatchSettings(
+            max_queue_size=2, batch_size=1, overflow_policy=LogDispatchOverflowPolicy.DROP_DEBUG
+        )
+    ).start()
+    log_manager = DagsterLogManager('123', {}, [_capturing_logger(handler)], dispatcher)
+
+    try:
+        # the handler is blocked, so the queue fills up and further debug messages are dropped
+        for i in range(10):
+            log_manager.debug('debug {}'.format(i))
+
+        assert dispatcher.dropped_count >= 7
+
+        gate.set()
+        log_manager.info('never dropped')
+        log_manager.flush()
+    finally:
+        dispatcher.stop()
+
+    messages = [record.dagster_meta['orig_message'] for record in handler.records]
+    assert messages[-1] == 'never dropped'
+    assert len(messages) + dispatcher.dropped_count == 11
+
+
+def test_execute_pipeline_with_log_dispatch():
+    @solid
+    def chatty(context):
+        for i in range(50):
+            context.log.debug('chatty {}'.format(i))
+        return 1
+
+    @solid
+    def downstream(_, num):
+        return num + 1
+
+    @pipeline
+    def chatty_pipeline():
+        downstream(chatty())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(
+            temp_dir, overrides={'log_dispatch': {'max_queue_size': 5, 'batch_size': 2}}
+        )
+        assert instance.log_dispatch_settings == LogDispatchSettings(max_queue_size=5, batch_size=2)
+
+        result = execute_pipeline(chatty_pipeline, instance=instance)
+        assert result.success
+
+        # everything has been written to storage by the time execute_pipeline returns
+        logs = instance.all_logs(result.run_id)
+        assert len([log for log in logs if log.user_message.startswith('chatty ')]) == 50
+        assert logs[-1].dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS
+        assert [
+            log.dagster_event.event_type
+            for log in logs
+            if isinstance(log.dagster_event, DagsterEvent)
+        ] == [event.event_type for event in result.event_list]
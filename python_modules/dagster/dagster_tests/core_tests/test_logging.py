@@ -5,7 +5,7 @@ from contextlib import contextmanager
 
 import pytest
 
-from dagster import ModeDefinition, check, execute_solid, pipeline, solid
+from dagster import ModeDefinition, check, execute_solid, logger, pipeline, solid
 from dagster.core.definitions import SolidHandle
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.logger import InitLoggerContext
@@ -158,8 +158,8 @@ def test_default_context_logging():
     @solid(input_defs=[], output_defs=[])
     def default_context_solid(context):
         called['yes'] = True
-        for logger in context.log.loggers:
-            assert logger.level == logging.DEBUG
+        for logger_ in context.log.loggers:
+            assert logger_.level == logging.DEBUG
 
     execute_solid(default_context_solid)
 
@@ -197,3 +197,34 @@ def test_json_console_logger(capsys):
                 found_msg = True
 
     assert found_msg
+
+
+def test_logger_handlers_closed_after_run():
+    events = []
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record):
+            events.append(record.dagster_meta['orig_message'])
+
+        def close(self):
+            events.append('closed')
+            super(RecordingHandler, self).close()
+
+    @logger
+    def recording_logger(_init_context):
+        logger_ = logging.Logger('recording', level=logging.INFO)
+        logger_.addHandler(RecordingHandler())
+        return logger_
+
+    @solid
+    def hello_world(context):
+        context.log.info('Hello, world!')
+
+    execute_solid(
+        hello_world,
+        mode_def=ModeDefinition(logger_defs={'recording': recording_logger}),
+        environment_dict={'loggers': {'recording': {}}},
+    )
+
+    assert 'Hello, world!' in events
+    assert events[-1] == 'closed'
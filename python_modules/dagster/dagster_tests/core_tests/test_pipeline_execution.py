@@ -398,6 +398,16 @@ def test_pipeline_disjoint_subset():
     assert len(disjoint_pipeline.solids) == 2
 
 
+def test_pipeline_subset_memoized():
+    pipeline_def = define_three_part_pipeline()
+
+    sub_pipeline = pipeline_def.build_sub_pipeline(['add_one', 'add_three'])
+    assert pipeline_def.build_sub_pipeline(['add_one', 'add_three']) is sub_pipeline
+    assert pipeline_def.build_sub_pipeline(['add_three', 'add_one']) is sub_pipeline
+    assert pipeline_def.build_sub_pipeline(['add_one']) is not sub_pipeline
+    assert pipeline_def.build_sub_pipeline(None) is pipeline_def
+
+
 def test_pipeline_execution_disjoint_subset():
     env_config = {
         'solids': {
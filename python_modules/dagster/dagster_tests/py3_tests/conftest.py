@@ -0,0 +1,4 @@
+import sys
+
+# async generators are only available from python 3.6
+collect_ignore = ['test_async_generator_solids.py'] if sys.version_info < (3, 6) else []
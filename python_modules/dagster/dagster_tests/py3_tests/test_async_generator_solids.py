@@ -0,0 +1,48 @@
+import asyncio
+
+from dagster import (
+    Materialization,
+    ModeDefinition,
+    Output,
+    asyncio_executor,
+    default_executors,
+    execute_pipeline,
+    pipeline,
+    solid,
+)
+
+
+@solid
+async def stream(_):
+    for i in range(3):
+        await asyncio.sleep(0)
+        yield Materialization(label='chunk_{i}'.format(i=i))
+    yield Output(3)
+
+
+@solid
+async def abandoned(_):
+    yield Output(1)
+    await asyncio.sleep(0)
+    raise Exception('should be reported as a failure')
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [asyncio_executor])])
+def streaming():
+    stream()
+    abandoned()
+
+
+def test_async_generator_solids():
+    for environment_dict in [{}, {'execution': {'asyncio': {}}}]:
+        result = execute_pipeline(streaming, environment_dict, raise_on_error=False)
+        assert not result.success
+
+        stream_result = result.result_for_solid('stream')
+        assert stream_result.output_value() == 3
+        assert [
+            materialization.label
+            for materialization in stream_result.materializations_during_compute
+        ] == ['chunk_0', 'chunk_1', 'chunk_2']
+
+        assert result.result_for_solid('abandoned').failure_data
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    InputDefinition,
+    ModeDefinition,
+    asyncio_executor,
+    default_executors,
+    execute_pipeline,
+    execute_solid,
+    lambda_solid,
+    pipeline,
+    solid,
+)
+
+ASYNCIO = {'execution': {'asyncio': {}}}
+
+asyncio_mode = ModeDefinition(executor_defs=default_executors + [asyncio_executor])
+
+
+@lambda_solid
+async def return_two():
+    await asyncio.sleep(0)
+    return 2
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+async def add_three(num):
+    await asyncio.sleep(0.01)
+    return num + 3
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def mult_three(num):
+    return num * 3
+
+
+@solid
+async def adder(context, left: int, right: int) -> int:
+    await asyncio.sleep(0)
+    context.log.info('adding')
+    return left + right
+
+
+@pipeline(mode_defs=[asyncio_mode])
+def async_diamond():
+    two = return_two()
+    adder(left=add_three(two), right=mult_three(two))
+
+
+def test_async_solid_in_process():
+    result = execute_solid(adder, input_values={'left': 1, 'right': 2})
+    assert result.success
+    assert result.output_value() == 3
+
+    result = execute_pipeline(async_diamond)
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_async_solid_threaded():
+    result = execute_pipeline(async_diamond, {'execution': {'threaded': {}}})
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_async_diamond_on_asyncio_executor():
+    result = execute_pipeline(async_diamond, ASYNCIO)
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    # the events of every step are in order, whatever the interleaving of steps
+    for step_key in ['return_two.compute', 'add_three.compute', 'adder.compute']:
+        event_types = [
+            event.event_type for event in result.step_event_list if event.step_key == step_key
+        ]
+        assert event_types[0] == DagsterEventType.STEP_START
+        assert event_types[-2] == DagsterEventType.STEP_OUTPUT
+        assert event_types[-1] == DagsterEventType.STEP_SUCCESS
+
+
+in_flight = {'current': 0, 'max': 0}
+
+
+@solid
+async def fan_out(_):
+    in_flight['current'] += 1
+    in_flight['max'] = max(in_flight['max'], in_flight['current'])
+    # give every other step the chance to start before this one finishes
+    for _ in range(3):
+        await asyncio.sleep(0.01)
+    in_flight['current'] -= 1
+
+
+@pipeline(mode_defs=[asyncio_mode])
+def fan_out_pipeline():
+    for i in range(20):
+        fan_out.alias('fan_out_{i}'.format(i=i))()
+
+
+def test_steps_await_concurrently():
+    in_flight.update(current=0, max=0)
+    assert execute_pipeline(fan_out_pipeline, ASYNCIO).success
+    assert in_flight['max'] == 20
+
+
+def test_max_concurrent():
+    in_flight.update(current=0, max=0)
+    assert execute_pipeline(
+        fan_out_pipeline, {'execution': {'asyncio': {'config': {'max_concurrent': 5}}}}
+    ).success
+    assert in_flight['max'] == 5
+
+
+@solid
+async def throw(_):
+    await asyncio.sleep(0)
+    raise ValueError('async failure')
+
+
+@solid
+def downstream_of_throw(_, _input):
+    pass
+
+
+@pipeline(mode_defs=[asyncio_mode])
+def failing():
+    downstream_of_throw(throw())
+    fan_out()
+
+
+def test_failure():
+    result = execute_pipeline(failing, ASYNCIO, raise_on_error=False)
+    assert not result.success
+    assert 'async failure' in result.result_for_solid('throw').failure_data.error.message
+    assert result.result_for_solid('downstream_of_throw').skipped
+    assert result.result_for_solid('fan_out').success
+
+
+def test_failure_raises():
+    with pytest.raises(ValueError, match='async failure'):
+        execute_pipeline(failing, ASYNCIO)
+
+    with pytest.raises(ValueError, match='async failure'):
+        execute_pipeline(failing)
@@ -1,5 +1,6 @@
 from .context import DagstermillExecutionContext
 from .errors import DagstermillError, DagstermillExecutionError
+from .kernel_pool import KERNEL_POOL_RESOURCE_KEY, KernelPool, kernel_pool_resource
 from .manager import MANAGER_FOR_NOTEBOOK_INSTANCE as _MANAGER_FOR_NOTEBOOK_INSTANCE
 from .solids import define_dagstermill_solid
 
@@ -6,6 +6,25 @@ from papermill.preprocess import PapermillExecutePreprocessor
 
 
 class DagstermillExecutePreprocessor(PapermillExecutePreprocessor):
+    # Calqued from PapermillExecutePreprocessor.preprocess. When it is passed a kernel manager --
+    # one from a KernelPool -- nbconvert leaves both the kernel and the channels of the client it
+    # made for it running. We stop the channels, and leave the kernel to the pool.
+    def preprocess(self, nb_man, resources, km=None):
+        with self.setup_preprocessor(nb_man.nb, resources, km=km):
+            kernel_client = self.kc
+            try:
+                if self.log_output:
+                    self.log.info('Executing notebook with kernel: {}'.format(self.kernel_name))
+                nb, resources = self.papermill_process(nb_man, resources)
+                info_msg = self._wait_for_reply(self.kc.kernel_info())
+                nb.metadata['language_info'] = info_msg['content']['language_info']
+                self.set_widgets_metadata()
+            finally:
+                if km is not None:
+                    kernel_client.stop_channels()
+
+        return nb, resources
+
     # We need to finalize dagster resources here (as opposed to, e.g., in the notebook_complete
     # method on the NotebookExecutionManager), because we need to be inside the scope of the
     # nbconvert.preprocessors.ExecutePreprocessor.setup_preprocessor context manager, which tears
@@ -47,6 +66,7 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         stderr_file=None,
         start_timeout=60,
         execution_timeout=None,
+        kernel_manager=None,
         **kwargs
     ):
         # Nicely handle preprocessor arguments prioritizing values set by engine
@@ -58,4 +78,4 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         )
 
         preprocessor.log_output = log_output  # pylint:disable = attribute-defined-outside-init
-        preprocessor.preprocess(nb_man, kwargs)
+        preprocessor.preprocess(nb_man, kwargs, km=kernel_manager)
@@ -3,6 +3,7 @@ import pickle
 import uuid
 
 import dagstermill
+import pandas as pd
 from dagster_pandas import DataFrame
 
 from dagster import (
@@ -163,6 +164,45 @@ def define_test_notebook_dag_pipeline():
     )
 
 
+NOTEBOOK_CHAIN_LENGTH = 4
+
+
+def define_notebook_chain_pipeline(use_kernel_pool=False):
+    add_two_numbers = dagstermill.define_dagstermill_solid(
+        'add_two_numbers',
+        nb_test_path('add_two_numbers'),
+        [InputDefinition(name='a', dagster_type=Int), InputDefinition(name='b', dagster_type=Int)],
+        [OutputDefinition(Int)],
+        required_resource_keys={dagstermill.KERNEL_POOL_RESOURCE_KEY} if use_kernel_pool else None,
+    )
+
+    dependencies = {SolidInvocation('load_constant', alias='load_b'): {}}
+    for index in range(NOTEBOOK_CHAIN_LENGTH):
+        dependencies[SolidInvocation('add_two_numbers', alias='add_{}'.format(index))] = {
+            'a': DependencyDefinition('load_b' if index == 0 else 'add_{}'.format(index - 1)),
+            'b': DependencyDefinition('load_b'),
+        }
+
+    return PipelineDefinition(
+        name='notebook_chain_pipeline',
+        solid_defs=[load_constant, add_two_numbers],
+        dependencies=dependencies,
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    dagstermill.KERNEL_POOL_RESOURCE_KEY: dagstermill.kernel_pool_resource
+                }
+                if use_kernel_pool
+                else {}
+            )
+        ],
+    )
+
+
+def define_kernel_pool_notebook_chain_pipeline():
+    return define_notebook_chain_pipeline(use_kernel_pool=True)
+
+
 def define_error_pipeline():
     return PipelineDefinition(
         name='error_pipeline',
@@ -209,6 +249,29 @@ def define_tutorial_pipeline():
     )
 
 
+@lambda_solid(output_def=OutputDefinition(DataFrame))
+def load_dataframe():
+    return pd.DataFrame({'num': [1, 2, 3]})
+
+
+@solid_definition
+def double_dataframe_solid():
+    return dagstermill.define_dagstermill_solid(
+        'double_dataframe',
+        nb_test_path('double_dataframe'),
+        input_defs=[InputDefinition(name='df', dagster_type=DataFrame)],
+        output_defs=[OutputDefinition(DataFrame)],
+    )
+
+
+def define_double_dataframe_pipeline():
+    return PipelineDefinition(
+        name='double_dataframe_pipeline',
+        solid_defs=[load_dataframe, double_dataframe_solid],
+        dependencies={'double_dataframe': {'df': DependencyDefinition('load_dataframe')}},
+    )
+
+
 @solid('resource_solid', required_resource_keys={'list'})
 def resource_solid(context):
     context.resources.list.append('Hello, solid!')
@@ -0,0 +1,163 @@
+'''A pool of warm Jupyter kernels that dagstermill solids execute their notebooks on.
+
+Starting a kernel, and importing libraries like pandas into it, can take much longer than executing
+a small notebook. Solids that require the kernel pool resource run their notebooks on a kernel from
+the pool, which is returned to it afterwards with its namespace reset, but with the modules it has
+imported still loaded:
+
+    clean_data = define_dagstermill_solid(
+        'clean_data', 'clean_data.ipynb', required_resource_keys={'dagstermill_kernel_pool'}
+    )
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(resource_defs={'dagstermill_kernel_pool': kernel_pool_resource})
+        ]
+    )
+    def tutorial_pipeline():
+        ...
+
+Kernels are pooled by kernel name and pipeline, and live as long as the resource -- i.e., for the
+run, in the process that initializes the resource. Kernels are only reused by the in-process
+executor, since the multiprocess executor initializes resources in each step's process.
+'''
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from dagster import Field, Int, check, resource
+
+KERNEL_POOL_RESOURCE_KEY = 'dagstermill_kernel_pool'
+
+# Clears the user namespace of a kernel, but doesn't unload the modules it has imported
+RESET_NAMESPACE_SOURCE = 'get_ipython().run_line_magic("reset", "-f")'
+
+RESET_TIMEOUT = 30
+
+
+class KernelPool(object):
+    '''Warm kernels, keyed by kernel name and pipeline.
+
+    Args:
+        max_idle_kernels (Optional[int]): How many idle kernels to keep for each kernel name and
+            pipeline. (default: 1)
+
+    Attributes:
+        kernels_started (int): How many kernels were started on kernel managers from the pool.
+    '''
+
+    def __init__(self, max_idle_kernels=1):
+        self.max_idle_kernels = check.int_param(max_idle_kernels, 'max_idle_kernels')
+        self._idle_kernels = defaultdict(list)
+        self._lock = threading.Lock()
+        self.kernels_started = 0
+
+    @contextmanager
+    def kernel(self, kernel_name, pipeline_name):
+        '''Check a kernel manager out of the pool, returning it once the block exits.
+
+        The kernel is only started once a notebook is executed on it. Kernels that raised are shut
+        down rather than returned, as are those whose namespace couldn't be reset.
+        '''
+        check.str_param(kernel_name, 'kernel_name')
+        check.str_param(pipeline_name, 'pipeline_name')
+
+        key = (kernel_name, pipeline_name)
+        kernel_manager = self._checkout(key)
+        had_kernel = kernel_manager.has_kernel
+        try:
+            yield kernel_manager
+        except Exception:
+            self._count_start(kernel_manager, had_kernel)
+            _shutdown(kernel_manager)
+            raise
+
+        self._count_start(kernel_manager, had_kernel)
+        self._checkin(key, kernel_manager)
+
+    def shutdown(self):
+        with self._lock:
+            kernel_managers = [
+                kernel_manager
+                for kernel_managers in self._idle_kernels.values()
+                for kernel_manager in kernel_managers
+            ]
+            self._idle_kernels.clear()
+
+        for kernel_manager in kernel_managers:
+            _shutdown(kernel_manager)
+
+    def _checkout(self, key):
+        with self._lock:
+            if self._idle_kernels[key]:
+                return self._idle_kernels[key].pop()
+
+        # deferred import for perf
+        from jupyter_client.manager import KernelManager
+
+        kernel_name, _pipeline_name = key
+        return KernelManager(kernel_name=kernel_name)
+
+    def _count_start(self, kernel_manager, had_kernel):
+        if kernel_manager.has_kernel and not had_kernel:
+            with self._lock:
+                self.kernels_started += 1
+
+    def _checkin(self, key, kernel_manager):
+        if not _reset_namespace(kernel_manager):
+            _shutdown(kernel_manager)
+            return
+
+        with self._lock:
+            if len(self._idle_kernels[key]) < self.max_idle_kernels:
+                self._idle_kernels[key].append(kernel_manager)
+                return
+
+        _shutdown(kernel_manager)
+
+
+def _reset_namespace(kernel_manager):
+    if not (kernel_manager.has_kernel and kernel_manager.is_alive()):
+        return False
+
+    kernel_client = kernel_manager.client()
+    kernel_client.start_channels()
+    try:
+        kernel_client.wait_for_ready(timeout=RESET_TIMEOUT)
+        reply = kernel_client.execute_interactive(
+            RESET_NAMESPACE_SOURCE,
+            silent=True,
+            store_history=False,
+            timeout=RESET_TIMEOUT,
+            output_hook=lambda _msg: None,
+        )
+        return reply['content']['status'] == 'ok'
+    except Exception:  # pylint: disable=broad-except
+        return False
+    finally:
+        kernel_client.stop_channels()
+
+
+def _shutdown(kernel_manager):
+    if kernel_manager.has_kernel:
+        kernel_manager.shutdown_kernel(now=True)
+
+
+@resource(
+    config={
+        'max_idle_kernels': Field(
+            Int,
+            description='How many idle kernels to keep for each kernel name and pipeline.',
+            is_required=False,
+            default_value=1,
+        )
+    },
+    description='A pool of warm Jupyter kernels for dagstermill solids to execute notebooks on.',
+)
+def kernel_pool_resource(init_context):
+    pool = KernelPool(max_idle_kernels=init_context.resource_config['max_idle_kernels'])
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
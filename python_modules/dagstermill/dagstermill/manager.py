@@ -18,6 +18,7 @@ from dagster import (
 from dagster.cli import load_handle
 from dagster.core.definitions.dependency import SolidHandle
 from dagster.core.execution.api import create_execution_plan, scoped_pipeline_context
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.context_creation_pipeline import (
     ResourcesStack,
     get_required_resource_keys_to_init,
@@ -30,7 +31,15 @@ from dagster.loggers import colored_console_logger
 
 from .context import DagstermillExecutionContext
 from .errors import DagstermillError
-from .serialize import PICKLE_PROTOCOL, read_value, write_value
+from .serialize import (
+    PICKLE_PROTOCOL,
+    intermediate_reference,
+    is_intermediate_reference,
+    is_marshalled_to_file,
+    read_value,
+    step_output_handle_for_reference,
+    write_value,
+)
 
 
 class Manager(object):
@@ -40,7 +49,9 @@ class Manager(object):
         self.solid_def = None
         self.in_pipeline = False
         self.marshal_dir = None
+        self.step_key = None
         self.context = None
+        self.pipeline_context = None
         self.resources_stack = None
 
     @contextmanager
@@ -69,6 +80,7 @@ class Manager(object):
         solid_subset=None,
         solid_handle_kwargs=None,
         instance_ref_dict=None,
+        step_key=None,
     ):
         '''Reconstitutes a context for dagstermill-managed execution.
 
@@ -89,6 +101,7 @@ class Manager(object):
         check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
         check.dict_param(solid_handle_kwargs, 'solid_handle_kwargs')
         check.dict_param(instance_ref_dict, 'instance_ref_dict')
+        check.opt_str_param(step_key, 'step_key')
 
         try:
             handle = load_handle.handle_for_pipeline_cli_args(
@@ -128,6 +141,7 @@ class Manager(object):
         pipeline_run = unpack_value(pipeline_run_dict)
 
         self.marshal_dir = marshal_dir
+        self.step_key = step_key
         self.in_pipeline = True
         self.solid_def = solid_def
         self.pipeline_def = pipeline_def
@@ -142,6 +156,7 @@ class Manager(object):
             execution_plan,
             scoped_resources_builder_cm=self._setup_resources,
         ) as pipeline_context:
+            self.pipeline_context = pipeline_context
             self.context = DagstermillExecutionContext(
                 pipeline_context=pipeline_context,
                 solid_config=None,
@@ -252,6 +267,21 @@ class Manager(object):
 
         runtime_type = self.solid_def.output_def_named(output_name).runtime_type
 
+        if self._stores_intermediates and is_marshalled_to_file(runtime_type, value):
+            # Hand the value back through the run's intermediate store, so that it is serialized
+            # by the storage plugins of its type. It is stored alongside, rather than as, the
+            # solid's output -- the output is stored once dagstermill has type checked it, and
+            # this copy is then removed. Hyphens aren't valid in output names, so this can't
+            # collide with a real output.
+            step_output_handle = StepOutputHandle(
+                self.step_key, 'dagstermill-{output_name}'.format(output_name=output_name)
+            )
+            self.pipeline_context.intermediates_manager.set_intermediate(
+                self.pipeline_context, runtime_type, step_output_handle, value
+            )
+            scrapbook.glue(output_name, intermediate_reference(step_output_handle))
+            return
+
         out_file = os.path.join(self.marshal_dir, 'output-{}'.format(output_name))
         scrapbook.glue(output_name, write_value(runtime_type, value, out_file))
 
@@ -285,8 +315,25 @@ class Manager(object):
         if self.resources_stack is not None:
             self.resources_stack.teardown()
 
+    @property
+    def _stores_intermediates(self):
+        return (
+            self.step_key is not None
+            and self.pipeline_context is not None
+            and self.pipeline_context.intermediates_manager.is_persistent
+        )
+
     def load_parameter(self, input_name, input_value):
         input_def = self.solid_def.input_def_named(input_name)
+        if is_intermediate_reference(input_value):
+            # the input is loaded from the run's intermediate store, where its upstream step stored
+            # it, rather than from a copy marshalled for the notebook
+            return self.pipeline_context.intermediates_manager.get_intermediate(
+                self.pipeline_context,
+                input_def.runtime_type,
+                step_output_handle_for_reference(input_value),
+            ).obj
+
         return read_value(input_def.runtime_type, input_value)
 
 
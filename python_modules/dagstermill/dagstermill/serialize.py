@@ -1,8 +1,13 @@
 from dagster import check, seven
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.dagster_type import DagsterType
 
 PICKLE_PROTOCOL = 2
 
+# Marks a parameter or scrap whose value is held in the run's intermediate store, rather than
+# having been marshalled to a file of its own
+INTERMEDIATE_REFERENCE_KEY = '__dm_intermediate'
+
 
 def is_json_serializable(value):
     try:
@@ -12,6 +17,33 @@ def is_json_serializable(value):
         return False
 
 
+def is_marshalled_to_file(runtime_type, value):
+    '''Whether write_value would serialize value to a file, rather than pass it as is.'''
+    check.inst_param(runtime_type, 'runtime_type', DagsterType)
+    if runtime_type.is_scalar:
+        return False
+    return not (runtime_type.is_any and is_json_serializable(value))
+
+
+def intermediate_reference(step_output_handle):
+    check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+    return {
+        INTERMEDIATE_REFERENCE_KEY: {
+            'step_key': step_output_handle.step_key,
+            'output_name': step_output_handle.output_name,
+        }
+    }
+
+
+def is_intermediate_reference(value):
+    return isinstance(value, dict) and list(value.keys()) == [INTERMEDIATE_REFERENCE_KEY]
+
+
+def step_output_handle_for_reference(reference):
+    check.param_invariant(is_intermediate_reference(reference), 'reference')
+    return StepOutputHandle(**reference[INTERMEDIATE_REFERENCE_KEY])
+
+
 def read_value(runtime_type, value):
     check.inst_param(runtime_type, 'runtime_type', DagsterType)
     if runtime_type.is_scalar:
@@ -23,10 +55,7 @@ def read_value(runtime_type, value):
 
 
 def write_value(runtime_type, value, target_file):
-    check.inst_param(runtime_type, 'runtime_type', DagsterType)
-    if runtime_type.is_scalar:
-        return value
-    elif runtime_type.is_any and is_json_serializable(value):
+    if not is_marshalled_to_file(runtime_type, value):
         return value
     else:
         runtime_type.serialization_strategy.serialize_to_file(value, target_file)
@@ -2,6 +2,7 @@ import copy
 import os
 import pickle
 import uuid
+from contextlib import contextmanager
 
 import nbformat
 import papermill
@@ -30,7 +31,15 @@ from dagster.utils import mkdir_p, safe_tempfile_path
 
 from .engine import DagstermillNBConvertEngine
 from .errors import DagstermillError, DagstermillExecutionError
-from .serialize import read_value, write_value
+from .kernel_pool import KERNEL_POOL_RESOURCE_KEY, KernelPool
+from .serialize import (
+    intermediate_reference,
+    is_intermediate_reference,
+    is_marshalled_to_file,
+    read_value,
+    step_output_handle_for_reference,
+    write_value,
+)
 from .translator import RESERVED_INPUT_NAMES, DagsterTranslator
 
 
@@ -85,6 +94,23 @@ def replace_parameters(context, nb, parameters):
     return nb
 
 
+def _stored_source_handle(compute_context, input_name):
+    '''The handle of the step output that the input was loaded from, if the notebook can load it
+    from the run's intermediate store too.'''
+    if not compute_context.intermediates_manager.is_persistent:
+        return None
+
+    step_input = compute_context.step.step_input_named(input_name)
+    if not step_input.is_from_single_output:
+        return None
+
+    source_handle = step_input.source_handles[0]
+    if not compute_context.intermediates_manager.has_intermediate(compute_context, source_handle):
+        return None
+
+    return source_handle
+
+
 def get_papermill_parameters(compute_context, inputs, output_log_path):
     check.inst_param(compute_context, 'compute_context', SystemComputeExecutionContext)
     check.param_invariant(
@@ -115,6 +141,7 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
         'output_log_path': output_log_path,
         'marshal_dir': marshal_dir,
         'environment_dict': compute_context.environment_dict,
+        'step_key': compute_context.step.key,
     }
 
     dm_solid_handle_kwargs = compute_context.solid_handle._asdict()
@@ -127,9 +154,14 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
             input_name not in RESERVED_INPUT_NAMES
         ), 'Dagstermill solids cannot have inputs named {input_name}'.format(input_name=input_name)
         runtime_type = input_def_dict[input_name].runtime_type
-        parameter_value = write_value(
-            runtime_type, input_value, os.path.join(marshal_dir, 'input-{}'.format(input_name))
-        )
+        source_handle = _stored_source_handle(compute_context, input_name)
+        if source_handle and is_marshalled_to_file(runtime_type, input_value):
+            # the notebook loads the value from the run's intermediate store itself
+            parameter_value = intermediate_reference(source_handle)
+        else:
+            parameter_value = write_value(
+                runtime_type, input_value, os.path.join(marshal_dir, 'input-{}'.format(input_name))
+            )
         parameters[input_name] = parameter_value
 
     parameters['__dm_context'] = dm_context_dict
@@ -142,6 +174,21 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
     return parameters
 
 
+@contextmanager
+def _kernel_manager(compute_context, nb):
+    '''The name of the kernel to execute nb on, and a kernel manager for it from the kernel pool if
+    the solid requires one -- otherwise None, and papermill starts a kernel of its own.'''
+    kernel_name = nb.metadata.kernelspec.name
+    kernel_pool = getattr(compute_context.resources, KERNEL_POOL_RESOURCE_KEY, None)
+    if kernel_pool is None:
+        yield kernel_name, None
+        return
+
+    check.inst(kernel_pool, KernelPool)
+    with kernel_pool.kernel(kernel_name, compute_context.pipeline_def.name) as kernel_manager:
+        yield kernel_name, kernel_manager
+
+
 def _dm_solid_compute(name, notebook_path):
     check.str_param(name, 'name')
     check.str_param(notebook_path, 'notebook_path')
@@ -188,9 +235,18 @@ def _dm_solid_compute(name, notebook_path):
             ):
                 try:
                     papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
-                    papermill.execute_notebook(
-                        intermediate_path, temp_path, engine_name='dagstermill', log_output=True
-                    )
+                    with _kernel_manager(system_compute_context, nb_no_parameters) as (
+                        kernel_name,
+                        kernel_manager,
+                    ):
+                        papermill.execute_notebook(
+                            intermediate_path,
+                            temp_path,
+                            engine_name='dagstermill',
+                            log_output=True,
+                            kernel_name=kernel_name,
+                            kernel_manager=kernel_manager,
+                        )
                 except Exception as exc:
                     yield Materialization(
                         label='output_notebook',
@@ -219,9 +275,25 @@ def _dm_solid_compute(name, notebook_path):
             for (output_name, output_def) in system_compute_context.solid_def.output_dict.items():
                 data_dict = output_nb.scraps.data_dict
                 if output_name in data_dict:
-                    value = read_value(output_def.runtime_type, data_dict[output_name])
-
-                    yield Output(value, output_name)
+                    scrap = data_dict[output_name]
+                    if is_intermediate_reference(scrap):
+                        intermediates_manager = system_compute_context.intermediates_manager
+                        step_output_handle = step_output_handle_for_reference(scrap)
+                        value = intermediates_manager.get_intermediate(
+                            system_compute_context, output_def.runtime_type, step_output_handle
+                        ).obj
+                        try:
+                            yield Output(value, output_name)
+                        finally:
+                            # By the time the engine resumes us, it has stored the value as the
+                            # step's output, so the copy the notebook handed back is removed. It
+                            # can't be removed as soon as it's loaded, since values like
+                            # DataFrameChunks are read from it lazily.
+                            intermediates_manager.rm_intermediate(
+                                system_compute_context, step_output_handle
+                            )
+                    else:
+                        yield Output(read_value(output_def.runtime_type, scrap), output_name)
 
             for key, value in output_nb.scraps.items():
                 if key.startswith('event-'):
@@ -37,7 +37,7 @@ def cleanup_result_notebook(result):
 
 
 @contextmanager
-def exec_for_test(fn_name, env=None, raise_on_error=True, **kwargs):
+def exec_for_test(fn_name, env=None, raise_on_error=True, instance=None, **kwargs):
     result = None
 
     handle = handle_for_pipeline_cli_args(
@@ -50,7 +50,7 @@ def exec_for_test(fn_name, env=None, raise_on_error=True, **kwargs):
         result = execute_pipeline(
             pipeline,
             env,
-            instance=DagsterInstance.local_temp(),
+            instance=instance or DagsterInstance.local_temp(),
             raise_on_error=raise_on_error,
             **kwargs
         )
@@ -147,6 +147,33 @@ def test_tutorial_pipeline():
         assert result.success
 
 
+@pytest.mark.notebook_test
+def test_dataframes_passed_by_reference():
+    instance = DagsterInstance.local_temp()
+    with exec_for_test(
+        'define_double_dataframe_pipeline', {'storage': {'filesystem': {}}}, instance=instance
+    ) as result:
+        assert result.success
+        assert result.result_for_solid('double_dataframe').output_value().to_dict('list') == {
+            'num': [2, 4, 6]
+        }
+
+        # the notebook loads its input from, and hands its output back through, the run's
+        # intermediate store, rather than files marshalled for it
+        marshal_dir = '/tmp/dagstermill/{run_id}/marshal'.format(run_id=result.run_id)
+        assert not os.listdir(marshal_dir)
+
+        # and the intermediate it handed its output back through is removed once the output is
+        # stored
+        assert os.listdir(
+            os.path.join(
+                instance.intermediates_directory(result.run_id),
+                'intermediates',
+                'double_dataframe.compute',
+            )
+        ) == ['result']
+
+
 @pytest.mark.notebook_test
 def test_hello_world_reexecution():
     with exec_for_test('define_hello_world_pipeline') as result:
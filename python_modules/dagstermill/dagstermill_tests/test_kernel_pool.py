@@ -0,0 +1,121 @@
+import os
+
+import nbformat
+import papermill
+import pytest
+from dagstermill import KernelPool
+from dagstermill import kernel_pool as kernel_pool_module
+from dagstermill.engine import DagstermillNBConvertEngine
+from dagstermill.examples.repository import NOTEBOOK_CHAIN_LENGTH
+from papermill.engines import papermill_engines
+
+from dagster import execute_pipeline, seven
+from dagster.seven import mock
+from dagster.cli.load_handle import handle_for_pipeline_cli_args
+from dagster.core.instance import DagsterInstance
+
+ENVIRONMENT_DICT = {'solids': {'load_b': {'config': 2}}}
+
+
+def execute_notebook_chain(fn_name):
+    handle = handle_for_pipeline_cli_args(
+        {'module_name': 'dagstermill.examples.repository', 'fn_name': fn_name}
+    )
+    result = execute_pipeline(
+        handle.build_pipeline_definition(), ENVIRONMENT_DICT, instance=DagsterInstance.local_temp()
+    )
+    assert result.success
+    assert result.result_for_solid(
+        'add_{}'.format(NOTEBOOK_CHAIN_LENGTH - 1)
+    ).output_value() == 2 * (NOTEBOOK_CHAIN_LENGTH + 1)
+
+
+def test_kernel_pool_discards_unstarted_kernels():
+    pool = KernelPool()
+    with pool.kernel('dagster', 'pipeline') as first:
+        pass
+    # never started, so it couldn't be reset, and isn't kept
+    with pool.kernel('dagster', 'pipeline') as second:
+        pass
+
+    assert first is not second
+    assert pool.kernels_started == 0
+
+
+def execute_notebook_source(kernel_manager, notebook_dir, source):
+    notebook_path = os.path.join(notebook_dir, 'notebook.ipynb')
+    nbformat.write(
+        nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(source)]), notebook_path
+    )
+
+    papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
+    papermill.execute_notebook(
+        notebook_path,
+        os.path.join(notebook_dir, 'notebook-out.ipynb'),
+        engine_name='dagstermill',
+        kernel_name='dagster',
+        kernel_manager=kernel_manager,
+        log_output=False,
+    )
+
+
+@pytest.mark.notebook_test
+def test_kernel_pool_reuses_idle_kernels():
+    pool = KernelPool()
+    try:
+        with seven.TemporaryDirectory() as notebook_dir:
+            with pool.kernel('dagster', 'pipeline') as first:
+                execute_notebook_source(
+                    first,
+                    notebook_dir,
+                    'import sys\n'
+                    'assert \'wave\' not in sys.modules\n'
+                    'import wave\n'
+                    'leftover = 1',
+                )
+
+            # the second notebook runs on the same kernel, with the modules the first imported still
+            # loaded, but none of its variables
+            with pool.kernel('dagster', 'pipeline') as second:
+                execute_notebook_source(
+                    second,
+                    notebook_dir,
+                    'import sys\n'
+                    'assert \'wave\' in sys.modules\n'
+                    'assert \'leftover\' not in globals()\n'
+                    'assert \'wave\' not in globals()',
+                )
+    finally:
+        pool.shutdown()
+
+    assert first is second
+    assert pool.kernels_started == 1
+
+
+def test_kernel_pool_discards_kernels_that_raise():
+    pool = KernelPool()
+    with pytest.raises(ValueError):
+        with pool.kernel('dagster', 'pipeline'):
+            raise ValueError()
+
+    with pool.kernel('dagster', 'pipeline'):
+        pass
+
+    # neither kernel manager started a kernel
+    assert pool.kernels_started == 0
+
+
+@pytest.mark.notebook_test
+def test_kernel_pool_notebook_chain_starts_one_kernel():
+    pools = []
+
+    class RecordingKernelPool(KernelPool):
+        def __init__(self, *args, **kwargs):
+            super(RecordingKernelPool, self).__init__(*args, **kwargs)
+            pools.append(self)
+
+    with mock.patch.object(kernel_pool_module, 'KernelPool', RecordingKernelPool):
+        execute_notebook_chain('define_kernel_pool_notebook_chain_pipeline')
+
+    # rather than each of the notebooks in the chain starting a kernel of its own
+    assert sum(pool.kernels_started for pool in pools) == 1
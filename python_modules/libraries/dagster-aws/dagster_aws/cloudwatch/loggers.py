@@ -1,7 +1,9 @@
 import datetime
 import logging
+import threading
 
 import boto3
+from botocore.exceptions import BotoCoreError, ClientError
 
 from dagster import Field, check, logger, seven
 from dagster.core.log_manager import coerce_valid_log_level
@@ -11,6 +13,13 @@ from dagster.core.log_manager import coerce_valid_log_level
 MAXIMUM_BATCH_SIZE = 1048576
 OVERHEAD = 26
 
+# A batch may contain at most 10,000 log events, which may not span more than 24 hours.
+MAXIMUM_BATCH_COUNT = 10000
+MAXIMUM_BATCH_SPAN = 24 * 60 * 60 * 1000  # in milliseconds
+
+# How often buffered log events are shipped if nothing else triggers a flush, in seconds.
+DEFAULT_FLUSH_INTERVAL = 1.0
+
 EPOCH = datetime.datetime(1970, 1, 1)
 
 # For real
@@ -23,6 +32,20 @@ def millisecond_timestamp(dt):
 
 
 class CloudwatchLogsHandler(logging.Handler):
+    '''Ships log records to a Cloudwatch Logs stream in batches.
+
+    Records are buffered as they are emitted and sent with as few ``PutLogEvents`` calls as the
+    Cloudwatch batch limits allow, from a background thread that wakes up every ``flush_interval``
+    seconds, or as soon as a full batch is buffered. :py:meth:`flush` ships everything buffered so
+    far from the calling thread; the :py:class:`DagsterLogManager` calls it at step boundaries,
+    and closes the handler, stopping the background thread, at the end of the run. With
+    ``flush_in_background`` False, there is no background thread, and records are only shipped by
+    :py:meth:`flush`.
+
+    Batches that fail to send, e.g. because the calls are throttled, are kept to be sent by the
+    next flush. Batches that Cloudwatch rejects outright are logged and dropped.
+    '''
+
     def __init__(
         self,
         log_group_name,
@@ -30,20 +53,47 @@ class CloudwatchLogsHandler(logging.Handler):
         aws_region=None,
         aws_secret_access_key=None,
         aws_access_key_id=None,
+        flush_interval=None,
+        client=None,
+        flush_in_background=True,
     ):
-        self.client = boto3.client(
-            'logs',
-            region_name=aws_region,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
+        self.client = (
+            client
+            if client is not None
+            else boto3.client(
+                'logs',
+                region_name=aws_region,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+            )
         )
         self.log_group_name = check.str_param(log_group_name, 'log_group_name')
         # Maybe we should make this optional, and default to the run_id
         self.log_stream_name = check.str_param(log_stream_name, 'log_stream_name')
+        self.flush_interval = (
+            DEFAULT_FLUSH_INTERVAL
+            if flush_interval is None
+            else check.float_param(flush_interval, 'flush_interval')
+        )
+        self.flush_in_background = check.bool_param(flush_in_background, 'flush_in_background')
         self.overhead = OVERHEAD
         self.maximum_batch_size = MAXIMUM_BATCH_SIZE
+        self.maximum_batch_count = MAXIMUM_BATCH_COUNT
         self.sequence_token = None
 
+        # log events waiting to be shipped, guarded by _buffer_lock
+        self._buffer = []
+        self._buffer_size = 0
+        self._buffer_lock = threading.Lock()
+
+        # held for the duration of a flush, so that batches go out in order and the sequence token
+        # is only ever used by one put_log_events call at a time
+        self._send_lock = threading.Lock()
+
+        self._wake = threading.Event()
+        self._closed = False
+        self._flush_thread = None
+
         self.check_log_group()
         self.check_log_stream()
 
@@ -102,31 +152,126 @@ class CloudwatchLogsHandler(logging.Handler):
                 '{log_stream_name}'.format(log_stream_name=self.log_stream_name)
             )
 
-    def log_error(self, record, exc):
+    def log_error(self, log_events, exc):
         logging.critical('Error while logging!')
         try:
             logging.error(
-                'Attempted to log: {record}'.format(record=seven.json.dumps(record.__dict__))
+                'Attempted to log: {log_events}'.format(log_events=seven.json.dumps(log_events))
             )
         except Exception:  # pylint: disable=broad-except
             pass
         logging.exception(str(exc))
 
     def emit(self, record):
-        self._emit(record, retry=False)
+        try:
+            message = seven.json.dumps(record.__dict__)
+            timestamp = millisecond_timestamp(
+                datetime.datetime.strptime(
+                    record.dagster_meta['log_timestamp'], '%Y-%m-%dT%H:%M:%S.%f'
+                )
+            )
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
 
-    def retry(self, record):
-        self._emit(record, retry=True)
+        event_size = len(message.encode('utf-8')) + self.overhead
 
-    def _emit(self, record, retry=False):
-        message = seven.json.dumps(record.__dict__)
-        timestamp = millisecond_timestamp(
-            datetime.datetime.strptime(record.dagster_meta['log_timestamp'], '%Y-%m-%dT%H:%M:%S.%f')
-        )
+        with self._buffer_lock:
+            self._buffer.append({'timestamp': timestamp, 'message': message})
+            self._buffer_size += event_size
+            batch_full = (
+                len(self._buffer) >= self.maximum_batch_count
+                or self._buffer_size >= self.maximum_batch_size
+            )
+
+        self._ensure_flush_thread()
+        if batch_full:
+            self._wake.set()
+
+    def flush(self):
+        '''Ship every buffered log event to Cloudwatch before returning, keeping those that
+        couldn't be sent in the buffer.'''
+        with self._send_lock:
+            with self._buffer_lock:
+                log_events = self._buffer
+                self._buffer = []
+                self._buffer_size = 0
+
+            batches = list(self._batches(log_events))
+            for index, batch in enumerate(batches):
+                if not self._put_log_events(batch):
+                    # keep the batches that weren't sent, ahead of anything buffered since, so that
+                    # the events still go out in order
+                    self._requeue([log_event for unsent in batches[index:] for log_event in unsent])
+                    return
+
+    def _requeue(self, log_events):
+        with self._buffer_lock:
+            self._buffer = log_events + self._buffer
+            self._buffer_size += sum(
+                len(log_event['message'].encode('utf-8')) + self.overhead
+                for log_event in log_events
+            )
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        self.flush()
+        super(CloudwatchLogsHandler, self).close()
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread is not None or self._closed or not self.flush_in_background:
+            return
+
+        with self._buffer_lock:
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_periodically,
+                    name='dagster-cloudwatch-flush-{}'.format(id(self)),
+                )
+                self._flush_thread.daemon = True
+                self._flush_thread.start()
+
+    def _flush_periodically(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('Cloudwatch logger: Error while shipping buffered log events')
+
+    def _batches(self, log_events):
+        # events within a batch must be in chronological order
+        log_events = sorted(log_events, key=lambda log_event: log_event['timestamp'])
+
+        batch = []
+        batch_size = 0
+        for log_event in log_events:
+            event_size = len(log_event['message'].encode('utf-8')) + self.overhead
+            if batch and (
+                len(batch) >= self.maximum_batch_count
+                or batch_size + event_size > self.maximum_batch_size
+                or log_event['timestamp'] - batch[0]['timestamp'] > MAXIMUM_BATCH_SPAN
+            ):
+                yield batch
+                batch = []
+                batch_size = 0
+
+            batch.append(log_event)
+            batch_size += event_size
+
+        if batch:
+            yield batch
+
+    def _put_log_events(self, log_events, retry=False):
+        '''Send a batch of log events, returning False if it should be sent again later.'''
         params = {
             'logGroupName': self.log_group_name,
             'logStreamName': self.log_stream_name,
-            'logEvents': [{'timestamp': timestamp, 'message': message}],
+            'logEvents': log_events,
         }
         if self.sequence_token is not None:
             params['sequenceToken'] = self.sequence_token
@@ -140,35 +285,43 @@ class CloudwatchLogsHandler(logging.Handler):
         except self.client.exceptions.InvalidSequenceTokenException as exc:
             if not retry:
                 self.check_log_stream()
-                self.retry(record)
-            else:
-                self.log_error(record, exc)
+                return self._put_log_events(log_events, retry=True)
+            self.log_error(log_events, exc)
+            return False
         except self.client.exceptions.DataAlreadyAcceptedException as exc:
-            logging.error('Cloudwatch logger: log events already accepted: {res}'.format(res=res))
+            # pick up the current sequence token, so that the next batch is accepted
+            self.check_log_stream()
+            logging.error('Cloudwatch logger: log events already accepted: {exc}'.format(exc=exc))
         except self.client.exceptions.InvalidParameterException as exc:
             logging.error(
-                'Cloudwatch logger: Invalid parameter exception while logging: {res}'.format(
-                    res=res
+                'Cloudwatch logger: Invalid parameter exception while logging: {exc}'.format(
+                    exc=exc
                 )
             )
         except self.client.exceptions.ResourceNotFoundException as exc:
             logging.error(
                 'Cloudwatch logger: Resource not found. Check that the log stream or log group '
-                'was not deleted: {res}'.format(res=res)
+                'was not deleted: {exc}'.format(exc=exc)
             )
         except self.client.exceptions.ServiceUnavailableException as exc:
             if not retry:
-                self.retry(record)
-            else:
-                logging.error('Cloudwatch logger: Service unavailable: {res}'.format(res=res))
-        except self.client.exceptions.ServiceUnavailableException as exc:
-            if not retry:
-                self.retry(record)
-            else:
-                logging.error(
-                    'Cloudwatch logger: Unrecognized client. Check your AWS access key id and '
-                    'secret key: {res}'.format(res=res)
-                )
+                return self._put_log_events(log_events, retry=True)
+            logging.error('Cloudwatch logger: Service unavailable: {exc}'.format(exc=exc))
+            return False
+        except self.client.exceptions.UnrecognizedClientException as exc:
+            logging.error(
+                'Cloudwatch logger: Unrecognized client. Check your AWS access key id and '
+                'secret key: {exc}'.format(exc=exc)
+            )
+        except (BotoCoreError, ClientError) as exc:
+            # e.g. throttling, or a dropped connection
+            logging.error(
+                'Cloudwatch logger: Error while shipping log events, which will be sent again: '
+                '{exc}'.format(exc=exc)
+            )
+            return False
+
+        return True
 
 
 @logger(
@@ -180,6 +333,12 @@ class CloudwatchLogsHandler(logging.Handler):
         'aws_region': Field(str, is_required=False),
         'aws_secret_access_key': Field(str, is_required=False),
         'aws_access_key_id': Field(str, is_required=False),
+        'flush_interval': Field(
+            float,
+            is_required=False,
+            description='How often buffered log events are shipped to Cloudwatch, in seconds. '
+            'Buffered events are also shipped at the end of every step.',
+        ),
     },
     description='The default colored console logger.',
 )
@@ -198,6 +357,7 @@ def cloudwatch_logger(init_context):
             aws_region=init_context.logger_config.get('aws_region'),
             aws_secret_access_key=init_context.logger_config.get('aws_secret_access_key'),
             aws_access_key_id=init_context.logger_config.get('aws_access_key_id'),
+            flush_interval=init_context.logger_config.get('flush_interval'),
         )
     )
     return logger_
@@ -41,6 +41,7 @@ class S3ObjectStore(ObjectStore):
             else:
                 serialization_strategy.serialize(obj, bytes_io)
             bytes_io.seek(0)
+            size_bytes = len(bytes_io.getvalue())
             self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
 
         return ObjectStoreOperation(
@@ -50,6 +51,7 @@ class S3ObjectStore(ObjectStore):
             obj=obj,
             serialization_strategy_name=serialization_strategy.name,
             object_store_name=self.name,
+            size_bytes=size_bytes,
         )
 
     def get_object(self, key, serialization_strategy=None):
@@ -0,0 +1,249 @@
+import logging
+import threading
+import time
+
+from botocore.exceptions import ClientError
+from dagster_aws.cloudwatch import cloudwatch_logger
+from dagster_aws.cloudwatch import loggers as cloudwatch_loggers
+from dagster_aws.cloudwatch.loggers import CloudwatchLogsHandler
+
+from dagster import ModeDefinition, execute_pipeline, pipeline, seven, solid
+from dagster.core.log_manager import DagsterLogManager
+
+LOG_GROUP_NAME = '/dagster-test/stub'
+LOG_STREAM_NAME = 'stub-stream'
+
+
+class StubCloudwatchLogsClient(object):
+    '''A local stand-in for the boto3 Cloudwatch Logs client that enforces sequence tokens.'''
+
+    class exceptions(object):  # pylint: disable=invalid-name
+        class InvalidSequenceTokenException(Exception):
+            pass
+
+        class DataAlreadyAcceptedException(Exception):
+            pass
+
+        class InvalidParameterException(Exception):
+            pass
+
+        class ResourceNotFoundException(Exception):
+            pass
+
+        class ServiceUnavailableException(Exception):
+            pass
+
+        class UnrecognizedClientException(Exception):
+            pass
+
+    def __init__(self):
+        self.put_calls = []
+        self.upload_sequence_token = None
+        # how many of the next put_log_events calls are throttled
+        self.throttled_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def messages(self):
+        with self._lock:
+            return [
+                seven.json.loads(log_event['message'])['dagster_meta']['orig_message']
+                for call in self.put_calls
+                for log_event in call
+            ]
+
+    def describe_log_groups(self, **_kwargs):
+        return {'logGroups': [{'logGroupName': LOG_GROUP_NAME}]}
+
+    def describe_log_streams(self, **_kwargs):
+        log_stream = {'logStreamName': LOG_STREAM_NAME}
+        if self.upload_sequence_token is not None:
+            log_stream['uploadSequenceToken'] = self.upload_sequence_token
+        return {'logStreams': [log_stream]}
+
+    def put_log_events(self, logGroupName, logStreamName, logEvents, sequenceToken=None):
+        assert logGroupName == LOG_GROUP_NAME
+        assert logStreamName == LOG_STREAM_NAME
+        assert [event['timestamp'] for event in logEvents] == sorted(
+            event['timestamp'] for event in logEvents
+        )
+
+        with self._lock:
+            if self.throttled_calls:
+                self.throttled_calls -= 1
+                raise ClientError(
+                    {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                    'PutLogEvents',
+                )
+
+            if sequenceToken != self.upload_sequence_token:
+                raise self.exceptions.InvalidSequenceTokenException(
+                    'The given sequenceToken is invalid'
+                )
+
+            self.put_calls.append(logEvents)
+            self.upload_sequence_token = str(len(self.put_calls))
+            return {'nextSequenceToken': self.upload_sequence_token}
+
+
+def _log_manager(handler):
+    logger_ = logging.Logger('test_cloudwatch_batching', level=logging.DEBUG)
+    logger_.addHandler(handler)
+    return DagsterLogManager('123', {}, [logger_])
+
+
+def _handler(client, flush_in_background=False, flush_interval=60.0):
+    # without the background thread, records are only shipped when the test flushes them
+    return CloudwatchLogsHandler(
+        LOG_GROUP_NAME,
+        LOG_STREAM_NAME,
+        flush_interval=flush_interval,
+        client=client,
+        flush_in_background=flush_in_background,
+    )
+
+
+def _flush_threads():
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith('dagster-cloudwatch-flush')
+    ]
+
+
+def test_records_shipped_in_one_batch():
+    client = StubCloudwatchLogsClient()
+    handler = _handler(client)
+    log_manager = _log_manager(handler)
+
+    for i in range(50):
+        log_manager.info('message {}'.format(i))
+
+    assert client.put_calls == []
+
+    log_manager.flush()
+    assert len(client.put_calls) == 1
+    assert client.messages == ['message {}'.format(i) for i in range(50)]
+
+    log_manager.info('another message')
+    log_manager.flush()
+    assert len(client.put_calls) == 2
+    assert client.messages[-1] == 'another message'
+
+
+def test_batches_split_on_count_and_size():
+    client = StubCloudwatchLogsClient()
+    handler = _handler(client)
+    handler.maximum_batch_count = 10
+    log_manager = _log_manager(handler)
+
+    for i in range(25):
+        log_manager.info('message {}'.format(i))
+    handler.flush()
+
+    assert [len(call) for call in client.put_calls] == [10, 10, 5]
+
+    handler.maximum_batch_count = 10000
+    for i in range(5):
+        log_manager.info('message {}'.format(i))
+    # room for two of the events, whose sizes vary by a few bytes, but not three
+    handler.maximum_batch_size = 2 * max(
+        len(log_event['message'].encode('utf-8')) + handler.overhead
+        for log_event in handler._buffer  # pylint: disable=protected-access
+    )
+    handler.flush()
+
+    assert [len(call) for call in client.put_calls[3:]] == [2, 2, 1]
+
+
+def test_invalid_sequence_token_refreshed():
+    client = StubCloudwatchLogsClient()
+    handler = _handler(client)
+    log_manager = _log_manager(handler)
+
+    # another writer to the same stream moves the sequence token on
+    client.upload_sequence_token = 'elsewhere'
+
+    log_manager.info('after token change')
+    handler.flush()
+
+    assert client.messages == ['after token change']
+    assert handler.sequence_token == client.upload_sequence_token
+
+
+def test_flushed_on_timer():
+    client = StubCloudwatchLogsClient()
+    handler = _handler(client, flush_in_background=True, flush_interval=0.01)
+    log_manager = _log_manager(handler)
+
+    log_manager.info('shipped in the background')
+
+    for _ in range(500):
+        if client.messages:
+            break
+        time.sleep(0.01)
+
+    assert client.messages == ['shipped in the background']
+    handler.close()
+    assert not _flush_threads()
+
+
+def test_throttled_batches_sent_again():
+    client = StubCloudwatchLogsClient()
+    handler = _handler(client)
+    handler.maximum_batch_count = 2
+    log_manager = _log_manager(handler)
+
+    for i in range(3):
+        log_manager.info('message {}'.format(i))
+
+    # the throttling error isn't raised out of the flush, and nothing is dropped
+    client.throttled_calls = 1
+    log_manager.flush()
+    assert client.messages == []
+
+    log_manager.info('message 3')
+    log_manager.flush()
+    assert [len(call) for call in client.put_calls] == [2, 2]
+    assert client.messages == ['message {}'.format(i) for i in range(4)]
+
+
+def test_flushed_at_step_boundaries(monkeypatch):
+    client = StubCloudwatchLogsClient()
+    monkeypatch.setattr(cloudwatch_loggers.boto3, 'client', lambda *args, **kwargs: client)
+
+    @solid
+    def first(context):
+        context.log.info('Hello from first')
+        return 1
+
+    @solid
+    def second(context, num):
+        # everything logged by the previous step has already been shipped
+        assert 'Hello from first' in client.messages
+        context.log.info('Hello from second')
+        return num
+
+    @pipeline(mode_defs=[ModeDefinition(logger_defs={'cloudwatch': cloudwatch_logger})])
+    def hello_cloudwatch_pipeline():
+        second(first())
+
+    result = execute_pipeline(
+        hello_cloudwatch_pipeline,
+        {
+            'loggers': {
+                'cloudwatch': {
+                    'config': {
+                        'log_group_name': LOG_GROUP_NAME,
+                        'log_stream_name': LOG_STREAM_NAME,
+                        'flush_interval': 60.0,
+                    }
+                }
+            }
+        },
+    )
+
+    assert result.success
+    assert 'Hello from second' in client.messages
+    # the handler is closed at the end of the run
+    assert not _flush_threads()
@@ -1,14 +1,18 @@
 import os
 import signal
+import sys
+from collections import deque
 from subprocess import PIPE, STDOUT, Popen
 from tempfile import NamedTemporaryFile
 
 from dagster import (
     Enum,
     EnumValue,
+    EventMetadataEntry,
     Failure,
     Field,
     InputDefinition,
+    Int,
     Noneable,
     Nothing,
     OutputDefinition,
@@ -18,6 +22,54 @@ from dagster import (
     solid,
 )
 
+DEFAULT_FAILURE_TAIL_LINES = 20
+
+
+class _OutputTail(object):
+    '''The output of a command, line by line, of which as many of the last lines as fit in
+    max_bytes, and at most max_lines of them, are kept.'''
+
+    def __init__(self, max_bytes=None, max_lines=None):
+        self.max_bytes = check.opt_int_param(max_bytes, 'max_bytes')
+        self.max_lines = check.opt_int_param(max_lines, 'max_lines')
+        self.line_count = 0
+        self.byte_count = 0
+        self.dropped_bytes = 0
+        self._lines = deque()
+        self._kept_bytes = 0
+
+    def append(self, line, num_bytes):
+        self.line_count += 1
+        self.byte_count += num_bytes
+
+        self._lines.append((line, num_bytes))
+        self._kept_bytes += num_bytes
+        if self.max_lines is not None and len(self._lines) > self.max_lines:
+            _, dropped = self._lines.popleft()
+            self._kept_bytes -= dropped
+
+        while self.max_bytes is not None and self._kept_bytes > self.max_bytes:
+            _, dropped = self._lines.popleft()
+            self._kept_bytes -= dropped
+            self.dropped_bytes += dropped
+
+    def text(self):
+        return ''.join(line for line, _ in self._lines)
+
+    def tail(self, num_lines):
+        lines = [line.rstrip() for line, _ in self._lines]
+        return '\n'.join(lines[-num_lines:] if num_lines else [])
+
+    def summary(self):
+        summary = '{line_count} lines ({byte_count} bytes) of output'.format(
+            line_count=self.line_count, byte_count=self.byte_count
+        )
+        if self.dropped_bytes:
+            summary += ', of which the first {dropped_bytes} bytes were dropped'.format(
+                dropped_bytes=self.dropped_bytes
+            )
+        return summary
+
 
 def bash_command_solid(
     bash_command, name='bash_solid', input_defs=None, output_encoding='utf-8', **kwargs
@@ -38,7 +90,8 @@ def bash_command_solid(
             logs produced by shell script execution. Defaults to "utf-8".
 
     Raises:
-        Failure: Raised when the shell command returns a non-zero exit code.
+        Failure: Raised when the shell command returns a non-zero exit code, with the end of its
+            output in the metadata entries.
 
     Returns:
         SolidDefinition: Returns the constructed solid definition.
@@ -75,12 +128,37 @@ def bash_command_solid(
                             'BUFFER',
                             description='Buffer bash script stdout/stderr, then log upon completion.',
                         ),
-                        EnumValue('NONE', description='No logging'),
+                        EnumValue(
+                            'COMPUTE_LOG',
+                            description='''Write script stdout/stderr to the compute logs, rather
+                            than as events, then log a summary upon completion.''',
+                        ),
+                        EnumValue(
+                            'NONE',
+                            description='''No logging. Only the end of the output is kept, for
+                            the Failure raised if the command fails, and the solid returns an empty
+                            string.''',
+                        ),
                     ],
                 ),
                 is_required=False,
                 default_value='BUFFER',
             ),
+            'max_output_bytes': Field(
+                Noneable(Int),
+                default_value=None,
+                is_required=False,
+                description='''The most bytes of output to keep for the result of the solid and
+                for buffered logs. The start of the output is dropped to keep the end of it within
+                the limit. Defaults to no limit.''',
+            ),
+            'failure_tail_lines': Field(
+                Int,
+                default_value=DEFAULT_FAILURE_TAIL_LINES,
+                is_required=False,
+                description='''The number of lines from the end of the output to include in the
+                Failure raised when the command returns a non-zero exit code.''',
+            ),
         },
         **kwargs
     )
@@ -99,9 +177,6 @@ def bash_command_solid(
             else os.environ.copy()
         )
 
-        # Solid will return the string result of reading stdout of the shell command
-        res = ''
-
         with NamedTemporaryFile(dir=tmp_path, prefix=name) as tmp_file:
             tmp_file.write(bytes(bash_command.encode('utf-8')))
             tmp_file.flush()
@@ -129,38 +204,64 @@ def bash_command_solid(
                 preexec_fn=pre_exec,
             )
 
-            # Stream back logs as they are emitted
-            if context.solid_config['output_logging'] == 'STREAM':
-                for raw_line in iter(sub_process.stdout.readline, b''):
-                    line = raw_line.decode(output_encoding).rstrip()
+            output_logging = context.solid_config['output_logging']
+            # with no logging, only the lines for a Failure are kept, and the result is empty
+            output = _OutputTail(
+                context.solid_config['max_output_bytes'],
+                max_lines=context.solid_config['failure_tail_lines']
+                if output_logging == 'NONE'
+                else None,
+            )
+
+            # Read the output as it is emitted, rather than once the command has exited, which
+            # would block once the command had filled the pipe
+            for raw_line in iter(sub_process.stdout.readline, b''):
+                line = raw_line.decode(output_encoding)
+
+                # Stream back logs as they are emitted
+                if output_logging == 'STREAM':
+                    line = line.rstrip()
                     context.log.info(line)
-                    res += line
+
+                # Write to this process's stdout, i.e. the compute logs
+                elif output_logging == 'COMPUTE_LOG':
+                    sys.stdout.write(line)
+
+                output.append(line, len(raw_line))
 
             sub_process.wait()
 
-            # Collect and buffer all logs, then emit
-            if context.solid_config['output_logging'] == 'BUFFER':
-                res = ''.join(
-                    [
-                        raw_line.decode(output_encoding)
-                        for raw_line in iter(sub_process.stdout.readline, b'')
-                    ]
-                )
-                context.log.info(res)
+            # Emit the buffered logs
+            if output_logging == 'BUFFER':
+                context.log.info(output.text())
+
+            elif output_logging == 'COMPUTE_LOG':
+                sys.stdout.flush()
 
             # no logging in this case
-            elif context.solid_config['output_logging'] == 'NONE':
+            elif output_logging == 'NONE':
                 pass
 
             context.log.info(
-                'Command exited with return code {retcode}'.format(retcode=sub_process.returncode)
+                'Command exited with return code {retcode}, having written {summary}'.format(
+                    retcode=sub_process.returncode, summary=output.summary()
+                )
             )
 
             if sub_process.returncode:
                 raise Failure(
-                    description='Bash command failed {command}'.format(command=bash_command)
+                    description='Bash command failed {command}'.format(command=bash_command),
+                    metadata_entries=[
+                        EventMetadataEntry.text(str(sub_process.returncode), 'return_code'),
+                        EventMetadataEntry.text(str(output.line_count), 'line_count'),
+                        EventMetadataEntry.text(
+                            output.tail(context.solid_config['failure_tail_lines']), 'output_tail'
+                        ),
+                    ],
                 )
-        return res
+
+        # Solid will return the string result of reading stdout of the shell command
+        return '' if output_logging == 'NONE' else output.text()
 
     return _bash_solid
 
@@ -36,6 +36,69 @@ def test_bash_command_stream_logs():
     assert result.output_values == {'result': 'hello 1hello 2hello 3hello 4hello 5'}
 
 
+def test_bash_command_buffer_large_output():
+    # more output than fits in the pipe the command writes to
+    solid = bash_command_solid('head -c 1000000 /dev/zero | tr "\\0" a; echo', name='foobar')
+
+    result = execute_solid(solid)
+    assert result.output_values == {'result': 'a' * 1000000 + '\n'}
+
+
+def test_bash_command_max_output_bytes():
+    solid = bash_command_solid('for i in $(seq 1 1000); do echo "line ${i}"; done', name='foobar')
+
+    result = execute_solid(
+        solid, environment_dict={'solids': {'foobar': {'config': {'max_output_bytes': 20}}}}
+    )
+    assert result.output_values == {'result': 'line 999\nline 1000\n'}
+
+
+def test_bash_command_compute_log(capsys):
+    solid = bash_command_solid('for i in 1 2 3 4 5; do echo "hello ${i}"; done', name='foobar')
+
+    result = execute_solid(
+        solid,
+        environment_dict={'solids': {'foobar': {'config': {'output_logging': 'COMPUTE_LOG'}}}},
+    )
+    expected = ''.join('hello {i}\n'.format(i=i) for i in range(1, 6))
+    assert result.output_values == {'result': expected}
+    assert expected in capsys.readouterr().out
+
+
+def test_bash_command_no_logging():
+    solid = bash_command_solid('for i in 1 2 3; do echo "line ${i}"; done', name='foobar')
+
+    result = execute_solid(
+        solid, environment_dict={'solids': {'foobar': {'config': {'output_logging': 'NONE'}}}}
+    )
+    assert result.output_values == {'result': ''}
+
+    with pytest.raises(Failure) as exc_info:
+        execute_solid(
+            bash_command_solid('for i in 1 2 3; do echo "${i}"; done; exit 3', name='foobar'),
+            environment_dict={
+                'solids': {
+                    'foobar': {'config': {'output_logging': 'NONE', 'failure_tail_lines': 2}}
+                }
+            },
+        )
+
+    metadata = {entry.label: entry.entry_data.text for entry in exc_info.value.metadata_entries}
+    assert metadata == {'return_code': '3', 'line_count': '3', 'output_tail': '2\n3'}
+
+
+def test_bash_command_failure_output_tail():
+    solid = bash_command_solid('for i in 1 2 3; do echo "${i}"; done; exit 3', name='foobar')
+
+    with pytest.raises(Failure) as exc_info:
+        execute_solid(
+            solid, environment_dict={'solids': {'foobar': {'config': {'failure_tail_lines': 2}}}}
+        )
+
+    metadata = {entry.label: entry.entry_data.text for entry in exc_info.value.metadata_entries}
+    assert metadata == {'return_code': '3', 'line_count': '3', 'output_tail': '2\n3'}
+
+
 def test_bash_script_solid():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     solid = bash_script_solid(os.path.join(script_dir, 'test.sh'), name='foobar')
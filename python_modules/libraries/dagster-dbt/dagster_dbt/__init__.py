@@ -1,9 +1,10 @@
 import distutils.spawn
 import io
+import json
 import os
 import re
-import shlex
 import subprocess
+import time
 from collections import namedtuple
 
 from dagster import (
@@ -12,13 +13,17 @@ from dagster import (
     Failure,
     Field,
     InputDefinition,
+    Int,
+    List,
     Materialization,
     Nothing,
     Output,
     OutputDefinition,
     Path,
+    String,
     check,
     solid,
+    usable_as_dagster_type,
 )
 
 CREATE_VIEW_REGEX = re.compile(r'OK created view model (\w+)\.(\w+)\.* \[CREATE VIEW')
@@ -26,6 +31,18 @@ CREATE_TABLE_REGEX = re.compile(r'OK created table model (\w+)\.(\w+)\.* \[SELEC
 ANSI_ESCAPE = re.compile(r'\x1B[@-_][0-?]*[ -/]*[@-~]')
 TEST_PASS_REGEX = re.compile(r'PASS (\w+)\.* \[PASS')
 TEST_FAIL_REGEX = re.compile(r'FAIL (\d+) (\w+)\.* \[FAIL')
+EXECUTION_TIME_REGEX = re.compile(r' in (\d+(?:\.\d+)?)s\]')
+
+RUN_RESULTS_FILENAME = 'run_results.json'
+
+
+def _execution_time_entries(text):
+    execution_time_match = EXECUTION_TIME_REGEX.search(text)
+
+    if not execution_time_match:
+        return []
+
+    return [EventMetadataEntry.text(execution_time_match.group(1), 'execution_time')]
 
 
 def try_parse_create_view(text):
@@ -40,7 +57,8 @@ def try_parse_create_view(text):
         metadata_entries=[
             EventMetadataEntry.text(view_match.group(1), 'schema'),
             EventMetadataEntry.text(view_match.group(2), 'view'),
-        ],
+        ]
+        + _execution_time_entries(text),
     )
 
 
@@ -57,7 +75,8 @@ def try_parse_create_table(text):
             EventMetadataEntry.text(table_match.group(1), 'schema'),
             EventMetadataEntry.text(table_match.group(2), 'table'),
             EventMetadataEntry.text(table_match.group(3), 'row_count'),
-        ],
+        ]
+        + _execution_time_entries(text),
     )
 
 
@@ -68,9 +87,188 @@ def try_parse_run(text):
             return mat
 
 
-def create_dbt_run_solid(project_dir, name=None, profiles_dir=None, dbt_executable='dbt'):
+@usable_as_dagster_type
+class DbtNodeResult(
+    namedtuple(
+        '_DbtNodeResult',
+        'unique_id name resource_type schema materialized status error execution_time thread_id '
+        'timing',
+    )
+):
+    '''The result of a model (or test, seed, etc.) in a dbt invocation, as recorded in the
+    run_results.json dbt writes to its target path.
+
+    Attributes:
+        unique_id (str): e.g. 'model.jaffle_shop.customers'.
+        name (str): e.g. 'customers'.
+        resource_type (str): e.g. 'model'.
+        schema (Optional[str]): The schema the node was built in.
+        materialized (Optional[str]): e.g. 'view', 'table', or 'incremental'.
+        status (Optional[str]): The status reported by the database, e.g. 'SELECT 99'.
+        error (Optional[str]): The error the node failed with, if it did.
+        execution_time (float): Seconds taken to compile and execute the node.
+        thread_id (Optional[str]): The dbt thread the node was executed on.
+        timing (Dict[str, Dict[str, str]]): The started_at and completed_at timestamps of each step
+            (e.g. 'compile', 'execute') of the node.
+    '''
+
+    def __new__(
+        cls,
+        unique_id,
+        name,
+        resource_type,
+        schema=None,
+        materialized=None,
+        status=None,
+        error=None,
+        execution_time=0.0,
+        thread_id=None,
+        timing=None,
+    ):
+        return super(DbtNodeResult, cls).__new__(
+            cls,
+            check.str_param(unique_id, 'unique_id'),
+            check.str_param(name, 'name'),
+            check.str_param(resource_type, 'resource_type'),
+            check.opt_str_param(schema, 'schema'),
+            check.opt_str_param(materialized, 'materialized'),
+            # dbt reports test results as numbers of failing rows
+            None if status is None else str(status),
+            check.opt_str_param(error, 'error'),
+            float(execution_time),
+            check.opt_str_param(thread_id, 'thread_id'),
+            check.opt_dict_param(timing, 'timing'),
+        )
+
+    @staticmethod
+    def from_dict(result):
+        node = result['node']
+        return DbtNodeResult(
+            unique_id=node['unique_id'],
+            name=node['name'],
+            resource_type=node['resource_type'],
+            schema=node.get('schema'),
+            materialized=node.get('config', {}).get('materialized'),
+            status=result.get('status'),
+            error=result.get('error'),
+            execution_time=result.get('execution_time') or 0.0,
+            thread_id=result.get('thread_id'),
+            timing={
+                step['name']: {k: v for k, v in step.items() if k != 'name'}
+                for step in result.get('timing', [])
+            },
+        )
+
+
+def parse_run_results(path):
+    '''Parse the run_results.json at path into a list of DbtNodeResult.'''
+    check.str_param(path, 'path')
+
+    with open(path, 'r') as ff:
+        return [DbtNodeResult.from_dict(result) for result in json.load(ff).get('results', [])]
+
+
+def _dbt_config(dbt_executable):
+    return {
+        'dbt_executable': Field(
+            Path,
+            default_value=dbt_executable,
+            is_required=False,
+            description=(
+                'Path to the dbt executable to invoke, e.g., \'/path/to/your/venv/bin/dbt\'. '
+                'Default: \'{dbt_executable}\''.format(dbt_executable=dbt_executable)
+            ),
+        ),
+        'threads': Field(
+            Int,
+            is_required=False,
+            description=(
+                'The number of threads dbt executes models on, which overrides the threads set in '
+                'the profile. Models that don\'t depend on one another are executed in parallel.'
+            ),
+        ),
+        'models': Field(
+            [String],
+            is_required=False,
+            description='The models to select, in dbt\'s --models syntax, e.g. [\'tag:nightly\'].',
+        ),
+        'exclude': Field(
+            [String],
+            is_required=False,
+            description='The models to exclude, in dbt\'s --exclude syntax.',
+        ),
+    }
+
+
+def _dbt_args(context, command, project_dir, profiles_dir):
+    executable_path = context.solid_config['dbt_executable']
+
+    if not distutils.spawn.find_executable(executable_path):
+        raise Failure(
+            'Could not find dbt executable at "{executable_path}". Please ensure that '
+            'dbt is installed and on the PATH.'.format(executable_path=executable_path)
+        )
+
+    args = [executable_path, command, '--project-dir', project_dir]
+    if profiles_dir:
+        args += ['--profiles-dir', profiles_dir]
+    if context.solid_config.get('threads'):
+        args += ['--threads', str(context.solid_config['threads'])]
+    if context.solid_config.get('models'):
+        args += ['--models'] + context.solid_config['models']
+    if context.solid_config.get('exclude'):
+        args += ['--exclude'] + context.solid_config['exclude']
+
+    return args
+
+
+def _execute_dbt(args, raise_on_error):
+    '''Run dbt, yielding each line of its output, with colors removed, as it is written.'''
+    # dbt block-buffers its output when it isn't writing to a terminal, which would hold back the
+    # events for models that have completed until the buffer fills
+    proc = subprocess.Popen(
+        args, stdout=subprocess.PIPE, env=dict(os.environ, PYTHONUNBUFFERED='1')
+    )
+
+    for line in io.TextIOWrapper(proc.stdout, encoding='utf-8'):
+        text = line.rstrip()
+        if not text:
+            continue
+
+        # print to stdout, i.e. to the compute logs, rather than as an event per line
+        print(text)
+
+        # remove colors
+        yield ANSI_ESCAPE.sub('', text)
+
+    proc.wait()
+
+    if raise_on_error and proc.returncode != 0:
+        raise Failure('Dbt invocation errored.')
+
+
+def _read_run_results(project_dir, target_path, started_at):
+    run_results_path = os.path.join(project_dir, target_path, RUN_RESULTS_FILENAME)
+
+    # older versions of dbt don't write run results, and a file that predates the run is stale
+    # (mtimes may only be accurate to the second)
+    if not os.path.exists(run_results_path):
+        return None
+    if os.path.getmtime(run_results_path) < int(started_at):
+        return None
+
+    return parse_run_results(run_results_path)
+
+
+def create_dbt_run_solid(
+    project_dir, name=None, profiles_dir=None, dbt_executable='dbt', target_path='target'
+):
     """Factory for solids that invoke dbt.
 
+    Materializations are yielded as dbt reports that each model has been created. Once dbt has
+    completed, the run_results output is a list of DbtNodeResult, with the status and timings of
+    each model, read from the run_results.json dbt writes to its target path.
+
     Args:
         project_dir (str): Path to the project directory (will be passed to dbt as the
             --project-dir argument).
@@ -85,70 +283,43 @@ def create_dbt_run_solid(project_dir, name=None, profiles_dir=None, dbt_executab
         dbt_executable (Optional[str]): The dbt executable to invoke. Set this value if,
             e.g., you would like to invoke dbt within a virtualenv. You may override this value for
             individual invocations of the dbt solid in its config. Default: 'dbt'.
+        target_path (Optional[str]): The target-path of the project, relative to project_dir, as
+            set in its dbt_project.yml. Default: 'target'.
     """
     check.str_param(project_dir, 'project_dir')
     check.opt_str_param(name, 'name')
     check.opt_str_param(profiles_dir, 'profiles_dir')
     check.str_param(dbt_executable, 'dbt_executable')
+    check.str_param(target_path, 'target_path')
 
     @solid(
         name=name if name else os.path.basename(project_dir),
-        config={
-            'dbt_executable': Field(
-                Path,
-                default_value=dbt_executable,
-                is_required=False,
-                description=(
-                    'Path to the dbt executable to invoke, e.g., \'/path/to/your/venv/bin/dbt\'. '
-                    'Default: \'{dbt_executable}\''.format(dbt_executable=dbt_executable)
-                ),
-            )
-        },
-        output_defs=[OutputDefinition(dagster_type=Nothing, name='run_complete')],
+        config=_dbt_config(dbt_executable),
+        output_defs=[
+            OutputDefinition(dagster_type=Nothing, name='run_complete'),
+            OutputDefinition(
+                dagster_type=List[DbtNodeResult], name='run_results', is_optional=True
+            ),
+        ],
     )
     def dbt_solid(context):
-        executable_path = context.solid_config['dbt_executable']
-
-        if not distutils.spawn.find_executable(executable_path):
-            raise Failure(
-                'Could not find dbt executable at "{executable_path}". Please ensure that '
-                'dbt is installed and on the PATH.'.format(executable_path=executable_path)
-            )
-
-        cmd = '{executable_path} run --project-dir {project_dir}'.format(
-            executable_path=executable_path, project_dir=project_dir
-        )
-        if profiles_dir:
-            cmd += ' --profiles-dir {profiles_dir}'.format(profiles_dir=profiles_dir)
-
-        args = shlex.split(cmd)
-        proc = subprocess.Popen(args, stdout=subprocess.PIPE)
+        args = _dbt_args(context, 'run', project_dir, profiles_dir)
+        started_at = time.time()
 
         # if https://github.com/fishtown-analytics/dbt/issues/1237 gets done
         # we should definitely switch to parsing the json output, as that
         # would be much more reliable/resilient
-        for line in io.TextIOWrapper(proc.stdout, encoding='utf-8'):
-            text = line.rstrip()
-            if not text:
-                continue
-
-            # print to stdout
-            print(text)
-
-            # remove colors
-            text = ANSI_ESCAPE.sub('', text)
-
+        for text in _execute_dbt(args, raise_on_error=True):
             mat = try_parse_run(text)
             if mat:
                 yield mat
 
-        proc.wait()
-
-        if proc.returncode != 0:
-            raise Failure('Dbt invocation errored.')
-
         yield Output(value=None, output_name='run_complete')
 
+        run_results = _read_run_results(project_dir, target_path, started_at)
+        if run_results is not None:
+            yield Output(value=run_results, output_name='run_results')
+
     return dbt_solid
 
 
@@ -204,45 +375,12 @@ def create_dbt_test_solid(project_dir, name=None, profiles_dir=None, dbt_executa
         name=name if name else os.path.basename(project_dir) + '_test',
         input_defs=[InputDefinition('test_start', Nothing)],
         output_defs=[OutputDefinition(dagster_type=Nothing, name='test_complete')],
-        config={
-            'dbt_executable': Field(
-                Path,
-                default_value=dbt_executable,
-                is_required=False,
-                description=(
-                    'Path to the dbt executable to invoke, e.g., \'/path/to/your/venv/bin/dbt\'. '
-                    'Default: \'{dbt_executable}\''.format(dbt_executable=dbt_executable)
-                ),
-            )
-        },
+        config=_dbt_config(dbt_executable),
     )
     def dbt_test_solid(context):
-        executable_path = context.solid_config['dbt_executable']
-
-        if not distutils.spawn.find_executable(executable_path):
-            raise Failure(
-                'Could not find dbt executable at "{executable_path}". Please ensure that '
-                'dbt is installed and on the PATH.'.format(executable_path=executable_path)
-            )
-
-        cmd = '{executable_path} test --project-dir {project_dir}'.format(
-            executable_path=executable_path, project_dir=project_dir
-        )
-        if profiles_dir:
-            cmd += ' --profiles-dir {}'.format(profiles_dir)
-        args = shlex.split(cmd)
-        proc = subprocess.Popen(args, stdout=subprocess.PIPE)
-        for line in io.TextIOWrapper(proc.stdout, encoding='utf-8'):
-            text = line.rstrip()
-            if not text:
-                continue
-
-            # print to stdout
-            print(text)
-
-            # remove colors
-            text = ANSI_ESCAPE.sub('', text)
+        args = _dbt_args(context, 'test', project_dir, profiles_dir)
 
+        for text in _execute_dbt(args, raise_on_error=False):
             expt = try_parse_test(text)
 
             if expt:
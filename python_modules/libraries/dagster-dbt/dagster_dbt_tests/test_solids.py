@@ -0,0 +1,213 @@
+import json
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+from dagster_dbt import (
+    DbtNodeResult,
+    create_dbt_run_solid,
+    create_dbt_test_solid,
+    parse_run_results,
+)
+
+from dagster import Failure, execute_solid, seven
+
+RUN_RESULTS = {
+    'results': [
+        {
+            'node': {
+                'unique_id': 'model.jaffle_shop.stg_customers',
+                'name': 'stg_customers',
+                'resource_type': 'model',
+                'schema': 'dbt_alice',
+                'config': {'materialized': 'view'},
+            },
+            'error': None,
+            'status': 'CREATE VIEW',
+            'execution_time': 0.18,
+            'thread_id': 'Thread-1',
+            'timing': [
+                {
+                    'name': 'compile',
+                    'started_at': '2019-12-11T17:36:00.100000Z',
+                    'completed_at': '2019-12-11T17:36:00.120000Z',
+                },
+                {
+                    'name': 'execute',
+                    'started_at': '2019-12-11T17:36:00.120000Z',
+                    'completed_at': '2019-12-11T17:36:00.280000Z',
+                },
+            ],
+        },
+        {
+            'node': {
+                'unique_id': 'model.jaffle_shop.order_payments',
+                'name': 'order_payments',
+                'resource_type': 'model',
+                'schema': 'dbt_alice',
+                'config': {'materialized': 'table'},
+            },
+            'error': None,
+            'status': 'SELECT 99',
+            'execution_time': 0.07,
+            'thread_id': 'Thread-2',
+            'timing': [],
+        },
+    ],
+    'generated_at': '2019-12-11T17:36:01.000000Z',
+    'elapsed_time': 1.2,
+}
+
+DBT_OUTPUT = [
+    '17:36:00 | 1 of 2 START view model dbt_alice.stg_customers.......... [RUN]',
+    '17:36:00 | 1 of 2 OK created view model dbt_alice.stg_customers..... [CREATE VIEW in 0.18s]',
+    '17:36:01 | 2 of 2 OK created table model dbt_alice.order_payments... [SELECT 99 in 0.07s]',
+]
+
+
+@pytest.fixture(name='fake_dbt')
+def fake_dbt_fixture():
+    '''A dbt executable which records its arguments, prints DBT_OUTPUT, writes RUN_RESULTS to the
+    project's target path, and exits with the return code in the FAKE_DBT_RETURNCODE env var.'''
+    with seven.TemporaryDirectory() as temp_dir:
+        project_dir = os.path.join(temp_dir, 'project')
+        os.makedirs(os.path.join(project_dir, 'target'))
+
+        executable_path = os.path.join(temp_dir, 'dbt')
+        with open(executable_path, 'w') as ff:
+            ff.write(
+                textwrap.dedent(
+                    '''\
+                    #!{python}
+                    import json, os, sys
+                    with open({args_path!r}, 'w') as ff:
+                        json.dump(sys.argv[1:] + [os.environ.get('PYTHONUNBUFFERED')], ff)
+                    for line in {output!r}:
+                        print(line)
+                    project_dir = sys.argv[sys.argv.index('--project-dir') + 1]
+                    with open(os.path.join(project_dir, 'target', 'run_results.json'), 'w') as ff:
+                        json.dump({run_results!r}, ff)
+                    sys.exit(int(os.environ.get('FAKE_DBT_RETURNCODE', '0')))
+                    '''
+                ).format(
+                    python=sys.executable,
+                    args_path=os.path.join(temp_dir, 'args.json'),
+                    output=DBT_OUTPUT,
+                    run_results=RUN_RESULTS,
+                )
+            )
+        os.chmod(executable_path, os.stat(executable_path).st_mode | stat.S_IEXEC)
+
+        def recorded_args():
+            with open(os.path.join(temp_dir, 'args.json')) as ff:
+                return json.load(ff)
+
+        yield project_dir, executable_path, recorded_args
+
+
+def test_parse_run_results():
+    with seven.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'run_results.json')
+        with open(path, 'w') as ff:
+            json.dump(RUN_RESULTS, ff)
+
+        results = parse_run_results(path)
+
+    assert [result.unique_id for result in results] == [
+        'model.jaffle_shop.stg_customers',
+        'model.jaffle_shop.order_payments',
+    ]
+    assert results[0] == DbtNodeResult(
+        unique_id='model.jaffle_shop.stg_customers',
+        name='stg_customers',
+        resource_type='model',
+        schema='dbt_alice',
+        materialized='view',
+        status='CREATE VIEW',
+        execution_time=0.18,
+        thread_id='Thread-1',
+        timing={
+            'compile': {
+                'started_at': '2019-12-11T17:36:00.100000Z',
+                'completed_at': '2019-12-11T17:36:00.120000Z',
+            },
+            'execute': {
+                'started_at': '2019-12-11T17:36:00.120000Z',
+                'completed_at': '2019-12-11T17:36:00.280000Z',
+            },
+        },
+    )
+    assert results[1].timing == {}
+
+
+def test_dbt_run_solid(fake_dbt):
+    project_dir, executable_path, recorded_args = fake_dbt
+
+    result = execute_solid(
+        create_dbt_run_solid(project_dir, dbt_executable=executable_path),
+        environment_dict={
+            'solids': {
+                'project': {'config': {'threads': 4, 'models': ['tag:nightly', 'customers']}}
+            }
+        },
+    )
+    assert result.success
+
+    assert recorded_args() == [
+        'run',
+        '--project-dir',
+        project_dir,
+        '--threads',
+        '4',
+        '--models',
+        'tag:nightly',
+        'customers',
+        # dbt's output isn't buffered, so that events are yielded as models complete
+        '1',
+    ]
+
+    materializations = result.materializations_during_compute
+    assert [materialization.label for materialization in materializations] == [
+        'create_view',
+        'create_table',
+    ]
+    metadata = [
+        {entry.label: entry.entry_data.text for entry in materialization.metadata_entries}
+        for materialization in materializations
+    ]
+    assert metadata == [
+        {'schema': 'dbt_alice', 'view': 'stg_customers', 'execution_time': '0.18'},
+        {
+            'schema': 'dbt_alice',
+            'table': 'order_payments',
+            'row_count': '99',
+            'execution_time': '0.07',
+        },
+    ]
+
+    run_results = result.output_value('run_results')
+    assert [(node.name, node.execution_time) for node in run_results] == [
+        ('stg_customers', 0.18),
+        ('order_payments', 0.07),
+    ]
+
+
+def test_dbt_run_solid_failure(fake_dbt, monkeypatch):
+    project_dir, executable_path, _ = fake_dbt
+    monkeypatch.setenv('FAKE_DBT_RETURNCODE', '1')
+
+    with pytest.raises(Failure):
+        execute_solid(create_dbt_run_solid(project_dir, dbt_executable=executable_path))
+
+
+def test_dbt_test_solid_selection(fake_dbt):
+    project_dir, executable_path, recorded_args = fake_dbt
+
+    result = execute_solid(
+        create_dbt_test_solid(project_dir, dbt_executable=executable_path),
+        environment_dict={'solids': {'project_test': {'config': {'exclude': ['orders']}}}},
+    )
+    assert result.success
+    assert recorded_args() == ['test', '--project-dir', project_dir, '--exclude', 'orders', '1']
@@ -4,6 +4,7 @@ from .bigquery.solids import (
     bq_delete_dataset,
     bq_solid_for_queries,
     import_df_to_bq,
+    import_dfs_to_bq,
     import_file_to_bq,
     import_gcs_paths_to_bq,
 )
@@ -21,6 +22,7 @@ __all__ = [
     'dataproc_resource',
     'dataproc_solid',
     'import_df_to_bq',
+    'import_dfs_to_bq',
     'import_file_to_bq',
     'import_gcs_paths_to_bq',
 ]
@@ -0,0 +1,89 @@
+import pandas as pd
+
+from dagster import ResourceDefinition, check
+
+
+def create_bigquery_fake_resource(query_results=None, page_size=None):
+    '''Create a fake of :py:class:`BigQueryClient` for test.'''
+    return ResourceDefinition.hardcoded_resource(
+        BigQueryFakeClient(query_results=query_results, page_size=page_size)
+    )
+
+
+class BigQueryFakeClient(object):
+    '''Stateful fake of a BigQuery client for test.
+
+    Queries return the DataFrames in query_results, keyed by their SQL, and loads are recorded in
+    loads. Jobs run until they are waited on, so running_jobs and max_running_jobs count how many
+    jobs were started before their results were needed.
+    '''
+
+    def __init__(self, query_results=None, page_size=None):
+        self.query_results = check.opt_dict_param(
+            query_results, 'query_results', key_type=str, value_type=pd.DataFrame
+        )
+        self.page_size = check.opt_int_param(page_size, 'page_size')
+        self.jobs = []
+        self.loads = []
+        self.max_running_jobs = 0
+
+    @property
+    def running_jobs(self):
+        return len([job for job in self.jobs if job.state == 'RUNNING'])
+
+    def query(self, sql, job_config=None):
+        if sql not in self.query_results:
+            return self._start_job(error='No results for query: %s' % sql)
+        return self._start_job(result=self.query_results[sql])
+
+    def load_table_from_source(self, source, load_input, destination, job_config):
+        self.loads.append((source, load_input, destination, job_config))
+        return self._start_job()
+
+    def bqstorage_client(self):
+        return None
+
+    def _start_job(self, result=None, error=None):
+        job = BigQueryFakeJob(result=result, error=error, page_size=self.page_size)
+        self.jobs.append(job)
+        self.max_running_jobs = max(self.max_running_jobs, self.running_jobs)
+        return job
+
+
+class BigQueryFakeJob(object):
+    def __init__(self, result=None, error=None, page_size=None):
+        self._result = result
+        self._error = error
+        self._page_size = page_size
+        self.state = 'RUNNING'
+
+    def done(self):
+        return self.state != 'RUNNING'
+
+    def cancel(self):
+        if self.state == 'RUNNING':
+            self.state = 'CANCELLED'
+        return True
+
+    def result(self):
+        if self.state == 'RUNNING':
+            self.state = 'DONE'
+        if self._error:
+            raise Exception(self._error)
+        return BigQueryFakeRowIterator(self._result, self._page_size)
+
+    def to_dataframe(self, bqstorage_client=None):  # pylint: disable=unused-argument
+        return self.result().to_dataframe()
+
+
+class BigQueryFakeRowIterator(object):
+    def __init__(self, result, page_size):
+        self._result = result if result is not None else pd.DataFrame()
+        self._page_size = page_size or max(len(self._result), 1)
+
+    def to_dataframe(self, bqstorage_client=None):  # pylint: disable=unused-argument
+        return self._result
+
+    def to_dataframe_iterable(self, bqstorage_client=None):  # pylint: disable=unused-argument
+        for start in range(0, len(self._result), self._page_size):
+            yield self._result.iloc[start : start + self._page_size]
@@ -241,7 +241,27 @@ def define_bigquery_query_config():
         is_required=False,
     )
 
+    parallelism = Field(
+        Int,
+        description='''The most queries to run at a time (1 by default, i.e. the queries are run one
+        after the other). Queries are started in order, and their results are returned in order.
+        ''',
+        is_required=False,
+        default_value=1,
+    )
+
+    use_bqstorage_api = Field(
+        Bool,
+        description='''Read query results with the BigQuery Storage API, which is faster for large
+        results, but is billed separately. Requires the google-cloud-bigquery-storage library.
+        ''',
+        is_required=False,
+        default_value=False,
+    )
+
     return {
+        'parallelism': parallelism,
+        'use_bqstorage_api': use_bqstorage_api,
         'query_job_config': {
             'allow_large_results': allow_large_results,
             'clustering_fields': sf['clustering_fields'],
@@ -263,7 +283,7 @@ def define_bigquery_query_config():
             'use_legacy_sql': use_legacy_sql,
             'use_query_cache': use_query_cache,
             'write_disposition': sf['write_disposition'],
-        }
+        },
     }
 
 
@@ -371,6 +391,20 @@ def define_bigquery_load_config():
     }
 
 
+def define_bigquery_load_many_config():
+    cfg = define_bigquery_load_config()
+
+    cfg['parallelism'] = Field(
+        Int,
+        description='''The most load jobs to run at a time (1 by default). Loads that run at the
+        same time must append to the destination table.''',
+        is_required=False,
+        default_value=1,
+    )
+
+    return cfg
+
+
 def define_bigquery_create_dataset_config():
     dataset = Field(Dataset, description='A dataset to create.', is_required=True)
 
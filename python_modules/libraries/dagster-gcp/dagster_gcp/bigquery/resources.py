@@ -69,6 +69,23 @@ class BigQueryClient(bigquery.Client):
                 None,
             )
 
+    def bqstorage_client(self):
+        '''A BigQuery Storage API client, which reads query results as Arrow record batches over
+        parallel streams, rather than page by page from the tabledata.list API.'''
+        try:
+            from google.cloud import bigquery_storage_v1beta1
+        except ImportError as e:
+            six.raise_from(
+                BigQueryError(
+                    'reading results with the BigQuery Storage API requires the '
+                    'google-cloud-bigquery-storage and pyarrow libraries to be installed. %s'
+                    % str(e)
+                ),
+                None,
+            )
+
+        return bigquery_storage_v1beta1.BigQueryStorageClient(credentials=self._credentials)
+
     def load_table_from_filepath(self, file_path, destination, job_config):
         with open(file_path, 'rb') as file_obj:
             return super(BigQueryClient, self).load_table_from_file(
@@ -1,5 +1,7 @@
-from dagster_pandas import DataFrame
-from google.cloud.bigquery.job import LoadJobConfig, QueryJobConfig
+from collections import deque
+
+from dagster_pandas import ChunkedDataFrame, DataFrame, DataFrameChunks
+from google.cloud.bigquery.job import LoadJobConfig, QueryJobConfig, WriteDisposition
 from google.cloud.bigquery.table import EncryptionConfiguration, TimePartitioning
 
 from dagster import InputDefinition, List, Nothing, OutputDefinition, Path, check, solid
@@ -8,9 +10,10 @@ from .configs import (
     define_bigquery_create_dataset_config,
     define_bigquery_delete_dataset_config,
     define_bigquery_load_config,
+    define_bigquery_load_many_config,
     define_bigquery_query_config,
 )
-from .types import BigQueryLoadSource
+from .types import BigQueryError, BigQueryLoadSource
 
 _START = 'start'
 
@@ -30,28 +33,73 @@ def _preprocess_config(cfg):
     return cfg
 
 
-def bq_solid_for_queries(sql_queries):
+def _run_jobs(start_job_fns, parallelism):
+    '''Start BigQuery jobs, with at most parallelism of them running at a time, yielding each job in
+    the order it was started once it is done.
+
+    BigQuery runs the jobs, so none of them block until they are waited on. If a job fails, or the
+    jobs are no longer needed, those that are still running are cancelled.
+    '''
+    check.int_param(parallelism, 'parallelism')
+    check.param_invariant(parallelism > 0, 'parallelism')
+
+    running = deque()
+    try:
+        for start_job in start_job_fns:
+            running.append(start_job())
+            if len(running) == parallelism:
+                yield _wait_for_job(running.popleft())
+
+        while running:
+            yield _wait_for_job(running.popleft())
+    finally:
+        for job in running:
+            job.cancel()
+
+
+def _wait_for_job(job):
+    job.result()
+    return job
+
+
+def _query_result_chunks(job, bqstorage_client):
+    # The results are read page by page (or stream by stream, with the BigQuery Storage API) from
+    # the job's destination table each time the chunks are iterated over
+    return DataFrameChunks(
+        lambda: job.result().to_dataframe_iterable(bqstorage_client=bqstorage_client)
+    )
+
+
+def bq_solid_for_queries(sql_queries, chunked=False):
     """
     Executes BigQuery SQL queries.
 
     Expects a BQ client to be provisioned in resources as context.resources.bigquery.
+
+    If chunked is True, the results of each query are output as DataFrameChunks, which are read from
+    BigQuery a page at a time as they are consumed, rather than as DataFrames held in memory. With
+    in-memory storage, that is: other system storages store the whole List, with every page read.
     """
 
     sql_queries = check.list_param(sql_queries, 'sql queries', of_type=str)
+    check.bool_param(chunked, 'chunked')
 
     @solid(
         input_defs=[InputDefinition(_START, Nothing)],
-        output_defs=[OutputDefinition(List[DataFrame])],
+        output_defs=[OutputDefinition(List[ChunkedDataFrame] if chunked else List[DataFrame])],
         config=define_bigquery_query_config(),
         required_resource_keys={'bigquery'},
         metadata={'kind': 'sql', 'sql': '\n'.join(sql_queries)},
     )
     def bq_solid(context):  # pylint: disable=unused-argument
         query_job_config = _preprocess_config(context.solid_config.get('query_job_config', {}))
+        bqstorage_client = (
+            context.resources.bigquery.bqstorage_client()
+            if context.solid_config['use_bqstorage_api']
+            else None
+        )
 
-        # Retrieve results as pandas DataFrames
-        results = []
-        for sql_query in sql_queries:
+        def start_query(sql_query):
             # We need to construct a new QueryJobConfig for each query.
             # See: https://bit.ly/2VjD6sl
             cfg = QueryJobConfig(**query_job_config) if query_job_config else None
@@ -59,9 +107,18 @@ def bq_solid_for_queries(sql_queries):
                 'executing query %s with config: %s'
                 % (sql_query, cfg.to_api_repr() if cfg else '(no config provided)')
             )
-            results.append(
-                context.resources.bigquery.query(sql_query, job_config=cfg).to_dataframe()
-            )
+            return context.resources.bigquery.query(sql_query, job_config=cfg)
+
+        # Retrieve results as pandas DataFrames, while the queries after them run
+        results = []
+        for job in _run_jobs(
+            [lambda sql_query=sql_query: start_query(sql_query) for sql_query in sql_queries],
+            context.solid_config['parallelism'],
+        ):
+            if chunked:
+                results.append(_query_result_chunks(job, bqstorage_client))
+            else:
+                results.append(job.to_dataframe(bqstorage_client=bqstorage_client))
 
         return results
 
@@ -91,6 +148,20 @@ def import_df_to_bq(context, df):
     return _execute_load_in_source(context, df, BigQueryLoadSource.DataFrame)
 
 
+@solid(
+    input_defs=[InputDefinition('dfs', List[DataFrame])],
+    output_defs=[OutputDefinition(Nothing)],
+    config=define_bigquery_load_many_config(),
+    required_resource_keys={'bigquery'},
+)
+def import_dfs_to_bq(context, dfs):
+    '''Load each of a list of DataFrames into the destination table, with up to parallelism load
+    jobs running at a time.'''
+    return _execute_loads_in_source(
+        context, dfs, BigQueryLoadSource.DataFrame, context.solid_config['parallelism']
+    )
+
+
 @solid(
     input_defs=[InputDefinition('path', Path)],
     output_defs=[OutputDefinition(Nothing)],
@@ -102,18 +173,35 @@ def import_file_to_bq(context, path):
 
 
 def _execute_load_in_source(context, source, source_name):
+    return _execute_loads_in_source(context, [source], source_name, parallelism=1)
+
+
+def _execute_loads_in_source(context, sources, source_name, parallelism):
     destination = context.solid_config.get('destination')
     load_job_config = _preprocess_config(context.solid_config.get('load_job_config', {}))
-    cfg = LoadJobConfig(**load_job_config) if load_job_config else None
+    write_disposition = load_job_config.get('write_disposition', WriteDisposition.WRITE_APPEND)
 
-    context.log.info(
-        'executing BQ load with config: %s for source %s'
-        % (cfg.to_api_repr() if cfg else '(no config provided)', source)
-    )
+    if parallelism > 1 and len(sources) > 1 and write_disposition != WriteDisposition.WRITE_APPEND:
+        raise BigQueryError(
+            'Loads into %s that run at the same time must use write_disposition %s, got %s'
+            % (destination, WriteDisposition.WRITE_APPEND, write_disposition)
+        )
+
+    def start_load(source):
+        cfg = LoadJobConfig(**load_job_config) if load_job_config else None
+        context.log.info(
+            'executing BQ load with config: %s for source %s'
+            % (cfg.to_api_repr() if cfg else '(no config provided)', source)
+        )
+        return context.resources.bigquery.load_table_from_source(
+            source_name, source, destination, job_config=cfg
+        )
 
-    context.resources.bigquery.load_table_from_source(
-        source_name, source, destination, job_config=cfg
-    ).result()
+    # wait for all of the loads to complete
+    for _ in _run_jobs(
+        [lambda source=source: start_load(source) for source in sources], parallelism
+    ):
+        pass
 
 
 @solid(
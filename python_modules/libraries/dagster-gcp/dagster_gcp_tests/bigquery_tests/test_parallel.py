@@ -0,0 +1,144 @@
+import pandas as pd
+import pytest
+from dagster_gcp import BigQueryError, bq_solid_for_queries, import_dfs_to_bq
+from dagster_gcp.bigquery.bigquery_fake_resource import (
+    BigQueryFakeClient,
+    create_bigquery_fake_resource,
+)
+from dagster_pandas import DataFrame, DataFrameChunks
+
+from dagster import (
+    InputDefinition,
+    List,
+    ModeDefinition,
+    OutputDefinition,
+    ResourceDefinition,
+    execute_pipeline,
+    execute_solid,
+    pipeline,
+    solid,
+)
+from dagster.core.instance import DagsterInstance
+
+QUERY_RESULTS = {
+    'SELECT {num} AS num'.format(num=num): pd.DataFrame({'num': [num] * num}) for num in range(1, 6)
+}
+
+
+def _fake_mode(client):
+    return ModeDefinition(resource_defs={'bigquery': ResourceDefinition.hardcoded_resource(client)})
+
+
+def _execute_queries(client, sql_queries, config=None, chunked=False):
+    return execute_solid(
+        bq_solid_for_queries(sql_queries, chunked=chunked),
+        mode_def=_fake_mode(client),
+        environment_dict={'solids': {'bq_solid': {'config': config or {}}}},
+        raise_on_error=False,
+    )
+
+
+def test_queries_run_one_at_a_time_by_default():
+    client = BigQueryFakeClient(QUERY_RESULTS)
+    result = _execute_queries(client, sorted(QUERY_RESULTS))
+    assert result.success
+
+    assert client.max_running_jobs == 1
+    assert [df['num'].tolist() for df in result.output_value()] == [
+        [num] * num for num in range(1, 6)
+    ]
+
+
+def test_queries_run_in_parallel():
+    client = BigQueryFakeClient(QUERY_RESULTS)
+    result = _execute_queries(client, sorted(QUERY_RESULTS), {'parallelism': 2})
+    assert result.success
+
+    assert client.max_running_jobs == 2
+    assert client.running_jobs == 0
+    # results are in the order of the queries, not of the jobs' completion
+    assert [df['num'].tolist() for df in result.output_value()] == [
+        [num] * num for num in range(1, 6)
+    ]
+
+
+def test_failed_query_cancels_running_queries():
+    client = BigQueryFakeClient(QUERY_RESULTS)
+    result = _execute_queries(
+        client, ['SELECT 1 AS num', 'SELECT nothing', 'SELECT 2 AS num'], {'parallelism': 3}
+    )
+    assert not result.success
+
+    assert [job.state for job in client.jobs] == ['DONE', 'DONE', 'CANCELLED']
+
+
+@pytest.mark.parametrize('chunked', [False, True])
+@pytest.mark.parametrize('storage', ['in_memory', 'filesystem'])
+def test_query_results_stored(chunked, storage):
+    client = BigQueryFakeClient(QUERY_RESULTS, page_size=2)
+    received = {}
+
+    @solid(input_defs=[InputDefinition('results', List[DataFrameChunks if chunked else DataFrame])])
+    def consume_results(_, results):
+        received['chunk_sizes'] = [
+            [len(chunk) for chunk in result] if chunked else [len(result)] for result in results
+        ]
+
+    @pipeline(mode_defs=[_fake_mode(client)])
+    def results_pipeline():
+        consume_results(
+            bq_solid_for_queries(['SELECT 3 AS num', 'SELECT 5 AS num'], chunked=chunked)()
+        )
+
+    assert execute_pipeline(
+        results_pipeline, {'storage': {storage: {}}}, instance=DagsterInstance.local_temp()
+    ).success
+    assert received['chunk_sizes'] == ([[2, 1], [2, 2, 1]] if chunked else [[3], [5]])
+
+
+def test_import_dfs_in_parallel():
+    client = BigQueryFakeClient()
+    dfs = [pd.DataFrame({'num': [num]}) for num in range(4)]
+
+    @solid(output_defs=[OutputDefinition(List[DataFrame])])
+    def emit_dfs(_):
+        return dfs
+
+    @pipeline(mode_defs=[_fake_mode(client)])
+    def load_pipeline():
+        import_dfs_to_bq(emit_dfs())
+
+    def load_config(**load_job_config):
+        return {
+            'solids': {
+                'import_dfs_to_bq': {
+                    'config': {
+                        'destination': 'project.dataset.table',
+                        'parallelism': 3,
+                        'load_job_config': load_job_config,
+                    }
+                }
+            }
+        }
+
+    assert execute_pipeline(load_pipeline, load_config()).success
+    assert client.max_running_jobs == 3
+    assert [load[1] for load in client.loads] == dfs
+
+    with pytest.raises(BigQueryError) as exc_info:
+        execute_pipeline(load_pipeline, load_config(write_disposition='WRITE_TRUNCATE'))
+    assert 'must use write_disposition WRITE_APPEND' in str(exc_info.value)
+
+
+def test_fake_resource():
+    @solid(required_resource_keys={'bigquery'})
+    def query(context):
+        return context.resources.bigquery.query('SELECT 1 AS num').to_dataframe()
+
+    result = execute_solid(
+        query,
+        mode_def=ModeDefinition(
+            resource_defs={'bigquery': create_bigquery_fake_resource(QUERY_RESULTS)}
+        ),
+    )
+    assert result.output_value()['num'].tolist() == [1]
@@ -42,11 +42,14 @@ def _do_setup(name='dagster-gcp'):
             'dagster',
             'dagster_pandas',
             'google-api-python-client',
-            'google-cloud-bigquery>=1.19.*',
+            'google-cloud-bigquery>=1.24.0',
             'google-cloud-storage',
             'oauth2client',
         ],
-        extras_require={'pyarrow': ['pyarrow']},
+        extras_require={
+            'pyarrow': ['pyarrow'],
+            'bqstorage': ['google-cloud-bigquery-storage<2.0.0', 'pyarrow'],
+        },
         zip_safe=False,
     )
 
@@ -1,3 +1,4 @@
+from .chunked import ChunkedDataFrame, DataFrameChunks
 from .data_frame import DataFrame
 
-__all__ = ['DataFrame']
+__all__ = ['ChunkedDataFrame', 'DataFrame', 'DataFrameChunks']
@@ -0,0 +1,408 @@
+'''A dagster type for DataFrames that are too large to hold in memory at once, which solids process
+chunk by chunk.
+
+    @solid(
+        input_defs=[InputDefinition('trips', ChunkedDataFrame)],
+        output_defs=[OutputDefinition(ChunkedDataFrame)],
+    )
+    def long_trips(_, trips):
+        return trips.map(lambda chunk: chunk[chunk['duration'] > 3600])
+
+Config-driven inputs are read in chunks of chunksize rows from csv files, and by row group from
+Parquet files. Outputs are materialized by appending each chunk to the file in turn.
+
+Intermediates are stored as Parquet files under filesystem storage. Elsewhere, or in a List or
+Optional, they are pickled with all of their chunks, which must then fit in memory.
+'''
+
+import os
+
+import pandas as pd
+from dagster_pandas.data_frame import dict_without_keys
+from dagster_pandas.storage import (
+    PARQUET_SERIALIZATION_STRATEGY_NAME,
+    columns_for_input,
+    parquet_write_options,
+)
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DagsterType,
+    EventMetadataEntry,
+    Field,
+    Int,
+    Materialization,
+    Path,
+    String,
+    TypeCheck,
+    check,
+)
+from dagster.config.field_utils import Selector
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.system_storage import fs_system_storage
+from dagster.core.storage.type_storage import TypeStoragePlugin
+from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
+from dagster.core.types.decorator import make_python_type_usable_as_dagster_type
+from dagster.utils import mkdir_p
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+class DataFrameChunks(object):
+    '''The chunks of a DataFrame, each a pandas DataFrame, which are produced one at a time.
+
+    Iterating over DataFrameChunks calls chunks_fn for a fresh iterator over the chunks, so that
+    they can be iterated over more than once -- e.g. by the solid that consumes them, and by the
+    materialization of the output that produced them -- without being held in memory.
+
+    Args:
+        chunks_fn (Callable[[], Iterator[pandas.DataFrame]]): Returns an iterator over the chunks.
+    '''
+
+    def __init__(self, chunks_fn):
+        self._chunks_fn = check.callable_param(chunks_fn, 'chunks_fn')
+
+    def __reduce__(self):
+        # chunks_fn is usually a closure, which can't be pickled, so DataFrameChunks are pickled by
+        # value -- e.g. when they are in a List, which the storage plugins below don't store
+        return (_dataframe_chunks_from_list, (list(self),))
+
+    def __iter__(self):
+        for chunk in self._chunks_fn():
+            if not isinstance(chunk, pd.DataFrame):
+                raise DagsterInvariantViolationError(
+                    'DataFrameChunks must be made up of pandas DataFrames. Got a chunk of type '
+                    '{type_name}.'.format(type_name=type(chunk).__name__)
+                )
+            yield chunk
+
+    def map(self, fn):
+        '''DataFrameChunks of the result of fn applied to each of these chunks, as it is produced.
+        '''
+        check.callable_param(fn, 'fn')
+        return DataFrameChunks(lambda: (fn(chunk) for chunk in self))
+
+    @staticmethod
+    def from_dataframe(dataframe, chunksize=DEFAULT_CHUNKSIZE):
+        check.inst_param(dataframe, 'dataframe', pd.DataFrame)
+        check.int_param(chunksize, 'chunksize')
+        check.param_invariant(chunksize > 0, 'chunksize')
+
+        return DataFrameChunks(
+            lambda: (
+                dataframe.iloc[start : start + chunksize]
+                for start in range(0, len(dataframe), chunksize)
+            )
+        )
+
+    def to_dataframe(self):
+        '''Concatenate the chunks into a single DataFrame, which must fit in memory.'''
+        chunks = list(self)
+        return pd.concat(chunks) if chunks else pd.DataFrame()
+
+
+def _dataframe_chunks_from_list(chunks):
+    return DataFrameChunks(lambda: iter(chunks))
+
+
+class _SchemaWidened(Exception):
+    def __init__(self, schema):
+        super(_SchemaWidened, self).__init__()
+        self.schema = schema
+        self.num_reported = 0
+
+
+def _widened_type(writer_type, chunk_type):
+    '''The type that values of both writer_type and chunk_type can be cast to, or None.'''
+    import pyarrow as pa
+
+    if writer_type.equals(chunk_type):
+        return writer_type
+    if pa.types.is_null(writer_type):
+        return chunk_type
+    if pa.types.is_null(chunk_type):
+        return writer_type
+
+    def is_numeric(arrow_type):
+        return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+    if is_numeric(writer_type) and is_numeric(chunk_type):
+        return pa.float64()
+    return None
+
+
+def _cast_to_schema(table, schema):
+    '''Cast table to schema, raising _SchemaWidened with a schema that both can be cast to if that
+    would lose values, e.g. if an int column has non-integral floats in this chunk.'''
+    import pyarrow as pa
+
+    if table.schema.equals(schema):
+        return table
+
+    if table.schema.names == schema.names:
+        try:
+            # e.g. an int column with nulls, which pandas holds as floats, is cast back to ints
+            return table.cast(schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+
+        fields = []
+        for field, chunk_field in zip(schema, table.schema):
+            widened_type = _widened_type(field.type, chunk_field.type)
+            if widened_type is None:
+                break
+            fields.append(field.with_type(widened_type))
+        else:
+            raise _SchemaWidened(pa.schema(fields, metadata=schema.metadata))
+
+    raise DagsterInvariantViolationError(
+        'Chunks of a DataFrame written to Parquet must have the same columns, of compatible types. '
+        'Got a chunk with schema:\n{chunk_schema}\nafter chunks with schema:\n{schema}'.format(
+            chunk_schema=table.schema.to_string(show_schema_metadata=False),
+            schema=schema.to_string(show_schema_metadata=False),
+        )
+    )
+
+
+def _write_parquet_chunks(chunks, path, schema, chunk_fn, num_reported):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    num_chunks = 0
+    try:
+        for chunk in chunks:
+            # the index is stored as a column, rather than the range of the first chunk's index
+            # being stored in the file's metadata
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(path, schema or table.schema, **parquet_write_options())
+            writer.write_table(_cast_to_schema(table, writer.schema))
+            num_chunks += 1
+            # chunks that were already written before the file was rewritten aren't passed again
+            if chunk_fn and num_chunks > num_reported:
+                chunk_fn(chunk)
+    except _SchemaWidened as widened:
+        widened.num_reported = max(num_chunks, num_reported)
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # no chunks, so no schema -- write an empty file, which reads back as one empty chunk
+        pq.write_table(pa.Table.from_pandas(pd.DataFrame()), path)
+
+    return num_chunks
+
+
+def write_parquet_chunks(chunks, path, chunk_fn=None):
+    '''Write chunks to the Parquet file at path, one or more row groups per chunk, calling chunk_fn
+    with each chunk once it is written. Returns the number of chunks written.
+
+    Later chunks are cast to the column types of the first, as when an int column has nulls, and so
+    is read by pandas as floats, in some chunks of a csv file. Where a cast would lose values, the
+    file is rewritten from the first chunk with the types widened, iterating over the chunks again.
+    The file is removed if the chunks can't be written.
+    '''
+    check.inst_param(chunks, 'chunks', DataFrameChunks)
+    check.str_param(path, 'path')
+    check.opt_callable_param(chunk_fn, 'chunk_fn')
+
+    schema = None
+    num_reported = 0
+    while True:
+        try:
+            return _write_parquet_chunks(chunks, path, schema, chunk_fn, num_reported)
+        except _SchemaWidened as widened:
+            schema = widened.schema
+            num_reported = widened.num_reported
+        except Exception:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+
+def read_parquet_chunks(path, columns=None):
+    '''Iterate over the row groups of the Parquet file at path as DataFrames.'''
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    for index in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(
+            index, columns=columns, use_pandas_metadata=True
+        ).to_pandas()
+
+
+class _ChunkSummary(object):
+    '''Summary statistics of chunks, which are accumulated one chunk at a time.'''
+
+    def __init__(self):
+        self.row_count = 0
+        self.chunk_count = 0
+        self.columns = None
+
+    def add(self, chunk):
+        self.row_count += len(chunk)
+        self.chunk_count += 1
+        if self.columns is None:
+            # string cast columns since they may be things like datetime
+            self.columns = list(map(str, chunk.columns))
+
+    @property
+    def metadata_entries(self):
+        return [
+            EventMetadataEntry.text(
+                str(self.row_count), 'row_count', 'Number of rows in DataFrame'
+            ),
+            EventMetadataEntry.text(
+                str(self.chunk_count), 'chunk_count', 'Number of chunks in DataFrame'
+            ),
+            EventMetadataEntry.json({'columns': self.columns or []}, 'metadata'),
+        ]
+
+
+@output_selector_schema(
+    Selector(
+        {
+            'csv': {'path': Path, 'sep': Field(String, is_required=False, default_value=','),},
+            'parquet': {'path': Path},
+            'table': {'path': Path},
+        },
+    )
+)
+def dataframe_chunks_output_schema(_context, file_type, file_options, chunks):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+    check.inst_param(chunks, 'chunks', DataFrameChunks)
+
+    path = file_options['path']
+    summary = _ChunkSummary()
+
+    if file_type in ('csv', 'table'):
+        csv_options = (
+            dict_without_keys(file_options, 'path') if file_type == 'csv' else {'sep': '\t'}
+        )
+        for chunk in chunks:
+            # the first chunk replaces any existing file, and writes the header
+            chunk.to_csv(
+                path,
+                mode='a' if summary.chunk_count else 'w',
+                header=not summary.chunk_count,
+                index=False,
+                **csv_options
+            )
+            summary.add(chunk)
+    elif file_type == 'parquet':
+        write_parquet_chunks(chunks, path, chunk_fn=summary.add)
+    else:
+        check.failed('Unsupported file_type {file_type}'.format(file_type=file_type))
+
+    return Materialization(
+        label=os.path.basename(path),
+        metadata_entries=[EventMetadataEntry.fspath(path)] + summary.metadata_entries,
+    )
+
+
+@input_selector_schema(
+    Selector(
+        {
+            'csv': {
+                'path': Path,
+                'sep': Field(String, is_required=False, default_value=','),
+                'chunksize': Field(Int, is_required=False, default_value=DEFAULT_CHUNKSIZE),
+            },
+            'parquet': {'path': Path},
+            'table': {
+                'path': Path,
+                'chunksize': Field(Int, is_required=False, default_value=DEFAULT_CHUNKSIZE),
+            },
+        },
+    )
+)
+def dataframe_chunks_input_schema(_context, file_type, file_options):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+
+    path = file_options['path']
+    if file_type == 'csv':
+        csv_options = dict_without_keys(file_options, 'path')
+        return DataFrameChunks(lambda: pd.read_csv(path, **csv_options))
+    elif file_type == 'parquet':
+        return DataFrameChunks(lambda: read_parquet_chunks(path))
+    elif file_type == 'table':
+        chunksize = file_options['chunksize']
+        return DataFrameChunks(lambda: pd.read_csv(path, sep='\t', chunksize=chunksize))
+    else:
+        raise DagsterInvariantViolationError(
+            'Unsupported file_type {file_type}'.format(file_type=file_type)
+        )
+
+
+def dataframe_chunks_type_check(_, value):
+    # the chunks themselves are only checked as they are produced, so that the type check doesn't
+    # read every chunk
+    if not isinstance(value, DataFrameChunks):
+        return TypeCheck(
+            success=False,
+            description='Must be DataFrameChunks. Got value of type {type_name}.'.format(
+                type_name=type(value).__name__
+            ),
+        )
+    return TypeCheck(success=True)
+
+
+class DataFrameChunksFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    '''Stores DataFrameChunks intermediates as Parquet files with a row group per chunk, which are
+    read back one row group at a time.'''
+
+    @classmethod
+    def falls_back_in_composites(cls):
+        return True
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return system_storage_def is fs_system_storage
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, _context, _runtime_type, paths):
+        check.inst_param(obj, 'obj', DataFrameChunks)
+
+        key = intermediate_store.key_for_paths(paths)
+        mkdir_p(os.path.dirname(key))
+        write_parquet_chunks(obj, key)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=intermediate_store.uri_for_paths(paths),
+            obj=obj,
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=intermediate_store.object_store.name,
+            size_bytes=os.path.getsize(key),
+        )
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, _runtime_type, paths):
+        key = intermediate_store.key_for_paths(paths)
+        columns = columns_for_input(context)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key=intermediate_store.uri_for_paths(paths),
+            obj=DataFrameChunks(lambda: read_parquet_chunks(key, columns)),
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=intermediate_store.object_store.name,
+        )
+
+
+ChunkedDataFrame = DagsterType(
+    name='PandasChunkedDataFrame',
+    description='''A pandas DataFrame that is processed in chunks, each a pandas DataFrame, rather
+    than held in memory at once. See dagster_pandas.DataFrameChunks.''',
+    input_hydration_config=dataframe_chunks_input_schema,
+    output_materialization_config=dataframe_chunks_output_schema,
+    type_check_fn=dataframe_chunks_type_check,
+    auto_plugins=[DataFrameChunksFilesystemStoragePlugin],
+)
+
+make_python_type_usable_as_dagster_type(DataFrameChunks, ChunkedDataFrame)
@@ -1,7 +1,12 @@
+import numpy as np
 from pandas import DataFrame
+from pandas.api.types import CategoricalDtype
 
 from dagster import check
 
+# The most offending rows a violation of a column constraint reports
+MAX_OFFENDING_ROWS = 10
+
 
 class ConstraintViolationException(Exception):
     pass
@@ -17,11 +22,19 @@ class DataFrameConstraintViolationException(ConstraintViolationException):
 
 
 class ColumnConstraintViolationException(ConstraintViolationException):
-    def __init__(self, constraint_name, constraint_description, column_name, offending_rows=None):
+    def __init__(
+        self,
+        constraint_name,
+        constraint_description,
+        column_name,
+        offending_rows=None,
+        offending_row_count=None,
+    ):
         self.constraint_name = constraint_name
         self.constraint_description = constraint_description
         self.column_name = column_name
         self.offending_rows = offending_rows
+        self.offending_row_count = offending_row_count
         super(ColumnConstraintViolationException, self).__init__(self.construct_message())
 
     def construct_message(self):
@@ -34,6 +47,12 @@ class ColumnConstraintViolationException(ConstraintViolationException):
             base_message += "The offending (index, row values) are the following: {}".format(
                 self.offending_rows
             )
+            if self.offending_row_count is not None and self.offending_row_count > len(
+                self.offending_rows
+            ):
+                base_message += " (the first {shown} of {count})".format(
+                    shown=len(self.offending_rows), count=self.offending_row_count
+                )
         return base_message
 
 
@@ -120,19 +139,55 @@ class RowCountConstraint(DataFrameConstraint):
 
 
 class ColumnConstraint(Constraint):
+    # Whether a column that satisfies the constraint can't have null values, so that a
+    # NonNullableColumnConstraint checked after it on the same column must also be satisfied
+    excludes_nulls = False
+
     def __init__(self, error_description=None, markdown_description=None):
         super(ColumnConstraint, self).__init__(
             error_description=error_description, markdown_description=markdown_description
         )
 
     def validate(self, dataframe, column_name):
-        pass
+        check.inst_param(dataframe, 'dataframe', DataFrame)
+        check.str_param(column_name, 'column_name')
+
+        column = dataframe[column_name]
+        offending_mask = self.offending_mask(column)
+        if offending_mask is not None and offending_mask.any():
+            raise self.violation(column, offending_mask)
+
+    def offending_mask(self, column):
+        '''Constraints on the values of a column implement this, rather than validate, returning a
+        boolean numpy array that is True for the values of the column (a Series) that violate the
+        constraint. This lets validation build one mask per constraint over just the column, and
+        only collect the offending rows if there are any.
+
+        Returns None for constraints that don't check values row by row.'''
+        return None
+
+    def violation(self, column, offending_mask):
+        '''The exception for the values of column where offending_mask is True, which reports up to
+        MAX_OFFENDING_ROWS of them.'''
+        offending_positions = np.flatnonzero(offending_mask)
+        offending_values = column.iloc[offending_positions[:MAX_OFFENDING_ROWS]]
+        return ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column.name,
+            offending_rows=_offending_row_pairs(offending_values),
+            offending_row_count=len(offending_positions),
+        )
 
     @staticmethod
     def get_offending_row_pairs(dataframe, column_name):
         return zip(dataframe.index.tolist(), dataframe[column_name].tolist())
 
 
+def _offending_row_pairs(column):
+    return list(zip(column.index.tolist(), column.tolist()))
+
+
 class ColumnExistsConstraint(ColumnConstraint):
     def __init__(self):
         description = "Column Name must exist in dataframe"
@@ -180,15 +235,8 @@ class NonNullableColumnConstraint(ColumnConstraint):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+    def offending_mask(self, column):
+        return column.isna().values
 
 
 class UniqueColumnConstraint(ColumnConstraint):
@@ -198,18 +246,21 @@ class UniqueColumnConstraint(ColumnConstraint):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_duplicated_values = dataframe[dataframe[column_name].duplicated()]
-        if not rows_with_duplicated_values.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+    def offending_mask(self, column):
+        if column.is_monotonic_increasing:
+            # e.g. an id column -- duplicates of sorted values are adjacent, so they are found
+            # without hashing every value
+            values = column.values
+            offending_mask = np.zeros(len(values), dtype=bool)
+            offending_mask[1:] = values[1:] == values[:-1]
+            return offending_mask
+
+        return column.duplicated().values
 
 
 class CategoricalColumnConstraint(ColumnConstraint):
+    excludes_nulls = True
+
     def __init__(self, categories):
         self.categories = list(check.set_param(categories, 'categories', of_type=str))
 
@@ -218,15 +269,14 @@ class CategoricalColumnConstraint(ColumnConstraint):
             markdown_description="Category examples are {}...".format(self.categories[:5]),
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_unexpected_buckets = dataframe[~dataframe[column_name].isin(self.categories)]
-        if not rows_with_unexpected_buckets.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+    def offending_mask(self, column):
+        if isinstance(column.dtype, CategoricalDtype):
+            # check each of the column's categories once, rather than each of its values. Null
+            # values have the code -1, which picks out the trailing True.
+            unexpected_categories = np.append(~column.cat.categories.isin(self.categories), True)
+            return unexpected_categories[column.cat.codes.values]
+
+        return ~column.isin(self.categories).values
 
 
 class MinValueColumnConstraint(ColumnConstraint):
@@ -237,15 +287,8 @@ class MinValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values > {}".format(self.min_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] < self.min_value]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_mask(self, column):
+        return (column < self.min_value).values
 
 
 class MaxValueColumnConstraint(ColumnConstraint):
@@ -256,18 +299,13 @@ class MaxValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values < {}".format(self.max_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] > self.max_value]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_mask(self, column):
+        return (column > self.max_value).values
 
 
 class InRangeColumnConstraint(ColumnConstraint):
+    excludes_nulls = True
+
     def __init__(self, min_value, max_value):
         self.min_value = min_value
         self.max_value = max_value
@@ -278,14 +316,5 @@ class InRangeColumnConstraint(ColumnConstraint):
             ),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[
-            ~dataframe[column_name].between(self.min_value, self.max_value)
-        ]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_mask(self, column):
+        return ~column.between(self.min_value, self.max_value).values
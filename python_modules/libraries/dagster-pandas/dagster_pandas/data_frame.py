@@ -4,6 +4,7 @@ from dagster_pandas.constraints import (
     ColumnTypeConstraint,
     ConstraintViolationException,
 )
+from dagster_pandas.storage import DataFrameFilesystemStoragePlugin, DataFrameS3StoragePlugin
 from dagster_pandas.validation import PandasColumn, validate_constraints
 
 from dagster import (
@@ -23,6 +24,8 @@ from dagster.core.types.decorator import make_python_type_usable_as_dagster_type
 
 CONSTRAINT_BLACKLIST = {ColumnExistsConstraint, ColumnTypeConstraint}
 
+DATAFRAME_STORAGE_PLUGINS = [DataFrameFilesystemStoragePlugin, DataFrameS3StoragePlugin]
+
 
 def dict_without_keys(ddict, *keys):
     return {key: value for key, value in ddict.items() if key not in set(keys)}
@@ -102,6 +105,7 @@ DataFrame = DagsterType(
     input_hydration_config=dataframe_input_schema,
     output_materialization_config=dataframe_output_schema,
     type_check_fn=df_type_check,
+    auto_plugins=DATAFRAME_STORAGE_PLUGINS,
 )
 
 make_python_type_usable_as_dagster_type(pd.DataFrame, DataFrame)
@@ -150,8 +154,14 @@ def create_dagster_pandas_dataframe_description(description, columns):
 
 
 def create_dagster_pandas_dataframe_type(
-    name=None, description=None, columns=None, event_metadata_fn=None, dataframe_constraints=None
+    name=None,
+    description=None,
+    columns=None,
+    event_metadata_fn=None,
+    dataframe_constraints=None,
+    sample_size=None,
 ):
+    sample_size = check.opt_int_param(sample_size, 'sample_size')
     event_metadata_fn = check.opt_callable_param(event_metadata_fn, 'event_metadata_fn')
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, 'description', default=''),
@@ -169,7 +179,10 @@ def create_dagster_pandas_dataframe_type(
 
         try:
             validate_constraints(
-                value, pandas_columns=columns, dataframe_constraints=dataframe_constraints
+                value,
+                pandas_columns=columns,
+                dataframe_constraints=dataframe_constraints,
+                sample_size=sample_size,
             )
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
@@ -183,7 +196,12 @@ def create_dagster_pandas_dataframe_type(
 
     # add input_hydration_confign and output_materialization_config
     # https://github.com/dagster-io/dagster/issues/2027
-    return DagsterType(name=name, type_check_fn=_dagster_type_check, description=description)
+    return DagsterType(
+        name=name,
+        type_check_fn=_dagster_type_check,
+        description=description,
+        auto_plugins=DATAFRAME_STORAGE_PLUGINS,
+    )
 
 
 def _execute_summary_stats(type_name, value, event_metadata_fn):
@@ -0,0 +1,202 @@
+'''Type storage plugins that persist pandas DataFrame intermediates as Parquet, rather than pickling
+them.
+
+Parquet files are compressed, and are read with memory mapping on the filesystem. A solid that only
+needs some of the columns of an upstream DataFrame can declare them on its InputDefinition, so that
+only those columns are read:
+
+    @solid(input_defs=[InputDefinition('df', DataFrame, metadata={'columns': ['a', 'b']})])
+
+DataFrames that Arrow can't represent -- e.g. those with columns of mixed types -- fall back to the
+serialization strategy of their dagster type, as do those that Parquet can't write, and those with
+columns of nested values like lists or dicts, which would be read back as other types (e.g. lists
+as numpy arrays). DataFrames in Lists and Optionals, which type storage plugins don't store, are
+pickled.
+'''
+
+import os
+from io import BytesIO
+
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.execution.context.system import SystemStepInputContext
+from dagster.core.storage.system_storage import fs_system_storage
+from dagster.core.storage.type_storage import TypeStoragePlugin
+from dagster.utils import mkdir_p
+
+PARQUET_COMPRESSION = 'snappy'
+
+PARQUET_SERIALIZATION_STRATEGY_NAME = 'parquet'
+
+# The leading (and trailing) bytes of every Parquet file
+PARQUET_MAGIC = b'PAR1'
+
+COLUMNS_METADATA_KEY = 'columns'
+
+
+def columns_for_input(context):
+    '''The columns, if any, that the input being loaded declared in its metadata.'''
+    if not isinstance(context, SystemStepInputContext):
+        return None
+
+    input_def = context.solid_def.input_def_named(context.input_name)
+    return input_def.metadata.get(COLUMNS_METADATA_KEY)
+
+
+def parquet_write_options():
+    '''The options Parquet files are written with.'''
+    import pyarrow as pa
+
+    # Before pyarrow 6, format version 2.0 stored nanosecond timestamps, which later versions only
+    # store as of 2.6 -- earlier versions coerce them to microseconds, which fails if that would
+    # lose data
+    major_version = int(pa.__version__.split('.')[0])
+    return {
+        'compression': PARQUET_COMPRESSION,
+        'version': '2.6' if major_version >= 6 else '2.0',
+    }
+
+
+def _arrow_table_from_dataframe(df):
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    # nested values aren't read back as the python objects they were written from
+    if any(pa.types.is_nested(field.type) for field in table.schema):
+        return None
+
+    return table
+
+
+def _write_parquet(table, where):
+    '''Write table to where, returning False if it couldn't be written as Parquet.'''
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        pq.write_table(table, where, **parquet_write_options())
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+
+    return True
+
+
+def _read_parquet(source, columns, memory_map=False):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(
+        source, columns=columns, use_pandas_metadata=True, memory_map=memory_map
+    ).to_pandas()
+
+
+class DataFrameFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    @classmethod
+    def falls_back_in_composites(cls):
+        # DataFrames in Lists and Optionals are pickled, as they were before this plugin
+        return True
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return system_storage_def is fs_system_storage
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, context, runtime_type, paths):
+        table = _arrow_table_from_dataframe(obj)
+        if table is None:
+            return intermediate_store.set_object(obj, context, runtime_type, paths)
+
+        key = intermediate_store.key_for_paths(paths)
+        mkdir_p(os.path.dirname(key))
+        if not _write_parquet(table, key):
+            if os.path.exists(key):
+                os.remove(key)
+            return intermediate_store.set_object(obj, context, runtime_type, paths)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=intermediate_store.uri_for_paths(paths),
+            obj=obj,
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=intermediate_store.object_store.name,
+            size_bytes=os.path.getsize(key),
+        )
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, runtime_type, paths):
+        key = intermediate_store.key_for_paths(paths)
+        with open(key, 'rb') as ff:
+            is_parquet = ff.read(len(PARQUET_MAGIC)) == PARQUET_MAGIC
+
+        if not is_parquet:
+            return intermediate_store.get_object(context, runtime_type, paths)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key=intermediate_store.uri_for_paths(paths),
+            obj=_read_parquet(key, columns_for_input(context), memory_map=True),
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=intermediate_store.object_store.name,
+        )
+
+
+class DataFrameS3StoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    @classmethod
+    def falls_back_in_composites(cls):
+        # DataFrames in Lists and Optionals are pickled, as they were before this plugin
+        return True
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        try:
+            from dagster_aws.s3.system_storage import s3_system_storage
+
+            return system_storage_def is s3_system_storage
+        except ImportError:
+            return False
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, context, runtime_type, paths):
+        table = _arrow_table_from_dataframe(obj)
+        if table is None:
+            return intermediate_store.set_object(obj, context, runtime_type, paths)
+
+        object_store = intermediate_store.object_store
+        key = intermediate_store.key_for_paths(paths)
+
+        with BytesIO() as bytes_io:
+            if not _write_parquet(table, bytes_io):
+                return intermediate_store.set_object(obj, context, runtime_type, paths)
+            size_bytes = bytes_io.tell()
+            bytes_io.seek(0)
+            object_store.s3.put_object(Bucket=object_store.bucket, Key=key, Body=bytes_io)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=object_store.uri_for_key(key),
+            obj=obj,
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=object_store.name,
+            size_bytes=size_bytes,
+        )
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, runtime_type, paths):
+        import pyarrow as pa
+
+        object_store = intermediate_store.object_store
+        key = intermediate_store.key_for_paths(paths)
+
+        body = object_store.s3.get_object(Bucket=object_store.bucket, Key=key)['Body'].read()
+        if not body.startswith(PARQUET_MAGIC):
+            return intermediate_store.get_object(context, runtime_type, paths)
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key=object_store.uri_for_key(key),
+            obj=_read_parquet(pa.BufferReader(body), columns_for_input(context)),
+            serialization_strategy_name=PARQUET_SERIALIZATION_STRATEGY_NAME,
+            object_store_name=object_store.name,
+        )
@@ -8,6 +8,7 @@ from dagster_pandas.constraints import (
     NonNullableColumnConstraint,
     UniqueColumnConstraint,
 )
+import numpy as np
 from pandas import DataFrame, Timestamp
 
 from dagster import check
@@ -33,9 +34,33 @@ class PandasColumn:
             constraints, 'constraints', of_type=Constraint
         )
 
-    def validate(self, dataframe):
+    def validate(self, dataframe, sampled_rows=None):
+        '''Validate the column of dataframe against the constraints, raising the
+        ColumnConstraintViolationException of the first that it violates.
+
+        The constraints on the values of the column are checked with a vectorized mask over just
+        the column, rather than over the dataframe -- against sampled_rows, a sample of the rows
+        of dataframe, if it is passed. The rest -- e.g. that the column exists, and its dtype --
+        are checked against dataframe.
+
+        Constraints implied by those already satisfied -- e.g. a NonNullableColumnConstraint after
+        an InRangeColumnConstraint, which nulls violate -- are skipped.'''
+        rows = dataframe if sampled_rows is None else sampled_rows
+        excludes_nulls = False
         for constraint in self.constraints:
-            constraint.validate(dataframe, self.name)
+            if excludes_nulls and isinstance(constraint, NonNullableColumnConstraint):
+                continue
+
+            # the ColumnExistsConstraint always comes first, so the column exists by the time the
+            # others are checked
+            column = None if isinstance(constraint, ColumnExistsConstraint) else rows[self.name]
+            offending_mask = None if column is None else constraint.offending_mask(column)
+            if offending_mask is None:
+                constraint.validate(dataframe, self.name)
+            elif offending_mask.any():
+                raise constraint.violation(column, offending_mask)
+
+            excludes_nulls = excludes_nulls or constraint.excludes_nulls
 
     @staticmethod
     def exists(name, non_nullable=False, unique=False):
@@ -123,7 +148,25 @@ class PandasColumn:
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
+def _sample_rows(dataframe, sample_size):
+    if hasattr(np.random, 'default_rng'):
+        # numpy's Generator samples without replacement without permuting all of the rows, as
+        # DataFrame.sample does
+        positions = np.random.default_rng().choice(len(dataframe), sample_size, replace=False)
+        return dataframe.iloc[np.sort(positions)]
+
+    return dataframe.sample(n=sample_size)
+
+
+def validate_constraints(
+    dataframe, pandas_columns=None, dataframe_constraints=None, sample_size=None
+):
+    '''Validate dataframe against the constraints of pandas_columns, and dataframe_constraints.
+
+    For very large dataframes, pass sample_size to check the constraints on the values of the
+    columns against a random sample of that many rows, rather than every row. Violations in the
+    rows that aren't sampled go undetected -- e.g. a UniqueColumnConstraint only finds duplicates
+    within the sample.'''
     dataframe = check.inst_param(dataframe, 'dataframe', DataFrame)
     pandas_columns = check.opt_list_param(
         pandas_columns, 'column_constraints', of_type=PandasColumn
@@ -131,10 +174,16 @@ def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=N
     dataframe_constraints = check.opt_list_param(
         dataframe_constraints, 'dataframe_constraints', of_type=DataFrameConstraint
     )
+    sample_size = check.opt_int_param(sample_size, 'sample_size')
 
     if pandas_columns:
+        sampled_rows = (
+            _sample_rows(dataframe, sample_size)
+            if sample_size is not None and sample_size < len(dataframe)
+            else None
+        )
         for column in pandas_columns:
-            column.validate(dataframe)
+            column.validate(dataframe, sampled_rows=sampled_rows)
 
     if dataframe_constraints:
         for dataframe_constraint in dataframe_constraints:
@@ -0,0 +1,225 @@
+import os
+
+import pandas as pd
+import pytest
+from dagster_pandas import ChunkedDataFrame, DataFrameChunks
+from dagster_pandas.chunked import read_parquet_chunks, write_parquet_chunks
+
+from dagster import (
+    DagsterInvariantViolationError,
+    InputDefinition,
+    List,
+    OutputDefinition,
+    check_dagster_type,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.instance import DagsterInstance
+from dagster.utils import script_relative_path
+
+
+def _dataframe(num_rows=10):
+    return pd.DataFrame({'num': range(num_rows), 'half': [num / 2.0 for num in range(num_rows)]})
+
+
+def test_dataframe_chunks():
+    chunks = DataFrameChunks.from_dataframe(_dataframe(), chunksize=3)
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    # chunks can be iterated over more than once
+    pd.testing.assert_frame_equal(chunks.to_dataframe(), _dataframe())
+
+    doubled = chunks.map(lambda chunk: chunk * 2)
+    pd.testing.assert_frame_equal(doubled.to_dataframe(), _dataframe() * 2)
+
+
+def test_dataframe_chunks_must_be_dataframes():
+    chunks = DataFrameChunks(lambda: iter([_dataframe(), 'not a dataframe']))
+    with pytest.raises(DagsterInvariantViolationError):
+        list(chunks)
+
+
+def test_chunked_dataframe_type_check():
+    assert check_dagster_type(
+        ChunkedDataFrame, DataFrameChunks.from_dataframe(_dataframe())
+    ).success
+    assert not check_dagster_type(ChunkedDataFrame, _dataframe()).success
+
+
+@pytest.mark.parametrize(
+    'input_config',
+    [
+        {'csv': {'path': script_relative_path('num.csv'), 'chunksize': 1}},
+        {'parquet': {'path': script_relative_path('num.parquet')}},
+        {'table': {'path': script_relative_path('num_table.txt'), 'chunksize': 1}},
+    ],
+)
+def test_chunked_dataframe_from_inputs(input_config):
+    called = {}
+
+    @solid(input_defs=[InputDefinition('chunks', ChunkedDataFrame)])
+    def chunks_as_config(_context, chunks):
+        chunk_list = list(chunks)
+        assert all(isinstance(chunk, pd.DataFrame) for chunk in chunk_list)
+        assert pd.concat(chunk_list).to_dict('list') == {'num1': [1, 3], 'num2': [2, 4]}
+        called['chunk_count'] = len(chunk_list)
+
+    @pipeline
+    def chunked_pipeline():
+        chunks_as_config()
+
+    result = execute_pipeline(
+        chunked_pipeline, {'solids': {'chunks_as_config': {'inputs': {'chunks': input_config}}}},
+    )
+
+    assert result.success
+    assert called['chunk_count'] >= 1
+    if 'csv' in input_config or 'table' in input_config:
+        assert called['chunk_count'] == 2
+
+
+@pytest.mark.parametrize('file_type', ['csv', 'parquet', 'table'])
+def test_chunked_dataframe_materialization(file_type):
+    @solid(output_defs=[OutputDefinition(ChunkedDataFrame)])
+    def emit_chunks(_):
+        return DataFrameChunks.from_dataframe(_dataframe(), chunksize=3)
+
+    @pipeline
+    def chunked_pipeline():
+        emit_chunks()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'out')
+        result = execute_pipeline(
+            chunked_pipeline,
+            {'solids': {'emit_chunks': {'outputs': [{'result': {file_type: {'path': path}}}]}}},
+        )
+        assert result.success
+
+        if file_type == 'csv':
+            written = pd.read_csv(path)
+        elif file_type == 'table':
+            written = pd.read_csv(path, sep='\t')
+        else:
+            chunks = list(read_parquet_chunks(path))
+            assert len(chunks) == 4
+            written = pd.concat(chunks)
+        pd.testing.assert_frame_equal(written, _dataframe())
+
+    materialization = result.result_for_solid('emit_chunks').materializations_during_compute[0]
+    metadata = {entry.label: entry.entry_data for entry in materialization.metadata_entries}
+    assert metadata['row_count'].text == '10'
+    assert metadata['chunk_count'].text == '4'
+    assert metadata['metadata'].data == {'columns': ['num', 'half']}
+
+
+def test_chunked_dataframe_intermediates():
+    received = {}
+
+    @solid(output_defs=[OutputDefinition(ChunkedDataFrame)])
+    def emit_chunks(_):
+        return DataFrameChunks.from_dataframe(_dataframe(), chunksize=3)
+
+    @solid(input_defs=[InputDefinition('chunks', ChunkedDataFrame, metadata={'columns': ['half']})])
+    def consume_chunks(_, chunks):
+        received['chunks'] = list(chunks)
+
+    @pipeline
+    def chunked_pipeline():
+        consume_chunks(emit_chunks())
+
+    result = execute_pipeline(chunked_pipeline, {'storage': {'filesystem': {}}})
+    assert result.success
+
+    assert [len(chunk) for chunk in received['chunks']] == [3, 3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(received['chunks']), _dataframe()[['half']])
+
+    messages = [
+        event.message
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.step_key == 'emit_chunks.compute'
+    ]
+    assert len(messages) == 1
+    assert messages[0].endswith('using parquet.')
+
+
+def test_write_parquet_chunks_with_nulls():
+    # as from pd.read_csv(chunksize=...), the num column is int in the first chunk, and float in
+    # the second, where it has a null
+    chunks = DataFrameChunks(
+        lambda: iter(
+            [pd.DataFrame({'num': [1, 2]}), pd.DataFrame({'num': [3, None]}, index=[2, 3])]
+        )
+    )
+    written = []
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, 'chunks.parquet')
+        assert write_parquet_chunks(chunks, path, chunk_fn=written.append) == 2
+
+        first_chunk, second_chunk = read_parquet_chunks(path)
+        pd.testing.assert_frame_equal(first_chunk, pd.DataFrame({'num': [1, 2]}))
+        pd.testing.assert_frame_equal(second_chunk, pd.DataFrame({'num': [3, None]}, index=[2, 3]))
+    assert len(written) == 2
+
+
+def test_write_parquet_chunks_widens_types():
+    chunks = DataFrameChunks(
+        lambda: iter(
+            [
+                pd.DataFrame({'num': [1, 2], 'name': [None, None]}),
+                pd.DataFrame({'num': [2.5, 3.5], 'name': ['a', None]}, index=[2, 3]),
+                pd.DataFrame({'num': [4, 5], 'name': [None, 'b']}, index=[4, 5]),
+            ]
+        )
+    )
+    written = []
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, 'chunks.parquet')
+        assert write_parquet_chunks(chunks, path, chunk_fn=written.append) == 3
+
+        pd.testing.assert_frame_equal(
+            pd.concat(read_parquet_chunks(path)),
+            pd.DataFrame(
+                {'num': [1.0, 2.0, 2.5, 3.5, 4.0, 5.0], 'name': [None, None, 'a', None, None, 'b']}
+            ),
+        )
+    # the file is rewritten once the num column has floats, but each chunk is only passed once
+    assert [chunk.index.tolist() for chunk in written] == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_write_parquet_chunks_incompatible_columns():
+    chunks = DataFrameChunks(
+        lambda: iter([pd.DataFrame({'num': [1, 2]}), pd.DataFrame({'other': ['a', 'b']})])
+    )
+    with seven.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, 'chunks.parquet')
+        with pytest.raises(DagsterInvariantViolationError, match='same columns'):
+            write_parquet_chunks(chunks, path)
+
+        assert not os.path.exists(path)
+
+
+def test_chunked_dataframes_in_list_intermediates():
+    @solid(output_defs=[OutputDefinition(List[ChunkedDataFrame])])
+    def emit_chunks_list(_):
+        return [DataFrameChunks.from_dataframe(_dataframe(), chunksize=3)] * 2
+
+    @solid(input_defs=[InputDefinition('chunks_list', List[ChunkedDataFrame])])
+    def consume_chunks_list(_, chunks_list):
+        return [[len(chunk) for chunk in chunks] for chunks in chunks_list]
+
+    @pipeline
+    def chunks_list_pipeline():
+        consume_chunks_list(emit_chunks_list())
+
+    result = execute_pipeline(
+        chunks_list_pipeline,
+        {'storage': {'filesystem': {}}},
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('consume_chunks_list').output_value() == [[3, 3, 3, 1]] * 2
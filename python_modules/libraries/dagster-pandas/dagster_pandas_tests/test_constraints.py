@@ -1,6 +1,9 @@
 import pytest
 from dagster_pandas.constraints import (
+    MAX_OFFENDING_ROWS,
     CategoricalColumnConstraint,
+    ColumnConstraint,
+    ColumnConstraintViolationException,
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     ConstraintViolationException,
@@ -12,7 +15,7 @@ from dagster_pandas.constraints import (
     StrictColumnsConstraint,
     UniqueColumnConstraint,
 )
-from pandas import DataFrame
+from pandas import Categorical, DataFrame
 
 
 def test_column_exists_constraint():
@@ -121,3 +124,65 @@ def test_row_count_constraint():
         assert RowCountConstraint(5, error_tolerance=1).validate(
             DataFrame({'foo': [1, 2, 3, 4, 5, 6, 7]})
         )
+
+
+def test_offending_rows_are_capped():
+    bad_test_dataframe = DataFrame({'foo': [None] * 100 + ['bar']})
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        NonNullableColumnConstraint().validate(bad_test_dataframe, 'foo')
+
+    assert exc_info.value.offending_rows == [(index, None) for index in range(MAX_OFFENDING_ROWS)]
+    assert exc_info.value.offending_row_count == 100
+    assert '(the first {} of 100)'.format(MAX_OFFENDING_ROWS) in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    'values,offending_rows',
+    [
+        # sorted, which is checked by comparing adjacent values
+        ([1, 2, 2, 3, 3, 3], [(2, 2), (4, 3), (5, 3)]),
+        ([3, 1, 3, 2, 1], [(2, 3), (4, 1)]),
+    ],
+)
+def test_column_unique_constraint_offending_rows(values, offending_rows):
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        UniqueColumnConstraint().validate(DataFrame({'foo': values}), 'foo')
+
+    assert exc_info.value.offending_rows == offending_rows
+
+
+def test_categorical_column_constraint_categorical_dtype():
+    constraint = CategoricalColumnConstraint({'bar', 'baz'})
+    test_dataframe = DataFrame(
+        {'foo': Categorical(['bar', 'baz', 'bar'], categories=['bar', 'baz', 'qux'])}
+    )
+    assert constraint.validate(test_dataframe, 'foo') is None
+
+    bad_test_dataframe = DataFrame({'foo': Categorical(['bar', 'qux', None, 'bar'])})
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        constraint.validate(bad_test_dataframe, 'foo')
+
+    assert [index for index, _ in exc_info.value.offending_rows] == [1, 2]
+
+
+def test_custom_column_constraint_get_offending_row_pairs():
+    class EvenColumnConstraint(ColumnConstraint):
+        def __init__(self):
+            super(EvenColumnConstraint, self).__init__(
+                error_description='even', markdown_description='even'
+            )
+
+        def validate(self, dataframe, column_name):
+            odd_rows = dataframe[dataframe[column_name] % 2 == 1]
+            if not odd_rows.empty:
+                raise ColumnConstraintViolationException(
+                    constraint_name=self.name,
+                    constraint_description=self.error_description,
+                    column_name=column_name,
+                    offending_rows=list(self.get_offending_row_pairs(odd_rows, column_name)),
+                )
+
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        EvenColumnConstraint().validate(DataFrame({'foo': [2, 3, 4, 5]}), 'foo')
+
+    assert exc_info.value.offending_rows == [(1, 3), (3, 5)]
@@ -0,0 +1,307 @@
+import os
+
+import pandas as pd
+import pytest
+from dagster_pandas import DataFrame
+from dagster_pandas.data_frame import create_dagster_pandas_dataframe_type
+from dagster_pandas.storage import (
+    PARQUET_MAGIC,
+    DataFrameFilesystemStoragePlugin,
+    DataFrameS3StoragePlugin,
+)
+
+from dagster import (
+    InputDefinition,
+    List,
+    Optional,
+    OutputDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
+from dagster.core.types.dagster_type import resolve_dagster_type
+from dagster.seven import mock
+from dagster.utils.test import yield_empty_pipeline_context
+
+FS_STORAGE = {'storage': {'filesystem': {}}}
+
+
+def _dataframe():
+    return pd.DataFrame(
+        {'num1': [1, 3, 5], 'num2': [2.0, 4.0, 6.0], 'name': ['a', 'b', 'c']},
+        index=pd.Index([10, 20, 30], name='idx'),
+    )
+
+
+def _dataframe_object_store_messages(result):
+    # the messages of the object store operations for the output of emit, and for its consumer's
+    # input
+    return [
+        event.message
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and (event.step_key.startswith('emit') or 'for input' in event.message)
+    ]
+
+
+def _intermediate_path(instance, result, step_key):
+    return os.path.join(
+        instance.intermediates_directory(result.run_id), 'intermediates', step_key, 'result'
+    )
+
+
+def test_plugins_registered_for_storage():
+    for dagster_type in [
+        DataFrame,
+        create_dagster_pandas_dataframe_type(name='TypedDataFrame', columns=[]),
+    ]:
+        assert DataFrameFilesystemStoragePlugin in dagster_type.auto_plugins
+        assert DataFrameS3StoragePlugin in dagster_type.auto_plugins
+
+    assert DataFrameFilesystemStoragePlugin.compatible_with_storage_def(fs_system_storage)
+    assert not DataFrameFilesystemStoragePlugin.compatible_with_storage_def(mem_system_storage)
+    assert not DataFrameS3StoragePlugin.compatible_with_storage_def(fs_system_storage)
+
+
+def test_dataframe_intermediates_stored_as_parquet():
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def emit():
+        return _dataframe()
+
+    @lambda_solid(input_defs=[InputDefinition('df', DataFrame)])
+    def consume(df):
+        received['df'] = df
+
+    @pipeline
+    def parquet_pipeline():
+        consume(emit())
+
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(parquet_pipeline, environment_dict=FS_STORAGE, instance=instance)
+    assert result.success
+
+    with open(_intermediate_path(instance, result, 'emit.compute'), 'rb') as ff:
+        assert ff.read(len(PARQUET_MAGIC)) == PARQUET_MAGIC
+
+    messages = _dataframe_object_store_messages(result)
+    assert len(messages) == 2
+    assert all(message.endswith('using parquet.') for message in messages)
+
+    pd.testing.assert_frame_equal(received['df'], _dataframe())
+
+
+def test_input_column_projection():
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def emit():
+        return _dataframe()
+
+    @lambda_solid(
+        input_defs=[InputDefinition('df', DataFrame, metadata={'columns': ['num2', 'name']})]
+    )
+    def consume_some_columns(df):
+        received['df'] = df
+
+    @pipeline
+    def projection_pipeline():
+        consume_some_columns(emit())
+
+    result = execute_pipeline(projection_pipeline, environment_dict=FS_STORAGE)
+    assert result.success
+
+    assert list(received['df'].columns) == ['num2', 'name']
+    pd.testing.assert_frame_equal(received['df'], _dataframe()[['num2', 'name']])
+
+
+def test_input_column_projection_per_input():
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def emit():
+        return _dataframe()
+
+    @lambda_solid(
+        input_defs=[
+            InputDefinition('some', DataFrame, metadata={'columns': ['num2']}),
+            InputDefinition('every', DataFrame),
+        ]
+    )
+    def consume_twice(some, every):
+        received['some'] = some
+        received['every'] = every
+
+    @pipeline
+    def projection_pipeline():
+        df = emit()
+        consume_twice(df, df)
+
+    result = execute_pipeline(projection_pipeline, environment_dict=FS_STORAGE)
+    assert result.success
+
+    pd.testing.assert_frame_equal(received['some'], _dataframe()[['num2']])
+    pd.testing.assert_frame_equal(received['every'], _dataframe())
+
+
+def test_dataframes_in_lists_and_optionals_stored():
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(List[DataFrame]))
+    def emit_list():
+        return [_dataframe(), _dataframe()]
+
+    @lambda_solid(output_def=OutputDefinition(Optional[DataFrame]))
+    def emit_optional():
+        return None
+
+    @lambda_solid(
+        input_defs=[
+            InputDefinition('dfs', List[DataFrame]),
+            InputDefinition('maybe_df', Optional[DataFrame]),
+        ]
+    )
+    def consume(dfs, maybe_df):
+        received['dfs'] = dfs
+        received['maybe_df'] = maybe_df
+
+    @pipeline
+    def composite_pipeline():
+        consume(emit_list(), emit_optional())
+
+    result = execute_pipeline(
+        composite_pipeline, environment_dict=FS_STORAGE, instance=DagsterInstance.local_temp()
+    )
+    assert result.success
+
+    # plugins don't store composite types, so these are pickled
+    assert len(received['dfs']) == 2
+    for df in received['dfs']:
+        pd.testing.assert_frame_equal(df, _dataframe())
+    assert received['maybe_df'] is None
+
+
+def test_unrepresentable_dataframe_falls_back_to_pickle():
+    mixed = pd.DataFrame({'mixed': [1, 'two', 3.0]})
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def emit_mixed():
+        return mixed
+
+    @lambda_solid(input_defs=[InputDefinition('df', DataFrame)])
+    def consume(df):
+        received['df'] = df
+
+    @pipeline
+    def fallback_pipeline():
+        consume(emit_mixed())
+
+    result = execute_pipeline(fallback_pipeline, environment_dict=FS_STORAGE)
+    assert result.success
+
+    messages = _dataframe_object_store_messages(result)
+    assert len(messages) == 2
+    assert all(message.endswith('using pickle.') for message in messages)
+    pd.testing.assert_frame_equal(received['df'], mixed)
+
+
+def _round_trip(df):
+    received = {}
+
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def emit():
+        return df
+
+    @lambda_solid(input_defs=[InputDefinition('df', DataFrame)])
+    def consume(df):
+        received['df'] = df
+
+    @pipeline
+    def round_trip_pipeline():
+        consume(emit())
+
+    result = execute_pipeline(round_trip_pipeline, environment_dict=FS_STORAGE)
+    assert result.success
+
+    return received['df'], _dataframe_object_store_messages(result)
+
+
+def test_nanosecond_timestamps_stored_as_parquet():
+    timestamps = pd.DataFrame({'at': pd.to_datetime(['2020-01-01 00:00:00.000000001'])})
+
+    received, messages = _round_trip(timestamps)
+
+    assert all(message.endswith('using parquet.') for message in messages)
+    pd.testing.assert_frame_equal(received, timestamps)
+
+
+def test_nested_values_fall_back_to_pickle():
+    nested = pd.DataFrame({'lists': [[1, 2], [3]], 'name': ['a', 'b']})
+
+    received, messages = _round_trip(nested)
+
+    assert all(message.endswith('using pickle.') for message in messages)
+    assert received['lists'].tolist() == [[1, 2], [3]]
+    assert all(isinstance(value, list) for value in received['lists'])
+
+
+def test_parquet_write_failure_falls_back_to_pickle():
+    import pyarrow as pa
+
+    with mock.patch(
+        'pyarrow.parquet.write_table', side_effect=pa.ArrowInvalid('cannot write')
+    ) as write_table:
+        received, messages = _round_trip(_dataframe())
+
+    assert write_table.called
+    assert all(message.endswith('using pickle.') for message in messages)
+    pd.testing.assert_frame_equal(received, _dataframe())
+
+
+def test_filesystem_plugin_round_trip():
+    runtime_type = resolve_dagster_type(DataFrame)
+    with yield_empty_pipeline_context() as context:
+        intermediate_store = build_fs_intermediate_store(
+            context.instance.intermediates_directory, context.run_id
+        )
+        paths = ['intermediates', 'emit.compute', 'result']
+
+        set_op = DataFrameFilesystemStoragePlugin.set_object(
+            intermediate_store, _dataframe(), context, runtime_type, paths
+        )
+        assert set_op.size_bytes > 0
+
+        get_op = DataFrameFilesystemStoragePlugin.get_object(
+            intermediate_store, context, runtime_type, paths
+        )
+        pd.testing.assert_frame_equal(get_op.obj, _dataframe())
+
+
+def test_s3_plugin_round_trip():
+    pytest.importorskip('dagster_aws')
+    from dagster_aws.s3.intermediate_store import S3IntermediateStore
+    from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+    runtime_type = resolve_dagster_type(DataFrame)
+    with yield_empty_pipeline_context() as context:
+        intermediate_store = S3IntermediateStore(
+            s3_bucket='bucket', run_id=context.run_id, s3_session=S3FakeSession()
+        )
+        paths = ['intermediates', 'emit.compute', 'result']
+
+        set_op = DataFrameS3StoragePlugin.set_object(
+            intermediate_store, _dataframe(), context, runtime_type, paths
+        )
+        assert set_op.serialization_strategy_name == 'parquet'
+        assert set_op.size_bytes > 0
+
+        get_op = DataFrameS3StoragePlugin.get_object(
+            intermediate_store, context, runtime_type, paths
+        )
+        pd.testing.assert_frame_equal(get_op.obj, _dataframe())
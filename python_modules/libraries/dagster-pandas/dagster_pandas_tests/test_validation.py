@@ -1,6 +1,7 @@
 import pytest
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
+    ColumnConstraintViolationException,
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     ConstraintViolationException,
@@ -128,3 +129,51 @@ def test_datetime_column_composition(composer, composer_args, expected_constrain
     distinct_included_constraints = expected_constraints + [UniqueColumnConstraint]
     distinct_column = composer('foo', *composer_args, unique=True)
     assert has_constraints(distinct_column, distinct_included_constraints)
+
+
+def test_non_nullable_implied_by_in_range():
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_constraints(
+            DataFrame({'foo': [1.0, None]}),
+            pandas_columns=[PandasColumn.float_column('foo', min_value=0, non_nullable=True)],
+        )
+    assert exc_info.value.constraint_name == 'InRangeColumnConstraint'
+
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_constraints(
+            DataFrame({'foo': ['bar', None]}),
+            pandas_columns=[PandasColumn.string_column('foo', non_nullable=True)],
+        )
+    assert exc_info.value.constraint_name == 'NonNullableColumnConstraint'
+
+
+def test_sampled_validation():
+    pandas_columns = [PandasColumn.integer_column('foo', min_value=0, unique=True)]
+
+    assert (
+        validate_constraints(
+            DataFrame({'foo': range(1000)}), pandas_columns=pandas_columns, sample_size=10
+        )
+        is None
+    )
+
+    with pytest.raises(ColumnConstraintViolationException):
+        validate_constraints(
+            DataFrame({'foo': range(-1000, 0)}), pandas_columns=pandas_columns, sample_size=10
+        )
+
+    # the dtype and existence of columns are checked against the whole dataframe
+    with pytest.raises(ColumnConstraintViolationException):
+        validate_constraints(
+            DataFrame({'foo': [float(value) for value in range(1000)]}),
+            pandas_columns=pandas_columns,
+            sample_size=10,
+        )
+
+    # a sample as large as the dataframe checks every row
+    with pytest.raises(ColumnConstraintViolationException):
+        validate_constraints(
+            DataFrame({'foo': list(range(999)) + [-1]}),
+            pandas_columns=pandas_columns,
+            sample_size=1000,
+        )
@@ -51,7 +51,7 @@ def _do_setup(name='dagster-pandas'):
         ],
         packages=find_packages(exclude=['dagster_pandas_tests']),
         include_package_data=True,
-        install_requires=['dagster', 'pandas', 'matplotlib'],
+        install_requires=['dagster', 'pandas', 'matplotlib', 'pyarrow'],
     )
 
 
@@ -0,0 +1,40 @@
+"""add run tags index
+
+Revision ID: c9159e740292
+Revises: 8f8dba68fd3b
+Create Date: 2020-02-20 10:14:32.618275
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = 'c9159e740292'
+down_revision = '8f8dba68fd3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_tags' in has_tables:
+        indices = [x.get('name') for x in inspector.get_indexes('run_tags')]
+        if 'idx_run_tags' not in indices:
+            op.create_index('idx_run_tags', 'run_tags', ['key', 'value'], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_tags' in has_tables:
+        indices = [x.get('name') for x in inspector.get_indexes('run_tags')]
+        if 'idx_run_tags' in indices:
+            op.drop_index('idx_run_tags', 'run_tags')
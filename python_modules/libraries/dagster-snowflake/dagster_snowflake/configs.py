@@ -111,6 +111,14 @@ def define_snowflake_config():
         is_required=False,
     )
 
+    max_idle_connections = Field(
+        Int,
+        description='''The most connections to keep open for reuse by later queries (1 by default).
+         Connections are opened as queries need them, and closed when the resource is torn down.''',
+        is_required=False,
+        default_value=1,
+    )
+
     return {
         'account': account,
         'user': user,
@@ -128,4 +136,5 @@ def define_snowflake_config():
         'validate_default_parameters': validate_default_parameters,
         'paramstyle': paramstyle,
         'timezone': timezone,
+        'max_idle_connections': max_idle_connections,
     }
@@ -1,12 +1,21 @@
+import os
 import sys
+import threading
+import uuid
 from contextlib import closing, contextmanager
+from multiprocessing.pool import ThreadPool
 
 import snowflake.connector
 
-from dagster import check, resource
+from dagster import check, resource, seven
 
 from .configs import define_snowflake_config
 
+# Rows per Parquet file staged by load_table_from_dataframe
+DEFAULT_UPLOAD_CHUNKSIZE = 100000
+
+DEFAULT_UPLOAD_PARALLELISM = 4
+
 
 class SnowflakeConnection(object):
     def __init__(self, context):  # pylint: disable=too-many-locals
@@ -39,13 +48,58 @@ class SnowflakeConnection(object):
         self.autocommit = self.conn_args.get('autocommit', False)
         self.log = context.log_manager
 
+        # Connections are reused across queries, rather than each query paying for authentication
+        # and session set-up
+        self.max_idle_connections = context.resource_config.get('max_idle_connections', 1)
+        self._idle_connections = []
+        self._lock = threading.Lock()
+
+    def _checkout_connection(self):
+        with self._lock:
+            while self._idle_connections:
+                conn = self._idle_connections.pop()
+                if not conn.is_closed():
+                    return conn
+
+        return snowflake.connector.connect(**self.conn_args)
+
+    def _checkin_connection(self, conn):
+        with self._lock:
+            if len(self._idle_connections) < self.max_idle_connections:
+                self._idle_connections.append(conn)
+                return
+
+        conn.close()
+
     @contextmanager
     def get_connection(self):
-        conn = snowflake.connector.connect(**self.conn_args)
-        yield conn
+        conn = self._checkout_connection()
+        try:
+            yield conn
+        except BaseException:
+            # the connection may be mid-transaction, so isn't reused -- this includes a
+            # GeneratorExit, e.g. when fetch_pandas_batches is closed before it is exhausted
+            conn.close()
+            raise
+
         if not self.autocommit:
             conn.commit()
-        conn.close()
+        self._checkin_connection(conn)
+
+    def close(self):
+        '''Close the connections kept for reuse.'''
+        with self._lock:
+            idle_connections, self._idle_connections = self._idle_connections, []
+
+        for conn in idle_connections:
+            conn.close()
+
+    def _execute(self, cursor, sql, parameters):
+        if sys.version_info[0] < 3:
+            sql = sql.encode('utf-8')
+
+        self.log.info('[snowflake] Executing query: ' + sql)
+        cursor.execute(sql, parameters)  # pylint: disable=E1101
 
     def execute_query(self, sql, parameters=None, fetch_results=False):
         check.str_param(sql, 'sql')
@@ -54,11 +108,7 @@ class SnowflakeConnection(object):
 
         with self.get_connection() as conn:
             with closing(conn.cursor()) as cursor:
-                if sys.version_info[0] < 3:
-                    sql = sql.encode('utf-8')
-
-                self.log.info('[snowflake] Executing query: ' + sql)
-                cursor.execute(sql, parameters)  # pylint: disable=E1101
+                self._execute(cursor, sql, parameters)
                 if fetch_results:
                     return cursor.fetchall()  # pylint: disable=E1101
 
@@ -71,10 +121,7 @@ class SnowflakeConnection(object):
         with self.get_connection() as conn:
             with closing(conn.cursor()) as cursor:
                 for sql in sql_queries:
-                    if sys.version_info[0] < 3:
-                        sql = sql.encode('utf-8')
-                    self.log.info('[snowflake] Executing query: ' + sql)
-                    cursor.execute(sql, parameters)  # pylint: disable=E1101
+                    self._execute(cursor, sql, parameters)
                     if fetch_results:
                         results.append(cursor.fetchall())  # pylint: disable=E1101
 
@@ -95,13 +142,116 @@ class SnowflakeConnection(object):
 
         self.execute_queries(sql_queries)
 
+    def fetch_pandas_batches(self, sql, parameters=None):
+        '''Execute a query, yielding its results as pandas DataFrames one batch at a time, as
+        they are fetched in Arrow format.
+
+        The connection is held until the batches are exhausted, or the generator is closed.
+        '''
+        check.str_param(sql, 'sql')
+        check.opt_dict_param(parameters, 'parameters')
+
+        with self.get_connection() as conn:
+            with closing(conn.cursor()) as cursor:
+                self._execute(cursor, sql, parameters)
+                for batch in cursor.fetch_pandas_batches():  # pylint: disable=E1101
+                    yield batch
+
+    def load_table_from_dataframe(
+        self,
+        dataframe,
+        table,
+        chunksize=DEFAULT_UPLOAD_CHUNKSIZE,
+        parallelism=DEFAULT_UPLOAD_PARALLELISM,
+    ):
+        '''Bulk load a pandas DataFrame into an existing table, whose columns are matched to the
+        DataFrame's by name.
+
+        The DataFrame is converted to Arrow in chunks of chunksize rows, which are written to
+        snappy-compressed Parquet files parallelism at a time, with at most parallelism chunks held
+        in memory. The files are staged under a prefix unique to this call, so that concurrent
+        loads into the same table don't overwrite or copy each other's files, then copied into the
+        table.
+        '''
+        import pandas as pd
+        import pyarrow as pa
+
+        check.inst_param(dataframe, 'dataframe', pd.DataFrame)
+        check.str_param(table, 'table')
+        check.int_param(chunksize, 'chunksize')
+        check.param_invariant(chunksize > 0, 'chunksize')
+        check.int_param(parallelism, 'parallelism')
+        check.param_invariant(parallelism > 0, 'parallelism')
+
+        if dataframe.empty:
+            return
+
+        stage = '@%{table}/{prefix}/'.format(table=table, prefix=uuid.uuid4().hex)
+
+        with seven.TemporaryDirectory() as tmp_dir:
+            # Converting DataFrames to Arrow isn't safe to do on several threads at once (slices of
+            # the same DataFrame share its index), so chunks are converted here and only the
+            # Parquet files are written in parallel. A chunk is converted once a slot is free.
+            in_flight = threading.BoundedSemaphore(parallelism)
+
+            def _write_and_release(table_and_path):
+                try:
+                    _write_parquet_table(table_and_path)
+                finally:
+                    in_flight.release()
+
+            pool = ThreadPool(parallelism)
+            try:
+                writes = []
+                for index, start in enumerate(range(0, len(dataframe), chunksize)):
+                    in_flight.acquire()
+                    chunk = pa.Table.from_pandas(
+                        dataframe.iloc[start : start + chunksize], preserve_index=False
+                    )
+                    path = os.path.join(tmp_dir, 'chunk_{index}.parquet'.format(index=index))
+                    writes.append(pool.apply_async(_write_and_release, ((chunk, path),)))
+                    # only the pending write holds the chunk, so it's freed once written
+                    del chunk
+                for write in writes:
+                    write.get()
+            finally:
+                pool.close()
+                pool.join()
+
+            self.execute_queries(
+                [
+                    # the files are already compressed, and are uploaded parallelism at a time
+                    'PUT \'file://{glob}\' {stage} PARALLEL = {parallelism} '
+                    'AUTO_COMPRESS = FALSE;'.format(
+                        glob=os.path.join(tmp_dir, 'chunk_*.parquet').replace('\\', '/'),
+                        stage=stage,
+                        parallelism=parallelism,
+                    ),
+                    'COPY INTO {table} FROM {stage} FILE_FORMAT = (TYPE = \'parquet\') '
+                    'MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE;'.format(
+                        table=table, stage=stage
+                    ),
+                ]
+            )
+
+
+def _write_parquet_table(table_and_path):
+    import pyarrow.parquet as pq
+
+    table, path = table_and_path
+    pq.write_table(table, path, compression='snappy')
+
 
 @resource(
     config=define_snowflake_config(),
     description='This resource is for connecting to the Snowflake data warehouse',
 )
 def snowflake_resource(context):
-    return SnowflakeConnection(context)
+    snowflake = SnowflakeConnection(context)
+    try:
+        yield snowflake
+    finally:
+        snowflake.close()
 
 
 def _filter_password(args):
@@ -1,10 +1,42 @@
+import glob
+import re
+import threading
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
 from dagster_snowflake import snowflake_resource
+from dagster_snowflake.resources import _write_parquet_table as write_parquet_table
 
 from dagster import ModeDefinition, execute_solid, solid
 from dagster.seven import mock
 
 from .utils import create_mock_connector
 
+SNOWFLAKE_ENVIRONMENT = {
+    'resources': {
+        'snowflake': {
+            'config': {
+                'account': 'foo',
+                'user': 'bar',
+                'password': 'baz',
+                'database': 'TESTDB',
+                'schema': 'TESTSCHEMA',
+                'warehouse': 'TINY_WAREHOUSE',
+            }
+        }
+    }
+}
+
+
+def execute_snowflake_solid(compute_fn):
+    return execute_solid(
+        solid(required_resource_keys={'snowflake'})(compute_fn),
+        environment_dict=SNOWFLAKE_ENVIRONMENT,
+        mode_def=ModeDefinition(resource_defs={'snowflake': snowflake_resource}),
+    )
+
 
 @mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
 def test_snowflake_resource(snowflake_connect):
@@ -41,3 +73,156 @@ def test_snowflake_resource(snowflake_connect):
         schema='TESTSCHEMA',
         warehouse='TINY_WAREHOUSE',
     )
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_connection_reused(snowflake_connect):
+    def query_twice(context):
+        context.resources.snowflake.execute_query('SELECT 1')
+        context.resources.snowflake.execute_queries(['SELECT 2', 'SELECT 3'])
+
+    assert execute_snowflake_solid(query_twice).success
+
+    snowflake_connect.assert_called_once()
+    conn = snowflake_connect.return_value
+    assert conn.commit.call_count == 2
+    # closed once the resource is torn down
+    conn.close.assert_called_once()
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_connection_discarded_on_error(snowflake_connect):
+    def query_fails(context):
+        with pytest.raises(ValueError):
+            with context.resources.snowflake.get_connection():
+                raise ValueError()
+
+        context.resources.snowflake.execute_query('SELECT 1')
+
+    assert execute_snowflake_solid(query_fails).success
+    assert snowflake_connect.call_count == 2
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_fetch_pandas_batches(snowflake_connect):
+    batches = [pd.DataFrame({'num': [1, 2]}), pd.DataFrame({'num': [3]})]
+    cursor = snowflake_connect.return_value.cursor.return_value
+    cursor.fetch_pandas_batches.return_value = iter(batches)
+
+    def fetch(context):
+        fetched = list(context.resources.snowflake.fetch_pandas_batches('SELECT num FROM nums'))
+        assert fetched == batches
+
+    assert execute_snowflake_solid(fetch).success
+    cursor.execute.assert_called_once_with('SELECT num FROM nums', None)
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_fetch_pandas_batches_closed_early(snowflake_connect):
+    batches = [pd.DataFrame({'num': [1, 2]}), pd.DataFrame({'num': [3]})]
+    cursor = snowflake_connect.return_value.cursor.return_value
+    cursor.fetch_pandas_batches.return_value = iter(batches)
+
+    def fetch_one(context):
+        fetched = context.resources.snowflake.fetch_pandas_batches('SELECT num FROM nums')
+        assert next(fetched) is batches[0]
+        fetched.close()
+
+        context.resources.snowflake.execute_query('SELECT 1')
+
+    assert execute_snowflake_solid(fetch_one).success
+
+    # the connection held by the closed generator isn't reused, or left open
+    assert snowflake_connect.call_count == 2
+    assert snowflake_connect.return_value.close.call_count == 2
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_load_table_from_dataframe(snowflake_connect):
+    dataframe = pd.DataFrame({'num': range(10), 'name': [str(num) for num in range(10)]})
+    staged = []
+
+    def stage(sql, _parameters):
+        if sql.startswith('PUT'):
+            staged_glob = re.match(r"PUT 'file://(.*)' ", sql).group(1)
+            staged.extend(
+                pq.read_table(path).to_pandas() for path in sorted(glob.glob(staged_glob))
+            )
+
+    cursor = snowflake_connect.return_value.cursor.return_value
+    cursor.execute.side_effect = stage
+
+    def load(context):
+        context.resources.snowflake.load_table_from_dataframe(
+            dataframe, 'nums', chunksize=3, parallelism=2
+        )
+
+    assert execute_snowflake_solid(load).success
+
+    queries = [call[0][0] for call in cursor.execute.call_args_list]
+    assert len(queries) == 2
+    assert 'PARALLEL = 2' in queries[0]
+    assert 'OVERWRITE' not in queries[0]
+
+    # only the files staged by this load are copied
+    stage = re.match(r"PUT '.*' (@%nums/\w+/) ", queries[0]).group(1)
+    assert queries[1].startswith('COPY INTO nums FROM {stage} '.format(stage=stage))
+
+    assert len(staged) == 4
+    pd.testing.assert_frame_equal(
+        pd.concat(staged).sort_values('num').reset_index(drop=True), dataframe
+    )
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_load_table_from_dataframe_stages_uniquely(snowflake_connect):
+    dataframe = pd.DataFrame({'num': range(10)})
+
+    def load_twice(context):
+        context.resources.snowflake.load_table_from_dataframe(dataframe, 'nums')
+        context.resources.snowflake.load_table_from_dataframe(dataframe, 'nums')
+
+    assert execute_snowflake_solid(load_twice).success
+
+    cursor = snowflake_connect.return_value.cursor.return_value
+    puts = [call[0][0] for call in cursor.execute.call_args_list if call[0][0].startswith('PUT')]
+    stages = {re.match(r"PUT '.*' (@%nums/\w+/) ", sql).group(1) for sql in puts}
+    assert len(stages) == 2
+
+
+@mock.patch('snowflake.connector.connect', new_callable=create_mock_connector)
+def test_snowflake_load_table_from_dataframe_bounds_chunks_in_flight(snowflake_connect):
+    # pylint: disable=unused-argument
+    dataframe = pd.DataFrame({'num': range(20)})
+    lock = threading.Lock()
+    counts = {'in_flight': 0, 'max_in_flight': 0}
+
+    iloc = pd.DataFrame.iloc
+
+    def _counting_iloc(self):
+        # each chunk is sliced from the DataFrame just before it is converted
+        if self is dataframe:
+            with lock:
+                counts['in_flight'] += 1
+                counts['max_in_flight'] = max(counts['max_in_flight'], counts['in_flight'])
+        return iloc.fget(self)
+
+    def _slow_write_parquet_table(table_and_path):
+        time.sleep(0.01)
+        write_parquet_table(table_and_path)
+        with lock:
+            counts['in_flight'] -= 1
+
+    def load(context):
+        context.resources.snowflake.load_table_from_dataframe(
+            dataframe, 'nums', chunksize=1, parallelism=3
+        )
+
+    with mock.patch.object(pd.DataFrame, 'iloc', property(_counting_iloc)):
+        with mock.patch(
+            'dagster_snowflake.resources._write_parquet_table', _slow_write_parquet_table
+        ):
+            assert execute_snowflake_solid(load).success
+
+    assert counts['in_flight'] == 0
+    assert counts['max_in_flight'] <= 3
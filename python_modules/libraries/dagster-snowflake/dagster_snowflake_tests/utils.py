@@ -10,6 +10,7 @@ def connect_with_fetchall_returning(value):
     cursor_mock.fetchall.return_value = value
     snowflake_connect = mock.MagicMock()
     snowflake_connect.cursor.return_value = cursor_mock
+    snowflake_connect.is_closed.return_value = False
     m = mock.Mock()
     m.return_value = snowflake_connect
     return m
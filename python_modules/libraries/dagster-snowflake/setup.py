@@ -38,6 +38,9 @@ def _do_setup(name='dagster-snowflake'):
         ],
         packages=find_packages(exclude=['test']),
         install_requires=['dagster', 'snowflake-connector-python>=2.1.0'],
+        extras_require={
+            'pandas': ['pandas', 'pyarrow', 'snowflake-connector-python[pandas]>=2.1.0']
+        },
         zip_safe=False,
     )
 